@@ -7,12 +7,15 @@ for real-time, context-aware summaries and retrieval.
 
 __version__ = "0.2.0"
 
+from vl_jepa.corpus import CorpusIndex, CorpusSearchResult
 from vl_jepa.decoder import YDecoder
 from vl_jepa.detector import EventDetector
 from vl_jepa.encoder import ModelLoadError, VisualEncoder
 from vl_jepa.frame import FrameSampler
-from vl_jepa.index import EmbeddingIndex
+from vl_jepa.index import BackendPolicy, EmbeddingIndex
 from vl_jepa.multimodal_index import (
+    DiversityConfig,
+    HybridConfig,
     Modality,
     MultimodalIndex,
     MultimodalSearchResult,
@@ -35,8 +38,13 @@ __all__ = [
     "TextEncoder",
     "YDecoder",
     "EmbeddingIndex",
+    "BackendPolicy",
     "MultimodalIndex",
     "MultimodalSearchResult",
     "Modality",
     "RankingConfig",
+    "HybridConfig",
+    "DiversityConfig",
+    "CorpusIndex",
+    "CorpusSearchResult",
 ]
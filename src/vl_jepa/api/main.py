@@ -76,6 +76,9 @@ from vl_jepa.api.models import (  # noqa: E402
 )
 
 if TYPE_CHECKING:
+    from vl_jepa.frame_cache import FrameEmbeddingCache
+    from vl_jepa.lexical import BM25Index
+    from vl_jepa.model_registry import ModelRegistry
     from vl_jepa.multimodal_index import MultimodalIndex
 
 logger = logging.getLogger(__name__)
@@ -186,6 +189,92 @@ def cleanup_old_jobs() -> int:
     return removed
 
 
+# Frame embedding cache shared by processing jobs (disabled unless a path is set)
+FRAME_CACHE_PATH = os.environ.get("FRAME_CACHE_PATH", "")
+FRAME_CACHE_DISTANCE = os.environ.get("FRAME_CACHE_DISTANCE", "")
+_frame_cache: FrameEmbeddingCache | None = None
+_frame_cache_lock = threading.Lock()
+
+
+def get_frame_cache(encoder: Any) -> FrameEmbeddingCache | None:
+    """
+    Return the process-wide frame embedding cache, opening it on first use.
+
+    Its namespace is the ``cache_namespace`` of the visual encoder, so
+    embeddings of a different projection are never served.
+
+    Returns None when FRAME_CACHE_PATH is not set.
+    """
+    global _frame_cache
+    if not FRAME_CACHE_PATH:
+        return None
+    with _frame_cache_lock:
+        if _frame_cache is None:
+            from vl_jepa.frame_cache import FrameEmbeddingCache
+
+            distance = int(FRAME_CACHE_DISTANCE) if FRAME_CACHE_DISTANCE else None
+            _frame_cache = FrameEmbeddingCache(
+                FRAME_CACHE_PATH,
+                namespace=encoder.cache_namespace,
+                max_distance=distance,
+            )
+        return _frame_cache
+
+
+# Models shared by processing jobs and search requests; an idle model is
+# unloaded after MODEL_IDLE_TIMEOUT seconds, and idle models are unloaded
+# to keep loaded models within MODEL_MEMORY_BUDGET_MB (unset = unlimited)
+MODEL_IDLE_TIMEOUT = os.environ.get("MODEL_IDLE_TIMEOUT", "600")
+MODEL_MEMORY_BUDGET_MB = os.environ.get("MODEL_MEMORY_BUDGET_MB", "")
+_models_configured = False
+_models_lock = threading.Lock()
+
+
+def get_models() -> ModelRegistry:
+    """
+    Return the process-wide model registry, configured on first use.
+    """
+    global _models_configured
+    from vl_jepa.model_registry import default_registry
+
+    registry = default_registry()
+    with _models_lock:
+        if not _models_configured:
+            registry.configure(
+                memory_budget=int(float(MODEL_MEMORY_BUDGET_MB) * 2**20)
+                if MODEL_MEMORY_BUDGET_MB
+                else None,
+                idle_timeout=float(MODEL_IDLE_TIMEOUT) if MODEL_IDLE_TIMEOUT else None,
+            )
+            _models_configured = True
+    return registry
+
+
+# Set once the MiniLM text encoder failed to load (e.g. sentence-transformers
+# is not installed), so later jobs go straight to the placeholder
+_text_encoder_failed = False
+
+
+def get_text_encoder_name() -> str:
+    """
+    Return the registry name of the text encoder jobs should use.
+
+    The real MiniLM encoder is tried once per process; if it cannot be
+    loaded, the placeholder encoder is used from then on.
+    """
+    global _text_encoder_failed
+    from vl_jepa.model_registry import PLACEHOLDER_TEXT_ENCODER, TEXT_ENCODER
+
+    if not _text_encoder_failed:
+        try:
+            get_models().get(TEXT_ENCODER)
+            return TEXT_ENCODER
+        except Exception as e:
+            logger.warning("TextEncoder unavailable (%s), using placeholder", e)
+            _text_encoder_failed = True
+    return PLACEHOLDER_TEXT_ENCODER
+
+
 # Static files directory
 STATIC_DIR = Path(__file__).parent / "static"
 
@@ -427,9 +516,9 @@ def _register_routes(app: FastAPI) -> None:
         if job["status"] != JobStatus.COMPLETED:
             raise HTTPException(status_code=400, detail="Processing not complete")
 
-        # Get the index and text encoder from job state
+        # Get the index and the name of its text encoder from job state
         index: MultimodalIndex | None = job.get("index")
-        text_encoder = job.get("text_encoder")
+        text_encoder_name = job.get("text_encoder")
         result = job.get("result")
 
         if not result:
@@ -437,19 +526,18 @@ def _register_routes(app: FastAPI) -> None:
 
         results: list[SearchResultItem] = []
 
-        # Use semantic search if index is available
-        if index is not None and text_encoder is not None and index.size > 0:
+        # Use hybrid (semantic + keyword) search if index is available
+        if index is not None and text_encoder_name is not None and index.size > 0:
             try:
-                # Encode query
-                query_embedding = text_encoder.encode(request.query)
+                # Encode query with the shared encoder that built the index
+                with get_models().acquire(text_encoder_name) as text_encoder:
+                    query_embedding = text_encoder.encode(request.query)
 
-                # Search transcript modality
-                from vl_jepa.multimodal_index import Modality
-
-                search_results = index.search(
+                # Fuse transcript embedding and BM25 rankings
+                search_results = index.search_hybrid(
                     query_embedding,
+                    request.query,
                     k=request.top_k,
-                    modality=Modality.TRANSCRIPT,
                 )
 
                 for sr in search_results:
@@ -463,29 +551,31 @@ def _register_routes(app: FastAPI) -> None:
                         )
                     )
                 logger.info(
-                    "Semantic search for '%s' found %d results",
+                    "Hybrid search for '%s' found %d results",
                     request.query,
                     len(results),
                 )
             except Exception as e:
-                logger.warning("Semantic search failed: %s, falling back to text", e)
-                # Fall through to text matching
+                logger.warning("Hybrid search failed: %s, falling back to text", e)
+                # Fall through to keyword search
 
-        # Fallback to text matching if semantic search not available or failed
+        # Fallback to BM25 keyword search if semantic search not available or failed
         if not results:
-            query_lower = request.query.lower()
-            for chunk in result.transcript:
-                if query_lower in chunk.text.lower():
-                    results.append(
-                        SearchResultItem(
-                            text=chunk.text,
-                            timestamp=chunk.start,
-                            timestamp_formatted=chunk.start_formatted,
-                            score=0.5,  # Lower score for text match
-                            result_type="transcript",
-                        )
+            chunks = result.transcript
+            ids, scores = _lexical_index(job, chunks).search(
+                request.query, k=request.top_k
+            )
+            for id_, score in zip(ids.tolist(), scores.tolist(), strict=True):
+                chunk = chunks[id_]
+                results.append(
+                    SearchResultItem(
+                        text=chunk.text,
+                        timestamp=chunk.start,
+                        timestamp_formatted=chunk.start_formatted,
+                        score=score,
+                        result_type="transcript",
                     )
-            results = results[: request.top_k]
+                )
 
         return SearchResponse(
             query=request.query,
@@ -588,6 +678,22 @@ def _register_routes(app: FastAPI) -> None:
         return {"message": "Job deleted"}
 
 
+def _lexical_index(job: dict[str, Any], chunks: list[TranscriptChunk]) -> BM25Index:
+    """BM25 index over a job's transcript chunks (ids are chunk positions).
+
+    Built on the first keyword search of the job and kept in its state.
+    """
+    from vl_jepa.lexical import BM25Index
+
+    with _job_lock:
+        lexical: BM25Index | None = job.get("lexical_index")
+        if lexical is None:
+            lexical = BM25Index()
+            lexical.add(range(len(chunks)), [chunk.text for chunk in chunks])
+            job["lexical_index"] = lexical
+    return lexical
+
+
 def _format_timestamp(seconds: float) -> str:
     """Format seconds to MM:SS."""
     import math
@@ -687,15 +793,13 @@ def _process_video(job_id: str) -> None:
                 ProcessingStage.TRANSCRIBING, 0.30, "Transcribing audio with Whisper..."
             )
             try:
-                from vl_jepa.audio.transcriber import (
-                    WhisperTranscriber,
-                    check_whisper_available,
-                )
+                from vl_jepa.audio.transcriber import check_whisper_available
+                from vl_jepa.model_registry import WHISPER_TRANSCRIBER
 
                 if check_whisper_available():
                     # Use base model for balance of speed/accuracy
-                    transcriber = WhisperTranscriber.load("base", device="auto")
-                    segments = transcriber.transcribe(audio_path)
+                    with get_models().acquire(WHISPER_TRANSCRIBER) as transcriber:
+                        segments = transcriber.transcribe(audio_path)
 
                     # Convert to API format
                     for seg in segments:
@@ -765,63 +869,87 @@ def _process_video(job_id: str) -> None:
         # Stage 5: Encode frames
         update_progress(ProcessingStage.ENCODING_FRAMES, 0.55, "Encoding frames...")
 
-        # Initialize visual encoder
-        frame_embeddings = []
+        # Initialize visual encoder (shared by all jobs)
+        frame_embeddings: list[np.ndarray] = []
         try:
-            from vl_jepa.encoders.placeholder import PlaceholderVisualEncoder
-
-            visual_encoder = PlaceholderVisualEncoder()
-
             # Encode frames (resize to 224x224 and normalize)
             import cv2
 
-            for frame in frames:
-                # frame is typically (H, W, 3) BGR uint8
-                resized = cv2.resize(frame, (224, 224))
-                # Convert BGR to RGB and normalize to [-1, 1]
-                rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-                normalized = (rgb.astype(np.float32) / 127.5) - 1.0
-                # Transpose to (C, H, W)
-                chw = normalized.transpose(2, 0, 1)
-                embedding = visual_encoder.encode_single(chw)
-                frame_embeddings.append(embedding)
-            logger.info("Encoded %d frames", len(frame_embeddings))
+            from vl_jepa.frame import FrameChangeGate
+            from vl_jepa.model_registry import PLACEHOLDER_VISUAL_ENCODER
+
+            gate = FrameChangeGate()
+            encode_seconds = 0.0
+            with get_models().acquire(PLACEHOLDER_VISUAL_ENCODER) as shared_encoder:
+                visual_encoder: Any = shared_encoder
+                frame_cache = get_frame_cache(shared_encoder)
+                if frame_cache is not None:
+                    from vl_jepa.frame_cache import CachedVisualEncoder
+
+                    visual_encoder = CachedVisualEncoder(visual_encoder, frame_cache)
+
+                for frame in frames:
+                    # Unchanged slide: inherit the previous embedding
+                    if not gate.changed(frame):
+                        frame_embeddings.append(frame_embeddings[-1])
+                        continue
+                    # frame is typically (H, W, 3) BGR uint8
+                    resized = cv2.resize(frame, (224, 224))
+                    # Convert BGR to RGB and normalize to [-1, 1]
+                    rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+                    normalized = (rgb.astype(np.float32) / 127.5) - 1.0
+                    # Transpose to (C, H, W)
+                    chw = normalized.transpose(2, 0, 1)
+                    start = time.perf_counter()
+                    embedding = visual_encoder.encode_single(chw)
+                    encode_seconds += time.perf_counter() - start
+                    frame_embeddings.append(embedding)
+            encoded = gate.frames - gate.skipped
+            logger.info(
+                "Encoded %d of %d frames (%.0f%% unchanged, ~%.1fs saved)",
+                encoded,
+                len(frame_embeddings),
+                100 * gate.skip_ratio,
+                gate.skipped * encode_seconds / encoded if encoded else 0.0,
+            )
+            if frame_cache is not None:
+                logger.info(
+                    "Frame cache: %.0f%% of frames reused, ~%.1fs saved",
+                    100 * frame_cache.stats.hit_rate,
+                    frame_cache.stats.saved_seconds,
+                )
         except Exception as e:
             logger.warning("Frame encoding failed: %s", e)
 
         # Stage 6: Encode text
         update_progress(ProcessingStage.ENCODING_TEXT, 0.65, "Encoding transcript...")
 
-        # Initialize text encoder and multimodal index
-        text_encoder: Any = None
+        # Pick the shared text encoder and build the multimodal index
+        text_encoder_name: str | None = None
         multimodal_index: MultimodalIndex | None = None
         try:
-            # Try real MiniLM encoder first
-            try:
-                from vl_jepa.text import TextEncoder
-
-                text_encoder = TextEncoder.load()
-                logger.info("Loaded real TextEncoder (MiniLM)")
-            except Exception:
-                from vl_jepa.encoders.placeholder import PlaceholderTextEncoder
-
-                text_encoder = PlaceholderTextEncoder()
-                logger.info("Using PlaceholderTextEncoder")
+            models = get_models()
+            # Real MiniLM encoder unless it failed to load before
+            text_encoder_name = get_text_encoder_name()
+            logger.info("Using text encoder %s", text_encoder_name)
 
             # Build multimodal index
             from vl_jepa.multimodal_index import MultimodalIndex
 
             multimodal_index = MultimodalIndex()
 
-            # Add transcript embeddings
-            for i, chunk in enumerate(transcript_chunks):
-                text_embedding = text_encoder.encode(chunk.text)
-                multimodal_index.add_transcript(
-                    embedding=text_embedding,
-                    start_time=chunk.start,
-                    end_time=chunk.end,
-                    text=chunk.text,
-                    segment_id=i,
+            # Add transcript embeddings (one index add for all chunks)
+            if transcript_chunks:
+                with models.acquire(text_encoder_name) as text_encoder:
+                    text_embeddings = text_encoder.encode_batch(
+                        [chunk.text for chunk in transcript_chunks]
+                    )
+                multimodal_index.add_transcript_batch(
+                    text_embeddings,
+                    start_times=[chunk.start for chunk in transcript_chunks],
+                    end_times=[chunk.end for chunk in transcript_chunks],
+                    texts=[chunk.text for chunk in transcript_chunks],
+                    segment_ids=list(range(len(transcript_chunks))),
                 )
             logger.info("Added %d transcript chunks to index", len(transcript_chunks))
 
@@ -927,7 +1055,7 @@ def _process_video(job_id: str) -> None:
                 _jobs[job_id]["message"] = "Processing complete"
                 _jobs[job_id]["result"] = result
                 _jobs[job_id]["index"] = multimodal_index
-                _jobs[job_id]["text_encoder"] = text_encoder
+                _jobs[job_id]["text_encoder"] = text_encoder_name
 
         logger.info(
             "Job %s completed: %d events, %d transcript chunks, index size %d",
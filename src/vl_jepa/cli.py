@@ -7,6 +7,7 @@ Command-line interface for VL-JEPA lecture summarizer.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import logging
 import sys
 from pathlib import Path
@@ -66,6 +67,23 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         default=0.3,
         help="Event detection threshold",
     )
+    process_parser.add_argument(
+        "--frame-cache",
+        type=str,
+        default=None,
+        help="SQLite file caching frame embeddings across runs",
+    )
+    process_parser.add_argument(
+        "--frame-cache-distance",
+        type=int,
+        default=None,
+        help="Reuse embeddings of frames within this many hash bits",
+    )
+    process_parser.add_argument(
+        "--keep-static-frames",
+        action="store_true",
+        help="Encode every sampled frame, even when the slide is unchanged",
+    )
 
     # Query command
     query_parser = subparsers.add_parser(
@@ -148,7 +166,7 @@ def cmd_process(args: argparse.Namespace) -> int:
     import numpy as np
 
     from vl_jepa.detector import EventDetector
-    from vl_jepa.frame import FrameSampler
+    from vl_jepa.frame import FrameChangeGate, FrameSampler
     from vl_jepa.storage import Storage
     from vl_jepa.video import VideoInput
 
@@ -157,12 +175,37 @@ def cmd_process(args: argparse.Namespace) -> int:
     # Initialize components
     video = VideoInput.open(args.video)
     sampler = FrameSampler()
+    gate = None if args.keep_static_frames else FrameChangeGate()
     detector = EventDetector(threshold=args.threshold)
     storage = Storage(Path(args.output))
 
     logging.info(f"Video: {video.width}x{video.height} @ {video.fps} fps")
     logging.info(f"Output: {args.output}")
 
+    def encode_frames(batch: np.ndarray) -> np.ndarray:
+        # TODO: Use actual encoder when model is available
+        # encoder = VisualEncoder.load("models/vjepa.safetensors")
+        # return encoder.encode(batch)
+        # For now, use random embeddings based on processed frame digests
+        # (hashlib, unlike hash(), is stable across runs for the frame cache)
+        rows = []
+        for chw in batch:
+            digest = hashlib.blake2b(chw.transpose(1, 2, 0).tobytes(), digest_size=4)
+            np.random.seed(int.from_bytes(digest.digest(), "little"))
+            embedding = np.random.randn(768).astype(np.float32)
+            rows.append(embedding / np.linalg.norm(embedding))
+        return np.stack(rows)
+
+    frame_cache = None
+    if args.frame_cache:
+        from vl_jepa.frame_cache import FrameEmbeddingCache
+
+        frame_cache = FrameEmbeddingCache(
+            args.frame_cache,
+            namespace="cli-frame-blake2b",
+            max_distance=args.frame_cache_distance,
+        )
+
     # Process frames
     frame_interval = 1.0 / args.fps
     last_sample_time = -frame_interval
@@ -174,16 +217,14 @@ def cmd_process(args: argparse.Namespace) -> int:
 
         last_sample_time = frame.timestamp
 
-        # Process frame and encode
-        processed = sampler.process(frame.data)
-
-        # TODO: Use actual encoder when model is available
-        # encoder = VisualEncoder.load("models/vjepa.safetensors")
-        # embedding = encoder.encode_single(processed)
-        # For now, use random embedding based on processed frame hash
-        np.random.seed(hash(processed.tobytes()) % (2**32))
-        embedding = np.random.randn(768).astype(np.float32)
-        embedding = embedding / np.linalg.norm(embedding)
+        # Process frame and encode; an unchanged slide keeps the last embedding
+        if gate is None or gate.changed(frame.data):
+            processed = sampler.process(frame.data)
+            batch = processed.transpose(2, 0, 1)[np.newaxis, ...]
+            if frame_cache is not None:
+                embedding = frame_cache.encode(batch, encode_frames)[0]
+            else:
+                embedding = encode_frames(batch)[0]
 
         embeddings.append(embedding)
 
@@ -197,6 +238,20 @@ def cmd_process(args: argparse.Namespace) -> int:
 
     video.close()
 
+    if gate is not None:
+        logging.info(
+            f"Skipped {gate.skipped}/{gate.frames} unchanged frames "
+            f"({100 * gate.skip_ratio:.0f}%)"
+        )
+
+    if frame_cache is not None:
+        stats = frame_cache.stats
+        logging.info(
+            f"Frame cache: {100 * stats.hit_rate:.0f}% of frames reused, "
+            f"~{stats.saved_seconds:.1f}s saved"
+        )
+        frame_cache.close()
+
     # Save embeddings
     if embeddings:
         storage.save_embeddings(np.stack(embeddings))
@@ -215,16 +270,16 @@ def cmd_query(args: argparse.Namespace) -> int:
         Exit code
     """
     from vl_jepa.index import EmbeddingIndex
-    from vl_jepa.text import TextEncoder
+    from vl_jepa.model_registry import TEXT_ENCODER, default_registry
 
     logging.info(f"Querying: {args.question}")
 
-    # Load index
-    index = EmbeddingIndex.load(Path(args.data_dir) / "index")
-    encoder = TextEncoder.load()
+    # Load index (read-only here, so map it instead of reading it)
+    index = EmbeddingIndex.load(Path(args.data_dir) / "index", mmap=True)
 
     # Encode query
-    query_embedding = encoder.encode(args.question)
+    with default_registry().acquire(TEXT_ENCODER) as encoder:
+        query_embedding = encoder.encode(args.question)
 
     # Search
     results = index.search(query_embedding, k=args.top_k)
@@ -0,0 +1,248 @@
+"""
+SPEC: Multimodal Index (binary container)
+
+Versioned binary file of named numpy arrays, used by MultimodalIndex.save.
+
+Layout (little-endian):
+
+- magic (8 bytes) and format version (uint32)
+- sections: raw array bytes, each starting on a 64-byte boundary
+- header: UTF-8 JSON with the caller's info dict and, per section, its
+  dtype, shape, file offset and CRC32
+- footer: header offset (uint64), header length (uint32), header CRC32
+  (uint32) and the magic again
+
+The header sits at the end so sections can be streamed to disk in
+chunks without knowing their size up front. Sections are read one at a
+time, either into memory or as read-only memory maps, and every section
+read is checked against its CRC32 unless verification is turned off.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+MAGIC: bytes = b"VLJEPAMX"
+FORMAT_VERSION: int = 1
+
+_ALIGN = 64
+_PREFIX = struct.Struct("<8sI")
+_FOOTER = struct.Struct("<QII8s")
+
+
+def _little_endian(array: np.ndarray) -> np.ndarray:
+    """C-contiguous little-endian view or copy of ``array``."""
+    array = np.ascontiguousarray(array)
+    if array.dtype.byteorder == ">":
+        array = array.astype(array.dtype.newbyteorder("<"))
+    return array
+
+
+def _raw(array: np.ndarray) -> memoryview:
+    """Raw bytes of a C-contiguous array, without copying."""
+    return array.reshape(-1).view(np.uint8).data
+
+
+class ContainerWriter:
+    """Streams named arrays into a container file.
+
+    The file is written next to ``path`` and moved into place by
+    ``close()``, so an interrupted save never leaves a truncated file.
+
+    Example:
+        writer = ContainerWriter(path)
+        writer.add("ids", ids)
+        writer.add_rows("embeddings", chunks, np.float32, (768,))
+        writer.close({"next_id": 42})
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open the temporary file and write the prefix.
+
+        Args:
+            path: Final container path
+        """
+        self._path = Path(path)
+        self._temp_path = self._path.with_name(self._path.name + ".tmp")
+        self._file = open(self._temp_path, "wb")
+        self._file.write(_PREFIX.pack(MAGIC, FORMAT_VERSION))
+        self._sections: dict[str, dict[str, Any]] = {}
+
+    def add(self, name: str, array: np.ndarray) -> None:
+        """Write one array as a section.
+
+        Args:
+            name: Section name (unique within the file)
+            array: Array to store
+        """
+        array = np.asarray(array)
+        self.add_rows(name, [array], array.dtype, array.shape[1:])
+
+    def add_rows(
+        self,
+        name: str,
+        chunks: Iterable[np.ndarray],
+        dtype: Any,
+        row_shape: tuple[int, ...] = (),
+    ) -> None:
+        """Write a section from row chunks, concatenated along axis 0.
+
+        Args:
+            name: Section name (unique within the file)
+            chunks: Arrays of shape (n_i, *row_shape)
+            dtype: Element dtype of the section
+            row_shape: Shape of one row
+
+        Raises:
+            ValueError: If the name is taken or a chunk has another row shape
+        """
+        if name in self._sections:
+            raise ValueError(f"duplicate container section: {name}")
+        dtype = np.dtype(dtype).newbyteorder("<")
+        row_shape = tuple(row_shape)
+
+        f = self._file
+        f.write(b"\0" * (-f.tell() % _ALIGN))
+        offset = f.tell()
+        rows = 0
+        crc = 0
+        for chunk in chunks:
+            chunk = _little_endian(np.asarray(chunk, dtype=dtype))
+            if chunk.shape[1:] != row_shape:
+                raise ValueError(
+                    f"section {name}: chunk rows {chunk.shape[1:]} != {row_shape}"
+                )
+            data = _raw(chunk)
+            f.write(data)
+            crc = zlib.crc32(data, crc)
+            rows += len(chunk)
+
+        self._sections[name] = {
+            "dtype": dtype.str,
+            "shape": [rows, *row_shape],
+            "offset": offset,
+            "crc32": crc,
+        }
+
+    def close(self, info: dict[str, Any] | None = None) -> None:
+        """Write header and footer, then move the file into place.
+
+        Args:
+            info: JSON-serializable values stored in the header
+        """
+        f = self._file
+        header = json.dumps({"info": info or {}, "sections": self._sections}).encode(
+            "utf-8"
+        )
+        offset = f.tell()
+        f.write(header)
+        f.write(_FOOTER.pack(offset, len(header), zlib.crc32(header), MAGIC))
+        f.close()
+        os.replace(self._temp_path, self._path)
+
+    def abort(self) -> None:
+        """Close and delete the temporary file."""
+        self._file.close()
+        self._temp_path.unlink(missing_ok=True)
+
+
+class Container:
+    """Reads sections of a container file.
+
+    Example:
+        container = Container(path, mmap=True)
+        ids = container.read("ids")
+        container.info["next_id"]
+    """
+
+    def __init__(self, path: Path, mmap: bool = False, verify: bool = True) -> None:
+        """Read and validate the header.
+
+        Args:
+            path: Container path
+            mmap: Return read-only memory maps instead of in-memory arrays
+            verify: Check each section read against its CRC32
+
+        Raises:
+            ValueError: If the file is not a container, has an unknown
+                format version or a corrupted header
+        """
+        self._path = Path(path)
+        self._mmap = mmap
+        self._verify = verify
+
+        with open(self._path, "rb") as f:
+            prefix = f.read(_PREFIX.size)
+            size = f.seek(0, os.SEEK_END)
+            if (
+                len(prefix) < _PREFIX.size
+                or size < _PREFIX.size + _FOOTER.size
+                or prefix[:8] != MAGIC
+            ):
+                raise ValueError(f"not a multimodal container: {self._path}")
+            version = _PREFIX.unpack(prefix)[1]
+            if version != FORMAT_VERSION:
+                raise ValueError(f"unsupported container format version {version}")
+
+            f.seek(size - _FOOTER.size)
+            offset, length, crc, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+            if magic != MAGIC or offset + length > size - _FOOTER.size:
+                raise ValueError(f"truncated multimodal container: {self._path}")
+            f.seek(offset)
+            header = f.read(length)
+        if zlib.crc32(header) != crc:
+            raise ValueError(f"corrupted container header: {self._path}")
+
+        data = json.loads(header)
+        self.info: dict[str, Any] = data["info"]
+        self._sections: dict[str, dict[str, Any]] = data["sections"]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._sections
+
+    @property
+    def names(self) -> list[str]:
+        """Section names, in file order."""
+        return list(self._sections)
+
+    def read(self, name: str) -> np.ndarray:
+        """Read one section.
+
+        Args:
+            name: Section name
+
+        Returns:
+            The stored array (a read-only memory map with ``mmap=True``)
+
+        Raises:
+            KeyError: If the section does not exist
+            ValueError: If the section fails its checksum
+        """
+        section = self._sections[name]
+        dtype = np.dtype(section["dtype"])
+        shape = tuple(section["shape"])
+        count = int(np.prod(shape))
+
+        array: np.ndarray
+        if count == 0:
+            array = np.empty(shape, dtype=dtype)
+        elif self._mmap:
+            array = np.memmap(
+                self._path, dtype=dtype, mode="r", offset=section["offset"], shape=shape
+            )
+        else:
+            with open(self._path, "rb") as f:
+                f.seek(section["offset"])
+                array = np.fromfile(f, dtype=dtype, count=count).reshape(shape)
+
+        if self._verify and zlib.crc32(_raw(array)) != section["crc32"]:
+            raise ValueError(f"checksum mismatch in container section {name!r}")
+        return array
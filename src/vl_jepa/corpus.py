@@ -0,0 +1,445 @@
+"""
+SPEC: Corpus Index (cross-lecture search)
+
+Searches many lectures at once, one MultimodalIndex per lecture.
+
+Each lecture is a shard with its own metadata (course, date, title...).
+A query:
+
+1. selects the shards whose metadata matches the filters
+2. loads any selected shard that is still on disk (lazily, once)
+3. runs the per-lecture search on every shard in a thread pool; FAISS
+   releases the GIL while scanning, so shards are searched in parallel
+4. merges the per-shard top-k lists, each sorted by score, with a heap
+
+A corpus directory holds a ``corpus.json`` manifest plus one saved
+MultimodalIndex per lecture, so opening a corpus reads the manifest only.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .multimodal_index import (
+    DiversityConfig,
+    HybridConfig,
+    Modality,
+    MultimodalIndex,
+    MultimodalSearchResult,
+    RankingConfig,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "corpus.json"
+FORMAT_VERSION: int = 1
+
+
+@dataclass
+class CorpusSearchResult:
+    """Search result from one lecture of a corpus."""
+
+    lecture_id: str
+    result: MultimodalSearchResult
+
+    @property
+    def score(self) -> float:
+        """Score of the underlying lecture result."""
+        return self.result.score
+
+
+@dataclass
+class _Shard:
+    """One lecture: its metadata and its index, loaded on first use."""
+
+    lecture_id: str
+    metadata: dict[str, Any]
+    path: Path | None = None
+    index: MultimodalIndex | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+def _matches(metadata: dict[str, Any], filters: dict[str, Any]) -> bool:
+    """Whether shard metadata passes every filter.
+
+    A filter value is matched by equality, by membership when it is a
+    list/tuple/set, or by calling it when it is callable.
+    """
+    for key, expected in filters.items():
+        if key not in metadata:
+            return False
+        value = metadata[key]
+        if callable(expected):
+            if not expected(value):
+                return False
+        elif isinstance(expected, list | tuple | set | frozenset):
+            if value not in expected:
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+class CorpusIndex:
+    """Index over many lectures, searched as shards in parallel.
+
+    IMPLEMENTS: Cross-lecture search
+    INVARIANTS:
+        - Lecture ids are unique within a corpus
+        - Results of every search are sorted by score, best first
+
+    Example:
+        corpus = CorpusIndex.load("courses/")  # manifest only
+        results = corpus.search(
+            query_emb,
+            k=10,
+            filters={"course": "CS229", "date": lambda d: d >= "2026-01-01"},
+        )
+        for r in results:
+            print(r.lecture_id, r.result.timestamp, r.score)
+    """
+
+    def __init__(self, max_workers: int | None = None, mmap: bool = True) -> None:
+        """Initialize an empty corpus.
+
+        Args:
+            max_workers: Threads used to search shards (None = executor default)
+            mmap: Memory-map lecture indexes loaded from disk
+        """
+        self._shards: dict[str, _Shard] = {}
+        self._max_workers = max_workers
+        self._mmap = mmap
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._shards)
+
+    def __contains__(self, lecture_id: object) -> bool:
+        return lecture_id in self._shards
+
+    def __enter__(self) -> CorpusIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @property
+    def lecture_ids(self) -> list[str]:
+        """Lecture ids, in insertion order."""
+        return list(self._shards)
+
+    @property
+    def loaded_count(self) -> int:
+        """Number of shards whose index is in memory."""
+        return sum(shard.index is not None for shard in self._shards.values())
+
+    def metadata(self, lecture_id: str) -> dict[str, Any]:
+        """Metadata of one lecture.
+
+        Raises:
+            KeyError: If the lecture is not in the corpus
+        """
+        return self._shards[lecture_id].metadata
+
+    def add_lecture(
+        self,
+        lecture_id: str,
+        index: MultimodalIndex,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Add an in-memory lecture index as a shard.
+
+        Args:
+            lecture_id: Unique lecture identifier
+            index: The lecture's multimodal index
+            metadata: Shard metadata used by filters (e.g. course, date)
+
+        Raises:
+            ValueError: If the lecture id is already in the corpus
+        """
+        self._add_shard(_Shard(lecture_id, dict(metadata or {}), index=index))
+
+    def register_lecture(
+        self,
+        lecture_id: str,
+        path: Path,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Add a lecture saved on disk; it is loaded by the first query.
+
+        Args:
+            lecture_id: Unique lecture identifier
+            path: Base path of the saved MultimodalIndex
+            metadata: Shard metadata used by filters (e.g. course, date)
+
+        Raises:
+            ValueError: If the lecture id is already in the corpus
+        """
+        self._add_shard(_Shard(lecture_id, dict(metadata or {}), path=Path(path)))
+
+    def _add_shard(self, shard: _Shard) -> None:
+        if shard.lecture_id in self._shards:
+            raise ValueError(f"lecture already in corpus: {shard.lecture_id}")
+        self._shards[shard.lecture_id] = shard
+
+    def remove_lecture(self, lecture_id: str) -> None:
+        """Remove a lecture from the corpus.
+
+        Raises:
+            KeyError: If the lecture is not in the corpus
+        """
+        del self._shards[lecture_id]
+
+    def lecture(self, lecture_id: str) -> MultimodalIndex:
+        """Index of one lecture, loading it from disk if needed.
+
+        Raises:
+            KeyError: If the lecture is not in the corpus
+        """
+        return self._load_shard(self._shards[lecture_id])
+
+    def _load_shard(self, shard: _Shard) -> MultimodalIndex:
+        """Shard index, loaded once even under concurrent queries."""
+        index = shard.index
+        if index is not None:
+            return index
+        with shard.lock:
+            if shard.index is None:
+                assert shard.path is not None
+                shard.index = MultimodalIndex.load(shard.path, mmap=self._mmap)
+                logger.info("Loaded corpus shard %s", shard.lecture_id)
+            return shard.index
+
+    def select(self, filters: dict[str, Any] | None = None) -> list[str]:
+        """Lecture ids whose metadata matches ``filters``.
+
+        Args:
+            filters: Metadata key -> value, list/tuple/set of values, or
+                predicate (None = all lectures)
+
+        Returns:
+            Matching lecture ids, in insertion order
+        """
+        if not filters:
+            return list(self._shards)
+        return [
+            lecture_id
+            for lecture_id, shard in self._shards.items()
+            if _matches(shard.metadata, filters)
+        ]
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        modality: Modality | None = None,
+        filters: dict[str, Any] | None = None,
+        diversity: DiversityConfig | None = None,
+    ) -> list[CorpusSearchResult]:
+        """Search every matching lecture (see MultimodalIndex.search).
+
+        Args:
+            query: Query embedding (768,)
+            k: Number of results across the corpus
+            modality: Filter by modality (None = all)
+            filters: Shard metadata filters (see ``select``)
+            diversity: Diversify each lecture's results (None = off)
+
+        Returns:
+            Top-k results across lectures, sorted by score
+        """
+        return self._fan_out(
+            lambda index: index.search(
+                query, k=k, modality=modality, diversity=diversity
+            ),
+            k,
+            filters,
+        )
+
+    def search_multimodal(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        config: RankingConfig | None = None,
+        filters: dict[str, Any] | None = None,
+        diversity: DiversityConfig | None = None,
+    ) -> list[CorpusSearchResult]:
+        """Fused visual + transcript search across lectures.
+
+        See MultimodalIndex.search_multimodal.
+
+        Args:
+            query: Query embedding (768,)
+            k: Number of results across the corpus
+            config: Ranking configuration (uses defaults if None)
+            filters: Shard metadata filters (see ``select``)
+            diversity: Diversify each lecture's results (None = off)
+
+        Returns:
+            Top-k results across lectures, sorted by fused score
+        """
+        return self._fan_out(
+            lambda index: index.search_multimodal(
+                query, k=k, config=config, diversity=diversity
+            ),
+            k,
+            filters,
+        )
+
+    def search_hybrid(
+        self,
+        query: np.ndarray,
+        text: str,
+        k: int = 10,
+        config: HybridConfig | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> list[CorpusSearchResult]:
+        """Dense + BM25 transcript search across lectures.
+
+        See MultimodalIndex.search_hybrid.
+
+        Args:
+            query: Query embedding (768,)
+            text: Query text, for the lexical ranking
+            k: Number of results across the corpus
+            config: Hybrid configuration (uses defaults if None)
+            filters: Shard metadata filters (see ``select``)
+
+        Returns:
+            Top-k results across lectures, sorted by fused score
+        """
+        return self._fan_out(
+            lambda index: index.search_hybrid(query, text, k=k, config=config),
+            k,
+            filters,
+        )
+
+    def _fan_out(
+        self,
+        search: Callable[[MultimodalIndex], list[MultimodalSearchResult]],
+        k: int,
+        filters: dict[str, Any] | None,
+    ) -> list[CorpusSearchResult]:
+        """Run ``search`` on every selected shard and merge the top k."""
+        shards = [self._shards[lecture_id] for lecture_id in self.select(filters)]
+        if not shards or k <= 0:
+            return []
+
+        def run(shard: _Shard) -> list[CorpusSearchResult]:
+            results = search(self._load_shard(shard))
+            return [CorpusSearchResult(shard.lecture_id, r) for r in results]
+
+        if len(shards) == 1:
+            per_shard: Iterable[list[CorpusSearchResult]] = [run(shards[0])]
+        else:
+            per_shard = list(self._pool().map(run, shards))
+
+        # Each list is sorted by score; ties keep shard (insertion) order
+        merged = heapq.merge(*per_shard, key=lambda r: -r.score)
+        return list(islice(merged, k))
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """Shared thread pool, created on first parallel query."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="corpus-shard"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the thread pool (a later query starts a new one)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def save(self, directory: Path) -> None:
+        """Save the manifest and every in-memory lecture under ``directory``.
+
+        Lectures added in memory are written to ``directory/<lecture_id>``.
+        Lectures registered from disk keep their files, which may be
+        memory-mapped, so they are not rewritten.
+
+        Args:
+            directory: Corpus directory (created if missing)
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        base = directory.resolve()
+
+        lectures = []
+        for shard in self._shards.values():
+            if shard.path is None:
+                assert shard.index is not None
+                shard.index.save(directory / shard.lecture_id)
+                shard.path = directory / shard.lecture_id
+            path = shard.path.resolve()
+            lectures.append(
+                {
+                    "lecture_id": shard.lecture_id,
+                    "path": str(
+                        path.relative_to(base) if path.is_relative_to(base) else path
+                    ),
+                    "metadata": shard.metadata,
+                }
+            )
+
+        with open(directory / MANIFEST_NAME, "w") as f:
+            json.dump({"version": FORMAT_VERSION, "lectures": lectures}, f, indent=2)
+
+        logger.info("Saved corpus to %s: %d lectures", directory, len(lectures))
+
+    @classmethod
+    def load(
+        cls,
+        directory: Path,
+        max_workers: int | None = None,
+        mmap: bool = True,
+    ) -> CorpusIndex:
+        """Open a saved corpus; lectures load lazily on first query.
+
+        Args:
+            directory: Corpus directory written by ``save``
+            max_workers: Threads used to search shards
+            mmap: Memory-map lecture indexes when they are loaded
+
+        Returns:
+            CorpusIndex with every lecture registered, none loaded
+
+        Raises:
+            ValueError: If the manifest has an unknown format version
+        """
+        directory = Path(directory)
+        with open(directory / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+        if manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(
+                f"unsupported corpus format version {manifest.get('version')}"
+            )
+
+        corpus = cls(max_workers=max_workers, mmap=mmap)
+        for lecture in manifest["lectures"]:
+            corpus.register_lecture(
+                lecture["lecture_id"],
+                directory / lecture["path"],
+                lecture.get("metadata"),
+            )
+
+        logger.info("Opened corpus %s: %d lectures", directory, len(corpus))
+        return corpus
+
+    def __repr__(self) -> str:
+        return f"CorpusIndex(lectures={len(self)}, loaded={self.loaded_count})"
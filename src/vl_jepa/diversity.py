@@ -0,0 +1,88 @@
+"""
+SPEC: Multimodal Index (result diversification)
+
+Maximal marginal relevance (MMR) with a minimum temporal separation.
+
+Lecture search hits come in runs: a slide stays on screen for many
+frames, so the top visual results are often near-identical frames a
+second apart. MMR picks results one at a time, each maximizing
+
+    lambda * relevance - (1 - lambda) * max similarity to those picked
+
+over a bounded candidate pool. Each pick computes one row of
+similarities (the pick against the pool) and folds it into a running
+maximum, so choosing k of n candidates costs O(k n D) regardless of
+index size. Candidates closer in time than ``min_separation`` to a
+picked result of the same group (modality) are excluded outright.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def mmr_select(
+    embeddings: np.ndarray,
+    relevance: np.ndarray,
+    k: int,
+    mmr_lambda: float = 0.7,
+    timestamps: np.ndarray | None = None,
+    min_separation: float = 0.0,
+    groups: np.ndarray | None = None,
+) -> np.ndarray:
+    """Pick up to k diverse candidates by maximal marginal relevance.
+
+    Relevance is min-max rescaled to [0, 1] within the pool, so that it
+    trades off against cosine similarity on a comparable scale whatever
+    the ranking score (similarity, fused weight, reciprocal rank).
+
+    Args:
+        embeddings: L2-normalized candidate embeddings (N, D)
+        relevance: Ranking score of each candidate (N,), higher is better
+        k: Number of candidates to pick
+        mmr_lambda: 1 = relevance only, 0 = novelty only
+        timestamps: Candidate timestamps in seconds (N,), needed when
+            ``min_separation`` is positive
+        min_separation: Minimum seconds between two picks of the same
+            group (0 = no temporal constraint)
+        groups: Group of each candidate (N,), e.g. modality codes; the
+            separation applies within a group (None = one group)
+
+    Returns:
+        Positions of the picked candidates, in pick order. Fewer than k
+        are returned when the separation excludes the rest of the pool.
+    """
+    n = len(relevance)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    relevance = np.asarray(relevance, dtype=np.float64)
+    low, high = float(relevance.min()), float(relevance.max())
+    relevance = (relevance - low) / (high - low) if high > low else np.ones(n)
+
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    separate = min_separation > 0 and timestamps is not None
+    if separate:
+        times = np.asarray(timestamps, dtype=np.float64)
+        group = np.asarray(groups) if groups is not None else np.zeros(n)
+
+    # Max similarity of each candidate to the picks so far (none yet)
+    redundancy = np.zeros(n)
+    available = np.ones(n, dtype=bool)
+    picked: list[int] = []
+    for step in range(k):
+        gain = mmr_lambda * relevance - (1.0 - mmr_lambda) * redundancy
+        gain[~available] = -np.inf
+        best = int(np.argmax(gain))
+        if not available[best]:
+            break
+        picked.append(best)
+        available[best] = False
+        similarity = embeddings @ embeddings[best]
+        redundancy = similarity if step == 0 else np.maximum(redundancy, similarity)
+        if separate:
+            too_close = np.abs(times - times[best]) < min_separation
+            available &= ~(too_close & (group == group[best]))
+
+    return np.array(picked, dtype=np.int64)
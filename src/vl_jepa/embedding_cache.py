@@ -0,0 +1,287 @@
+"""
+SPEC: S006 - Text Encoding with Projection (embedding cache)
+
+Content-addressed cache of text embeddings.
+
+Transcript chunks and queries repeat: a lecture is re-processed, users
+search the same phrases, courses share intros. Each embedding is keyed
+by a hash of the encoder namespace (model name and projection digest)
+and the normalized text, so a cached vector is only ever served for the
+exact model and projection that produced it.
+
+Lookups go through a bounded in-memory LRU, then an optional SQLite
+store (WAL mode, one row per key with the raw float32 vector). Misses
+are encoded in one batch by the caller's encode function, and the
+measured encode time gives an estimate of the time saved by hits.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY: int = 4096
+
+# Keys per SELECT ... IN (...) statement (below SQLite's variable limit)
+_SQL_CHUNK: int = 500
+
+
+@dataclass(frozen=True)
+class EmbeddingCacheStats:
+    """Snapshot of embedding cache counters.
+
+    Attributes:
+        hits: Texts answered from the cache (memory or disk)
+        disk_hits: Hits read from the on-disk store
+        misses: Texts that were not cached
+        encoded: Texts actually encoded (misses without duplicates)
+        encode_seconds: Time spent encoding misses
+        size: Embeddings currently held in memory
+        capacity: Maximum number of embeddings held in memory
+    """
+
+    hits: int
+    disk_hits: int
+    misses: int
+    encoded: int
+    encode_seconds: float
+    size: int
+    capacity: int
+
+    @property
+    def lookups(self) -> int:
+        """Total number of texts looked up."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of texts answered from the cache (0 if none)."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated encode time saved: hits at the mean cost per text."""
+        if not self.encoded:
+            return 0.0
+        return self.hits * self.encode_seconds / self.encoded
+
+
+def normalize_text(text: str) -> str:
+    """Unicode-normalize (NFC) text and collapse runs of whitespace."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def array_digest(array: np.ndarray) -> str:
+    """Hex digest of an array's shape, dtype and contents."""
+    array = np.ascontiguousarray(array)
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{array.shape}{array.dtype.str}".encode())
+    digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of text embeddings backed by an optional SQLite file.
+
+    Example:
+        cache = EmbeddingCache(Path("~/.cache/lecture-mind/text.db"))
+        encoder = TextEncoder.load(cache=cache)
+        encoder.encode("What is gradient descent?")  # encoded and stored
+        encoder.encode("What is  gradient descent?")  # cache hit
+        cache.stats.hit_rate, cache.stats.saved_seconds
+    """
+
+    def __init__(
+        self, path: Path | str | None = None, capacity: int = DEFAULT_CAPACITY
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file for persistent storage (None = memory only)
+            capacity: Maximum number of embeddings kept in memory
+
+        Raises:
+            ValueError: If capacity is negative
+        """
+        if capacity < 0:
+            raise ValueError("capacity must be non-negative")
+        self._capacity = capacity
+        self._memory: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._encoded = 0
+        self._encode_seconds = 0.0
+
+        self._path = Path(path) if path is not None else None
+        self._conn: sqlite3.Connection | None = None
+        if self._path is not None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key BLOB PRIMARY KEY,
+                    vector BLOB NOT NULL
+                )
+            """
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    @property
+    def path(self) -> Path | None:
+        """SQLite file of the persistent store, if any."""
+        return self._path
+
+    @staticmethod
+    def key(namespace: str, text: str) -> bytes:
+        """16-byte key of a text embedded under ``namespace``.
+
+        Args:
+            namespace: Encoder identity, e.g. "model-name:projection-digest"
+            text: Text to embed (normalized before hashing)
+        """
+        payload = f"{namespace}\0{normalize_text(text)}".encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def encode(
+        self,
+        namespace: str,
+        texts: list[str],
+        encode: Callable[[list[str]], np.ndarray],
+    ) -> np.ndarray:
+        """Embeddings of ``texts``, encoding only the uncached ones.
+
+        Args:
+            namespace: Encoder identity (see ``key``)
+            texts: Texts to embed
+            encode: Function embedding a list of texts as an (M, D) array;
+                called at most once, with each uncached text once
+
+        Returns:
+            Embeddings (N, D) in the order of ``texts``
+        """
+        keys = [self.key(namespace, text) for text in texts]
+        found = self._lookup(keys)
+
+        missing: dict[bytes, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in found and key not in missing:
+                missing[key] = text
+        misses = sum(key not in found for key in keys)
+        with self._lock:
+            self._hits += len(keys) - misses
+            self._misses += misses
+
+        if missing:
+            start = time.perf_counter()
+            encoded = np.asarray(encode(list(missing.values())), dtype=np.float32)
+            elapsed = time.perf_counter() - start
+            new = dict(zip(missing, encoded, strict=True))
+            self._store(new)
+            found.update(new)
+            with self._lock:
+                self._encoded += len(missing)
+                self._encode_seconds += elapsed
+
+        if not keys:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([found[key] for key in keys])
+
+    def _lookup(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        """Cached embeddings of ``keys``, from memory then from disk."""
+        found: dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+
+        pending = list({key for key in keys if key not in found})
+        if self._conn is None or not pending:
+            return found
+
+        from_disk: dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for i in range(0, len(pending), _SQL_CHUNK):
+                chunk = pending[i : i + _SQL_CHUNK]
+                rows = self._conn.execute(
+                    "SELECT key, vector FROM embeddings WHERE key IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, vector in rows:
+                    from_disk[bytes(key)] = np.frombuffer(vector, dtype=np.float32)
+            self._disk_hits += sum(key in from_disk for key in keys)
+            self._remember(from_disk)
+        found.update(from_disk)
+        return found
+
+    def _store(self, vectors: dict[bytes, np.ndarray]) -> None:
+        """Add new embeddings to memory and to the persistent store."""
+        with self._lock:
+            self._remember(vectors)
+            if self._conn is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in vectors.items()],
+                )
+                self._conn.commit()
+
+    def _remember(self, vectors: dict[bytes, np.ndarray]) -> None:
+        """Insert into the memory LRU, evicting the oldest (lock held)."""
+        if self._capacity == 0:
+            return
+        for key, vector in vectors.items():
+            vector.flags.writeable = False
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+        while len(self._memory) > self._capacity:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached embedding, in memory and on disk."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings")
+                self._conn.commit()
+
+    def close(self) -> None:
+        """Close the persistent store; the cache keeps working in memory."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def stats(self) -> EmbeddingCacheStats:
+        """Current counters."""
+        with self._lock:
+            return EmbeddingCacheStats(
+                hits=self._hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                encoded=self._encoded,
+                encode_seconds=self._encode_seconds,
+                size=len(self._memory),
+                capacity=self._capacity,
+            )
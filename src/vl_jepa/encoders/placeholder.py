@@ -9,6 +9,7 @@ IMPLEMENTS: Gate 0.3 - Encoder Interface Design
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 import numpy as np
 
@@ -19,6 +20,9 @@ from .base import (
     VisualEncoderProtocol,
 )
 
+if TYPE_CHECKING:
+    from vl_jepa.embedding_cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,9 +55,20 @@ class PlaceholderVisualEncoder:
         # Fixed random projection matrix for consistency
         self._projection = self._rng.randn(3 * 224 * 224, self.EMBEDDING_DIM)
         self._projection = self._projection.astype(np.float32)
+        self._cache_namespace: str | None = None
 
         logger.info("Initialized PlaceholderVisualEncoder (seed=%d)", seed)
 
+    @property
+    def cache_namespace(self) -> str:
+        """Frame cache namespace, digested from the projection on first use."""
+        if self._cache_namespace is None:
+            from vl_jepa.embedding_cache import array_digest
+
+            digest = array_digest(self._projection)
+            self._cache_namespace = f"placeholder-visual:{digest}"
+        return self._cache_namespace
+
     def encode(self, frames: np.ndarray) -> np.ndarray:
         """Encode frames to embeddings.
 
@@ -118,17 +133,30 @@ class PlaceholderTextEncoder:
     VISUAL_DIM: int = VISUAL_EMBEDDING_DIM
     MAX_TOKENS: int = 256
 
-    def __init__(self, seed: int = 42) -> None:
+    def __init__(self, seed: int = 42, cache: EmbeddingCache | None = None) -> None:
         """Initialize placeholder encoder.
 
         Args:
             seed: Random seed for reproducible embeddings
+            cache: Optional embedding cache consulted before hashing
         """
         self._rng = np.random.RandomState(seed)
         self._projection = self._create_projection()
 
+        self._cache = cache
+        self._cache_namespace = ""
+        if cache is not None:
+            from vl_jepa.embedding_cache import array_digest
+
+            self._cache_namespace = f"placeholder:{array_digest(self._projection)}"
+
         logger.info("Initialized PlaceholderTextEncoder (seed=%d)", seed)
 
+    @property
+    def cache(self) -> EmbeddingCache | None:
+        """Embedding cache in use, if any (see ``cache.stats``)."""
+        return self._cache
+
     def _create_projection(self) -> np.ndarray:
         """Create projection matrix from TEXT_DIM to VISUAL_DIM."""
         proj = np.zeros((self.TEXT_DIM, self.VISUAL_DIM), dtype=np.float32)
@@ -147,17 +175,8 @@ class PlaceholderTextEncoder:
         embedding = text_rng.randn(self.TEXT_DIM).astype(np.float32)
         return embedding
 
-    def encode(self, text: str) -> np.ndarray:
-        """Encode text to embedding.
-
-        INVARIANT: INV009 - Output shape is (768,)
-        INVARIANT: INV010 - L2-normalized
-
-        Args:
-            text: Query text
-
-        Returns:
-            L2-normalized embedding (768,)
+    def _prepare(self, text: str) -> str:
+        """Validate text and truncate it to MAX_TOKENS words.
 
         Raises:
             ValueError: If text is empty
@@ -174,32 +193,62 @@ class PlaceholderTextEncoder:
                 self.MAX_TOKENS,
             )
             text = " ".join(words[: self.MAX_TOKENS])
+        return text
 
-        # Get text embedding
-        text_embedding = self._text_to_embedding(text)
+    def encode(self, text: str) -> np.ndarray:
+        """Encode text to embedding.
 
-        # Project to visual space
-        projected = text_embedding @ self._projection
+        INVARIANT: INV009 - Output shape is (768,)
+        INVARIANT: INV010 - L2-normalized
 
-        # L2 normalize (INV010)
-        norm = np.linalg.norm(projected)
-        if norm > 1e-8:
-            projected = projected / norm
+        Args:
+            text: Query text
 
-        result: np.ndarray = projected.astype(np.float32)
+        Returns:
+            L2-normalized embedding (768,)
+
+        Raises:
+            ValueError: If text is empty
+        """
+        result: np.ndarray = self.encode_batch([text])[0]
         return result
 
     def encode_batch(self, texts: list[str]) -> np.ndarray:
-        """Encode multiple texts.
+        """Encode multiple texts with one projection and normalization.
+
+        With a cache, only the texts it does not hold are hashed.
 
         Args:
             texts: List of query texts
 
         Returns:
             L2-normalized embeddings (N, 768)
+
+        Raises:
+            ValueError: If any text is empty
         """
-        embeddings = [self.encode(t) for t in texts]
-        return np.stack(embeddings, axis=0)
+        texts = [self._prepare(text) for text in texts]
+        if not texts:
+            return np.empty((0, self.VISUAL_DIM), dtype=np.float32)
+
+        if self._cache is not None:
+            return self._cache.encode(self._cache_namespace, texts, self._embed)
+        return self._embed(texts)
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        """Hash, project and normalize prepared texts."""
+        # Get text embeddings
+        text_embeddings = np.stack([self._text_to_embedding(text) for text in texts])
+
+        # Project to visual space
+        projected = text_embeddings @ self._projection
+
+        # L2 normalize (INV010)
+        norms = np.linalg.norm(projected, axis=1, keepdims=True)
+        projected = projected / np.maximum(norms, 1e-8)
+
+        result: np.ndarray = projected.astype(np.float32)
+        return result
 
 
 # Type assertions for Protocol compliance
@@ -0,0 +1,239 @@
+"""
+SPEC: Multimodal Index (entry store)
+
+Columnar storage for MultimodalIndex entries.
+
+Each entry field lives in its own numpy column, indexed by slot:
+
+- ids (int64, ascending), modality code (uint8), timestamp (float64)
+- frame_index / segment_id (int64, NONE_INT when absent)
+- start / end (float64) transcript span
+- text: one packed UTF-8 table (offsets + bytes), plus a presence mask
+
+Embeddings and extra metadata are not kept here: EmbeddingIndex already
+stores both, so MultimodalIndex builds entry objects from these columns
+and the index only when they are requested.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+# Marks a missing frame_index / segment_id in the integer columns
+NONE_INT: int = int(np.iinfo(np.int64).min)
+
+_INITIAL_CAPACITY = 64
+
+
+class EntryStore:
+    """Growable column arrays for entries, addressed by slot.
+
+    Ids must be appended in ascending order (MultimodalIndex assigns them
+    sequentially), so id -> slot is a binary search over the id column.
+
+    Example:
+        store = EntryStore()
+        store.append(ids=[0, 1], modality=[0, 0], timestamps=[0.0, 0.5])
+        store.slots([1])  # array([1])
+    """
+
+    _COLUMNS: dict[str, tuple[type, Any]] = {
+        "ids": (np.int64, 0),
+        "modality": (np.uint8, 0),
+        "timestamp": (np.float64, 0.0),
+        "frame_index": (np.int64, NONE_INT),
+        "segment_id": (np.int64, NONE_INT),
+        "start": (np.float64, np.nan),
+        "end": (np.float64, np.nan),
+        "has_text": (np.bool_, False),
+        "text_offsets": (np.int64, 0),  # (N + 1) offsets into text bytes
+    }
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._size = 0
+        self._arrays: dict[str, np.ndarray] = {
+            name: np.full(_INITIAL_CAPACITY, fill, dtype=dtype)
+            for name, (dtype, fill) in self._COLUMNS.items()
+        }
+        self._text = bytearray()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+        """View of one column over the stored entries (no copy)."""
+        return self._arrays[name][: self._size]
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Entry ids, ascending (view)."""
+        return self.column("ids")
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the columns and the text table."""
+        return sum(a.nbytes for a in self._arrays.values()) + len(self._text)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Views of every column over the stored entries.
+
+        ``text_offsets`` has N + 1 items; the text bytes are ``text_bytes``.
+        """
+        columns = {name: self.column(name) for name in self._COLUMNS}
+        columns["text_offsets"] = self._arrays["text_offsets"][: self._size + 1]
+        return columns
+
+    @property
+    def text_bytes(self) -> np.ndarray:
+        """Packed UTF-8 text table (uint8 view)."""
+        return np.frombuffer(self._text, dtype=np.uint8)
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, np.ndarray], text: Any) -> EntryStore:
+        """Store holding a copy of saved columns (see ``columns()``).
+
+        Args:
+            columns: One array per column, ids ascending
+            text: Packed UTF-8 text table the offsets point into
+
+        Raises:
+            ValueError: If a column is missing or has the wrong length
+        """
+        store = cls()
+        size = len(columns["ids"])
+        store._reserve(size)
+        for name in cls._COLUMNS:
+            length = size + 1 if name == "text_offsets" else size
+            if name not in columns or len(columns[name]) != length:
+                raise ValueError(f"entry column {name!r} missing or wrong length")
+            store._arrays[name][:length] = columns[name]
+        store._text = bytearray(np.asarray(text, dtype=np.uint8).tobytes())
+        store._size = size
+        return store
+
+    def take(self, slots: np.ndarray) -> EntryStore:
+        """New store holding the entries at ``slots`` (ascending)."""
+        offsets = self._arrays["text_offsets"]
+        columns = {name: self._arrays[name][slots] for name in self._COLUMNS}
+        lengths = offsets[slots + 1] - offsets[slots]
+        columns["text_offsets"] = np.concatenate([[0], np.cumsum(lengths)])
+        text = b"".join(
+            self._text[start:end]
+            for start, end in zip(
+                offsets[slots].tolist(), offsets[slots + 1].tolist(), strict=True
+            )
+            if end > start
+        )
+        return EntryStore.from_columns(columns, np.frombuffer(text, dtype=np.uint8))
+
+    def append(
+        self,
+        ids: Any,
+        modality: Any,
+        timestamps: Any,
+        frame_indices: Any = None,
+        segment_ids: Any = None,
+        starts: Any = None,
+        ends: Any = None,
+        texts: list[str | None] | None = None,
+    ) -> None:
+        """Append N entries. Optional columns default to absent values.
+
+        Args:
+            ids: Entry ids (N,), all greater than the stored ids
+            modality: Modality codes (N,)
+            timestamps: Entry timestamps in seconds (N,)
+            frame_indices: Frame indices (N,), None items allowed
+            segment_ids: Segment ids (N,), None items allowed
+            starts: Span start times (N,)
+            ends: Span end times (N,)
+            texts: Texts (N,), None items allowed
+
+        Raises:
+            ValueError: If ids are not ascending past the stored ids
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        n = len(ids)
+        if n == 0:
+            return
+        last = self.ids[-1] if self._size else None
+        if (last is not None and ids[0] <= last) or (np.diff(ids) <= 0).any():
+            raise ValueError("entry ids must be appended in ascending order")
+
+        self._reserve(self._size + n)
+        rows = slice(self._size, self._size + n)
+        arrays = self._arrays
+        arrays["ids"][rows] = ids
+        arrays["modality"][rows] = modality
+        arrays["timestamp"][rows] = timestamps
+        if frame_indices is not None:
+            arrays["frame_index"][rows] = _optional_ints(frame_indices)
+        if segment_ids is not None:
+            arrays["segment_id"][rows] = _optional_ints(segment_ids)
+        if starts is not None:
+            arrays["start"][rows] = starts
+        if ends is not None:
+            arrays["end"][rows] = ends
+
+        offsets = arrays["text_offsets"]
+        base = offsets[self._size]
+        if texts is not None:
+            encoded = [(text or "").encode("utf-8") for text in texts]
+            arrays["has_text"][rows] = [text is not None for text in texts]
+            self._text += b"".join(encoded)
+            lengths = np.cumsum([len(e) for e in encoded])
+            offsets[self._size + 1 : self._size + n + 1] = base + lengths
+        else:
+            offsets[self._size + 1 : self._size + n + 1] = base
+        self._size += n
+
+    def _reserve(self, size: int) -> None:
+        """Grow every column (doubling) to hold ``size`` entries."""
+        capacity = len(self._arrays["ids"])
+        if size + 1 <= capacity:  # text_offsets needs one extra slot
+            return
+        while capacity < size + 1:
+            capacity *= 2
+        for name, (dtype, fill) in self._COLUMNS.items():
+            grown: np.ndarray = np.full(capacity, fill, dtype=dtype)
+            grown[: self._size + 1] = self._arrays[name][: self._size + 1]
+            self._arrays[name] = grown
+
+    def slots(self, ids: Any) -> np.ndarray:
+        """Slot of each id (-1 if not stored)."""
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        stored = self.ids
+        slots = np.searchsorted(stored, ids)
+        found = slots < len(stored)
+        found[found] = stored[slots[found]] == ids[found]
+        return np.where(found, slots, -1)
+
+    def text(self, slot: int) -> str | None:
+        """Decoded text of one slot (None if it has none)."""
+        if not self._arrays["has_text"][slot]:
+            return None
+        offsets = self._arrays["text_offsets"]
+        start, end = int(offsets[slot]), int(offsets[slot + 1])
+        return bytes(self._text[start:end]).decode("utf-8")
+
+    def optional_int(self, name: str, slot: int) -> int | None:
+        """Value of an int column (frame_index / segment_id) or None."""
+        value = int(self._arrays[name][slot])
+        return None if value == NONE_INT else value
+
+
+def _optional_ints(values: Any) -> np.ndarray:
+    """Int64 array from values that may contain None (stored as NONE_INT)."""
+    array = np.asarray(values)
+    if array.dtype.kind in "iu":
+        return array.astype(np.int64)
+    return np.array(
+        [NONE_INT if value is None else value for value in values], dtype=np.int64
+    )
+
+
+# Column names, in storage order (``text_offsets`` holds N + 1 items)
+COLUMN_NAMES: tuple[str, ...] = tuple(EntryStore._COLUMNS)
@@ -136,3 +136,115 @@ class FrameSampler:
 
         # Clamp to ensure bounds (safety)
         return np.clip(normalized, -1.0, 1.0)
+
+
+class FrameChangeGate:
+    """Cheap pre-encoder test of whether a raw frame shows new content.
+
+    IMPLEMENTS: S003 (static-slide skipping)
+
+    Most 1 FPS samples of a lecture show an unchanged slide. Each raw
+    frame is reduced to a 32x32 grayscale thumbnail (a strided subsample,
+    area-averaged, which also smooths away compression noise) and
+    compared with the thumbnail of the last frame that passed the gate.
+    The frame passes when more than ``min_changed`` of the cells moved by
+    more than ``pixel_threshold``. Comparing against the last passed
+    frame, not the previous sample, keeps slow changes from slipping
+    through in steps.
+
+    Example:
+        gate = FrameChangeGate()
+        for frame in video.sample_frames(target_fps=1.0):
+            if gate.changed(frame.data):
+                embedding = encoder.encode_single(sampler.process(frame.data))
+            embeddings.append(embedding)  # skipped frames inherit it
+    """
+
+    THUMBNAIL_SIZE: int = 32
+
+    def __init__(
+        self, pixel_threshold: float = 0.04, min_changed: float = 0.002
+    ) -> None:
+        """Initialize the gate.
+
+        Args:
+            pixel_threshold: Cell difference, in [0, 1] intensity, that
+                counts as a change
+            min_changed: Fraction of cells that must change for the frame
+                to pass (0.002 = more than 2 of 1024)
+
+        Raises:
+            ValueError: If a threshold is outside [0, 1]
+        """
+        if not 0.0 <= pixel_threshold <= 1.0:
+            raise ValueError("pixel_threshold must be in [0, 1]")
+        if not 0.0 <= min_changed <= 1.0:
+            raise ValueError("min_changed must be in [0, 1]")
+        self._pixel_threshold = pixel_threshold
+        self._min_changed = min_changed
+        self._reference: np.ndarray | None = None
+        self._frames = 0
+        self._skipped = 0
+
+    def thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """Grayscale THUMBNAIL_SIZE x THUMBNAIL_SIZE thumbnail in [0, 1].
+
+        Args:
+            frame: Raw frame, shape (H, W, 3) or (H, W), uint8 [0, 255]
+        """
+        size = self.THUMBNAIL_SIZE
+        # ~8 samples per cell side: averaging every pixel of a 1080p frame
+        # is about 4x slower and no more robust to compression noise
+        step = max(1, min(frame.shape[:2]) // (8 * size))
+        small = cv2.resize(
+            np.ascontiguousarray(frame[::step, ::step]),
+            (size, size),
+            interpolation=cv2.INTER_AREA,
+        )
+        if small.ndim == 3:
+            small = small.mean(axis=2, dtype=np.float32)
+        result: np.ndarray = small.astype(np.float32) / 255.0
+        return result
+
+    def changed(self, frame: np.ndarray) -> bool:
+        """Whether ``frame`` differs from the last frame that passed.
+
+        The first frame always passes. A passing frame becomes the new
+        reference; a skipped frame is counted in ``skipped``.
+
+        Args:
+            frame: Raw frame, shape (H, W, 3), uint8 [0, 255]
+
+        Returns:
+            True if the frame must be encoded
+        """
+        self._frames += 1
+        thumb = self.thumbnail(frame)
+        if self._reference is not None:
+            moved = np.abs(thumb - self._reference) > self._pixel_threshold
+            if moved.mean() <= self._min_changed:
+                self._skipped += 1
+                return False
+        self._reference = thumb
+        return True
+
+    def reset(self) -> None:
+        """Forget the reference frame and counters (e.g. for a new video)."""
+        self._reference = None
+        self._frames = 0
+        self._skipped = 0
+
+    @property
+    def frames(self) -> int:
+        """Frames tested since the last reset."""
+        return self._frames
+
+    @property
+    def skipped(self) -> int:
+        """Frames judged unchanged since the last reset."""
+        return self._skipped
+
+    @property
+    def skip_ratio(self) -> float:
+        """Fraction of tested frames that were skipped (0 if none)."""
+        return self._skipped / self._frames if self._frames else 0.0
@@ -0,0 +1,482 @@
+"""
+SPEC: S004 - Visual Encoding (frame embedding cache)
+
+Content-fingerprinted cache of visual embeddings.
+
+Lecture video is mostly static slides: consecutive 1 FPS samples are
+often identical or nearly so, and re-processing a video samples the
+same frames again. Each preprocessed frame gets two fingerprints:
+
+- an exact key, a hash of the frame bytes, which reuses the embedding of
+  an identical frame;
+- a 256-bit average hash (grayscale 16x16 block means above their mean),
+  which, when ``max_distance`` is set, reuses the embedding of a cached
+  frame within that many differing bits.
+
+Only frames that are actually encoded are stored, so near-duplicate
+reuse never chains from one reused embedding to the next. Entries live
+in a bounded in-memory LRU backed by an optional SQLite file (WAL mode);
+the most recent entries are loaded from it at startup so near-duplicate
+matching also works across runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY: int = 4096
+
+# Side of the average-hash grid: HASH_SIZE**2 bits per frame
+HASH_SIZE: int = 16
+HASH_BYTES: int = HASH_SIZE * HASH_SIZE // 8
+
+# Keys per SELECT ... IN (...) statement (below SQLite's variable limit)
+_SQL_CHUNK: int = 500
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+
+@dataclass(frozen=True)
+class FrameCacheStats:
+    """Snapshot of frame cache counters.
+
+    Attributes:
+        hits: Frames reusing the embedding of an identical frame
+        near_hits: Frames reusing the embedding of a near-duplicate
+        disk_hits: Exact hits read from the on-disk store
+        misses: Frames that were encoded
+        encode_seconds: Time spent encoding misses
+        size: Embeddings currently held in memory
+        capacity: Maximum number of embeddings held in memory
+    """
+
+    hits: int
+    near_hits: int
+    disk_hits: int
+    misses: int
+    encode_seconds: float
+    size: int
+    capacity: int
+
+    @property
+    def lookups(self) -> int:
+        """Total number of frames looked up."""
+        return self.hits + self.near_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of frames that were not encoded (0 if none)."""
+        return (self.hits + self.near_hits) / self.lookups if self.lookups else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated encode time saved: reused frames at the mean cost."""
+        if not self.misses:
+            return 0.0
+        return (self.hits + self.near_hits) * self.encode_seconds / self.misses
+
+
+def frame_fingerprints(frames: np.ndarray) -> tuple[list[bytes], np.ndarray]:
+    """Exact keys and average hashes of a batch of frames.
+
+    Args:
+        frames: Preprocessed frames (B, C, H, W) with H, W >= HASH_SIZE
+
+    Returns:
+        Tuple of (16-byte exact keys, packed average hashes (B, HASH_BYTES))
+
+    Raises:
+        ValueError: If frames are not a 4D batch
+    """
+    if frames.ndim != 4:
+        raise ValueError(f"Expected 4D tensor (B,C,H,W), got {frames.ndim}D")
+    prefix = f"{frames.shape[1:]}{frames.dtype.str}".encode()
+    keys = [
+        hashlib.blake2b(
+            prefix + np.ascontiguousarray(frame).tobytes(), digest_size=16
+        ).digest()
+        for frame in frames
+    ]
+
+    batch, _, height, width = frames.shape
+    bh, bw = height // HASH_SIZE, width // HASH_SIZE
+    gray = frames[:, :, : bh * HASH_SIZE, : bw * HASH_SIZE].mean(
+        axis=1, dtype=np.float32
+    )
+    blocks = gray.reshape(batch, HASH_SIZE, bh, HASH_SIZE, bw).mean(axis=(2, 4))
+    bits = blocks.reshape(batch, -1) > blocks.mean(axis=(1, 2))[:, np.newaxis]
+    return keys, np.packbits(bits, axis=1)
+
+
+def hamming_distances(hashes: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Number of differing bits between packed hashes (N, B) and one (B,)."""
+    distances: np.ndarray = _POPCOUNT[np.bitwise_xor(hashes, query)].sum(axis=1)
+    return distances
+
+
+class FrameEmbeddingCache:
+    """Thread-safe LRU of frame embeddings backed by an optional SQLite file.
+
+    A cache holds the embeddings of one visual encoder, named by
+    ``namespace``; caches of different encoders can share a file.
+
+    Example:
+        cache = FrameEmbeddingCache("frames.db", namespace="dinov2", max_distance=4)
+        encoder = CachedVisualEncoder(DINOv2Encoder.load(), cache)
+        embeddings = encoder.encode(frames)  # static slides encoded once
+        cache.stats.hit_rate, cache.stats.saved_seconds
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        namespace: str = "default",
+        max_distance: int | None = None,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file for persistent storage (None = memory only)
+            namespace: Identity of the encoder whose embeddings are cached
+            max_distance: Largest average-hash distance, in bits out of
+                HASH_SIZE**2, at which a frame reuses a cached embedding
+                (None = exact duplicates only)
+            capacity: Maximum number of embeddings kept in memory
+
+        Raises:
+            ValueError: If capacity or max_distance is negative
+        """
+        if capacity < 0:
+            raise ValueError("capacity must be non-negative")
+        if max_distance is not None and max_distance < 0:
+            raise ValueError("max_distance must be non-negative")
+        self._namespace = namespace
+        self._max_distance = max_distance
+        self._capacity = capacity
+        self._lock = threading.Lock()
+
+        # Memory LRU: key -> slot in the hash and vector arrays
+        self._slots: OrderedDict[bytes, int] = OrderedDict()
+        self._hashes = np.zeros((capacity, HASH_BYTES), dtype=np.uint8)
+        self._live = np.zeros(capacity, dtype=bool)
+        self._vectors: np.ndarray | None = None
+
+        self._hits = 0
+        self._near_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._encode_seconds = 0.0
+
+        self._path = Path(path) if path is not None else None
+        self._conn: sqlite3.Connection | None = None
+        if self._path is not None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS frames (
+                    namespace TEXT NOT NULL,
+                    key BLOB NOT NULL,
+                    phash BLOB NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+            """
+            )
+            self._conn.commit()
+            self._preload()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def namespace(self) -> str:
+        """Identity of the encoder whose embeddings are cached."""
+        return self._namespace
+
+    @property
+    def max_distance(self) -> int | None:
+        """Near-duplicate threshold in bits (None = exact only)."""
+        return self._max_distance
+
+    def encode(
+        self, frames: np.ndarray, encode: Callable[[np.ndarray], np.ndarray]
+    ) -> np.ndarray:
+        """Embeddings of ``frames``, encoding only frames not yet cached.
+
+        Args:
+            frames: Preprocessed frames (B, C, H, W)
+            encode: Function embedding a frame batch as a (M, D) array;
+                called at most once, with the frames that must be encoded
+
+        Returns:
+            Embeddings (B, D) in the order of ``frames``
+        """
+        keys, hashes = frame_fingerprints(frames)
+        rows: list[np.ndarray | None] = [None] * len(keys)
+        hits = near_hits = 0
+
+        with self._lock:
+            pending = []
+            for i, key in enumerate(keys):
+                vector = self._get(key)
+                if vector is not None:
+                    rows[i] = vector
+                    hits += 1
+                else:
+                    pending.append(i)
+
+            from_disk = self._read([keys[i] for i in pending])
+            self._disk_hits += len({keys[i] for i in pending} & from_disk.keys())
+            still_pending = []
+            for i in pending:
+                if keys[i] in from_disk:
+                    rows[i] = from_disk[keys[i]]
+                    hits += 1
+                elif self._max_distance is not None:
+                    slot = self._nearest(hashes[i])
+                    if slot is not None and self._vectors is not None:
+                        rows[i] = self._vectors[slot].copy()
+                        near_hits += 1
+                    else:
+                        still_pending.append(i)
+                else:
+                    still_pending.append(i)
+
+        # Within the batch, reuse the first frame encoded for a key or hash
+        encode_idx: list[int] = []
+        source: dict[int, int] = {}
+        first_of_key: dict[bytes, int] = {}
+        for i in still_pending:
+            if keys[i] in first_of_key:
+                source[i] = first_of_key[keys[i]]
+                hits += 1
+                continue
+            if self._max_distance is not None and encode_idx:
+                distances = hamming_distances(hashes[encode_idx], hashes[i])
+                nearest = int(np.argmin(distances))
+                if distances[nearest] <= self._max_distance:
+                    source[i] = encode_idx[nearest]
+                    near_hits += 1
+                    continue
+            first_of_key[keys[i]] = i
+            encode_idx.append(i)
+
+        elapsed = 0.0
+        if encode_idx:
+            start = time.perf_counter()
+            encoded = np.asarray(encode(frames[encode_idx]), dtype=np.float32)
+            elapsed = time.perf_counter() - start
+            for i, vector in zip(encode_idx, encoded, strict=True):
+                rows[i] = vector
+            for i, j in source.items():
+                rows[i] = rows[j]
+            self._store([keys[i] for i in encode_idx], hashes[encode_idx], encoded)
+
+        with self._lock:
+            self._hits += hits
+            self._near_hits += near_hits
+            self._misses += len(encode_idx)
+            self._encode_seconds += elapsed
+
+        return np.stack([row for row in rows if row is not None])
+
+    def _get(self, key: bytes) -> np.ndarray | None:
+        """Copy of the in-memory embedding of ``key`` (lock held)."""
+        slot = self._slots.get(key)
+        if slot is None or self._vectors is None:
+            return None
+        self._slots.move_to_end(key)
+        vector: np.ndarray = self._vectors[slot].copy()
+        return vector
+
+    def _nearest(self, query: np.ndarray) -> int | None:
+        """Slot of the closest in-memory hash within max_distance (lock held)."""
+        if not self._slots or self._max_distance is None:
+            return None
+        live = np.flatnonzero(self._live)
+        distances = hamming_distances(self._hashes[live], query)
+        best = int(np.argmin(distances))
+        if distances[best] > self._max_distance:
+            return None
+        return int(live[best])
+
+    def _read(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        """Embeddings of ``keys`` from the on-disk store (lock held)."""
+        found: dict[bytes, np.ndarray] = {}
+        if self._conn is None or not keys:
+            return found
+        unique = list(dict.fromkeys(keys))
+        for i in range(0, len(unique), _SQL_CHUNK):
+            chunk = unique[i : i + _SQL_CHUNK]
+            rows = self._conn.execute(
+                "SELECT key, phash, vector FROM frames WHERE namespace = ? "
+                f"AND key IN ({','.join('?' * len(chunk))})",
+                [self._namespace, *chunk],
+            ).fetchall()
+            for key, phash, vector in rows:
+                embedding = np.frombuffer(vector, dtype=np.float32).copy()
+                found[bytes(key)] = embedding
+                self._remember(
+                    bytes(key), np.frombuffer(phash, dtype=np.uint8), embedding
+                )
+        return found
+
+    def _store(
+        self, keys: list[bytes], hashes: np.ndarray, vectors: np.ndarray
+    ) -> None:
+        """Add newly encoded embeddings to memory and to the store."""
+        with self._lock:
+            for key, phash, vector in zip(keys, hashes, vectors, strict=True):
+                self._remember(key, phash, vector)
+            if self._conn is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO frames (namespace, key, phash, vector) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (self._namespace, key, phash.tobytes(), vector.tobytes())
+                        for key, phash, vector in zip(
+                            keys, hashes, vectors, strict=True
+                        )
+                    ],
+                )
+                self._conn.commit()
+
+    def _remember(self, key: bytes, phash: np.ndarray, vector: np.ndarray) -> None:
+        """Insert into the memory LRU, evicting the oldest (lock held)."""
+        if self._capacity == 0:
+            return
+        if self._vectors is None:
+            self._vectors = np.zeros((self._capacity, len(vector)), dtype=np.float32)
+        slot = self._slots.get(key)
+        if slot is None:
+            if len(self._slots) == self._capacity:
+                _, slot = self._slots.popitem(last=False)
+            else:
+                slot = len(self._slots)
+        self._slots[key] = slot
+        self._slots.move_to_end(key)
+        self._hashes[slot] = phash
+        self._vectors[slot] = vector
+        self._live[slot] = True
+
+    def _preload(self) -> None:
+        """Load the most recently stored entries of this namespace."""
+        if self._conn is None or self._capacity == 0:
+            return
+        rows = self._conn.execute(
+            "SELECT key, phash, vector FROM frames WHERE namespace = ? "
+            "ORDER BY rowid DESC LIMIT ?",
+            (self._namespace, self._capacity),
+        ).fetchall()
+        for key, phash, vector in reversed(rows):
+            self._remember(
+                bytes(key),
+                np.frombuffer(phash, dtype=np.uint8),
+                np.frombuffer(vector, dtype=np.float32),
+            )
+
+    def clear(self) -> None:
+        """Drop every cached embedding of this namespace, memory and disk."""
+        with self._lock:
+            self._slots.clear()
+            self._live[:] = False
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM frames WHERE namespace = ?", (self._namespace,)
+                )
+                self._conn.commit()
+
+    def close(self) -> None:
+        """Close the persistent store; the cache keeps working in memory."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def stats(self) -> FrameCacheStats:
+        """Current counters."""
+        with self._lock:
+            return FrameCacheStats(
+                hits=self._hits,
+                near_hits=self._near_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                encode_seconds=self._encode_seconds,
+                size=len(self._slots),
+                capacity=self._capacity,
+            )
+
+
+class CachedVisualEncoder:
+    """Visual encoder wrapper that serves repeated frames from a cache.
+
+    Implements the same ``encode`` / ``encode_single`` interface as the
+    encoder it wraps, so pipelines use it unchanged.
+
+    Example:
+        encoder = CachedVisualEncoder(PlaceholderVisualEncoder(), cache)
+        embedding = encoder.encode_single(frame)
+    """
+
+    def __init__(self, encoder: Any, cache: FrameEmbeddingCache) -> None:
+        """Wrap ``encoder``.
+
+        Args:
+            encoder: Visual encoder with ``encode(frames) -> (B, D)``
+            cache: Frame embedding cache for this encoder
+        """
+        self._encoder = encoder
+        self._cache = cache
+
+    @property
+    def encoder(self) -> Any:
+        """The wrapped encoder."""
+        return self._encoder
+
+    @property
+    def cache(self) -> FrameEmbeddingCache:
+        """Frame embedding cache in use (see ``cache.stats``)."""
+        return self._cache
+
+    def encode(self, frames: np.ndarray) -> np.ndarray:
+        """Encode frames, reusing cached embeddings of repeated frames.
+
+        Args:
+            frames: Batch of frames, shape (B, 3, 224, 224)
+
+        Returns:
+            Embeddings, shape (B, D)
+        """
+        if len(frames) == 0:
+            result: np.ndarray = self._encoder.encode(frames)
+            return result
+        return self._cache.encode(frames, self._encoder.encode)
+
+    def encode_single(self, frame: np.ndarray) -> np.ndarray:
+        """Encode a single frame.
+
+        Args:
+            frame: Single frame, shape (3, 224, 224)
+
+        Returns:
+            Embedding, shape (D,)
+        """
+        result: np.ndarray = self.encode(frame[np.newaxis, ...])[0]
+        return result
@@ -8,15 +8,62 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from .metadata_store import MetadataStore
+from .quantization import CODECS, EmbeddingCodec, make_codec
+
 logger = logging.getLogger(__name__)
 
 
+def _append_rows(
+    matrix: np.ndarray, count: int, rows: np.ndarray, initial_capacity: int
+) -> np.ndarray:
+    """Write rows into matrix[count:], doubling capacity when full.
+
+    Works for 1D arrays (one value per row) as well as 2D matrices.
+
+    Returns:
+        The matrix holding count + len(rows) live rows (may be a new array)
+    """
+    required = count + len(rows)
+    capacity = len(matrix)
+    if required > capacity:
+        new_capacity = max(capacity, initial_capacity)
+        while new_capacity < required:
+            new_capacity *= 2
+        grown = np.empty((new_capacity, *matrix.shape[1:]), dtype=matrix.dtype)
+        grown[:count] = matrix[:count]
+        matrix = grown
+
+    matrix[count:required] = rows
+    return matrix
+
+
+def _top_k(scores: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Top-k columns of a (Q, N) score matrix, sorted descending per row.
+
+    Returns:
+        (top scores, column indices), each of shape (Q, k)
+    """
+    if k < scores.shape[1]:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    return np.take_along_axis(top_scores, order, axis=1), np.take_along_axis(
+        top, order, axis=1
+    )
+
+
 @dataclass
 class SearchResult:
     """Search result with ID, score, and optional metadata."""
@@ -26,6 +73,85 @@ class SearchResult:
     metadata: dict[str, Any] | None = None
 
 
+@dataclass
+class BatchSearchResult:
+    """Compact result of a multi-query search.
+
+    Holds the raw (Q, k) id and score matrices returned by a single
+    FAISS/BLAS call. ``SearchResult`` objects are only built when a row
+    is accessed, so bulk consumers can work on the arrays directly.
+
+    Attributes:
+        ids: Entry IDs (Q, k), -1 where fewer than k hits exist
+        scores: Similarity scores (Q, k), sorted descending per row
+        metadata_map: Index metadata used for lazy conversion (only the
+            rows of returned hits are decoded)
+    """
+
+    ids: np.ndarray
+    scores: np.ndarray
+    metadata_map: Mapping[int, dict[str, Any]] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return int(self.ids.shape[0])
+
+    def __getitem__(self, q: int) -> list[SearchResult]:
+        """Convert results of query ``q`` to SearchResult objects."""
+        results = []
+        for id_, score in zip(
+            self.ids[q].tolist(), self.scores[q].tolist(), strict=False
+        ):
+            if id_ < 0:  # FAISS returns -1 for missing
+                continue
+            results.append(
+                SearchResult(id=id_, score=score, metadata=self.metadata_map.get(id_))
+            )
+        return results
+
+    def to_results(self) -> list[list[SearchResult]]:
+        """Convert all rows to lists of SearchResult."""
+        return [self[q] for q in range(len(self))]
+
+
+BACKENDS: tuple[str, ...] = ("flat", "ivf", "hnsw")
+
+
+@dataclass
+class BackendPolicy:
+    """Which FAISS backend an EmbeddingIndex grows into.
+
+    The index starts flat (exact) and moves to ``backend`` once it holds
+    ``transition_threshold`` vectors. HNSW needs no training, so it can
+    also be used from the first insert with ``transition_threshold=0``.
+    The numpy fallback ignores the policy and always searches exactly.
+
+    Attributes:
+        backend: Target backend: "flat" (never transition), "ivf", "hnsw"
+        transition_threshold: Size at which to leave the flat index
+            (None = EmbeddingIndex.IVF_THRESHOLD)
+        hnsw_m: HNSW neighbours per node
+        hnsw_ef_construction: HNSW candidate list size while inserting
+        hnsw_ef_search: HNSW candidate list size while searching
+    """
+
+    backend: str = "ivf"
+    transition_threshold: int | None = None
+    hnsw_m: int = 32
+    hnsw_ef_construction: int = 40
+    hnsw_ef_search: int = 64
+
+    def __post_init__(self) -> None:
+        """Validate policy."""
+        if self.backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}")
+        if self.transition_threshold is not None and self.transition_threshold < 0:
+            raise ValueError("transition_threshold must be >= 0")
+        if self.transition_threshold == 0 and self.backend == "ivf":
+            raise ValueError("ivf needs training data, transition_threshold > 0")
+        if min(self.hnsw_m, self.hnsw_ef_construction, self.hnsw_ef_search) < 1:
+            raise ValueError("HNSW parameters must be >= 1")
+
+
 class EmbeddingIndex:
     """FAISS embedding index for similarity search.
 
@@ -34,7 +160,13 @@ class EmbeddingIndex:
 
     Features:
     - Flat index for small collections (<1000)
-    - Automatic IVF transition for large collections
+    - Automatic IVF or HNSW transition for large collections (BackendPolicy)
+    - Optional background IVF rebuild that keeps serving from the flat index
+    - Search-time nprobe and recall-targeted nprobe calibration for IVF
+    - Compressed storage codecs (float16, sq8, pq) with optional exact
+      re-ranking of the top candidates
+    - remove() / upsert() via tombstones, excluded at search time and
+      reclaimed by compaction
 
     Example:
         index = EmbeddingIndex()
@@ -43,19 +175,85 @@ class EmbeddingIndex:
     """
 
     DIM: int = 768
-    IVF_THRESHOLD: int = 1000  # Switch to IVF above this
+    IVF_THRESHOLD: int = 1000  # Default BackendPolicy transition threshold
+    INITIAL_CAPACITY: int = 64  # Rows preallocated by the numpy fallback
+    COMPACTION_RATIO: float = 0.25  # Deleted row fraction that triggers compact()
+    EXACT_SUBSET_ROWS: int = 4096  # Id-restricted searches this small skip FAISS
 
-    def __init__(self, dimension: int = 768) -> None:
+    def __init__(
+        self,
+        dimension: int = 768,
+        background_rebuild: bool = False,
+        codec: str = "float32",
+        rerank_factor: int = 0,
+        pq_subvectors: int = 96,
+        policy: BackendPolicy | None = None,
+    ) -> None:
         """Initialize empty index.
 
+        Codecs trade memory for recall. "float16" is used from the first
+        insert; "sq8" and "pq" need training data and take effect at the
+        IVF transition (IndexIVFScalarQuantizer / IndexIVFPQ, or the numpy
+        equivalents in quantization.py when FAISS is missing).
+
         Args:
             dimension: Embedding dimension
+            background_rebuild: Build the IVF/HNSW index on a background
+                thread instead of blocking the add_batch call that crosses
+                the transition threshold
+            codec: Storage codec, one of "float32", "float16", "sq8", "pq"
+            rerank_factor: If > 0 with a lossy codec, fetch
+                k * rerank_factor candidates and re-rank them exactly
+                against a float32 copy of the vectors
+            pq_subvectors: Sub-vectors per embedding for the "pq" codec
+            policy: Backend policy (default: IVF at IVF_THRESHOLD)
+
+        Raises:
+            ValueError: If codec is unknown, rerank_factor is negative, or
+                the codec needs training but the policy uses HNSW
         """
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}', expected one of {CODECS}")
+        if rerank_factor < 0:
+            raise ValueError("rerank_factor must be >= 0")
+        self._policy = policy or BackendPolicy()
+        if self._policy.backend == "hnsw" and codec in ("sq8", "pq"):
+            raise ValueError("hnsw backend supports float32 and float16 codecs")
+
         self._dimension = dimension
+        self._codec: EmbeddingCodec = make_codec(codec, dimension, pq_subvectors)
+        self._pq_subvectors = pq_subvectors
+        self._rerank_factor = rerank_factor if codec != "float32" else 0
+        # Exact float32 copy used for re-ranking lossy codecs
+        self._rerank_vectors: np.ndarray | None = None
+        if self._rerank_factor > 0:
+            self._rerank_vectors = np.empty(
+                (self.INITIAL_CAPACITY, dimension), dtype=np.float32
+            )
         self._index: Any = None
-        self._id_map: list[int] = []
-        self._metadata: dict[int, dict[str, Any]] = {}
+        # Row position -> id (first _num_rows entries). Rows are never
+        # reordered except by compaction.
+        self._id_array = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self._num_rows = 0
+        # Live id -> row position, built on first use (see _position_map)
+        self._positions: dict[int, int] | None = {}
+        self._deleted: set[int] = set()  # tombstoned row positions
+        self._deleted_selector: Any = None  # cached FAISS IDSelector
+        # Live ids sorted, with their positions (see _lookup_positions)
+        self._id_lookup: tuple[np.ndarray, np.ndarray] | None = None
+        self._mmapped = False  # FAISS storage is a read-only file mapping
+        self._metadata = MetadataStore()
         self._use_ivf = False
+        self._use_hnsw = False
+        self._nprobe: int | None = None  # None = FAISS default
+
+        # Background IVF rebuild state (guarded by _lock)
+        self._background_rebuild = background_rebuild
+        self._lock = threading.RLock()
+        self._rebuild_thread: threading.Thread | None = None
+        self._rebuild_buffer: list[np.ndarray] = []
+        self._rebuild_status = "idle"  # idle | running | completed | failed
+        self._rebuild_duration: float | None = None
 
         self._init_index()
 
@@ -64,19 +262,174 @@ class EmbeddingIndex:
         try:
             import faiss
 
-            # Start with flat index
-            self._index = faiss.IndexFlatIP(self._dimension)
+            # Start with flat index (half precision for the float16 codec)
+            if self._transition_threshold == 0 and self._policy.backend == "hnsw":
+                self._index = self._new_hnsw_index()
+                self._use_hnsw = True
+            elif self._codec.name == "float16":
+                self._index = faiss.IndexScalarQuantizer(
+                    self._dimension,
+                    faiss.ScalarQuantizer.QT_fp16,
+                    faiss.METRIC_INNER_PRODUCT,
+                )
+            else:
+                self._index = faiss.IndexFlatIP(self._dimension)
             logger.debug(f"Initialized flat index, dim={self._dimension}")
 
         except ImportError:
             logger.warning("FAISS not installed, using numpy fallback")
             self._index = None
-            self._embeddings: list[np.ndarray] = []
+            # Contiguous (capacity, width) matrix; only the first _num_vectors
+            # rows are live. Capacity doubles on demand. Rows are raw float32
+            # until the codec is trained, codec codes afterwards.
+            width = self._dimension
+            if self._codec.is_trained:
+                width = self._codec.code_width
+            self._vectors = np.empty(
+                (self.INITIAL_CAPACITY, width), dtype=self._vectors_dtype()
+            )
+            self._num_vectors = 0
+
+    @property
+    def _transition_threshold(self) -> int:
+        """Size at which the flat index is replaced by the policy backend."""
+        if self._policy.transition_threshold is not None:
+            return self._policy.transition_threshold
+        return self.IVF_THRESHOLD
+
+    @property
+    def policy(self) -> BackendPolicy:
+        """Backend policy."""
+        return self._policy
+
+    @property
+    def backend(self) -> str:
+        """Active search backend: "flat", "ivf", "hnsw" or "numpy"."""
+        if self._index is None:
+            return "numpy"
+        if self._use_ivf:
+            return "ivf"
+        if self._use_hnsw:
+            return "hnsw"
+        return "flat"
+
+    def _append_vectors(self, embeddings: np.ndarray) -> None:
+        """Append rows to the numpy fallback matrix, growing it if needed."""
+        if self._codec.is_trained:
+            embeddings = self._codec.encode(embeddings)
+        self._vectors = _append_rows(
+            self._vectors, self._num_vectors, embeddings, self.INITIAL_CAPACITY
+        )
+        self._num_vectors += len(embeddings)
+
+        # Train alongside the policy's backend switch (on the first rows at 0)
+        threshold = max(self._transition_threshold, 1)
+        if not self._codec.is_trained and self._num_vectors >= threshold:
+            self._train_fallback_codec()
+
+    def _train_fallback_codec(self) -> None:
+        """Train the numpy codec on stored rows and re-encode them in place."""
+        raw = self._fallback_matrix()
+        logger.info(f"Training {self._codec.name} codec on {len(raw)} vectors")
+        self._codec.train(raw)
+        codes = self._codec.encode(raw)
+        self._vectors = np.empty(
+            (len(self._vectors), self._codec.code_width), dtype=self._codec.dtype
+        )
+        self._vectors[: len(codes)] = codes
+
+    def _vectors_dtype(self) -> Any:
+        """dtype of fallback rows: codec codes once trained, else float32."""
+        return self._codec.dtype if self._codec.is_trained else np.float32
+
+    def _fallback_matrix(self) -> np.ndarray:
+        """View of the live rows of the numpy fallback matrix (no copy)."""
+        return self._vectors[: self._num_vectors]
+
+    def _fallback_scores(
+        self, queries: np.ndarray, rows: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Inner products (Q, N) against the numpy fallback rows.
+
+        Args:
+            queries: Query embeddings (Q, D)
+            rows: Only score these row positions (None = all rows)
+        """
+        matrix = self._fallback_matrix()
+        if rows is not None:
+            matrix = matrix[rows]
+        if self._codec.is_trained:
+            return self._codec.score(queries, matrix)
+        result: np.ndarray = queries @ matrix.T
+        return result
+
+    @property
+    def codec(self) -> str:
+        """Name of the storage codec."""
+        return self._codec.name
+
+    @property
+    def bytes_per_vector(self) -> int:
+        """Embedding storage bytes per vector in the current state.
+
+        Includes the float32 re-rank copy when enabled; excludes ids and
+        metadata. Codecs that need training report float32 size until the
+        IVF transition.
+        """
+        if self._index is not None:
+            compressed = self._use_ivf or not self._codec.needs_training
+        else:
+            compressed = self._codec.is_trained
+        size = self._codec.bytes_per_vector if compressed else 4 * self._dimension
+        if self._rerank_vectors is not None:
+            size += 4 * self._dimension
+        if self._use_hnsw:
+            # Level-0 adjacency: 2 * M int32 neighbour ids
+            size += 2 * self._policy.hnsw_m * 4
+        return size
 
     @property
     def size(self) -> int:
-        """Get number of embeddings in index."""
-        return len(self._id_map)
+        """Get number of live (not deleted) embeddings in index."""
+        return self._num_rows - len(self._deleted)
+
+    @property
+    def _id_map(self) -> list[int]:
+        """Row position -> id, tombstoned rows included."""
+        ids: list[int] = self._id_array[: self._num_rows].tolist()
+        return ids
+
+    @property
+    def ids(self) -> list[int]:
+        """Live ids in row order (matches reconstruct_all())."""
+        with self._lock:
+            ids: list[int] = self._id_array[self._live_positions()].tolist()
+            return ids
+
+    def __contains__(self, id: int) -> bool:
+        with self._lock:
+            return id in self._position_map()
+
+    def _position_map(self) -> dict[int, int]:
+        """Live id -> row position, built lazily after load().
+
+        Building it is O(N) Python work, so loaded indexes only pay for it
+        on the first insert, removal or membership test, not on search.
+        """
+        if self._positions is None:
+            positions: dict[int, int] = {}
+            ids = self._id_array[: self._num_rows].tolist()
+            for position, id_ in enumerate(ids):
+                if position in self._deleted:
+                    continue
+                if id_ in positions:
+                    # Files from before upsert kept duplicate ids: newest wins
+                    self._deleted.add(positions[id_])
+                    self._deleted_selector = None
+                    self._id_lookup = None
+                positions[id_] = position
+            self._positions = positions
+        return self._positions
 
     def add(
         self,
@@ -86,6 +439,9 @@ class EmbeddingIndex:
     ) -> None:
         """Add single embedding to index.
 
+        Adding an id that is already present replaces its embedding and
+        metadata (see upsert()).
+
         Args:
             embedding: L2-normalized embedding (768,)
             id: Unique identifier
@@ -107,6 +463,9 @@ class EmbeddingIndex:
 
         EDGE_CASE: EC038 - IVF transition at 1000 vectors
 
+        Ids already in the index are replaced: the old row is tombstoned
+        and its metadata dropped.
+
         Args:
             embeddings: L2-normalized embeddings (N, 768)
             ids: List of unique identifiers
@@ -118,104 +477,580 @@ class EmbeddingIndex:
         # Ensure float32
         embeddings = embeddings.astype(np.float32)
 
-        # Check if we need to transition to IVF
-        new_size = self.size + len(embeddings)
-        transitioned_to_ivf = False
-        if new_size >= self.IVF_THRESHOLD and not self._use_ivf:
-            transitioned_to_ivf = self._transition_to_ivf(embeddings)
+        with self._lock:
+            # Check if the policy moves us off the flat index
+            new_size = self.size + len(embeddings)
+            needs_transition = (
+                new_size >= self._transition_threshold
+                and self.backend == "flat"
+                and self._policy.backend != "flat"
+            )
+            transitioned = False
+            if needs_transition and not self._background_rebuild:
+                transitioned = self._transition_backend(
+                    embeddings, self._policy.backend
+                )
 
-        # Add to index (skip if just transitioned - IVF already has the embeddings)
-        if not transitioned_to_ivf:
-            if self._index is not None:
-                self._index.add(embeddings)
-            else:
-                # Numpy fallback
-                for emb in embeddings:
-                    self._embeddings.append(emb)
-
-        # Update mappings
-        self._id_map.extend(ids)
-
-        if metadata:
-            if isinstance(metadata, dict):
-                # Dict keyed by id
-                for id_, meta in metadata.items():
-                    if meta:
-                        self._metadata[id_] = meta
-            else:
-                # List of metadata
-                for id_, meta in zip(ids, metadata, strict=False):
-                    if meta:
-                        self._metadata[id_] = meta
+            # Add to index (skip if just transitioned - new index has them)
+            if not transitioned:
+                if self._index is not None:
+                    self._ensure_writable()
+                    self._index.add(embeddings)
+                    if self._rebuild_status == "running":
+                        # Replayed into the IVF index before the swap
+                        self._rebuild_buffer.append(embeddings)
+                else:
+                    # Numpy fallback
+                    self._append_vectors(embeddings)
+
+            start = self._num_rows
+            if self._rerank_vectors is not None:
+                self._rerank_vectors = _append_rows(
+                    self._rerank_vectors, start, embeddings, self.INITIAL_CAPACITY
+                )
+
+            # Update mappings, tombstoning rows of re-added ids
+            positions = self._position_map()
+            self._id_array = _append_rows(
+                self._id_array,
+                start,
+                np.asarray(ids, dtype=np.int64),
+                self.INITIAL_CAPACITY,
+            )
+            self._num_rows += len(ids)
+            for offset, id_ in enumerate(ids):
+                replaced = positions.get(id_)
+                if replaced is not None:
+                    self._deleted.add(replaced)
+                    self._deleted_selector = None
+                    self._metadata.pop(id_, None)
+                positions[id_] = start + offset
+            self._id_lookup = None
+
+            if metadata:
+                if isinstance(metadata, dict):
+                    # Dict keyed by id
+                    for id_, meta in metadata.items():
+                        if meta:
+                            self._metadata[id_] = meta
+                else:
+                    # List of metadata
+                    for id_, meta in zip(ids, metadata, strict=False):
+                        if meta:
+                            self._metadata[id_] = meta
+
+            # Background mode: flat index (now holding this batch) keeps serving
+            if (
+                needs_transition
+                and self._background_rebuild
+                and self._rebuild_status != "failed"
+            ):
+                self._start_background_rebuild(self._policy.backend)
 
         logger.debug(f"Added {len(embeddings)} embeddings, total={self.size}")
 
+    def upsert(
+        self,
+        embedding: np.ndarray,
+        id: int,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Insert an embedding, replacing any existing entry with this id.
+
+        Args:
+            embedding: L2-normalized embedding (768,)
+            id: Identifier to insert or replace
+            metadata: Optional metadata dict (replaces the old metadata)
+        """
+        self.add(embedding, id=id, metadata=metadata)
+
+    def remove(self, ids: list[int]) -> int:
+        """Remove entries by id.
+
+        Removed rows are tombstoned and excluded from every search right
+        away. Once tombstones exceed COMPACTION_RATIO of the stored rows,
+        the index is compacted (on the background thread in
+        background_rebuild mode).
+
+        Args:
+            ids: Identifiers to remove (unknown ids are ignored)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            positions = self._position_map()
+            removed = 0
+            for id_ in ids:
+                position = positions.pop(id_, None)
+                if position is None:
+                    continue
+                self._deleted.add(position)
+                self._metadata.pop(id_, None)
+                removed += 1
+
+            if removed:
+                self._deleted_selector = None
+                self._id_lookup = None
+                if len(self._deleted) > self.COMPACTION_RATIO * self._num_rows:
+                    if self._background_rebuild and self._index is not None:
+                        self._start_background_rebuild(self.backend)
+                    else:
+                        self.compact()
+
+        logger.debug(f"Removed {removed} embeddings, total={self.size}")
+        return removed
+
+    def compact(self) -> int:
+        """Drop tombstoned rows from storage, keeping the backend.
+
+        FAISS indexes are emptied and refilled through a clone, so trained
+        IVF quantizers and codecs are reused without retraining.
+
+        Returns:
+            Number of rows reclaimed (0 while a background rebuild runs;
+            the rebuild drops tombstoned rows itself)
+        """
+        with self._lock:
+            if not self._deleted or self._rebuild_status == "running":
+                return 0
+
+            self._ensure_writable()
+            reclaimed = len(self._deleted)
+            keep = self._live_positions()
+            if self._index is None:
+                self._vectors = np.ascontiguousarray(self._fallback_matrix()[keep])
+                self._num_vectors = len(keep)
+            else:
+                self._index = self._refilled_index(self._compaction_rows(keep))
+            self._remap_rows(keep)
+
+        logger.info(f"Compacted index, reclaimed {reclaimed} rows")
+        return reclaimed
+
+    def _ensure_writable(self) -> None:
+        """Swap a memory-mapped FAISS index for an owned copy before writes.
+
+        FAISS aborts the process when mapped storage is resized, so the
+        first mutation after load(mmap=True) pays for one full copy.
+        Mapped numpy arrays need no copy: appends reallocate them anyway.
+        """
+        if not self._mmapped:
+            return
+
+        import faiss
+
+        logger.info("Copying memory-mapped index into memory before writing")
+        self._index = faiss.deserialize_index(faiss.serialize_index(self._index))
+        self._mmapped = False
+
+    def _live_positions(self) -> np.ndarray:
+        """Row positions that are not tombstoned, ascending."""
+        live = np.ones(self._num_rows, dtype=bool)
+        live[list(self._deleted)] = False
+        return np.flatnonzero(live)
+
+    def _compaction_rows(self, keep: np.ndarray) -> np.ndarray:
+        """Embeddings of the kept rows, exact when a re-rank copy exists."""
+        source = self._rerank_vectors
+        if source is None:
+            source = self._reconstruct_all()
+        rows: np.ndarray = source[keep]
+        return rows
+
+    def _refilled_index(self, embeddings: np.ndarray) -> Any:
+        """Empty clone of the current FAISS index (same training) with rows."""
+        import faiss
+
+        new_index = faiss.clone_index(self._index)
+        new_index.reset()
+        new_index.add(np.ascontiguousarray(embeddings, dtype=np.float32))
+        return new_index
+
+    def _remap_rows(self, rows: np.ndarray) -> None:
+        """Renumber row state after storage was rebuilt from old ``rows``.
+
+        New position i holds the old row rows[i]. Rows missing from
+        ``rows`` are dropped; tombstones of kept rows carry over.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        deleted = np.zeros(self._num_rows, dtype=bool)
+        deleted[list(self._deleted)] = True
+
+        self._id_array = np.ascontiguousarray(self._id_array[rows])
+        self._num_rows = len(rows)
+        self._deleted = set(np.flatnonzero(deleted[rows]).tolist())
+        self._deleted_selector = None
+        self._id_lookup = None
+        if self._rerank_vectors is not None:
+            self._rerank_vectors = np.ascontiguousarray(self._rerank_vectors[rows])
+        self._positions = None
+
+    def _lookup_positions(self, ids: Any) -> np.ndarray:
+        """Sorted, unique row positions of the live ids among ``ids``.
+
+        Unknown and removed ids are dropped.
+        """
+        positions = self._positions_of(ids)
+        return np.unique(positions[positions >= 0])
+
+    def _positions_of(self, ids: Any) -> np.ndarray:
+        """Row position of each id in ``ids`` (-1 if unknown or removed).
+
+        Vectorized over a sorted id table that is rebuilt only after the
+        rows change.
+        """
+        if self._id_lookup is None:
+            live = self._live_positions()
+            live_ids = self._id_array[live]
+            order = np.argsort(live_ids, kind="stable")
+            self._id_lookup = (live_ids[order], live[order])
+        sorted_ids, sorted_positions = self._id_lookup
+
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        # Rightmost match: the newest row if a legacy file repeats an id
+        slots = np.searchsorted(sorted_ids, ids, side="right") - 1
+        found = slots >= 0
+        found[found] = sorted_ids[slots[found]] == ids[found]
+        positions = np.full(len(ids), -1, dtype=np.int64)
+        positions[found] = sorted_positions[slots[found]]
+        return positions
+
     def _transition_to_ivf(self, new_embeddings: np.ndarray) -> bool:
         """Transition from flat to IVF index.
 
         EDGE_CASE: EC038
 
+        Returns:
+            True if transition succeeded, False otherwise
+        """
+        return self._transition_backend(new_embeddings, "ivf")
+
+    def _transition_backend(self, new_embeddings: np.ndarray, backend: str) -> bool:
+        """Replace the flat index by an IVF or HNSW index holding all vectors.
+
+        Tombstoned rows are left out of the new index.
+
         Returns:
             True if transition succeeded, False otherwise
         """
         try:
-            import faiss
+            import faiss  # noqa: F401
 
-            logger.info(f"Transitioning to IVF index at {self.size} vectors")
+            logger.info(f"Transitioning to {backend} index at {self.size} vectors")
 
-            # Get all existing embeddings
-            if self._index is not None and self.size > 0:
-                existing = self._reconstruct_all()
+            # Get all existing live embeddings
+            keep = self._live_positions()
+            if self._index is not None and len(keep) > 0:
+                existing = self._reconstruct_all()[keep]
                 all_embeddings = np.concatenate([existing, new_embeddings], axis=0)
             else:
                 all_embeddings = new_embeddings
 
-            # Create IVF index
-            nlist = max(int(np.sqrt(len(all_embeddings))), 10)
-            quantizer = faiss.IndexFlatIP(self._dimension)
-            new_index = faiss.IndexIVFFlat(quantizer, self._dimension, nlist)
-
-            # Train and add
-            new_index.train(all_embeddings)
-            new_index.add(all_embeddings)
-
-            self._index = new_index
-            self._use_ivf = True
+            self._index = self._build_backend_index(backend, all_embeddings)
+            self._set_backend_flags(backend)
+            self._remap_rows(keep)
             return True
 
         except Exception as e:
-            logger.error(f"IVF transition failed: {e}, keeping flat index")
+            logger.error(f"{backend} transition failed: {e}, keeping flat index")
             return False
 
+    def _set_backend_flags(self, backend: str) -> None:
+        self._use_ivf = backend == "ivf"
+        self._use_hnsw = backend == "hnsw"
+
+    def _build_backend_index(self, backend: str, embeddings: np.ndarray) -> Any:
+        """Build a populated index of the given backend from embeddings."""
+        if backend == "hnsw":
+            new_index = self._new_hnsw_index()
+            new_index.add(embeddings)
+            return new_index
+        return self._build_ivf_index(embeddings)
+
+    def _new_hnsw_index(self) -> Any:
+        """Create an empty HNSW index configured from the policy."""
+        import faiss
+
+        m = self._policy.hnsw_m
+        new_index: Any
+        if self._codec.name == "float16":
+            new_index = faiss.IndexHNSWSQ(
+                self._dimension,
+                faiss.ScalarQuantizer.QT_fp16,  # type: ignore[arg-type]
+                m,
+                faiss.METRIC_INNER_PRODUCT,
+            )
+        else:
+            new_index = faiss.IndexHNSWFlat(
+                self._dimension, m, faiss.METRIC_INNER_PRODUCT
+            )
+        new_index.hnsw.efConstruction = self._policy.hnsw_ef_construction
+        new_index.hnsw.efSearch = self._policy.hnsw_ef_search
+        return new_index
+
+    def _build_ivf_index(self, embeddings: np.ndarray) -> Any:
+        """Train a new IVF index on embeddings and add them to it."""
+        import faiss
+
+        nlist = max(int(np.sqrt(len(embeddings))), 10)
+        quantizer = faiss.IndexFlatIP(self._dimension)
+        metric = faiss.METRIC_INNER_PRODUCT
+        new_index: Any
+        if self._codec.name == "float16":
+            new_index = faiss.IndexIVFScalarQuantizer(
+                quantizer,
+                self._dimension,
+                nlist,
+                faiss.ScalarQuantizer.QT_fp16,
+                metric,
+            )
+        elif self._codec.name == "sq8":
+            new_index = faiss.IndexIVFScalarQuantizer(
+                quantizer,
+                self._dimension,
+                nlist,
+                faiss.ScalarQuantizer.QT_8bit,
+                metric,
+            )
+        elif self._codec.name == "pq":
+            new_index = faiss.IndexIVFPQ(
+                quantizer, self._dimension, nlist, self._pq_subvectors, 8, metric
+            )
+        else:
+            new_index = faiss.IndexIVFFlat(quantizer, self._dimension, nlist, metric)
+        if self._nprobe is not None:
+            new_index.nprobe = min(self._nprobe, nlist)
+
+        new_index.train(embeddings)
+        # Keep position -> list offset so reconstruction is a single call
+        new_index.make_direct_map()
+        new_index.add(embeddings)
+        return new_index
+
+    def _start_background_rebuild(self, backend: str) -> None:
+        """Start rebuilding the index as ``backend`` on a background thread.
+
+        Must be called with _lock held. Used both for the flat -> policy
+        backend transition and for compaction (``backend`` equal to the
+        active one). Snapshots the live rows; inserts arriving while the
+        build runs keep going to the current index (which keeps serving
+        searches) and are buffered for replay before the swap. Removals in
+        the meantime stay tombstoned across the swap. A failed transition
+        is not retried; the current index stays in service.
+        """
+        if self._rebuild_status == "running":
+            return
+
+        logger.info(f"Starting background {backend} rebuild at {self.size} vectors")
+        self._ensure_writable()
+        keep = self._live_positions()
+        snapshot = self._compaction_rows(keep)  # fancy indexing copies
+
+        self._rebuild_status = "running"
+        self._rebuild_buffer = []
+        self._rebuild_thread = threading.Thread(
+            target=self._run_background_rebuild,
+            args=(snapshot, keep, self._num_rows, backend),
+            name=f"EmbeddingIndex-{backend}-rebuild",
+            daemon=True,
+        )
+        self._rebuild_thread.start()
+
+    def _run_background_rebuild(
+        self, snapshot: np.ndarray, keep: np.ndarray, base: int, backend: str
+    ) -> None:
+        """Build from snapshot, replay buffered inserts, swap atomically.
+
+        ``keep`` are the snapshot's row positions; rows from ``base`` on
+        were added during the build and come from the buffer.
+        """
+        start = time.perf_counter()
+        try:
+            if backend == self.backend:
+                new_index = self._refilled_index(snapshot)
+            else:
+                new_index = self._build_backend_index(backend, snapshot)
+
+            with self._lock:
+                for batch in self._rebuild_buffer:
+                    new_index.add(batch)
+                self._rebuild_buffer = []
+                self._index = new_index
+                self._set_backend_flags(backend)
+                replayed = np.arange(base, self._num_rows)
+                self._remap_rows(np.concatenate([keep, replayed]))
+                self._rebuild_status = "completed"
+                self._rebuild_duration = time.perf_counter() - start
+
+            logger.info(
+                f"Background index rebuild finished in {self._rebuild_duration:.2f}s"
+            )
+
+        except Exception as e:
+            with self._lock:
+                self._rebuild_buffer = []
+                self._rebuild_status = "failed"
+                self._rebuild_duration = time.perf_counter() - start
+            logger.error(f"Background index rebuild failed: {e}, keeping flat index")
+
+    def wait_for_rebuild(self, timeout: float | None = None) -> bool:
+        """Block until a running background rebuild finishes.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if no rebuild is running anymore
+        """
+        thread = self._rebuild_thread
+        if thread is not None:
+            thread.join(timeout)
+        return self._rebuild_status != "running"
+
+    @property
+    def rebuild_metrics(self) -> dict[str, Any]:
+        """Background IVF rebuild metrics.
+
+        Returns:
+            Dict with status (idle/running/completed/failed), duration in
+            seconds of the last finished rebuild, number of buffered insert
+            batches, whether the IVF index is serving, the active backend,
+            and the number of tombstoned rows awaiting compaction
+        """
+        with self._lock:
+            return {
+                "status": self._rebuild_status,
+                "duration_seconds": self._rebuild_duration,
+                "buffered_batches": len(self._rebuild_buffer),
+                "use_ivf": self._use_ivf,
+                "backend": self.backend,
+                "deleted_rows": len(self._deleted),
+            }
+
+    def reconstruct_all(self) -> np.ndarray:
+        """Return every live embedding as one (N, D) float32 matrix.
+
+        Rows are in insertion order, matching the ``ids`` property. The
+        result is an owned copy, safe to keep across further inserts.
+
+        Returns:
+            Embedding matrix (N, 768)
+        """
+        with self._lock:
+            stored = self._reconstruct_all()
+            if self._deleted:
+                stored = stored[self._live_positions()]
+            return np.array(stored, dtype=np.float32, copy=True)
+
+    def reconstruct(self, ids: Any) -> np.ndarray:
+        """Return the stored embeddings of ``ids`` as one (M, D) float32 matrix.
+
+        Lossy codecs return their decoded approximation unless a re-rank
+        copy is kept.
+
+        Args:
+            ids: Ids to look up (sequence or array)
+
+        Returns:
+            Embedding matrix (M, 768), rows in the order of ``ids``
+
+        Raises:
+            KeyError: If an id is not in the index
+        """
+        with self._lock:
+            positions = self._positions_of(ids)
+            if (positions < 0).any():
+                missing = np.asarray(ids).ravel()[positions < 0]
+                raise KeyError(f"ids not in index: {missing[:5].tolist()}")
+            if len(positions) == 0:
+                return np.empty((0, self._dimension), dtype=np.float32)
+            return np.array(self._subset_rows(positions), dtype=np.float32)
+
+    def get_metadata(self, id: int) -> dict[str, Any] | None:
+        """Metadata stored with ``id`` (None if it has none or is unknown)."""
+        with self._lock:
+            return self._metadata.get(id)
+
     def _reconstruct_all(self) -> np.ndarray:
-        """Reconstruct all embeddings from index."""
+        """Reconstruct all stored rows (tombstoned ones included) in one call.
+
+        Flat float32 and numpy backends return a view of their storage; IVF
+        indexes use reconstruct_n over a direct map. Lossy codecs return
+        their decoded approximation.
+        """
+        if self._index is None:
+            if self._codec.is_trained:
+                return self._codec.decode(self._fallback_matrix())
+            return self._fallback_matrix()
+
         import faiss
 
-        if isinstance(self._index, faiss.IndexFlatIP):
+        ntotal = int(self._index.ntotal)
+        if isinstance(self._index, faiss.IndexFlat):
             result: np.ndarray = faiss.rev_swig_ptr(
-                self._index.get_xb(), self.size * self._dimension
-            ).reshape(self.size, self._dimension)
-            return result
-        else:
-            # For IVF, we'd need to iterate - simplified here
-            embeddings = []
-            for i in range(self.size):
-                embeddings.append(self._index.reconstruct(i))
-            result = np.stack(embeddings)
+                self._index.get_xb(), ntotal * self._dimension
+            ).reshape(ntotal, self._dimension)
             return result
 
+        self._ensure_direct_map()
+        result = self._index.reconstruct_n(0, ntotal)
+        return result
+
+    def _ensure_direct_map(self) -> None:
+        """Enable row reconstruction on IVF indexes saved without a direct map."""
+        if not self._use_ivf:
+            return
+
+        import faiss
+
+        ivf = faiss.extract_index_ivf(self._index)
+        if ivf.direct_map.type == faiss.DirectMap.NoMap:  # type: ignore[attr-defined]
+            # Indexes saved before direct maps were maintained
+            ivf.make_direct_map()
+
+    def _subset_rows(self, positions: np.ndarray) -> np.ndarray:
+        """Embeddings at ``positions``, exact when a re-rank copy exists."""
+        if self._rerank_vectors is not None:
+            rows: np.ndarray = self._rerank_vectors[positions]
+            return rows
+        if self._index is None:
+            rows = self._fallback_matrix()[positions]
+            return self._codec.decode(rows) if self._codec.is_trained else rows
+        self._ensure_direct_map()
+        rows = self._index.reconstruct_batch(positions)
+        return rows
+
+    @property
+    def nprobe(self) -> int | None:
+        """Default number of IVF lists probed per query (None = FAISS default)."""
+        return self._nprobe
+
+    @nprobe.setter
+    def nprobe(self, value: int | None) -> None:
+        if value is not None and value < 1:
+            raise ValueError("nprobe must be >= 1")
+        self._nprobe = value
+        if value is not None and self._use_ivf:
+            self._index.nprobe = value
+
     def search(
         self,
         query: np.ndarray,
         k: int = 5,
+        nprobe: int | None = None,
+        ids: Any = None,
     ) -> list[SearchResult]:
         """Search for similar embeddings.
 
-        INVARIANT: INV012 - Returns exactly min(k, size) results
+        INVARIANT: INV012 - Returns exactly min(k, size) results. Removed
+        ids never appear.
 
         Args:
             query: Query embedding (768,)
             k: Number of results to return
+            nprobe: IVF lists to probe for this query (None = index default)
+            ids: Only consider these ids (None = all), see search_batch()
 
         Returns:
             List of SearchResult, sorted by score descending
@@ -223,41 +1058,252 @@ class EmbeddingIndex:
         if self.size == 0:
             return []
 
-        # Ensure proper shape
-        query = query.reshape(1, -1).astype(np.float32)
-        k = min(k, self.size)  # INV012
+        return self.search_batch(query.reshape(1, -1), k=k, nprobe=nprobe, ids=ids)[0]
 
-        if self._index is not None:
-            scores, indices = self._index.search(query, k)
-            scores = scores[0]
-            indices = indices[0]
-        else:
-            # Numpy fallback
-            all_emb = np.stack(self._embeddings)
-            scores = all_emb @ query.T
-            scores = scores.flatten()
-            indices = np.argsort(scores)[::-1][:k]
-            scores = scores[indices]
+    def search_batch(
+        self,
+        queries: np.ndarray,
+        k: int = 5,
+        nprobe: int | None = None,
+        ids: Any = None,
+    ) -> BatchSearchResult:
+        """Search for many queries with a single FAISS/BLAS call.
 
-        results = []
-        for score, idx in zip(scores, indices, strict=False):
-            if idx < 0:  # FAISS returns -1 for missing
-                continue
+        INVARIANT: INV012 - Each row holds min(k, size) results, or
+        min(k, matching) results when restricted to ``ids``
 
-            id_ = self._id_map[idx]
-            results.append(
-                SearchResult(
-                    id=id_,
-                    score=float(score),
-                    metadata=self._metadata.get(id_),
+        Filtering happens inside the scan (a FAISS IDSelectorBitmap, or
+        scoring only the selected rows in the numpy fallback), so a
+        restricted search costs about as much as a search over the
+        selected rows alone. Subsets of up to EXACT_SUBSET_ROWS ids are
+        scored exactly, as are approximate searches that come back with
+        fewer than k filtered hits.
+
+        Args:
+            queries: Query embeddings (Q, 768)
+            k: Number of results per query
+            nprobe: IVF lists to probe (None = index default). Ignored by
+                exact (flat / numpy) backends.
+            ids: Only consider these ids (None = all). Unknown and
+                removed ids are ignored.
+
+        Returns:
+            BatchSearchResult with (Q, min(k, size)) ids and scores
+
+        Example:
+            batch = index.search_batch(queries, k=10)
+            best_ids = batch.ids[:, 0]  # array form
+            first = batch[0]  # list[SearchResult] for query 0
+        """
+        queries = np.ascontiguousarray(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+
+        if nprobe is not None and nprobe < 1:
+            raise ValueError("nprobe must be >= 1")
+
+        # Compaction renumbers rows: positions and id map must match
+        with self._lock:
+            subset = None if ids is None else self._lookup_positions(ids)
+            candidates = self.size if subset is None else len(subset)
+            k = min(k, candidates)  # INV012
+            if k <= 0:
+                empty_ids = np.empty((len(queries), 0), dtype=np.int64)
+                empty_scores = np.empty((len(queries), 0), dtype=np.float32)
+                return BatchSearchResult(empty_ids, empty_scores, self._metadata)
+
+            if self._rerank_vectors is not None:
+                # Over-fetch from the compressed index, then re-rank exactly
+                fetch_k = min(k * self._rerank_factor, candidates)
+                scores, indices = self._search_positions(
+                    queries, fetch_k, nprobe, subset
                 )
-            )
+                scores, indices = self._rerank(queries, indices, k)
+            else:
+                scores, indices = self._search_positions(queries, k, nprobe, subset)
 
-        return results
+            # Map index positions to user IDs (-1 stays -1)
+            ids = np.where(indices >= 0, self._id_array[np.maximum(indices, 0)], -1)
+
+        return BatchSearchResult(ids, scores, self._metadata)
+
+    def _search_positions(
+        self,
+        queries: np.ndarray,
+        k: int,
+        nprobe: int | None = None,
+        subset: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return (scores, positions) matrices of shape (Q, k).
+
+        Tombstoned rows, and rows outside ``subset`` (sorted live
+        positions) when given, are excluded inside the search, so k live
+        rows come back whenever that many are eligible.
+        """
+        index = self._index
+        if index is not None and subset is not None:
+            if len(subset) <= self.EXACT_SUBSET_ROWS:
+                # One small GEMM beats a filtered scan/walk of every row
+                scores, top = _top_k(queries @ self._subset_rows(subset).T, k)
+                return scores, subset[top]
+
+        if index is not None:
+            params, bitmap = self._search_params(nprobe, subset)
+            if params is not None:
+                # Per-call parameters leave the shared index untouched
+                scores, indices = index.search(queries, k, params=params)
+            else:
+                scores, indices = index.search(queries, k)
+            del bitmap  # referenced by params.sel until the search returns
+
+            if subset is not None and (indices[:, -1] < 0).any():
+                # Selective filters can starve IVF probes / HNSW walks
+                scores, top = _top_k(queries @ self._subset_rows(subset).T, k)
+                indices = subset[top]
+            return scores, indices
+
+        # Numpy fallback: one GEMV/GEMM over the stored rows, top-k per row
+        if subset is not None:
+            scores, top = _top_k(self._fallback_scores(queries, subset), k)
+            return scores, subset[top]
+
+        scores = self._fallback_scores(queries)
+        if self._deleted:
+            scores[:, list(self._deleted)] = -np.inf
+        return _top_k(scores, k)
+
+    def _search_params(
+        self, nprobe: int | None, subset: np.ndarray | None = None
+    ) -> tuple[Any, np.ndarray | None]:
+        """FAISS SearchParameters for nprobe, tombstones and an id subset.
+
+        Returns:
+            (params or None if unneeded, bitmap array the selector reads)
+        """
+        if (
+            not self._deleted
+            and subset is None
+            and (nprobe is None or not self._use_ivf)
+        ):
+            return None, None
+
+        import faiss
+
+        params: Any
+        if self._use_ivf:
+            params = faiss.SearchParametersIVF()
+            # Unset fields would override the index defaults
+            params.nprobe = nprobe if nprobe is not None else self._index.nprobe
+        elif self._use_hnsw:
+            params = faiss.SearchParametersHNSW()  # type: ignore[attr-defined]
+            params.efSearch = self._index.hnsw.efSearch
+        else:
+            params = faiss.SearchParameters()
+
+        bitmap = None
+        if subset is not None:
+            # Subset positions are live, so tombstones need no extra check
+            mask = np.zeros(self._num_rows, dtype=bool)
+            mask[subset] = True
+            bitmap = np.packbits(mask, bitorder="little")
+            params.sel = faiss.IDSelectorBitmap(len(mask), faiss.swig_ptr(bitmap))
+        elif self._deleted:
+            if self._deleted_selector is None:
+                dead = np.fromiter(self._deleted, dtype=np.int64)
+                inner = faiss.IDSelectorBatch(dead)
+                # Keep the wrapped selector alive alongside the outer one
+                self._deleted_selector = (inner, faiss.IDSelectorNot(inner))
+            params.sel = self._deleted_selector[1]
+        return params, bitmap
+
+    def _rerank(
+        self, queries: np.ndarray, positions: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Re-score candidate positions (Q, K') exactly and keep the top k."""
+        assert self._rerank_vectors is not None
+        valid = positions >= 0
+        candidates = self._rerank_vectors[np.maximum(positions, 0)]  # (Q, K', D)
+        exact = np.einsum("qd,qkd->qk", queries, candidates)
+        exact[~valid] = -np.inf
+
+        order = np.argsort(-exact, axis=1, kind="stable")[:, :k]
+        top_positions = np.take_along_axis(positions, order, axis=1)
+        top_scores = np.take_along_axis(exact, order, axis=1)
+        top_scores[top_positions < 0] = 0.0
+        return top_scores.astype(np.float32), top_positions
+
+    def calibrate_nprobe(
+        self,
+        queries: np.ndarray,
+        k: int = 10,
+        target_recall: float = 0.95,
+    ) -> int | None:
+        """Pick the smallest nprobe that reaches a target recall@k.
+
+        Ground truth is an exhaustive probe of every IVF list, which for
+        IVFFlat equals exact flat search. Candidates are powers of two up
+        to nlist; the winner becomes the index default and is persisted
+        by save().
+
+        Args:
+            queries: Held-out query sample (Q, 768)
+            k: Recall cutoff
+            target_recall: Required mean recall@k in (0, 1]
+
+        Returns:
+            Chosen nprobe, or None if the index is not IVF (search is exact)
+
+        Raises:
+            ValueError: If target_recall is outside (0, 1]
+        """
+        if not 0 < target_recall <= 1:
+            raise ValueError("target_recall must be in (0, 1]")
+        if not self._use_ivf or self.size == 0:
+            return None
+
+        queries = np.ascontiguousarray(queries, dtype=np.float32).reshape(
+            -1, self._dimension
+        )
+        k = min(k, self.size)
+        nlist = int(self._index.nlist)
+
+        _, truth = self._search_positions(queries, k, nprobe=nlist)
+
+        candidates = []
+        probe = 1
+        while probe < nlist:
+            candidates.append(probe)
+            probe *= 2
+        candidates.append(nlist)
+
+        chosen = nlist
+        for probe in candidates:
+            _, found = self._search_positions(queries, k, nprobe=probe)
+            hits = sum(
+                len(np.intersect1d(f[f >= 0], t[t >= 0]))
+                for f, t in zip(found, truth, strict=False)
+            )
+            recall = hits / truth.size
+            logger.debug(f"nprobe={probe}: recall@{k}={recall:.3f}")
+            if recall >= target_recall:
+                chosen = probe
+                break
+
+        self.nprobe = chosen
+        logger.info(
+            f"Calibrated nprobe={chosen}/{nlist} for recall@{k}>={target_recall}"
+        )
+        return chosen
 
     def save(self, path: Path) -> None:
         """Save index to file.
 
+        Writes the index (.faiss, or .npy for the numpy fallback), the row
+        ids as a raw int64 array (.ids.npy), metadata as columnar arrays
+        (.meta.npz, see metadata_store.py) and a small JSON sidecar with
+        configuration and tombstones. The .npy arrays can be memory mapped
+        by load(mmap=True).
+
         Args:
             path: Path to save index
         """
@@ -267,56 +1313,179 @@ class EmbeddingIndex:
             import faiss
 
             faiss.write_index(self._index, str(path.with_suffix(".faiss")))
-        elif hasattr(self, "_embeddings") and self._embeddings:
-            # Save numpy fallback embeddings
-            embeddings_array = np.stack(self._embeddings)
-            np.save(path.with_suffix(".npy"), embeddings_array)
+        elif self._num_vectors > 0:
+            # Save numpy fallback embeddings (codes once the codec is trained)
+            np.save(path.with_suffix(".npy"), self._fallback_matrix())
+            if self._codec.is_trained and self._codec.needs_training:
+                state: dict[str, Any] = self._codec.get_state()
+                np.savez(path.with_suffix(".codec.npz"), **state)
+
+        if self._rerank_vectors is not None:
+            np.save(
+                path.with_suffix(".rerank.npy"), self._rerank_vectors[: self._num_rows]
+            )
+
+        # Binary id map: loads (or maps) without per-id parsing
+        np.save(path.with_suffix(".ids.npy"), self._id_array[: self._num_rows])
+
+        self._metadata.save(path.with_suffix(".meta.npz"))
 
-        # Save mappings as JSON (safe serialization)
+        # Save configuration as JSON (safe serialization)
         mappings = {
-            "id_map": self._id_map,
-            "metadata": {str(k): v for k, v in self._metadata.items()},
+            "deleted": sorted(self._deleted),
+            "nprobe": self._nprobe,
+            "dimension": self._dimension,
+            "codec": self._codec.name,
+            "rerank_factor": self._rerank_factor,
+            "pq_subvectors": self._pq_subvectors,
+            "policy": asdict(self._policy),
         }
         with open(path.with_suffix(".json"), "w") as f:
             json.dump(mappings, f)
 
         logger.info(f"Saved index to {path}")
 
+    @staticmethod
+    def _read_config(path: Path) -> dict[str, Any]:
+        """Configuration and mappings saved next to the index (.json)."""
+        json_path = path.with_suffix(".json")
+        if not json_path.exists():
+            return {}
+        with open(json_path) as f:
+            mappings: dict[str, Any] = json.load(f)
+        return mappings
+
+    @classmethod
+    def _from_config(cls, mappings: dict[str, Any]) -> EmbeddingIndex:
+        """Empty index with the dimension, codec and policy of ``mappings``."""
+        return cls(
+            dimension=mappings.get("dimension", cls.DIM),
+            codec=mappings.get("codec", "float32"),
+            rerank_factor=mappings.get("rerank_factor", 0),
+            pq_subvectors=mappings.get("pq_subvectors", 96),
+            policy=BackendPolicy(**mappings["policy"])
+            if "policy" in mappings
+            else None,
+        )
+
+    @classmethod
+    def empty_like(cls, path: Path) -> EmbeddingIndex:
+        """Empty index configured like the one saved at ``path``.
+
+        Takes the dimension, codec, re-rank factor, backend policy and
+        nprobe of the saved index without reading its vectors.
+
+        Args:
+            path: Path the index was saved to
+
+        Returns:
+            Empty EmbeddingIndex
+        """
+        mappings = cls._read_config(Path(path))
+        index = cls._from_config(mappings)
+        if mappings.get("nprobe") is not None:
+            index.nprobe = int(mappings["nprobe"])
+        return index
+
     @classmethod
-    def load(cls, path: Path) -> EmbeddingIndex:
+    def load(cls, path: Path, mmap: bool = False) -> EmbeddingIndex:
         """Load index from file.
 
+        With ``mmap=True`` the FAISS index (IO_FLAG_MMAP_IFC), the numpy
+        fallback matrix and the id array are memory mapped instead of read:
+        load time no longer grows with the number of vectors, and processes
+        loading the same files share page-cache pages. The first write
+        (add, upsert, compaction) copies the FAISS index into memory.
+
         Args:
             path: Path to index file
+            mmap: Memory-map the stored arrays read-only
 
         Returns:
             Loaded EmbeddingIndex
         """
         path = Path(path)
-        index = cls()
+
+        # Load mappings from JSON first: they carry the index configuration
+        mappings = cls._read_config(path)
+        index = cls._from_config(mappings)
+
+        # Read-only mappings: appends reallocate, nothing writes in place
+        mmap_mode: Any = "r" if mmap else None
 
         # Load FAISS index if available
         faiss_path = path.with_suffix(".faiss")
         if faiss_path.exists():
             import faiss
 
-            index._index = faiss.read_index(str(faiss_path))
+            io_flags = 0
+            if mmap:
+                io_flags = getattr(faiss, "IO_FLAG_MMAP_IFC", 0)
+                if io_flags == 0:
+                    logger.warning("FAISS build lacks IO_FLAG_MMAP_IFC, reading index")
+            index._index = faiss.read_index(str(faiss_path), io_flags)
+            index._mmapped = io_flags != 0
+            if isinstance(index._index, faiss.IndexHNSW):
+                index._set_backend_flags("hnsw")
+                index._index.hnsw.efSearch = index._policy.hnsw_ef_search
+            else:
+                try:
+                    faiss.extract_index_ivf(index._index)
+                    index._set_backend_flags("ivf")
+                except RuntimeError:
+                    index._set_backend_flags("flat")
+                if index._use_ivf and (
+                    index._index.metric_type != faiss.METRIC_INNER_PRODUCT
+                ):
+                    # Float32 IVF indexes used to be saved with the L2 metric
+                    logger.warning("Retraining L2 IVF index %s for inner product", path)
+                    index._index = index._build_ivf_index(index._reconstruct_all())
+                    index._mmapped = False
         else:
             # Load numpy fallback embeddings if available
             npy_path = path.with_suffix(".npy")
             if npy_path.exists():
-                embeddings_array = np.load(npy_path)
-                index._embeddings = list(embeddings_array)
+                stored = np.load(npy_path, mmap_mode=mmap_mode)
+                codec_path = path.with_suffix(".codec.npz")
+                if codec_path.exists():
+                    with np.load(codec_path) as state:
+                        index._codec.set_state(dict(state))
+                stored = np.ascontiguousarray(stored, dtype=index._vectors_dtype())
+
+                if index._index is not None:
+                    # Saved without FAISS, loaded with it
+                    if index._codec.is_trained:
+                        stored = index._codec.decode(stored)
+                    index._index.add(np.ascontiguousarray(stored, dtype=np.float32))
+                else:
+                    index._vectors = stored
+                    index._num_vectors = len(stored)
+
+        rerank_path = path.with_suffix(".rerank.npy")
+        if index._rerank_vectors is not None and rerank_path.exists():
+            index._rerank_vectors = np.ascontiguousarray(
+                np.load(rerank_path, mmap_mode=mmap_mode), dtype=np.float32
+            )
 
-        # Load mappings from JSON (safe deserialization)
-        json_path = path.with_suffix(".json")
-        if json_path.exists():
-            with open(json_path) as f:
-                mappings = json.load(f)
-            index._id_map = mappings.get("id_map", [])
-            index._metadata = {
-                int(k): v for k, v in mappings.get("metadata", {}).items()
-            }
+        ids_path = path.with_suffix(".ids.npy")
+        if ids_path.exists():
+            index._id_array = np.load(ids_path, mmap_mode=mmap_mode)
+        else:
+            # Legacy sidecar with the id map inline
+            index._id_array = np.asarray(mappings.get("id_map", []), dtype=np.int64)
+        index._num_rows = len(index._id_array)
+        index._deleted = set(mappings.get("deleted", []))
+        index._positions = None  # built on first write
+        meta_path = path.with_suffix(".meta.npz")
+        if meta_path.exists():
+            index._metadata = MetadataStore.load(meta_path)
+        else:
+            # Legacy sidecar with metadata inline
+            index._metadata = MetadataStore(
+                {int(k): v for k, v in mappings.get("metadata", {}).items()}
+            )
+        if mappings.get("nprobe") is not None:
+            index.nprobe = int(mappings["nprobe"])
 
         logger.info(f"Loaded index from {path}, size={index.size}")
 
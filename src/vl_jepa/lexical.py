@@ -0,0 +1,152 @@
+"""
+SPEC: Multimodal Index (lexical search)
+
+BM25 inverted index over transcript texts.
+
+Texts are split into lowercase word tokens (runs of Unicode word
+characters). Each term keeps a posting list of the documents that
+contain it and how often, in growable int arrays, so documents are
+added one batch at a time without rebuilding anything.
+
+A query reads only the posting lists of its own terms: its cost grows
+with how many documents contain those terms, not with corpus size.
+Rare, exact terms (formula names, acronyms) therefore come back fast
+and score high, which is what dense embeddings tend to miss.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from array import array
+from collections import Counter
+from typing import Any
+
+import numpy as np
+
+_TOKEN = re.compile(r"\w+")
+
+_INITIAL_CAPACITY = 64
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens of ``text``."""
+    return _TOKEN.findall(text.lower())
+
+
+class BM25Index:
+    """Incremental BM25 index mapping entry ids to tokenized texts.
+
+    Example:
+        lexical = BM25Index()
+        lexical.add([3, 4], ["Fourier transform", "Laplace transform"])
+        ids, scores = lexical.search("fourier", k=5)  # ids == [3]
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        """Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation (>= 0)
+            b: Document length normalization (0-1)
+
+        Raises:
+            ValueError: If k1 or b is out of range
+        """
+        if k1 < 0:
+            raise ValueError("k1 must be non-negative")
+        if not 0 <= b <= 1:
+            raise ValueError("b must be in [0, 1]")
+        self._k1 = k1
+        self._b = b
+
+        # term -> (document rows, term counts)
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._size = 0
+        self._ids = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._lengths = np.zeros(_INITIAL_CAPACITY, dtype=np.float64)
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of distinct terms."""
+        return len(self._postings)
+
+    def add(self, ids: Any, texts: list[str | None]) -> None:
+        """Index one document per id.
+
+        Args:
+            ids: Entry ids (N,)
+            texts: Document texts (N,), None is indexed as empty
+
+        Raises:
+            ValueError: If ids and texts differ in length
+        """
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        if len(ids) != len(texts):
+            raise ValueError("ids and texts must have same length")
+
+        size = self._size + len(ids)
+        if size > len(self._ids):
+            capacity = len(self._ids)
+            while capacity < size:
+                capacity *= 2
+            self._ids = np.resize(self._ids, capacity)
+            self._lengths = np.resize(self._lengths, capacity)
+
+        for row, text in enumerate(texts, start=self._size):
+            counts = Counter(tokenize(text or ""))
+            for term, count in counts.items():
+                posting = self._postings.get(term)
+                if posting is None:
+                    posting = self._postings[term] = (array("q"), array("q"))
+                posting[0].append(row)
+                posting[1].append(count)
+            length = sum(counts.values())
+            self._lengths[row] = length
+            self._total_length += length
+
+        self._ids[self._size : size] = ids
+        self._size = size
+
+    def search(self, text: str, k: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """Top-k documents for a text query by BM25 score.
+
+        Args:
+            text: Query text
+            k: Number of results
+
+        Returns:
+            Tuple of (ids, scores), best first; ties in insertion order.
+            Documents sharing no term with the query are not returned.
+        """
+        terms = dict.fromkeys(tokenize(text))
+        postings = [self._postings[t] for t in terms if t in self._postings]
+        if not postings or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        n = self._size
+        k1, b = self._k1, self._b
+        mean_length = self._total_length / n or 1.0
+        row_parts: list[np.ndarray] = []
+        score_parts: list[np.ndarray] = []
+        for docs, counts in postings:
+            term_rows = np.array(docs, dtype=np.int64)
+            tf = np.array(counts, dtype=np.float64)
+            df = len(term_rows)
+            idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            norm = k1 * (1.0 - b + b * self._lengths[term_rows] / mean_length)
+            row_parts.append(term_rows)
+            score_parts.append(idf * tf * (k1 + 1.0) / (tf + norm))
+
+        rows = np.concatenate(row_parts)
+        scores = np.concatenate(score_parts)
+        if len(postings) > 1:
+            rows, inverse = np.unique(rows, return_inverse=True)
+            scores = np.bincount(inverse, weights=scores)
+
+        order = np.lexsort((rows, -scores))[:k]
+        return self._ids[rows[order]], scores[order]
@@ -0,0 +1,271 @@
+"""
+SPEC: S007 - Embedding Index (metadata sidecar)
+
+Columnar, lazily decoded metadata storage for EmbeddingIndex.
+
+Metadata dicts are stored on disk column by column in one .npz file:
+
+- ids: sorted int64 ids that carry metadata
+- per key: int64 / float64 / bool values, a packed UTF-8 string table
+  (offsets + bytes), or JSON strings for mixed and nested values
+- per key: a presence mask when some rows lack the key
+
+Loading reads the arrays only. A row is decoded into a dict the first
+time it is accessed, so searches pay for the hits they return and not
+for the whole collection.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterator, Mapping, MutableMapping
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION: int = 1
+
+_MISSING = object()
+
+
+def _pack_strings(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack strings into (offsets (N+1,), utf-8 bytes) arrays."""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return offsets, data
+
+
+def _column_kind(values: list[Any]) -> str:
+    """Narrowest column type holding every value exactly."""
+    types = {type(value) for value in values}
+    if types == {bool}:
+        return "bool"
+    if types == {int} and all(-(2**63) <= v < 2**63 for v in values):
+        return "int"
+    if types == {float}:
+        return "float"
+    if types == {str}:
+        return "str"
+    return "json"
+
+
+def _encode_columns(rows: Mapping[int, dict[str, Any]]) -> dict[str, Any]:
+    """Encode id -> dict rows into named arrays for np.savez."""
+    ids = np.array(sorted(rows), dtype=np.int64)
+    ordered = [rows[id_] for id_ in ids.tolist()]
+
+    keys: dict[str, None] = {}
+    for row in ordered:
+        keys.update(dict.fromkeys(row))
+
+    arrays: dict[str, Any] = {"ids": ids}
+    columns = []
+    for col, key in enumerate(keys):
+        cells = [row.get(key, _MISSING) for row in ordered]
+        present = np.array([cell is not _MISSING for cell in cells], dtype=bool)
+        values = [cell for cell in cells if cell is not _MISSING]
+        kind = _column_kind(values)
+        columns.append([key, kind])
+
+        if not present.all():
+            arrays[f"c{col}_present"] = present
+        if kind == "bool":
+            arrays[f"c{col}_values"] = np.array(values, dtype=bool)
+        elif kind == "int":
+            arrays[f"c{col}_values"] = np.array(values, dtype=np.int64)
+        elif kind == "float":
+            arrays[f"c{col}_values"] = np.array(values, dtype=np.float64)
+        else:
+            if kind == "json":
+                values = [json.dumps(value) for value in values]
+            offsets, data = _pack_strings(values)
+            arrays[f"c{col}_offsets"] = offsets
+            arrays[f"c{col}_data"] = data
+
+    header = {"version": FORMAT_VERSION, "columns": columns}
+    arrays["header"] = np.frombuffer(json.dumps(header).encode("utf-8"), np.uint8)
+    return arrays
+
+
+class _Column:
+    """One decoded-on-demand metadata column."""
+
+    def __init__(self, key: str, kind: str, arrays: dict[str, np.ndarray], col: int):
+        self.key = key
+        self.kind = kind
+        present = arrays.get(f"c{col}_present")
+        # Row -> value slot; only needed when some rows lack the key
+        self._slots: np.ndarray | None = None
+        self._present = present
+        if present is not None:
+            self._slots = np.cumsum(present) - 1
+        self._values = arrays.get(f"c{col}_values")
+        self._offsets = arrays.get(f"c{col}_offsets")
+        self._data = arrays.get(f"c{col}_data")
+
+    def get(self, row: int) -> Any:
+        """Value of this column at row, or _MISSING."""
+        if self._present is not None:
+            if not self._present[row]:
+                return _MISSING
+            assert self._slots is not None
+            row = int(self._slots[row])
+
+        if self._values is not None:
+            return self._values[row].item()
+
+        assert self._offsets is not None and self._data is not None
+        start, end = self._offsets[row], self._offsets[row + 1]
+        text = self._data[start:end].tobytes().decode("utf-8")
+        return json.loads(text) if self.kind == "json" else text
+
+
+class MetadataStore(MutableMapping[int, dict[str, Any]]):
+    """id -> metadata dict mapping backed by columnar arrays.
+
+    Behaves like the plain dict EmbeddingIndex used before. Rows loaded
+    from disk stay encoded until first accessed and are then kept in a
+    read cache; writes go to an in-memory overlay that save() merges back
+    into columns. Reads alone leave the loaded arrays to be saved as-is.
+
+    Example:
+        store = MetadataStore.load(path)
+        store.get(42)  # decodes a single row
+    """
+
+    def __init__(self, rows: Mapping[int, dict[str, Any]] | None = None) -> None:
+        """Initialize store.
+
+        Args:
+            rows: Initial id -> metadata dicts
+        """
+        self._rows: dict[int, dict[str, Any]] = dict(rows or {})
+        self._decoded: dict[int, dict[str, Any]] = {}  # base rows read so far
+        self._removed: set[int] = set()  # base ids deleted since load
+        self._base_ids = np.empty(0, dtype=np.int64)
+        self._columns: list[_Column] = []
+        self._base_arrays: dict[str, Any] | None = None
+
+    def _base_row(self, id_: int) -> int | None:
+        """Row of id_ in the loaded columns, if stored there and not removed."""
+        if id_ in self._removed:
+            return None
+        row = int(np.searchsorted(self._base_ids, id_))
+        if row < len(self._base_ids) and self._base_ids[row] == id_:
+            return row
+        return None
+
+    def __getitem__(self, id_: int) -> dict[str, Any]:
+        row = self._rows.get(id_)
+        if row is None:
+            row = self._decoded.get(id_)
+        if row is not None:
+            return row
+
+        base_row = self._base_row(id_)
+        if base_row is None:
+            raise KeyError(id_)
+
+        # Cache so repeated lookups return the same (mutable) dict
+        decoded = self._decode(base_row)
+        self._decoded[id_] = decoded
+        return decoded
+
+    def _decode(self, base_row: int) -> dict[str, Any]:
+        """Metadata dict of a row of the loaded columns."""
+        decoded = {}
+        for column in self._columns:
+            value = column.get(base_row)
+            if value is not _MISSING:
+                decoded[column.key] = value
+        return decoded
+
+    def __setitem__(self, id_: int, value: dict[str, Any]) -> None:
+        self._rows[id_] = value
+        self._decoded.pop(id_, None)
+        self._removed.discard(id_)
+
+    def __delitem__(self, id_: int) -> None:
+        self._decoded.pop(id_, None)
+        in_rows = self._rows.pop(id_, None) is not None
+        base_row = self._base_row(id_)
+        if base_row is not None:
+            self._removed.add(id_)
+        elif not in_rows:
+            raise KeyError(id_)
+
+    def __contains__(self, id_: object) -> bool:
+        if id_ in self._rows:
+            return True
+        return (
+            isinstance(id_, (int, np.integer)) and self._base_row(int(id_)) is not None
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        for id_ in self._base_ids.tolist():
+            if id_ not in self._removed and id_ not in self._rows:
+                yield id_
+        yield from list(self._rows)
+
+    def __len__(self) -> int:
+        overlay_only = sum(1 for id_ in self._rows if self._base_row(id_) is None)
+        return len(self._base_ids) - len(self._removed) + overlay_only
+
+    def save(self, path: Path) -> None:
+        """Write the store as a columnar .npz file.
+
+        Args:
+            path: Output file (conventionally <index>.meta.npz)
+        """
+        if self._base_arrays is not None and not self._is_modified():
+            arrays = self._base_arrays  # only read since load
+        else:
+            arrays = _encode_columns({id_: self[id_] for id_ in self})
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+
+    def _is_modified(self) -> bool:
+        """Whether rows were written, deleted or edited in place since load."""
+        if self._rows or self._removed:
+            return True
+        for id_, row in self._decoded.items():
+            base_row = self._base_row(id_)
+            if base_row is None or row != self._decode(base_row):
+                return True
+        return False
+
+    @classmethod
+    def load(cls, path: Path) -> MetadataStore:
+        """Load a store written by save(). Rows are decoded on access.
+
+        Args:
+            path: .npz file written by save()
+
+        Returns:
+            Loaded MetadataStore
+
+        Raises:
+            ValueError: If the file uses an unknown format version
+        """
+        with np.load(path) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+
+        header = json.loads(arrays["header"].tobytes().decode("utf-8"))
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported metadata format: {header.get('version')}")
+
+        store = cls()
+        store._base_arrays = arrays
+        store._base_ids = arrays["ids"]
+        store._columns = [
+            _Column(key, kind, arrays, col)
+            for col, (key, kind) in enumerate(header["columns"])
+        ]
+        logger.debug(f"Loaded {len(store._base_ids)} metadata rows from {path}")
+        return store
@@ -0,0 +1,514 @@
+"""
+SPEC: Model Loading (shared model registry)
+
+Process-wide registry of lazily loaded models.
+
+Loading a model dominates short jobs: the MiniLM text encoder and
+Whisper read hundreds of megabytes from disk, and the placeholder
+visual encoder allocates a 460 MB projection. The registry keeps one
+instance of each model per process, shared by API jobs, search
+requests, the Gradio app and the CLI.
+
+Models are registered by name with a factory and loaded on first use.
+Callers hold a model through ``acquire``, which counts references. A
+model nobody holds stays resident until it has been idle for
+``idle_timeout`` seconds, or until loading another model would exceed
+``memory_budget`` bytes, in which case idle models are unloaded least
+recently used first. Models in use are never unloaded.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Names of the models registered by ``register_default_models``
+TEXT_ENCODER = "text-encoder"
+PLACEHOLDER_TEXT_ENCODER = "placeholder-text-encoder"
+PLACEHOLDER_VISUAL_ENCODER = "placeholder-visual-encoder"
+WHISPER_TRANSCRIBER = "whisper-base"
+PLACEHOLDER_TRANSCRIBER = "placeholder-transcriber"
+Y_DECODER = "y-decoder"
+
+# faster-whisper keeps its weights in native memory, out of reach of
+# ``model_nbytes``; this is the size of the "base" model
+_WHISPER_BASE_BYTES: int = 150 * 2**20
+
+# Bounds of the interval between two idle sweeps of the reaper thread
+_MIN_REAP_INTERVAL: float = 1.0
+_MAX_REAP_INTERVAL: float = 60.0
+
+
+@dataclass(frozen=True)
+class ModelRegistryStats:
+    """Snapshot of model registry counters.
+
+    Attributes:
+        loads: Models loaded by their factory
+        hits: Acquisitions served by an already loaded model
+        evictions: Models unloaded (idle timeout, memory budget or unload)
+        load_seconds: Time spent in factories
+        resident: Models currently loaded
+        resident_bytes: Estimated memory of the loaded models
+        memory_budget: Memory budget in bytes (None = unlimited)
+    """
+
+    loads: int
+    hits: int
+    evictions: int
+    load_seconds: float
+    resident: int
+    resident_bytes: int
+    memory_budget: int | None
+
+
+@dataclass
+class _Entry:
+    """A registered model and its bookkeeping."""
+
+    factory: Callable[[], Any]
+    size_bytes: int | None
+    model: Any = None
+    loaded: bool = False
+    nbytes: int = 0
+    refs: int = 0
+    last_used: float = 0.0
+    load_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def model_nbytes(model: Any) -> int:
+    """Approximate memory held by a model's arrays and tensors.
+
+    Sums the numpy arrays and torch parameters and buffers found on the
+    model and its attributes, two levels deep, counting each object once.
+    Memory held by native runtimes is not seen.
+
+    Args:
+        model: Model instance, e.g. an encoder wrapping a torch module
+
+    Returns:
+        Estimated size in bytes
+    """
+    seen: set[int] = set()
+
+    def visit(obj: Any, depth: int) -> int:
+        if obj is None or id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        if isinstance(obj, np.ndarray):
+            return int(obj.nbytes)
+        parameters = getattr(obj, "parameters", None)
+        buffers = getattr(obj, "buffers", None)
+        if callable(parameters) and callable(buffers):  # torch.nn.Module
+            try:
+                tensors = [*parameters(), *buffers()]
+                return sum(int(t.numel()) * int(t.element_size()) for t in tensors)
+            except (AttributeError, TypeError):
+                return 0
+        if depth == 0:
+            return 0
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is None:
+            return 0
+        return sum(visit(value, depth - 1) for value in attributes.values())
+
+    return visit(model, 2)
+
+
+class ModelRegistry:
+    """Thread-safe registry of lazily loaded, shared models.
+
+    Example:
+        registry = ModelRegistry(memory_budget=2 * 2**30, idle_timeout=600)
+        registry.register("text-encoder", TextEncoder.load)
+        with registry.acquire("text-encoder") as encoder:  # loaded once
+            embedding = encoder.encode("What is gradient descent?")
+        registry.stats.loads, registry.stats.hits
+    """
+
+    def __init__(
+        self,
+        memory_budget: int | None = None,
+        idle_timeout: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            memory_budget: Bytes of loaded models above which idle models
+                are unloaded (None = unlimited)
+            idle_timeout: Seconds after which a model nobody holds is
+                unloaded (None = keep until evicted by the budget)
+            clock: Monotonic time source, in seconds
+
+        Raises:
+            ValueError: If memory_budget is negative or idle_timeout is
+                not positive
+        """
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._loads = 0
+        self._hits = 0
+        self._evictions = 0
+        self._load_seconds = 0.0
+        self._reaper: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._memory_budget: int | None = None
+        self._idle_timeout: float | None = None
+        self.configure(memory_budget, idle_timeout)
+
+    def configure(
+        self, memory_budget: int | None = None, idle_timeout: float | None = None
+    ) -> None:
+        """Set the memory budget and idle timeout (see ``__init__``).
+
+        Raises:
+            ValueError: If memory_budget is negative or idle_timeout is
+                not positive
+        """
+        if memory_budget is not None and memory_budget < 0:
+            raise ValueError("memory_budget must be non-negative")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be positive")
+        with self._lock:
+            self._memory_budget = memory_budget
+            self._idle_timeout = idle_timeout
+            self._make_room(0, warn=False)
+            loaded = any(entry.loaded for entry in self._entries.values())
+        if loaded:
+            self._start_reaper()
+
+    def __contains__(self, name: object) -> bool:
+        with self._lock:
+            return name in self._entries
+
+    @property
+    def memory_budget(self) -> int | None:
+        """Memory budget in bytes (None = unlimited)."""
+        return self._memory_budget
+
+    @property
+    def idle_timeout(self) -> float | None:
+        """Seconds after which an idle model is unloaded (None = never)."""
+        return self._idle_timeout
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        size_bytes: int | None = None,
+        replace: bool = False,
+    ) -> None:
+        """Register a model; it is loaded on first ``acquire`` or ``get``.
+
+        Args:
+            name: Model name
+            factory: Function returning a new instance of the model
+            size_bytes: Memory of the model (None = measured after loading
+                with ``model_nbytes``)
+            replace: Replace a registered model of the same name; holders
+                keep the old instance, new acquisitions load the new one
+
+        Raises:
+            ValueError: If the name is taken and replace is False
+        """
+        with self._lock:
+            old = self._entries.get(name)
+            if old is not None and not replace:
+                raise ValueError(f"model {name!r} is already registered")
+            self._entries[name] = _Entry(factory, size_bytes)
+            if old is not None and old.loaded:
+                self._unload(name, old)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether model ``name`` is resident."""
+        with self._lock:
+            entry = self._entries.get(name)
+            return entry is not None and entry.loaded
+
+    @contextmanager
+    def acquire(self, name: str) -> Iterator[Any]:
+        """Hold model ``name``, loading it if needed.
+
+        The model is not unloaded while held. Concurrent first
+        acquisitions load it once.
+
+        Args:
+            name: Registered model name
+
+        Yields:
+            The shared model instance
+
+        Raises:
+            ValueError: If no model of that name is registered
+        """
+        entry, model = self._hold(name)
+        try:
+            yield model
+        finally:
+            self._release(entry)
+
+    def get(self, name: str) -> Any:
+        """Model ``name``, loading it if needed, without holding it.
+
+        Suits short-lived users; a caller keeping the model across idle
+        periods should ``acquire`` it, or the registry may unload it and
+        load a second copy for the next caller.
+
+        Raises:
+            ValueError: If no model of that name is registered
+        """
+        entry, model = self._hold(name)
+        self._release(entry)
+        return model
+
+    def _hold(self, name: str) -> tuple[_Entry, Any]:
+        """Take a reference to a model, loading it on first use."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                raise ValueError(f"unknown model {name!r}")
+            entry.refs += 1
+            entry.last_used = self._clock()
+            if entry.loaded:
+                self._hits += 1
+                return entry, entry.model
+
+        try:
+            with entry.load_lock:
+                with self._lock:
+                    if entry.loaded:
+                        self._hits += 1
+                        return entry, entry.model
+                    self._make_room(entry.size_bytes or 0, warn=False)
+
+                start = time.perf_counter()
+                model = entry.factory()
+                elapsed = time.perf_counter() - start
+                nbytes = entry.size_bytes
+                if nbytes is None:
+                    nbytes = model_nbytes(model)
+
+                with self._lock:
+                    entry.model = model
+                    entry.loaded = True
+                    entry.nbytes = nbytes
+                    self._loads += 1
+                    self._load_seconds += elapsed
+                    self._make_room(0, warn=True)
+                logger.info(
+                    "Loaded model %s (%.0f MB) in %.2fs", name, nbytes / 2**20, elapsed
+                )
+                self._start_reaper()
+                return entry, model
+        except BaseException:
+            with self._lock:
+                entry.refs -= 1
+            raise
+
+    def _release(self, entry: _Entry) -> None:
+        """Drop a reference to a model and sweep idle models."""
+        with self._lock:
+            entry.refs -= 1
+            entry.last_used = self._clock()
+        self.evict_idle()
+
+    def _make_room(self, incoming: int, warn: bool) -> None:
+        """Unload idle models, LRU first, to fit the budget (lock held)."""
+        if self._memory_budget is None:
+            return
+        loaded = [(n, e) for n, e in self._entries.items() if e.loaded]
+        resident = sum(entry.nbytes for _, entry in loaded)
+        idle = sorted(
+            ((n, e) for n, e in loaded if e.refs == 0), key=lambda i: i[1].last_used
+        )
+        for name, entry in idle:
+            if resident + incoming <= self._memory_budget:
+                break
+            resident -= entry.nbytes
+            self._unload(name, entry)
+        if warn and resident + incoming > self._memory_budget:
+            logger.warning(
+                "Models in use take %.0f MB, over the %.0f MB budget",
+                resident / 2**20,
+                self._memory_budget / 2**20,
+            )
+
+    def _unload(self, name: str, entry: _Entry) -> None:
+        """Drop the registry's instance of a model (lock held)."""
+        logger.info("Unloading model %s (%.0f MB)", name, entry.nbytes / 2**20)
+        entry.model = None
+        entry.loaded = False
+        entry.nbytes = 0
+        self._evictions += 1
+
+    def evict_idle(self) -> list[str]:
+        """Unload models nobody has held for ``idle_timeout`` seconds.
+
+        Called after every release and periodically by a background
+        thread, so idle models are freed even when no requests arrive.
+
+        Returns:
+            Names of the unloaded models
+        """
+        with self._lock:
+            if self._idle_timeout is None:
+                return []
+            now = self._clock()
+            expired = [
+                (name, entry)
+                for name, entry in self._entries.items()
+                if entry.loaded
+                and entry.refs == 0
+                and now - entry.last_used >= self._idle_timeout
+            ]
+            for name, entry in expired:
+                self._unload(name, entry)
+        return [name for name, _ in expired]
+
+    def unload(self, name: str) -> bool:
+        """Unload model ``name`` now unless it is held.
+
+        Returns:
+            True if the model was unloaded
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or not entry.loaded or entry.refs > 0:
+                return False
+            self._unload(name, entry)
+            return True
+
+    def clear(self) -> None:
+        """Unload every model that is not held."""
+        with self._lock:
+            for name, entry in self._entries.items():
+                if entry.loaded and entry.refs == 0:
+                    self._unload(name, entry)
+
+    def close(self) -> None:
+        """Stop the background sweep and unload every model not held."""
+        self._stop.set()
+        reaper = self._reaper
+        if reaper is not None:
+            reaper.join(timeout=_MAX_REAP_INTERVAL)
+            self._reaper = None
+        self.clear()
+
+    def _start_reaper(self) -> None:
+        """Start the idle sweep thread if a timeout is set."""
+        with self._lock:
+            if self._idle_timeout is None or self._reaper is not None:
+                return
+            self._stop = threading.Event()
+            self._reaper = threading.Thread(
+                target=self._reap,
+                args=(self._stop,),
+                name="model-registry-reaper",
+                daemon=True,
+            )
+            self._reaper.start()
+
+    def _reap(self, stop: threading.Event) -> None:
+        """Sweep idle models until ``stop`` is set."""
+        while True:
+            timeout = self._idle_timeout or _MAX_REAP_INTERVAL
+            interval = min(max(timeout / 4, _MIN_REAP_INTERVAL), _MAX_REAP_INTERVAL)
+            if stop.wait(interval):
+                return
+            self.evict_idle()
+
+    @property
+    def stats(self) -> ModelRegistryStats:
+        """Current counters."""
+        with self._lock:
+            loaded = [entry for entry in self._entries.values() if entry.loaded]
+            return ModelRegistryStats(
+                loads=self._loads,
+                hits=self._hits,
+                evictions=self._evictions,
+                load_seconds=self._load_seconds,
+                resident=len(loaded),
+                resident_bytes=sum(entry.nbytes for entry in loaded),
+                memory_budget=self._memory_budget,
+            )
+
+
+def _load_text_encoder() -> Any:
+    from vl_jepa.text import TextEncoder
+
+    return TextEncoder.load()
+
+
+def _load_placeholder_text_encoder() -> Any:
+    from vl_jepa.encoders.placeholder import PlaceholderTextEncoder
+
+    return PlaceholderTextEncoder(seed=42)
+
+
+def _load_placeholder_visual_encoder() -> Any:
+    from vl_jepa.encoders.placeholder import PlaceholderVisualEncoder
+
+    return PlaceholderVisualEncoder(seed=42)
+
+
+def _load_whisper_transcriber() -> Any:
+    from vl_jepa.audio.transcriber import WhisperTranscriber
+
+    return WhisperTranscriber.load("base", device="auto")
+
+
+def _load_placeholder_transcriber() -> Any:
+    from vl_jepa.audio.placeholder import PlaceholderTranscriber
+
+    return PlaceholderTranscriber()
+
+
+def _load_y_decoder() -> Any:
+    from vl_jepa.decoder import YDecoder
+
+    return YDecoder.load()
+
+
+def register_default_models(registry: ModelRegistry) -> None:
+    """Register the encoders, transcribers and decoder of the pipelines.
+
+    Args:
+        registry: Registry to register them in (names must be free)
+    """
+    registry.register(TEXT_ENCODER, _load_text_encoder)
+    registry.register(PLACEHOLDER_TEXT_ENCODER, _load_placeholder_text_encoder)
+    registry.register(PLACEHOLDER_VISUAL_ENCODER, _load_placeholder_visual_encoder)
+    registry.register(
+        WHISPER_TRANSCRIBER, _load_whisper_transcriber, size_bytes=_WHISPER_BASE_BYTES
+    )
+    registry.register(PLACEHOLDER_TRANSCRIBER, _load_placeholder_transcriber)
+    registry.register(Y_DECODER, _load_y_decoder)
+
+
+_default_registry: ModelRegistry | None = None
+_default_registry_lock = threading.Lock()
+
+
+def default_registry() -> ModelRegistry:
+    """Return the process-wide registry, with the default models registered.
+
+    Models stay loaded until the memory budget or idle timeout unloads
+    them; neither is set until configured (see ``ModelRegistry.configure``).
+    """
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = ModelRegistry()
+            register_default_models(_default_registry)
+        return _default_registry
@@ -11,17 +11,31 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass, field
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from .container import Container, ContainerWriter
+from .diversity import mmr_select
+from .entry_store import COLUMN_NAMES, EntryStore
 from .index import EmbeddingIndex
+from .lexical import BM25Index
+from .metadata_store import MetadataStore
+from .query_cache import DEFAULT_CAPACITY, CacheStats, QueryCache
+from .timeline import TimelineIndex
 
 logger = logging.getLogger(__name__)
 
+# Widens time windows past float rounding; hits are then checked exactly
+_TIME_SLACK: float = 1e-9
+
+# Embedding rows reconstructed per chunk while saving (~48 MB at 768 dims)
+_SAVE_CHUNK_ROWS: int = 16384
+
 
 class Modality(str, Enum):
     """Embedding modality type."""
@@ -30,6 +44,17 @@ class Modality(str, Enum):
     TRANSCRIPT = "transcript"
 
 
+# Modality codes stored in the entry store's modality column
+_MODALITIES: tuple[Modality, ...] = (Modality.VISUAL, Modality.TRANSCRIPT)
+_CODES: dict[Modality, int] = {m: code for code, m in enumerate(_MODALITIES)}
+
+# Index metadata keys that are entry fields, not user metadata
+_ENTRY_KEYS: dict[Modality, frozenset[str]] = {
+    Modality.VISUAL: frozenset({"modality", "timestamp", "frame_index"}),
+    Modality.TRANSCRIPT: frozenset({"modality", "timestamp", "text"}),
+}
+
+
 @dataclass
 class MultimodalEntry:
     """Entry in the multimodal index.
@@ -75,12 +100,17 @@ class RankingConfig:
         transcript_weight: Weight for transcript similarity scores (0-1)
         time_decay: Decay factor for temporal distance (0 = no decay)
         time_reference: Reference timestamp for time decay (None = no decay)
+        fusion: "weighted" (weight x similarity) or "rrf" (reciprocal rank
+            fusion: weight / (rrf_k + rank within the modality))
+        rrf_k: Rank offset for reciprocal rank fusion (must be positive)
     """
 
     visual_weight: float = 0.3
     transcript_weight: float = 0.7
     time_decay: float = 0.0
     time_reference: float | None = None
+    fusion: str = "weighted"
+    rrf_k: int = 60
 
     def __post_init__(self) -> None:
         """Validate weights."""
@@ -90,6 +120,78 @@ class RankingConfig:
             raise ValueError("transcript_weight must be in [0, 1]")
         if not 0 <= self.time_decay <= 1:
             raise ValueError("time_decay must be in [0, 1]")
+        if self.fusion not in ("weighted", "rrf"):
+            raise ValueError("fusion must be 'weighted' or 'rrf'")
+        if self.rrf_k <= 0:
+            raise ValueError("rrf_k must be positive")
+
+
+@dataclass
+class HybridConfig:
+    """Configuration for hybrid lexical + dense transcript search.
+
+    Attributes:
+        dense_weight: Weight of the embedding similarity ranking (0-1)
+        lexical_weight: Weight of the BM25 ranking (0-1)
+        fusion: "rrf" (weight / (rrf_k + rank) per ranking) or "weighted"
+            (weight x score, min-max normalized within each ranking)
+        rrf_k: Rank offset for reciprocal rank fusion (must be positive)
+    """
+
+    dense_weight: float = 0.5
+    lexical_weight: float = 0.5
+    fusion: str = "rrf"
+    rrf_k: int = 60
+
+    def __post_init__(self) -> None:
+        """Validate weights."""
+        if not 0 <= self.dense_weight <= 1:
+            raise ValueError("dense_weight must be in [0, 1]")
+        if not 0 <= self.lexical_weight <= 1:
+            raise ValueError("lexical_weight must be in [0, 1]")
+        if self.fusion not in ("weighted", "rrf"):
+            raise ValueError("fusion must be 'weighted' or 'rrf'")
+        if self.rrf_k <= 0:
+            raise ValueError("rrf_k must be positive")
+
+
+@dataclass
+class DiversityConfig:
+    """Configuration for diversifying search results.
+
+    The top ``pool_size`` candidates are re-selected by maximal marginal
+    relevance (see diversity.py), so adjacent frames of one slide do not
+    fill the results.
+
+    Attributes:
+        mmr_lambda: Relevance vs. novelty trade-off (0-1); 1 keeps the
+            plain ranking, lower values penalize results similar to ones
+            already picked
+        min_separation: Minimum seconds between two results of the same
+            modality (0 = no temporal constraint)
+        pool_size: Number of top candidates diversified (must be positive);
+            bounds the cost independently of index size
+    """
+
+    mmr_lambda: float = 0.7
+    min_separation: float = 0.0
+    pool_size: int = 200
+
+    def __post_init__(self) -> None:
+        """Validate parameters."""
+        if not 0 <= self.mmr_lambda <= 1:
+            raise ValueError("mmr_lambda must be in [0, 1]")
+        if self.min_separation < 0:
+            raise ValueError("min_separation must be non-negative")
+        if self.pool_size <= 0:
+            raise ValueError("pool_size must be positive")
+
+
+def _config_key(
+    config: RankingConfig | HybridConfig | DiversityConfig | None,
+) -> tuple[Hashable, ...] | None:
+    """Field values of a search config, as part of a query cache key."""
+    return tuple(vars(config).values()) if config is not None else None
 
 
 class MultimodalIndex:
@@ -122,20 +224,32 @@ class MultimodalIndex:
 
     DIM: int = 768
 
-    def __init__(self, dimension: int = 768) -> None:
+    def __init__(
+        self, dimension: int = 768, cache_size: int = DEFAULT_CAPACITY
+    ) -> None:
         """Initialize multimodal index.
 
         Args:
             dimension: Embedding dimension (default 768)
+            cache_size: Search results kept in the query cache (0 = off)
         """
         self._dimension = dimension
         self._index = EmbeddingIndex(dimension=dimension)
-        self._entries: dict[int, MultimodalEntry] = {}
+        # Entry fields by column; embeddings and metadata live in _index
+        self._store = EntryStore()
         self._next_id = 0
-
-        # Separate tracking for each modality
-        self._visual_ids: list[int] = []
-        self._transcript_ids: list[int] = []
+        # BM25 over transcript texts, extended as transcripts are added
+        self._lexical = BM25Index()
+        # Bumped by every change to the entries; cached results computed
+        # at another version are discarded
+        self._version = 0
+        self._cache = QueryCache(cache_size)
+
+        # Per-modality id arrays and timestamp indexes, rebuilt lazily
+        # when entries are added
+        self._id_arrays: dict[Modality, np.ndarray] = {}
+        self._timelines: dict[str, TimelineIndex] = {}
+        self._derived_size = -1
 
         logger.info("MultimodalIndex initialized, dim=%d", dimension)
 
@@ -144,21 +258,68 @@ class MultimodalIndex:
         """Total number of entries."""
         return self._index.size
 
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever entries are added."""
+        return self._version
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit/miss counters of the query cache."""
+        return self._cache.stats
+
+    def clear_cache(self) -> None:
+        """Drop every cached search result."""
+        self._cache.clear()
+
     @property
     def visual_count(self) -> int:
         """Number of visual entries."""
-        return len(self._visual_ids)
+        return len(self._modality_ids(Modality.VISUAL))
 
     @property
     def transcript_count(self) -> int:
         """Number of transcript entries."""
-        return len(self._transcript_ids)
+        return len(self._modality_ids(Modality.TRANSCRIPT))
+
+    def _refresh_derived(self) -> None:
+        """Rebuild id arrays and timelines if entries were added since."""
+        store = self._store
+        if self._derived_size == len(store):
+            return
+
+        codes = store.column("modality")
+        visual = codes == _CODES[Modality.VISUAL]
+        transcript = codes == _CODES[Modality.TRANSCRIPT]
+        ids = store.ids
+        timestamps = store.column("timestamp")
+        self._id_arrays = {
+            Modality.VISUAL: ids[visual],
+            Modality.TRANSCRIPT: ids[transcript],
+        }
+        self._timelines = {
+            "visual": TimelineIndex(ids[visual], timestamps[visual]),
+            "transcript": TimelineIndex(ids[transcript], timestamps[transcript]),
+            "span": TimelineIndex(
+                ids[transcript],
+                store.column("start")[transcript],
+                store.column("end")[transcript],
+            ),
+        }
+        self._derived_size = len(store)
 
-    def _get_next_id(self) -> int:
-        """Get next unique ID."""
-        id_ = self._next_id
-        self._next_id += 1
-        return id_
+    def _modality_ids(self, modality: Modality) -> np.ndarray:
+        """Ids of one modality as an int64 array (cached)."""
+        self._refresh_derived()
+        return self._id_arrays[modality]
+
+    def _timeline(self, name: str) -> TimelineIndex:
+        """Timestamp index: "visual", "transcript" (centres) or "span".
+
+        "span" indexes transcript [start_time, end_time] intervals.
+        """
+        self._refresh_derived()
+        return self._timelines[name]
 
     def add_visual(
         self,
@@ -178,29 +339,12 @@ class MultimodalIndex:
         Returns:
             Entry ID
         """
-        id_ = self._get_next_id()
-
-        entry = MultimodalEntry(
-            id=id_,
-            modality=Modality.VISUAL,
-            timestamp=timestamp,
-            embedding=embedding,
-            frame_index=frame_index,
-            metadata=metadata or {},
-        )
-
-        # Add to FAISS index with metadata
-        index_metadata = {
-            "modality": Modality.VISUAL.value,
-            "timestamp": timestamp,
-            "frame_index": frame_index,
-            **(metadata or {}),
-        }
-        self._index.add(embedding, id=id_, metadata=index_metadata)
-
-        # Store entry
-        self._entries[id_] = entry
-        self._visual_ids.append(id_)
+        id_ = self.add_visual_batch(
+            embedding.reshape(1, -1),
+            timestamps=[timestamp],
+            frame_indices=[frame_index],
+            metadata=[metadata] if metadata else None,
+        )[0]
 
         logger.debug(
             "Added visual entry: id=%d, timestamp=%.2f, frame=%d",
@@ -233,39 +377,14 @@ class MultimodalIndex:
         Returns:
             Entry ID
         """
-        id_ = self._get_next_id()
-
-        # Use center timestamp for search alignment
-        timestamp = (start_time + end_time) / 2
-
-        entry = MultimodalEntry(
-            id=id_,
-            modality=Modality.TRANSCRIPT,
-            timestamp=timestamp,
-            embedding=embedding,
-            text=text,
-            segment_id=segment_id,
-            metadata={
-                "start_time": start_time,
-                "end_time": end_time,
-                **(metadata or {}),
-            },
-        )
-
-        # Add to FAISS index with metadata
-        index_metadata = {
-            "modality": Modality.TRANSCRIPT.value,
-            "timestamp": timestamp,
-            "start_time": start_time,
-            "end_time": end_time,
-            "text": text[:200] if text else None,  # Truncate for storage
-            **(metadata or {}),
-        }
-        self._index.add(embedding, id=id_, metadata=index_metadata)
-
-        # Store entry
-        self._entries[id_] = entry
-        self._transcript_ids.append(id_)
+        id_ = self.add_transcript_batch(
+            embedding.reshape(1, -1),
+            start_times=[start_time],
+            end_times=[end_time],
+            texts=[text],
+            segment_ids=[segment_id],
+            metadata=[metadata] if metadata else None,
+        )[0]
 
         logger.debug(
             "Added transcript entry: id=%d, time=%.2f-%.2f, text='%s...'",
@@ -277,53 +396,203 @@ class MultimodalIndex:
 
         return id_
 
+    def add_visual_batch(
+        self,
+        embeddings: np.ndarray,
+        timestamps: Any,
+        frame_indices: Any,
+        metadata: list[dict[str, Any] | None] | None = None,
+    ) -> list[int]:
+        """Add many visual frame embeddings with a single index add.
+
+        Args:
+            embeddings: L2-normalized embeddings (N, 768)
+            timestamps: Frame timestamps in seconds (N,)
+            frame_indices: Frame indices in video (N,)
+            metadata: Optional per-frame metadata dicts (N,)
+
+        Returns:
+            Entry IDs, in input order
+
+        Raises:
+            ValueError: If the inputs do not all have N rows
+        """
+        n = self._check_batch(embeddings, timestamps, frame_indices, metadata)
+        times = np.asarray(timestamps, dtype=np.float64)
+        frames = np.asarray(frame_indices).tolist()
+        extras = metadata or [None] * n
+
+        index_metadata = [
+            {
+                "modality": Modality.VISUAL.value,
+                "timestamp": t,
+                "frame_index": frame,
+                **(extra or {}),
+            }
+            for t, frame, extra in zip(times.tolist(), frames, extras, strict=True)
+        ]
+
+        ids = self._add_entries(embeddings, index_metadata)
+        self._store.append(
+            ids,
+            _CODES[Modality.VISUAL],
+            times,
+            frame_indices=frames,
+        )
+        self._version += 1
+        return ids
+
+    def add_transcript_batch(
+        self,
+        embeddings: np.ndarray,
+        start_times: Any,
+        end_times: Any,
+        texts: list[str],
+        segment_ids: list[int | None] | None = None,
+        metadata: list[dict[str, Any] | None] | None = None,
+    ) -> list[int]:
+        """Add many transcript text embeddings with a single index add.
+
+        Args:
+            embeddings: L2-normalized embeddings (N, 768)
+            start_times: Segment start times in seconds (N,)
+            end_times: Segment end times in seconds (N,)
+            texts: Transcript texts (N,)
+            segment_ids: Optional segment identifiers (N,)
+            metadata: Optional per-segment metadata dicts (N,)
+
+        Returns:
+            Entry IDs, in input order
+
+        Raises:
+            ValueError: If the inputs do not all have N rows
+        """
+        n = self._check_batch(
+            embeddings, start_times, end_times, texts, segment_ids, metadata
+        )
+        starts = np.asarray(start_times, dtype=np.float64)
+        ends = np.asarray(end_times, dtype=np.float64)
+        # Use center timestamp for search alignment
+        centres = (starts + ends) / 2
+        extras = metadata or [None] * n
+
+        index_metadata = [
+            {
+                "modality": Modality.TRANSCRIPT.value,
+                "timestamp": t,
+                "start_time": start,
+                "end_time": end,
+                "text": text[:200] if text else None,  # Truncate for storage
+                **(extra or {}),
+            }
+            for t, start, end, text, extra in zip(
+                centres.tolist(),
+                starts.tolist(),
+                ends.tolist(),
+                texts,
+                extras,
+                strict=True,
+            )
+        ]
+
+        ids = self._add_entries(embeddings, index_metadata)
+        self._store.append(
+            ids,
+            _CODES[Modality.TRANSCRIPT],
+            centres,
+            segment_ids=segment_ids,
+            starts=starts,
+            ends=ends,
+            texts=list(texts),
+        )
+        self._lexical.add(ids, list(texts))
+        self._version += 1
+        return ids
+
+    @staticmethod
+    def _check_batch(embeddings: np.ndarray, *columns: Any) -> int:
+        """Validate a batch: (N, D) embeddings and N-long columns (or None)."""
+        if np.ndim(embeddings) != 2:
+            raise ValueError("embeddings must be a 2D (N, D) array")
+        n = len(embeddings)
+        for column in columns:
+            if column is not None and len(column) != n:
+                raise ValueError("all batch inputs must have the same length")
+        return n
+
+    def _add_entries(
+        self, embeddings: np.ndarray, index_metadata: list[dict[str, Any]]
+    ) -> list[int]:
+        """Assign ids and add the embeddings in one index call."""
+        ids = list(range(self._next_id, self._next_id + len(index_metadata)))
+        if ids:
+            self._index.add_batch(embeddings, ids=ids, metadata=index_metadata)
+            self._next_id = ids[-1] + 1
+        return ids
+
     def search(
         self,
         query: np.ndarray,
         k: int = 10,
         modality: Modality | None = None,
+        diversity: DiversityConfig | None = None,
     ) -> list[MultimodalSearchResult]:
         """Search for similar entries.
 
+        A modality filter is applied inside the embedding search, so
+        filtered queries return min(k, entries of that modality) results
+        and cost about as much as searching that modality alone.
+
         Args:
             query: Query embedding (768,)
             k: Number of results
             modality: Filter by modality (None = all)
+            diversity: Diversify the top candidates (None = plain top k)
 
         Returns:
             List of MultimodalSearchResult sorted by score
         """
-        # Get more results if filtering, then filter
-        search_k = k * 3 if modality else k
-
-        raw_results = self._index.search(query, k=search_k)
-
-        results = []
-        for r in raw_results:
-            entry = self._entries.get(r.id)
-            if entry is None:
-                continue
-
-            # Filter by modality if specified
-            if modality and entry.modality != modality:
-                continue
+        return self._cached(
+            query,
+            ("search", k, modality, _config_key(diversity)),
+            lambda: self._search(query, k, modality, diversity),
+        )
 
-            results.append(
-                MultimodalSearchResult(
-                    id=r.id,
-                    score=r.score,
-                    modality=entry.modality,
-                    timestamp=entry.timestamp,
-                    text=entry.text,
-                    frame_index=entry.frame_index,
-                    metadata=r.metadata,
-                )
+    def _search(
+        self,
+        query: np.ndarray,
+        k: int,
+        modality: Modality | None,
+        diversity: DiversityConfig | None,
+    ) -> list[MultimodalSearchResult]:
+        """Uncached ``search``."""
+        ids = self._modality_ids(modality) if modality else None
+        if diversity is not None:
+            batch = self._index.search_batch(
+                np.asarray(query, dtype=np.float32).reshape(1, -1),
+                k=max(k, diversity.pool_size),
+                ids=ids,
             )
+            hits = batch.ids[0] >= 0
+            found, scores = batch.ids[0][hits], batch.scores[0][hits]
+            slots = self._store.slots(found)
+            return [
+                self._result(
+                    int(slots[i]),
+                    float(scores[i]),
+                    metadata=self._index.get_metadata(int(found[i])),
+                )
+                for i in self._diversify(found, scores, slots, k, diversity).tolist()
+            ]
 
-            if len(results) >= k:
-                break
+        raw_results = self._index.search(query, k=k, ids=ids)
 
-        return results
+        slots = self._store.slots([r.id for r in raw_results])
+        return [
+            self._result(int(slot), r.score, metadata=r.metadata)
+            for r, slot in zip(raw_results, slots.tolist(), strict=True)
+            if slot >= 0
+        ]
 
     def search_visual(
         self,
@@ -346,19 +615,25 @@ class MultimodalIndex:
         query: np.ndarray,
         k: int = 10,
         config: RankingConfig | None = None,
+        diversity: DiversityConfig | None = None,
     ) -> list[MultimodalSearchResult]:
         """Search across both modalities with weighted fusion ranking.
 
         IMPLEMENTS: v0.2.0 Week 3 Day 4 - Multimodal search with ranking
 
-        This method queries both visual and transcript indices separately,
-        applies modality-specific weights, and fuses results using a
-        weighted scoring algorithm.
+        The top hits of each modality are gathered into one candidate set
+        (one unfiltered search, plus a filtered one for a modality it holds
+        too few hits of) and scored in a single vectorized pass: modality
+        weight times similarity ("weighted") or times 1 / (rrf_k + rank)
+        ("rrf"), then the optional time decay. With ``diversity`` the top
+        ``pool_size`` fused candidates are re-selected by MMR. Only the
+        final k results are built.
 
         Args:
             query: Query embedding (768,)
             k: Number of final results to return
             config: Ranking configuration (uses defaults if None)
+            diversity: Diversify the top candidates (None = plain top k)
 
         Returns:
             List of MultimodalSearchResult sorted by fused score
@@ -367,76 +642,247 @@ class MultimodalIndex:
             config = RankingConfig(visual_weight=0.3, transcript_weight=0.7)
             results = index.search_multimodal(query_emb, k=10, config=config)
         """
-        if config is None:
-            config = RankingConfig()
-
-        # Get results from each modality (get more to have enough after fusion)
-        fetch_k = k * 2
-        visual_results = self.search_visual(query, k=fetch_k)
-        transcript_results = self.search_transcript(query, k=fetch_k)
-
-        # Apply weights and collect all results
-        scored_results: dict[int, MultimodalSearchResult] = {}
+        ranking = config if config is not None else RankingConfig()
+        return self._cached(
+            query,
+            ("multimodal", k, _config_key(ranking), _config_key(diversity)),
+            lambda: self._search_multimodal(query, k, ranking, diversity),
+        )
 
-        for r in visual_results:
-            weighted_score = r.score * config.visual_weight
-            if config.time_decay > 0 and config.time_reference is not None:
-                weighted_score *= self._apply_time_decay(
-                    r.timestamp, config.time_reference, config.time_decay
-                )
-            scored_results[r.id] = MultimodalSearchResult(
-                id=r.id,
-                score=weighted_score,
-                modality=r.modality,
-                timestamp=r.timestamp,
-                text=r.text,
-                frame_index=r.frame_index,
-                metadata=r.metadata,
+    def _search_multimodal(
+        self,
+        query: np.ndarray,
+        k: int,
+        config: RankingConfig,
+        diversity: DiversityConfig | None,
+    ) -> list[MultimodalSearchResult]:
+        """Uncached ``search_multimodal``."""
+        decay = config.time_decay > 0 and config.time_reference is not None
+        # Fusion keeps the order within a modality, so its top k suffices;
+        # time decay can promote lower-ranked hits, so fetch deeper
+        fetch_k = k * 2 if decay else k
+        if diversity is not None:
+            fetch_k = max(fetch_k, diversity.pool_size)
+        query = np.asarray(query, dtype=np.float32).reshape(1, -1)
+
+        # One unfiltered search of depth fetch_k per modality holds the full
+        # top list of at least one modality (usually the dominant one); a
+        # modality that came up short is searched again, filtered to its ids
+        batch = self._index.search_batch(query, k=fetch_k * len(_MODALITIES))
+        hits = batch.ids[0] >= 0
+        found_ids, found_scores = batch.ids[0][hits], batch.scores[0][hits]
+        found_codes = self._store.column("modality")[self._store.slots(found_ids)]
+
+        id_parts, score_parts, rank_parts = [], [], []
+        for code, modality in enumerate(_MODALITIES):
+            mine = found_codes == code
+            modality_ids = self._modality_ids(modality)
+            if mine.sum() < min(fetch_k, len(modality_ids)):
+                batch = self._index.search_batch(query, k=fetch_k, ids=modality_ids)
+                mine = batch.ids[0] >= 0
+                id_parts.append(batch.ids[0][mine])
+                score_parts.append(batch.scores[0][mine])
+            else:
+                id_parts.append(found_ids[mine][:fetch_k])
+                score_parts.append(found_scores[mine][:fetch_k])
+            rank_parts.append(np.arange(1, len(id_parts[-1]) + 1))
+
+        ids = np.concatenate(id_parts)
+        slots = self._store.slots(ids)
+        weights = np.array([config.visual_weight, config.transcript_weight])
+        weights = weights[self._store.column("modality")[slots]]
+        if config.fusion == "rrf":
+            fused = weights / (config.rrf_k + np.concatenate(rank_parts))
+        else:
+            fused = weights * np.concatenate(score_parts).astype(np.float64)
+        if decay:
+            assert config.time_reference is not None
+            fused *= self._apply_time_decay(
+                self._store.column("timestamp")[slots],
+                config.time_reference,
+                config.time_decay,
             )
 
-        for r in transcript_results:
-            weighted_score = r.score * config.transcript_weight
-            if config.time_decay > 0 and config.time_reference is not None:
-                weighted_score *= self._apply_time_decay(
-                    r.timestamp, config.time_reference, config.time_decay
-                )
-            scored_results[r.id] = MultimodalSearchResult(
-                id=r.id,
-                score=weighted_score,
-                modality=r.modality,
-                timestamp=r.timestamp,
-                text=r.text,
-                frame_index=r.frame_index,
-                metadata=r.metadata,
+        # Stable: ties keep modality order, then rank
+        order = np.argsort(-fused, kind="stable")
+        if diversity is not None:
+            pool = order[: max(k, diversity.pool_size)]
+            order = pool[
+                self._diversify(ids[pool], fused[pool], slots[pool], k, diversity)
+            ]
+        else:
+            order = order[:k]
+        return [
+            self._result(
+                int(slots[i]),
+                float(fused[i]),
+                metadata=self._index.get_metadata(int(ids[i])),
             )
+            for i in order.tolist()
+        ]
 
-        # Sort by weighted score and return top k
-        sorted_results = sorted(
-            scored_results.values(), key=lambda x: x.score, reverse=True
+    def _diversify(
+        self,
+        ids: np.ndarray,
+        scores: np.ndarray,
+        slots: np.ndarray,
+        k: int,
+        config: DiversityConfig,
+    ) -> np.ndarray:
+        """Positions of k diverse candidates, in the candidates' order.
+
+        Candidates must be sorted by score, so the picks come back sorted
+        by score too.
+        """
+        store = self._store
+        picked = mmr_select(
+            self._index.reconstruct(ids),
+            scores,
+            k,
+            mmr_lambda=config.mmr_lambda,
+            timestamps=store.column("timestamp")[slots],
+            min_separation=config.min_separation,
+            groups=store.column("modality")[slots],
         )
-        return sorted_results[:k]
+        return np.sort(picked)
 
     def _apply_time_decay(
         self,
-        timestamp: float,
+        timestamp: float | np.ndarray,
         reference: float,
         decay: float,
-    ) -> float:
+    ) -> float | np.ndarray:
         """Apply exponential time decay to score.
 
         Args:
-            timestamp: Entry timestamp
+            timestamp: Entry timestamp, or an array of them
             reference: Reference timestamp
             decay: Decay factor (0-1, higher = more decay)
 
         Returns:
-            Decay multiplier (0-1)
+            Decay multiplier (0-1), an array for an array of timestamps
         """
-        time_diff = abs(timestamp - reference)
+        time_diff = np.abs(np.asarray(timestamp, dtype=np.float64) - reference)
         # Exponential decay: e^(-decay * time_diff)
         # At time_diff=0: returns 1.0
         # As time_diff increases: approaches 0
-        return float(np.exp(-decay * time_diff))
+        multiplier: np.ndarray = np.exp(-decay * time_diff)
+        return float(multiplier) if multiplier.ndim == 0 else multiplier
+
+    def search_lexical(
+        self,
+        text: str,
+        k: int = 10,
+    ) -> list[MultimodalSearchResult]:
+        """Search transcript texts by BM25 keyword relevance.
+
+        Matches whole words (case-insensitive), so exact terms such as
+        formula names and acronyms are found even when their embeddings
+        are not close to the query's.
+
+        Args:
+            text: Query text
+            k: Number of results
+
+        Returns:
+            Transcript results sorted by BM25 score; entries sharing no
+            word with the query are not returned
+        """
+        ids, scores = self._lexical.search(text, k=k)
+        return self._results(ids, scores)
+
+    def search_hybrid(
+        self,
+        query: np.ndarray,
+        text: str,
+        k: int = 10,
+        config: HybridConfig | None = None,
+    ) -> list[MultimodalSearchResult]:
+        """Search transcripts by fusing dense and BM25 rankings.
+
+        The top 2k transcript hits of the embedding search and of the
+        BM25 index are merged into one candidate set and fused with
+        array operations (see HybridConfig).
+
+        Args:
+            query: Query embedding (768,)
+            text: Query text, for the lexical ranking
+            k: Number of final results to return
+            config: Hybrid configuration (uses defaults if None)
+
+        Returns:
+            List of transcript MultimodalSearchResult sorted by fused score
+        """
+        hybrid = config if config is not None else HybridConfig()
+        return self._cached(
+            query,
+            ("hybrid", k, text, _config_key(hybrid)),
+            lambda: self._search_hybrid(query, text, k, hybrid),
+        )
+
+    def _search_hybrid(
+        self, query: np.ndarray, text: str, k: int, config: HybridConfig
+    ) -> list[MultimodalSearchResult]:
+        """Uncached ``search_hybrid``."""
+        fetch_k = k * 2
+        batch = self._index.search_batch(
+            np.asarray(query, dtype=np.float32).reshape(1, -1),
+            k=fetch_k,
+            ids=self._modality_ids(Modality.TRANSCRIPT),
+        )
+        hits = batch.ids[0] >= 0
+        rankings = (
+            (config.dense_weight, batch.ids[0][hits], batch.scores[0][hits]),
+            (config.lexical_weight, *self._lexical.search(text, k=fetch_k)),
+        )
+
+        ids = np.union1d(rankings[0][1], rankings[1][1])
+        fused = np.zeros(len(ids))
+        for weight, ranked_ids, scores in rankings:
+            if len(ranked_ids) == 0:
+                continue
+            if config.fusion == "rrf":
+                contribution = 1.0 / (config.rrf_k + np.arange(1, len(scores) + 1))
+            else:
+                low, high = float(scores.min()), float(scores.max())
+                contribution = (
+                    (scores - low) / (high - low)
+                    if high > low
+                    else np.ones(len(scores))
+                )
+            fused[np.searchsorted(ids, ranked_ids)] += weight * contribution
+
+        order = np.lexsort((ids, -fused))[:k]
+        slots = self._store.slots(ids[order])
+        return [
+            self._result(slot, score, metadata=self._index.get_metadata(int(ids[i])))
+            for i, slot, score in zip(
+                order.tolist(), slots.tolist(), fused[order].tolist(), strict=True
+            )
+        ]
+
+    def _cached(
+        self,
+        query: np.ndarray,
+        params: tuple[Hashable, ...],
+        search: Callable[[], list[MultimodalSearchResult]],
+    ) -> list[MultimodalSearchResult]:
+        """Results of ``search`` through the query cache.
+
+        Callers get copies of the cached results, so changing their
+        fields does not change later hits (metadata dicts are shared).
+        """
+        if not self._cache.capacity:
+            return search()
+        key = self._cache.key(query, *params)
+        # Read before searching: results stored for a version that
+        # changed mid-search are discarded on the next lookup
+        version = self._version
+        results = self._cache.get(key, version)
+        if results is None:
+            results = search()
+            self._cache.put(key, version, results)
+        return [replace(r) for r in results]
 
     def search_by_timestamp(
         self,
@@ -458,29 +904,98 @@ class MultimodalIndex:
         if tolerance <= 0:
             raise ValueError("tolerance must be positive")
 
-        results = []
-
-        for id_, entry in self._entries.items():
-            time_diff = abs(entry.timestamp - timestamp)
-            if time_diff <= tolerance:
-                results.append(
-                    MultimodalSearchResult(
-                        id=id_,
-                        score=1.0 - (time_diff / tolerance),  # Closer = higher score
-                        modality=entry.modality,
-                        timestamp=entry.timestamp,
-                        text=entry.text,
-                        frame_index=entry.frame_index,
-                    )
-                )
+        ids = []
+        scores = []
+        for name in ("visual", "transcript"):
+            hit_ids, diffs = self._point_hits(
+                self._timeline(name), timestamp, tolerance
+            )
+            ids.append(hit_ids)
+            scores.append(1.0 - diffs / tolerance)  # Closer = higher score
 
-        # Sort by score (proximity)
-        results.sort(key=lambda x: x.score, reverse=True)
-        return results
+        return self._results(np.concatenate(ids), np.concatenate(scores), text=True)
+
+    def _point_hits(
+        self, timeline: TimelineIndex, timestamp: float, tolerance: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Ids and time distances of point entries within ±tolerance."""
+        rows = timeline.query(
+            timestamp - tolerance - _TIME_SLACK, timestamp + tolerance + _TIME_SLACK
+        )
+        diffs = np.abs(timeline.starts[rows] - timestamp)
+        keep = diffs <= tolerance
+        return timeline.ids[rows[keep]], diffs[keep]
+
+    def _results(
+        self,
+        ids: np.ndarray,
+        scores: np.ndarray,
+        text: bool = True,
+        frame_index: bool = True,
+    ) -> list[MultimodalSearchResult]:
+        """Timestamp-lookup results sorted by score, ties in insertion order."""
+        order = np.lexsort((ids, -scores))
+        slots = self._store.slots(ids[order])
+        return [
+            self._result(slot, score, text=text, frame_index=frame_index)
+            for slot, score in zip(slots.tolist(), scores[order].tolist(), strict=True)
+        ]
+
+    def _result(
+        self,
+        slot: int,
+        score: float,
+        text: bool = True,
+        frame_index: bool = True,
+        metadata: dict[str, Any] | None = None,
+    ) -> MultimodalSearchResult:
+        """Search result for one entry slot, read from the entry columns."""
+        store = self._store
+        return MultimodalSearchResult(
+            id=int(store.ids[slot]),
+            score=score,
+            modality=_MODALITIES[store.column("modality")[slot]],
+            timestamp=float(store.column("timestamp")[slot]),
+            text=store.text(slot) if text else None,
+            frame_index=store.optional_int("frame_index", slot)
+            if frame_index
+            else None,
+            metadata=metadata,
+        )
 
     def get_entry(self, id_: int) -> MultimodalEntry | None:
-        """Get entry by ID."""
-        return self._entries.get(id_)
+        """Get entry by ID.
+
+        The entry is assembled on demand: fields from the entry columns,
+        embedding and extra metadata from the embedding index. Mutating it
+        does not change the index.
+        """
+        slot = int(self._store.slots([id_])[0])
+        if slot < 0:
+            return None
+
+        store = self._store
+        return MultimodalEntry(
+            id=id_,
+            modality=_MODALITIES[store.column("modality")[slot]],
+            timestamp=float(store.column("timestamp")[slot]),
+            embedding=self._index.reconstruct([id_])[0],
+            frame_index=store.optional_int("frame_index", slot),
+            text=store.text(slot),
+            segment_id=store.optional_int("segment_id", slot),
+            metadata=self._entry_metadata(id_, slot),
+        )
+
+    def _entry_metadata(self, id_: int, slot: int) -> dict[str, Any]:
+        """Entry metadata: the index metadata minus the entry's own fields."""
+        store = self._store
+        modality = _MODALITIES[store.column("modality")[slot]]
+        stored = self._index.get_metadata(id_) or {}
+        metadata = {k: v for k, v in stored.items() if k not in _ENTRY_KEYS[modality]}
+        if modality == Modality.TRANSCRIPT:
+            metadata.setdefault("start_time", float(store.column("start")[slot]))
+            metadata.setdefault("end_time", float(store.column("end")[slot]))
+        return metadata
 
     def get_aligned_context(
         self,
@@ -500,66 +1015,90 @@ class MultimodalIndex:
         Returns:
             Dict with 'visual' and 'transcript' result lists
 
+        Raises:
+            ValueError: If any tolerance is not positive
+        """
+        return self.get_aligned_context_batch(
+            [timestamp], visual_tolerance, transcript_tolerance
+        )[0]
+
+    def get_aligned_context_batch(
+        self,
+        timestamps: Any,
+        visual_tolerance: float = 1.0,
+        transcript_tolerance: float = 2.0,
+    ) -> list[dict[str, list[MultimodalSearchResult]]]:
+        """Get aligned context for many timestamps at once.
+
+        Window bounds for all timestamps are located with one vectorized
+        binary search per modality, so each lookup costs O(log N + hits).
+
+        Args:
+            timestamps: Target times in seconds (sequence or array)
+            visual_tolerance: Tolerance for visual frames, must be positive
+            transcript_tolerance: Tolerance for transcript, must be positive
+
+        Returns:
+            One get_aligned_context() dict per timestamp, in input order
+
         Raises:
             ValueError: If any tolerance is not positive
         """
         if visual_tolerance <= 0 or transcript_tolerance <= 0:
             raise ValueError("tolerance values must be positive")
 
-        visual_results = []
-        transcript_results = []
-
-        for id_, entry in self._entries.items():
-            if entry.modality == Modality.VISUAL:
-                time_diff = abs(entry.timestamp - timestamp)
-                if time_diff <= visual_tolerance:
-                    visual_results.append(
-                        MultimodalSearchResult(
-                            id=id_,
-                            score=1.0 - (time_diff / visual_tolerance),
-                            modality=entry.modality,
-                            timestamp=entry.timestamp,
-                            frame_index=entry.frame_index,
-                        )
-                    )
-            else:  # TRANSCRIPT
-                # Check if timestamp falls within segment
-                start = entry.metadata.get("start_time", entry.timestamp)
-                end = entry.metadata.get("end_time", entry.timestamp)
-
-                # Expand by tolerance
-                if (
-                    start - transcript_tolerance
-                    <= timestamp
-                    <= end + transcript_tolerance
-                ):
-                    # Score based on overlap
-                    overlap = min(end, timestamp + transcript_tolerance) - max(
-                        start, timestamp - transcript_tolerance
-                    )
-                    score = overlap / (2 * transcript_tolerance)
-                    transcript_results.append(
-                        MultimodalSearchResult(
-                            id=id_,
-                            score=max(0, score),
-                            modality=entry.modality,
-                            timestamp=entry.timestamp,
-                            text=entry.text,
-                        )
-                    )
-
-        # Sort by score
-        visual_results.sort(key=lambda x: x.score, reverse=True)
-        transcript_results.sort(key=lambda x: x.score, reverse=True)
-
-        return {
-            "visual": visual_results,
-            "transcript": transcript_results,
-        }
+        times = np.asarray(timestamps, dtype=np.float64).ravel()
+        visual = self._timeline("visual")
+        span = self._timeline("span")
+        visual_rows = visual.query_batch(
+            times - visual_tolerance - _TIME_SLACK,
+            times + visual_tolerance + _TIME_SLACK,
+        )
+        # Segments whose span, expanded by the tolerance, contains the time
+        span_rows = span.query_batch(
+            times - transcript_tolerance - _TIME_SLACK,
+            times + transcript_tolerance + _TIME_SLACK,
+        )
+
+        contexts = []
+        for t, v_rows, s_rows in zip(
+            times.tolist(), visual_rows, span_rows, strict=True
+        ):
+            diffs = np.abs(visual.starts[v_rows] - t)
+            keep = diffs <= visual_tolerance
+            visual_results = self._results(
+                visual.ids[v_rows[keep]],
+                1.0 - diffs[keep] / visual_tolerance,
+                text=False,
+            )
+
+            starts, ends = span.starts[s_rows], span.ends[s_rows]
+            keep = (starts - transcript_tolerance <= t) & (
+                t <= ends + transcript_tolerance
+            )
+            # Score based on overlap with the ±tolerance window
+            overlap = np.minimum(ends[keep], t + transcript_tolerance) - np.maximum(
+                starts[keep], t - transcript_tolerance
+            )
+            transcript_results = self._results(
+                span.ids[s_rows[keep]],
+                np.maximum(0.0, overlap / (2 * transcript_tolerance)),
+                frame_index=False,
+            )
+
+            contexts.append(
+                {"visual": visual_results, "transcript": transcript_results}
+            )
+        return contexts
 
     def save(self, path: Path) -> None:
         """Save multimodal index to disk.
 
+        Writes the embedding index files (see EmbeddingIndex.save) and a
+        binary container (.multimodal.bin, see container.py) holding the
+        entry columns, the packed text table and one float32 embedding
+        matrix per modality, rows in id order.
+
         Args:
             path: Base path for index files
         """
@@ -568,30 +1107,27 @@ class MultimodalIndex:
         # Save FAISS index
         self._index.save(path)
 
-        # Save entries as JSON
-        entries_data = {}
-        for id_, entry in self._entries.items():
-            entries_data[str(id_)] = {
-                "modality": entry.modality.value,
-                "timestamp": entry.timestamp,
-                "frame_index": entry.frame_index,
-                "text": entry.text,
-                "segment_id": entry.segment_id,
-                "metadata": entry.metadata,
-            }
-
-        multimodal_path = path.with_suffix(".multimodal.json")
-        with open(multimodal_path, "w") as f:
-            json.dump(
-                {
-                    "next_id": self._next_id,
-                    "visual_ids": self._visual_ids,
-                    "transcript_ids": self._transcript_ids,
-                    "entries": entries_data,
-                },
-                f,
-                indent=2,
-            )
+        writer = ContainerWriter(path.with_suffix(".multimodal.bin"))
+        try:
+            for name, column in self._store.columns().items():
+                writer.add(f"entries.{name}", column)
+            writer.add("entries.text", self._store.text_bytes)
+            for modality in _MODALITIES:
+                ids = self._modality_ids(modality)
+                chunks = (
+                    self._index.reconstruct(ids[i : i + _SAVE_CHUNK_ROWS])
+                    for i in range(0, len(ids), _SAVE_CHUNK_ROWS)
+                )
+                writer.add_rows(
+                    f"embeddings.{modality.value}",
+                    chunks,
+                    np.float32,
+                    (self._dimension,),
+                )
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close({"dimension": self._dimension, "next_id": self._next_id})
 
         logger.info(
             "Saved multimodal index to %s: %d visual, %d transcript",
@@ -601,43 +1137,81 @@ class MultimodalIndex:
         )
 
     @classmethod
-    def load(cls, path: Path) -> MultimodalIndex:
+    def load(
+        cls,
+        path: Path,
+        mmap: bool = False,
+        modality: Modality | None = None,
+        verify: bool = True,
+        cache_size: int = DEFAULT_CAPACITY,
+    ) -> MultimodalIndex:
         """Load multimodal index from disk.
 
+        With ``modality`` only that modality is loaded: the saved FAISS
+        index and the other modality's embeddings are not read. Its
+        embedding index is rebuilt from the container's embedding matrix
+        with the saved codec and backend policy, so a modality past the
+        policy's transition threshold pays the IVF (or codec) training of
+        a fresh build, and the rebuilt index lives in memory. The metadata
+        sidecar (.meta.npz) is read in full; only this modality's rows are
+        decoded. Indexes saved before the binary container
+        (.multimodal.json) still load in full.
+
         Args:
             path: Base path for index files
+            mmap: Memory-map the embedding index (see EmbeddingIndex.load)
+                and read container sections as read-only memory maps; with
+                ``modality`` only the container sections are mapped
+            modality: Load only the entries of this modality (None = all)
+            verify: Check each container section read against its CRC32
+            cache_size: Search results kept in the query cache (0 = off)
 
         Returns:
             Loaded MultimodalIndex
+
+        Raises:
+            ValueError: If the container is corrupted or has an unknown
+                format version, or ``modality`` is given for a JSON index
         """
         path = Path(path)
-        index = cls()
-
-        # Load FAISS index
-        index._index = EmbeddingIndex.load(path)
-
-        # Load entries
-        multimodal_path = path.with_suffix(".multimodal.json")
-        if multimodal_path.exists():
-            with open(multimodal_path) as f:
-                data = json.load(f)
-
-            index._next_id = data.get("next_id", 0)
-            index._visual_ids = data.get("visual_ids", [])
-            index._transcript_ids = data.get("transcript_ids", [])
-
-            for id_str, entry_data in data.get("entries", {}).items():
-                id_ = int(id_str)
-                index._entries[id_] = MultimodalEntry(
-                    id=id_,
-                    modality=Modality(entry_data["modality"]),
-                    timestamp=entry_data["timestamp"],
-                    embedding=np.zeros(index._dimension),  # Not stored, use index
-                    frame_index=entry_data.get("frame_index"),
-                    text=entry_data.get("text"),
-                    segment_id=entry_data.get("segment_id"),
-                    metadata=entry_data.get("metadata", {}),
+        container_path = path.with_suffix(".multimodal.bin")
+        if not container_path.exists():
+            if modality is not None:
+                raise ValueError(
+                    "loading one modality needs a .multimodal.bin index; "
+                    "load it in full and save it again"
+                )
+            index = cls(cache_size=cache_size)
+            index._index = EmbeddingIndex.load(path, mmap=mmap)
+            index._load_json_entries(path.with_suffix(".multimodal.json"))
+        else:
+            container = Container(container_path, mmap=mmap, verify=verify)
+            index = cls(dimension=container.info["dimension"], cache_size=cache_size)
+            index._next_id = container.info["next_id"]
+            store = EntryStore.from_columns(
+                {name: container.read(f"entries.{name}") for name in COLUMN_NAMES},
+                container.read("entries.text"),
+            )
+            if modality is None:
+                index._index = EmbeddingIndex.load(path, mmap=mmap)
+            else:
+                store = store.take(
+                    np.flatnonzero(store.column("modality") == _CODES[modality])
+                )
+                index._index = index._modality_index(
+                    path,
+                    store.ids,
+                    container.read(f"embeddings.{modality.value}"),
                 )
+            index._store = store
+
+        store = index._store
+        transcript = np.flatnonzero(
+            store.column("modality") == _CODES[Modality.TRANSCRIPT]
+        )
+        index._lexical.add(
+            store.ids[transcript], [store.text(slot) for slot in transcript.tolist()]
+        )
 
         logger.info(
             "Loaded multimodal index from %s: %d visual, %d transcript",
@@ -648,6 +1222,58 @@ class MultimodalIndex:
 
         return index
 
+    def _modality_index(
+        self, path: Path, ids: np.ndarray, embeddings: np.ndarray
+    ) -> EmbeddingIndex:
+        """Embedding index over one modality's saved rows and metadata.
+
+        Configured like the saved index (codec, policy, nprobe), and
+        trained from scratch once the rows reach the policy's threshold.
+        """
+        if len(embeddings) != len(ids):
+            raise ValueError(
+                f"container holds {len(embeddings)} embeddings for {len(ids)} entries"
+            )
+        meta_path = path.with_suffix(".meta.npz")
+        stored = MetadataStore.load(meta_path) if meta_path.exists() else {}
+        id_list = ids.tolist()
+        index = EmbeddingIndex.empty_like(path)
+        if id_list:
+            index.add_batch(
+                embeddings,
+                ids=id_list,
+                metadata={id_: stored[id_] for id_ in id_list if id_ in stored},
+            )
+        return index
+
+    def _load_json_entries(self, multimodal_path: Path) -> None:
+        """Load entries from a .multimodal.json file (pre-container format)."""
+        if not multimodal_path.exists():
+            return
+        with open(multimodal_path) as f:
+            data = json.load(f)
+
+        self._next_id = data.get("next_id", 0)
+
+        # Modality id lists are derived from the entries themselves
+        entries = sorted(
+            (int(id_str), entry) for id_str, entry in data.get("entries", {}).items()
+        )
+        timestamps = [entry["timestamp"] for _, entry in entries]
+        spans = [entry.get("metadata", {}) for _, entry in entries]
+        self._store.append(
+            [id_ for id_, _ in entries],
+            [_CODES[Modality(entry["modality"])] for _, entry in entries],
+            timestamps,
+            frame_indices=[entry.get("frame_index") for _, entry in entries],
+            segment_ids=[entry.get("segment_id") for _, entry in entries],
+            starts=[
+                m.get("start_time", t) for m, t in zip(spans, timestamps, strict=True)
+            ],
+            ends=[m.get("end_time", t) for m, t in zip(spans, timestamps, strict=True)],
+            texts=[entry.get("text") for _, entry in entries],
+        )
+
     def __repr__(self) -> str:
         return (
             f"MultimodalIndex(visual={self.visual_count}, "
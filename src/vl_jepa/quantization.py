@@ -0,0 +1,294 @@
+"""
+SPEC: S007 - Embedding Index (compressed storage)
+
+Numpy embedding codecs used by EmbeddingIndex when FAISS is unavailable.
+
+Each codec mirrors a FAISS storage mode so both backends offer the same
+memory/recall trade-offs:
+
+- float32: raw vectors (IndexFlatIP / IndexIVFFlat)
+- float16: half precision (QT_fp16 scalar quantizer)
+- sq8: per-dimension 8-bit scalar quantization (QT_8bit)
+- pq: product quantization, 8 bits per sub-vector (IndexIVFPQ)
+"""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CODECS: tuple[str, ...] = ("float32", "float16", "sq8", "pq")
+
+# Rows scored per block; bounds temporary memory when decoding codes
+SCORE_BLOCK_ROWS: int = 16384
+
+
+class EmbeddingCodec:
+    """Lossless float32 codec and base class for compressed codecs.
+
+    Subclasses override encode/decode (and score where a faster path than
+    decode-then-dot exists). Codes are stored as a 2D array of ``dtype``
+    with ``code_width`` columns.
+    """
+
+    name: str = "float32"
+    dtype: type = np.float32
+    needs_training: bool = False
+
+    def __init__(self, dimension: int) -> None:
+        """Initialize codec.
+
+        Args:
+            dimension: Embedding dimension
+        """
+        self.dimension = dimension
+        self.is_trained = not self.needs_training
+
+    @property
+    def code_width(self) -> int:
+        """Number of code columns per vector."""
+        return self.dimension
+
+    @property
+    def bytes_per_vector(self) -> int:
+        """Storage bytes per encoded vector."""
+        return self.code_width * np.dtype(self.dtype).itemsize
+
+    def train(self, embeddings: np.ndarray) -> None:
+        """Fit codec parameters on sample embeddings (N, D)."""
+        self.is_trained = True
+
+    def encode(self, embeddings: np.ndarray) -> np.ndarray:
+        """Encode embeddings (N, D) to codes (N, code_width)."""
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Decode codes (N, code_width) to float32 embeddings (N, D)."""
+        return np.asarray(codes, dtype=np.float32)
+
+    def score(self, queries: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Inner products between queries (Q, D) and encoded rows.
+
+        Returns:
+            Score matrix (Q, N)
+        """
+        if codes.dtype == np.float32:
+            result: np.ndarray = queries @ codes.T
+            return result
+
+        scores = np.empty((len(queries), len(codes)), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_BLOCK_ROWS):
+            block = self.decode(codes[start : start + SCORE_BLOCK_ROWS])
+            scores[:, start : start + len(block)] = queries @ block.T
+        return scores
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """Trained parameters as arrays (for persistence)."""
+        return {}
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        """Restore trained parameters saved by get_state()."""
+        self.is_trained = True
+
+
+class Float16Codec(EmbeddingCodec):
+    """Half-precision storage (2 bytes per dimension)."""
+
+    name = "float16"
+    dtype = np.float16
+
+    def encode(self, embeddings: np.ndarray) -> np.ndarray:
+        return np.ascontiguousarray(embeddings, dtype=np.float16)
+
+
+class ScalarQuantizer8(EmbeddingCodec):
+    """Per-dimension 8-bit scalar quantization (1 byte per dimension).
+
+    Each dimension is mapped linearly from its trained [min, max] range
+    to 256 levels, like FAISS QT_8bit.
+    """
+
+    name = "sq8"
+    dtype = np.uint8
+    needs_training = True
+
+    def __init__(self, dimension: int) -> None:
+        super().__init__(dimension)
+        self._vmin = np.zeros(dimension, dtype=np.float32)
+        self._scale = np.ones(dimension, dtype=np.float32)
+
+    def train(self, embeddings: np.ndarray) -> None:
+        self._vmin = embeddings.min(axis=0).astype(np.float32)
+        vmax = embeddings.max(axis=0).astype(np.float32)
+        self._scale = np.maximum(vmax - self._vmin, 1e-12) / 255.0
+        self.is_trained = True
+
+    def encode(self, embeddings: np.ndarray) -> np.ndarray:
+        levels = np.rint((embeddings - self._vmin) / self._scale)
+        codes: np.ndarray = np.clip(levels, 0, 255).astype(np.uint8)
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        result: np.ndarray = self._vmin + codes.astype(np.float32) * self._scale
+        return result
+
+    def score(self, queries: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        # q . (vmin + scale * c) = q . vmin + (q * scale) . c
+        offset = queries @ self._vmin
+        scaled = queries * self._scale
+        scores = np.empty((len(queries), len(codes)), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_BLOCK_ROWS):
+            block = codes[start : start + SCORE_BLOCK_ROWS].astype(np.float32)
+            scores[:, start : start + len(block)] = scaled @ block.T
+        scores += offset[:, None]
+        return scores
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        return {"vmin": self._vmin, "scale": self._scale}
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        self._vmin = np.asarray(state["vmin"], dtype=np.float32)
+        self._scale = np.asarray(state["scale"], dtype=np.float32)
+        self.is_trained = True
+
+
+class ProductQuantizer(EmbeddingCodec):
+    """Product quantization with 256 centroids per sub-vector (1 byte each).
+
+    The D-dim space is split into ``num_subvectors`` blocks, each coded by
+    its nearest k-means centroid. Search uses asymmetric distance
+    computation: per-query lookup tables of sub-vector inner products.
+    """
+
+    name = "pq"
+    dtype = np.uint8
+    needs_training = True
+
+    NUM_CENTROIDS: int = 256
+    TRAIN_ITERATIONS: int = 10
+    MAX_TRAIN_POINTS: int = 256 * 40
+
+    def __init__(self, dimension: int, num_subvectors: int = 96) -> None:
+        """Initialize product quantizer.
+
+        Args:
+            dimension: Embedding dimension
+            num_subvectors: Number of sub-vectors (must divide dimension)
+
+        Raises:
+            ValueError: If num_subvectors does not divide dimension
+        """
+        if num_subvectors < 1 or dimension % num_subvectors != 0:
+            raise ValueError("num_subvectors must divide dimension")
+        super().__init__(dimension)
+        self.num_subvectors = num_subvectors
+        self._sub_dim = dimension // num_subvectors
+        # (M, K, D/M) centroids
+        self._centroids = np.zeros(
+            (num_subvectors, self.NUM_CENTROIDS, self._sub_dim), dtype=np.float32
+        )
+
+    @property
+    def code_width(self) -> int:
+        return self.num_subvectors
+
+    def _split(self, embeddings: np.ndarray) -> np.ndarray:
+        """Reshape (N, D) to (M, N, D/M) sub-vectors."""
+        n = len(embeddings)
+        sub = embeddings.reshape(n, self.num_subvectors, self._sub_dim)
+        return np.ascontiguousarray(sub.transpose(1, 0, 2), dtype=np.float32)
+
+    def train(self, embeddings: np.ndarray) -> None:
+        rng = np.random.default_rng(0)
+        if len(embeddings) > self.MAX_TRAIN_POINTS:
+            rows = rng.choice(len(embeddings), self.MAX_TRAIN_POINTS, replace=False)
+            embeddings = embeddings[rows]
+
+        num_centroids = min(self.NUM_CENTROIDS, len(embeddings))
+        subs = self._split(embeddings)
+
+        for m in range(self.num_subvectors):
+            points = subs[m]
+            init = rng.choice(len(points), num_centroids, replace=False)
+            centroids = points[init].copy()
+            for _ in range(self.TRAIN_ITERATIONS):
+                assign = self._nearest(points, centroids)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, assign, points)
+                counts = np.bincount(assign, minlength=num_centroids)
+                filled = counts > 0
+                centroids[filled] = sums[filled] / counts[filled, None]
+            self._centroids[m, :num_centroids] = centroids
+            # Unused slots duplicate the first centroid (never closer)
+            self._centroids[m, num_centroids:] = centroids[0]
+
+        self.is_trained = True
+
+    @staticmethod
+    def _nearest(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Index of nearest centroid (L2) for each point."""
+        dist = (
+            np.einsum("ij,ij->i", centroids, centroids)[None, :]
+            - 2.0 * points @ centroids.T
+        )
+        result: np.ndarray = dist.argmin(axis=1)
+        return result
+
+    def encode(self, embeddings: np.ndarray) -> np.ndarray:
+        subs = self._split(embeddings)
+        codes = np.empty((len(embeddings), self.num_subvectors), dtype=np.uint8)
+        for m in range(self.num_subvectors):
+            codes[:, m] = self._nearest(subs[m], self._centroids[m])
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        parts = self._centroids[np.arange(self.num_subvectors), codes]
+        result: np.ndarray = parts.reshape(len(codes), self.dimension)
+        return result
+
+    def score(self, queries: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        # Lookup tables (Q, M, K): query sub-vector . centroid
+        tables = np.einsum("mqd,mkd->mqk", self._split(queries), self._centroids)
+        codes_by_sub = np.ascontiguousarray(codes.T)  # (M, N)
+        scores = np.zeros((len(queries), len(codes)), dtype=np.float32)
+        for m in range(self.num_subvectors):
+            # (Q, K) table gathered by the N codes of sub-vector m
+            scores += np.take(tables[m], codes_by_sub[m], axis=1)
+        return scores
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        return {"centroids": self._centroids}
+
+    def set_state(self, state: dict[str, np.ndarray]) -> None:
+        self._centroids = np.asarray(state["centroids"], dtype=np.float32)
+        self.num_subvectors = self._centroids.shape[0]
+        self._sub_dim = self._centroids.shape[2]
+        self.is_trained = True
+
+
+def make_codec(name: str, dimension: int, pq_subvectors: int = 96) -> EmbeddingCodec:
+    """Create a numpy codec by name.
+
+    Args:
+        name: One of CODECS
+        dimension: Embedding dimension
+        pq_subvectors: Sub-vectors for the "pq" codec
+
+    Returns:
+        Untrained codec instance
+
+    Raises:
+        ValueError: If name is not a known codec
+    """
+    if name == "float32":
+        return EmbeddingCodec(dimension)
+    if name == "float16":
+        return Float16Codec(dimension)
+    if name == "sq8":
+        return ScalarQuantizer8(dimension)
+    if name == "pq":
+        return ProductQuantizer(dimension, num_subvectors=pq_subvectors)
+    raise ValueError(f"Unknown codec '{name}', expected one of {CODECS}")
@@ -0,0 +1,183 @@
+"""
+SPEC: Multimodal Index (query cache)
+
+Bounded LRU cache of search results, keyed by query embedding.
+
+Repeated searches (suggested queries, pagination, re-sorting) skip the
+embedding search and fusion entirely. A key hashes the query embedding
+rounded to a fixed grid, together with the search parameters, so float
+noise from re-encoding the same text usually maps to the same key (a
+component right at a rounding boundary only costs a miss).
+
+Each cached value records the index version it was computed at. A lookup
+at any other version is a miss and drops the value, so adding entries
+invalidates every cached result without walking the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+DEFAULT_CAPACITY: int = 256
+
+# Query components are rounded to this many decimals before hashing;
+# L2-normalized 768-dim embeddings have components around 0.04
+DEFAULT_DECIMALS: int = 5
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of query cache counters.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that had to search (including stale entries)
+        evictions: Entries dropped to stay within capacity
+        invalidations: Entries dropped because the index changed
+        size: Entries currently cached
+        capacity: Maximum number of entries
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    capacity: int
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0 if none)."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+def query_digest(query: np.ndarray, decimals: int = DEFAULT_DECIMALS) -> bytes:
+    """Hash of a query embedding rounded to ``decimals`` places.
+
+    Args:
+        query: Query embedding, any shape
+        decimals: Rounding precision of each component
+
+    Returns:
+        16-byte digest, equal for embeddings on the same rounding grid
+    """
+    grid = np.rint(np.asarray(query, dtype=np.float32).ravel() * 10.0**decimals)
+    return hashlib.blake2b(grid.astype(np.int64).tobytes(), digest_size=16).digest()
+
+
+class QueryCache:
+    """Thread-safe LRU cache of versioned search results.
+
+    Example:
+        cache = QueryCache(capacity=128)
+        key = cache.key(query, "search", 10)
+        results = cache.get(key, version)
+        if results is None:
+            results = run_search()
+            cache.put(key, version, results)
+    """
+
+    def __init__(
+        self, capacity: int = DEFAULT_CAPACITY, decimals: int = DEFAULT_DECIMALS
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            capacity: Maximum number of cached results (0 disables caching)
+            decimals: Rounding precision of query components in keys
+
+        Raises:
+            ValueError: If capacity is negative
+        """
+        if capacity < 0:
+            raise ValueError("capacity must be non-negative")
+        self._capacity = capacity
+        self._decimals = decimals
+        self._entries: OrderedDict[Hashable, tuple[int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of cached results."""
+        return self._capacity
+
+    def key(self, query: np.ndarray, *params: Hashable) -> tuple[Hashable, ...]:
+        """Cache key of a query embedding and hashable search parameters."""
+        return (query_digest(query, self._decimals), *params)
+
+    def get(self, key: Hashable, version: int) -> Any | None:
+        """Cached value for ``key`` if it was stored at ``version``.
+
+        Args:
+            key: Cache key (see ``key``)
+            version: Current index version
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+                self._invalidations += 1
+            self._misses += 1
+            return None
+
+    def put(self, key: Hashable, version: int, value: Any) -> None:
+        """Cache ``value`` computed at ``version``, evicting the oldest.
+
+        Args:
+            key: Cache key (see ``key``)
+            version: Index version the value was computed at
+            value: Value to cache
+        """
+        if self._capacity == 0:
+            return
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached value (counters are kept)."""
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                capacity=self._capacity,
+            )
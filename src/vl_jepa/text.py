@@ -7,10 +7,13 @@ MiniLM text encoder with projection to visual embedding space.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from vl_jepa.embedding_cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,31 +35,62 @@ class TextEncoder:
     TEXT_DIM: int = 384
     VISUAL_DIM: int = 768
     MAX_TOKENS: int = 256
+    BATCH_SIZE: int = 32
 
     def __init__(
         self,
         model: Any,
         projection: np.ndarray | None = None,
+        batch_size: int = BATCH_SIZE,
+        cache: EmbeddingCache | None = None,
+        model_name: str = "all-MiniLM-L6-v2",
     ) -> None:
         """Initialize text encoder.
 
         Args:
             model: Sentence transformer model
             projection: Optional projection matrix (384, 768)
+            batch_size: Texts per model forward pass in encode_batch
+            cache: Optional embedding cache consulted before the model
+            model_name: Model identity used in cache keys
+
+        Raises:
+            ValueError: If batch_size is not positive
         """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
         self._model = model
-        self._projection = projection
+        self._batch_size = batch_size
 
         # Default projection: simple expansion with L2 normalization
-        if self._projection is None:
-            self._projection = self._default_projection()
+        self._projection: np.ndarray = (
+            projection if projection is not None else self._default_projection()
+        )
+
+        self._cache = cache
+        self._cache_namespace = ""
+        if cache is not None:
+            from vl_jepa.embedding_cache import array_digest
+
+            name = model_name if model is not None else "random"
+            self._cache_namespace = f"{name}:{array_digest(self._projection)}"
+
+    @property
+    def cache(self) -> EmbeddingCache | None:
+        """Embedding cache in use, if any (see ``cache.stats``)."""
+        return self._cache
 
     @classmethod
-    def load(cls, model_name: str = "all-MiniLM-L6-v2") -> TextEncoder:
+    def load(
+        cls,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache: EmbeddingCache | None = None,
+    ) -> TextEncoder:
         """Load text encoder.
 
         Args:
             model_name: Sentence transformer model name
+            cache: Optional embedding cache consulted before the model
 
         Returns:
             Initialized TextEncoder
@@ -67,13 +101,13 @@ class TextEncoder:
             model = SentenceTransformer(model_name)
             logger.info(f"Loaded text encoder: {model_name}")
 
-            return cls(model)
+            return cls(model, cache=cache, model_name=model_name)
 
         except ImportError:
             logger.warning(
                 "sentence-transformers not installed, using placeholder encoder"
             )
-            return cls(None)
+            return cls(None, cache=cache, model_name=model_name)
 
     def _default_projection(self) -> np.ndarray:
         """Create default projection matrix.
@@ -87,17 +121,8 @@ class TextEncoder:
         proj[:, self.TEXT_DIM :] = np.eye(self.TEXT_DIM)
         return proj
 
-    def encode(self, text: str) -> np.ndarray:
-        """Encode text to embedding.
-
-        INVARIANT: INV009 - Output shape is (768,)
-        INVARIANT: INV010 - L2-normalized
-
-        Args:
-            text: Query text
-
-        Returns:
-            L2-normalized embedding (768,)
+    def _prepare(self, text: str) -> str:
+        """Validate text and truncate it to MAX_TOKENS words.
 
         Raises:
             ValueError: If text is empty
@@ -112,31 +137,81 @@ class TextEncoder:
                 f"Text has {len(words)} tokens, truncating to {self.MAX_TOKENS}"
             )
             text = " ".join(words[: self.MAX_TOKENS])
+        return text
 
-        # Encode with model
-        if self._model is not None:
-            text_embedding = self._model.encode(text, convert_to_numpy=True)
-        else:
-            # Placeholder: random embedding for testing
-            text_embedding = np.random.randn(self.TEXT_DIM).astype(np.float32)
+    def encode(self, text: str) -> np.ndarray:
+        """Encode text to embedding.
 
-        # Project to visual space
-        projected = text_embedding @ self._projection
+        INVARIANT: INV009 - Output shape is (768,)
+        INVARIANT: INV010 - L2-normalized
 
-        # L2 normalize (INV010)
-        projected = projected / np.linalg.norm(projected)
+        Args:
+            text: Query text
 
-        result: np.ndarray = projected.astype(np.float32)
+        Returns:
+            L2-normalized embedding (768,)
+
+        Raises:
+            ValueError: If text is empty
+        """
+        result: np.ndarray = self.encode_batch([text])[0]
         return result
 
-    def encode_batch(self, texts: list[str]) -> np.ndarray:
+    def encode_batch(
+        self, texts: list[str], batch_size: int | None = None
+    ) -> np.ndarray:
         """Encode multiple texts.
 
+        One model call embeds every text (in forward passes of
+        ``batch_size``), then one (N, 384) @ (384, 768) projection and a
+        row-wise L2 normalization map them to the visual space. With a
+        cache, only the texts it does not hold are encoded.
+
+        INVARIANT: INV009 - Output shape is (N, 768)
+        INVARIANT: INV010 - Rows are L2-normalized
+
         Args:
             texts: List of query texts
+            batch_size: Texts per forward pass (None = encoder default)
 
         Returns:
             L2-normalized embeddings (N, 768)
+
+        Raises:
+            ValueError: If any text is empty
         """
-        embeddings = [self.encode(t) for t in texts]
-        return np.stack(embeddings, axis=0)
+        texts = [self._prepare(text) for text in texts]
+        if not texts:
+            return np.empty((0, self.VISUAL_DIM), dtype=np.float32)
+
+        if self._cache is not None:
+            return self._cache.encode(
+                self._cache_namespace,
+                texts,
+                lambda missing: self._embed(missing, batch_size),
+            )
+        return self._embed(texts, batch_size)
+
+    def _embed(self, texts: list[str], batch_size: int | None) -> np.ndarray:
+        """Run the model, projection and normalization on prepared texts."""
+        # Encode with model
+        if self._model is not None:
+            text_embeddings = self._model.encode(
+                texts,
+                batch_size=batch_size or self._batch_size,
+                convert_to_numpy=True,
+            )
+        else:
+            # Placeholder: random embeddings for testing
+            text_embeddings = np.random.randn(len(texts), self.TEXT_DIM).astype(
+                np.float32
+            )
+
+        # Project to visual space
+        projected = np.asarray(text_embeddings, dtype=np.float32) @ self._projection
+
+        # L2 normalize (INV010)
+        projected /= np.linalg.norm(projected, axis=1, keepdims=True)
+
+        result: np.ndarray = projected.astype(np.float32, copy=False)
+        return result
@@ -0,0 +1,101 @@
+"""
+SPEC: Multimodal Index (timestamp lookups)
+
+Sorted time index used by MultimodalIndex for window queries.
+
+Entries are stored as [start, end] intervals sorted by start; point
+entries (visual frames, transcript centres) have start == end. A window
+query [lo, hi] returns every entry with start <= hi and end >= lo:
+
+- entries with start <= hi form a prefix of the start order
+- a running maximum of end is non-decreasing, so the first entry that
+  can reach lo is found by binary search too
+
+Both bounds come from np.searchsorted, so a query costs O(log N + hits)
+whenever intervals are not nested inside each other (always the case
+for points and for sequential transcript chunks).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+class TimelineIndex:
+    """Static index over timed entries, answering window queries.
+
+    Example:
+        timeline = TimelineIndex(ids, starts, ends)
+        rows = timeline.query(10.0, 12.0)
+        timeline.ids[rows]  # entries overlapping [10s, 12s]
+    """
+
+    def __init__(
+        self,
+        ids: Any,
+        starts: Any,
+        ends: Any = None,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            ids: Entry ids, sequence or array (N,)
+            starts: Entry start times in seconds (N,)
+            ends: Entry end times (N,), None for point entries
+        """
+        starts = np.asarray(starts, dtype=np.float64)
+        order = np.argsort(starts, kind="stable")
+
+        self.ids: np.ndarray = np.asarray(ids, dtype=np.int64)[order]
+        self.starts: np.ndarray = starts[order]
+        self._points = ends is None
+        if ends is None:
+            self.ends = self.starts
+            self._reach = self.starts
+        else:
+            self.ends = np.asarray(ends, dtype=np.float64)[order]
+            # Latest end among entries up to each row (non-decreasing)
+            self._reach = np.maximum.accumulate(self.ends)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def query(self, lo: float, hi: float) -> np.ndarray:
+        """Rows (into ids/starts/ends) of entries overlapping [lo, hi].
+
+        Args:
+            lo: Window start in seconds
+            hi: Window end in seconds
+
+        Returns:
+            Row positions, in start-time order
+        """
+        return self.query_batch(np.array([lo]), np.array([hi]))[0]
+
+    def query_batch(self, lo: np.ndarray, hi: np.ndarray) -> list[np.ndarray]:
+        """Rows of entries overlapping each window [lo[i], hi[i]].
+
+        The window bounds of all queries are located with two vectorized
+        binary searches.
+
+        Args:
+            lo: Window starts (Q,)
+            hi: Window ends (Q,)
+
+        Returns:
+            Q arrays of row positions, each in start-time order
+        """
+        first = np.searchsorted(self._reach, lo, side="left")
+        last = np.searchsorted(self.starts, hi, side="right")
+
+        lows = np.asarray(lo).tolist()
+        rows = []
+        for a, b, low in zip(first.tolist(), last.tolist(), lows, strict=True):
+            span = np.arange(a, max(a, b))
+            if not self._points:
+                # Only entries nested inside a longer one can end before lo
+                span = span[self.ends[a : max(a, b)] >= low]
+            rows.append(span)
+        return rows
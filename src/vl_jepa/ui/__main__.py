@@ -22,6 +22,18 @@ def main() -> None:
         action="store_true",
         help="Use real encoders instead of placeholders",
     )
+    parser.add_argument(
+        "--frame-cache",
+        type=str,
+        default=None,
+        help="SQLite file caching frame embeddings across runs",
+    )
+    parser.add_argument(
+        "--frame-cache-distance",
+        type=int,
+        default=None,
+        help="Reuse embeddings of frames within this many hash bits",
+    )
 
     args = parser.parse_args()
 
@@ -30,6 +42,8 @@ def main() -> None:
         server_port=args.port,
         server_name=args.host,
         use_placeholders=not args.no_placeholders,
+        frame_cache_path=args.frame_cache,
+        frame_cache_distance=args.frame_cache_distance,
     )
 
 
@@ -44,7 +44,7 @@ from vl_jepa.ui.processing import (
 from vl_jepa.ui.styles import CUSTOM_CSS
 
 if TYPE_CHECKING:
-    pass
+    from vl_jepa.frame_cache import FrameEmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +52,7 @@ logger = logging.getLogger(__name__)
 def create_app(
     use_placeholders: bool = True,
     share: bool = False,
+    frame_cache: FrameEmbeddingCache | None = None,
 ) -> gr.Blocks:
     """
     Create the Lecture Mind Gradio application.
@@ -61,6 +62,7 @@ def create_app(
     Args:
         use_placeholders: Use placeholder encoders (for testing).
         share: Create a public share link.
+        frame_cache: Cache reusing embeddings of repeated frames.
 
     Returns:
         Configured gr.Blocks application.
@@ -417,13 +419,13 @@ def create_app(
                 progress(p.progress, desc=p.message)
 
             # Create pipeline with callback
-            proc_pipeline = ProcessingPipeline(
+            with ProcessingPipeline(
                 use_placeholders=use_placeholders,
                 progress_callback=on_progress,
-            )
-
-            # Process
-            result = proc_pipeline.process_video(video_path)
+                frame_cache=frame_cache,
+            ) as proc_pipeline:
+                # Process
+                result = proc_pipeline.process_video(video_path)
 
             if result.has_error:
                 error_msg = f"Error: {result.error}"
@@ -507,11 +509,14 @@ def create_app(
                 return "<div class='search-placeholder'>Process a video first</div>"
 
             try:
-                # Encode query
-                from vl_jepa.encoders.placeholder import PlaceholderTextEncoder
+                # Encode query with the shared encoder that built the index
+                from vl_jepa.model_registry import (
+                    PLACEHOLDER_TEXT_ENCODER,
+                    default_registry,
+                )
 
-                text_encoder = PlaceholderTextEncoder(seed=42)
-                query_embedding = text_encoder.encode(query)
+                with default_registry().acquire(PLACEHOLDER_TEXT_ENCODER) as encoder:
+                    query_embedding = encoder.encode(query)
 
                 # Search
                 search_results = result.multimodal_index.search(
@@ -722,6 +727,8 @@ def launch(
     server_port: int = 7860,
     server_name: str = "127.0.0.1",
     use_placeholders: bool = True,
+    frame_cache_path: str | None = None,
+    frame_cache_distance: int | None = None,
 ) -> None:
     """
     Launch the Lecture Mind application.
@@ -731,8 +738,28 @@ def launch(
         server_port: Port to run the server on.
         server_name: Server host to bind to (use 0.0.0.0 for Docker).
         use_placeholders: Use placeholder encoders.
+        frame_cache_path: SQLite file caching frame embeddings across runs
+            (placeholder encoders only).
+        frame_cache_distance: Near-duplicate threshold in hash bits.
     """
-    app = create_app(use_placeholders=use_placeholders, share=share)
+    frame_cache = None
+    if frame_cache_path is not None and not use_placeholders:
+        logger.warning("Frame cache needs placeholder encoders, not using it")
+    elif frame_cache_path is not None:
+        from vl_jepa.frame_cache import FrameEmbeddingCache
+        from vl_jepa.model_registry import PLACEHOLDER_VISUAL_ENCODER, default_registry
+
+        # Cached embeddings are tied to the projection of the shared encoder
+        with default_registry().acquire(PLACEHOLDER_VISUAL_ENCODER) as encoder:
+            namespace = encoder.cache_namespace
+        frame_cache = FrameEmbeddingCache(
+            frame_cache_path,
+            namespace=namespace,
+            max_distance=frame_cache_distance,
+        )
+    app = create_app(
+        use_placeholders=use_placeholders, share=share, frame_cache=frame_cache
+    )
     app.launch(
         share=share,
         server_port=server_port,
@@ -760,6 +787,18 @@ if __name__ == "__main__":
         action="store_true",
         help="Use real encoders instead of placeholders",
     )
+    parser.add_argument(
+        "--frame-cache",
+        type=str,
+        default=None,
+        help="SQLite file caching frame embeddings across runs",
+    )
+    parser.add_argument(
+        "--frame-cache-distance",
+        type=int,
+        default=None,
+        help="Reuse embeddings of frames within this many hash bits",
+    )
 
     args = parser.parse_args()
 
@@ -768,4 +807,6 @@ if __name__ == "__main__":
         server_port=args.port,
         server_name=args.host,
         use_placeholders=not args.no_placeholders,
+        frame_cache_path=args.frame_cache,
+        frame_cache_distance=args.frame_cache_distance,
     )
@@ -15,6 +15,7 @@ from __future__ import annotations
 import logging
 import time
 from collections.abc import Callable
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -23,13 +24,15 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 
 if TYPE_CHECKING:
-    pass
+    from vl_jepa.frame_cache import FrameEmbeddingCache
+    from vl_jepa.model_registry import ModelRegistry
 
 logger = logging.getLogger(__name__)
 
 # Configuration constants
 MAX_VIDEO_SIZE_BYTES: int = 500 * 1024 * 1024  # 500MB max video file size
 DEFAULT_TARGET_FPS: float = 1.0  # Default frames per second for sampling
+TEXT_ENCODE_BATCH: int = 64  # Transcript chunks per encode_batch call
 
 
 class ProcessingStage(str, Enum):
@@ -150,6 +153,9 @@ class ProcessingResult:
         events: Detected events.
         transcript_chunks: Transcript segments.
         processing_time: Total processing time.
+        frames_skipped: Sampled frames that showed an unchanged slide and
+            inherited the previous embedding instead of being encoded.
+        encode_time_saved: Estimated encoding time saved by skipping them.
         multimodal_index: Built search index.
         metadata: Video metadata.
         error: Error message if processing failed.
@@ -161,6 +167,8 @@ class ProcessingResult:
     events: list[EventResult] = field(default_factory=list)
     transcript_chunks: list[TranscriptChunkResult] = field(default_factory=list)
     processing_time: float = 0.0
+    frames_skipped: int = 0
+    encode_time_saved: float = 0.0
     multimodal_index: Any | None = None
     metadata: VideoMetadataResult | None = None
     error: str | None = None
@@ -170,6 +178,11 @@ class ProcessingResult:
         """Check if processing encountered an error."""
         return self.error is not None
 
+    @property
+    def skip_ratio(self) -> float:
+        """Fraction of sampled frames that were not encoded."""
+        return self.frames_skipped / self.frame_count if self.frame_count else 0.0
+
 
 class ProcessingPipeline:
     """
@@ -195,6 +208,9 @@ class ProcessingPipeline:
         use_placeholders: bool = False,
         progress_callback: Callable[[ProcessingProgress], None] | None = None,
         target_fps: float = 1.0,
+        frame_cache: FrameEmbeddingCache | None = None,
+        skip_static_frames: bool = True,
+        models: ModelRegistry | None = None,
     ) -> None:
         """
         Initialize ProcessingPipeline.
@@ -205,9 +221,19 @@ class ProcessingPipeline:
             use_placeholders: Use placeholder encoders for testing.
             progress_callback: Callback for progress updates.
             target_fps: Target frames per second to sample.
+            frame_cache: Cache reusing embeddings of repeated frames.
+            skip_static_frames: Skip encoding sampled frames whose raw
+                pixels did not change (see FrameChangeGate).
+            models: Registry of the shared placeholder encoders and
+                transcriber (default: the process-wide registry). The
+                placeholder encoders are held until ``close()``.
         """
         self._progress_callback = progress_callback
         self._target_fps = target_fps
+        self._skip_static_frames = skip_static_frames
+        self._encode_time_saved = 0.0
+        self._models = models
+        self._held_models = ExitStack()
 
         if use_placeholders:
             self._init_placeholders()
@@ -215,22 +241,54 @@ class ProcessingPipeline:
             self._visual_encoder = visual_encoder
             self._text_encoder = text_encoder
 
+        if frame_cache is not None and self._visual_encoder is not None:
+            from vl_jepa.frame_cache import CachedVisualEncoder
+
+            self._visual_encoder = CachedVisualEncoder(
+                self._visual_encoder, frame_cache
+            )
+
+    def _get_models(self) -> ModelRegistry:
+        """Registry the shared models come from."""
+        if self._models is None:
+            from vl_jepa.model_registry import default_registry
+
+            self._models = default_registry()
+        return self._models
+
     def _init_placeholders(self) -> None:
         """Initialize placeholder encoders for testing."""
         try:
-            from vl_jepa.encoders.placeholder import (
-                PlaceholderTextEncoder,
-                PlaceholderVisualEncoder,
+            from vl_jepa.model_registry import (
+                PLACEHOLDER_TEXT_ENCODER,
+                PLACEHOLDER_VISUAL_ENCODER,
             )
 
-            self._visual_encoder = PlaceholderVisualEncoder(seed=42)
-            self._text_encoder = PlaceholderTextEncoder(seed=42)
+            models = self._get_models()
+            self._visual_encoder = self._held_models.enter_context(
+                models.acquire(PLACEHOLDER_VISUAL_ENCODER)
+            )
+            self._text_encoder = self._held_models.enter_context(
+                models.acquire(PLACEHOLDER_TEXT_ENCODER)
+            )
             logger.info("Using placeholder encoders")
         except ImportError:
             logger.warning("Placeholder encoders not available")
             self._visual_encoder = None
             self._text_encoder = None
 
+    def close(self) -> None:
+        """Release the shared models held by this pipeline."""
+        self._held_models.close()
+
+    def __enter__(self) -> ProcessingPipeline:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Context manager exit."""
+        self.close()
+
     def _emit_progress(
         self,
         stage: ProcessingStage,
@@ -384,6 +442,8 @@ class ProcessingPipeline:
         timestamps: list[float] = []
         try:
             visual_embeddings, timestamps = self._encode_frames(frames)
+            result.frames_skipped = sum(frame is None for frame, _ in frames)
+            result.encode_time_saved = self._encode_time_saved
         except Exception:
             result.error = "Failed to encode video frames. Please try again."
             logger.exception("Visual encoding failed")
@@ -450,10 +510,10 @@ class ProcessingPipeline:
     def _transcribe(self, audio_path: Path) -> list[TranscriptChunkResult]:
         """Transcribe audio file."""
         try:
-            from vl_jepa.audio import PlaceholderTranscriber
+            from vl_jepa.model_registry import PLACEHOLDER_TRANSCRIBER
 
-            transcriber = PlaceholderTranscriber()
-            segments = transcriber.transcribe(str(audio_path))
+            with self._get_models().acquire(PLACEHOLDER_TRANSCRIBER) as transcriber:
+                segments = transcriber.transcribe(str(audio_path))
 
             return [
                 TranscriptChunkResult(
@@ -470,18 +530,27 @@ class ProcessingPipeline:
     def _sample_frames(
         self,
         video_path: Path,
-    ) -> list[tuple[np.ndarray, float]]:
-        """Sample frames from video at target FPS."""
-        from vl_jepa.frame import FrameSampler
+    ) -> list[tuple[np.ndarray | None, float]]:
+        """Sample frames from video at target FPS.
+
+        With static-frame skipping, a frame whose raw pixels match the
+        last kept frame is returned as (None, timestamp) without being
+        preprocessed; it inherits the previous embedding when encoding.
+        """
+        from vl_jepa.frame import FrameChangeGate, FrameSampler
         from vl_jepa.video import VideoInput
 
         sampler = FrameSampler(mode="center_crop")
-        frames: list[tuple[np.ndarray, float]] = []
+        gate = FrameChangeGate() if self._skip_static_frames else None
+        frames: list[tuple[np.ndarray | None, float]] = []
 
         with VideoInput.open(video_path) as video:
             for frame in video.sample_frames(target_fps=self._target_fps):
-                processed = sampler.process(frame.data)
-                frames.append((processed, frame.timestamp))
+                if gate is not None and not gate.changed(frame.data):
+                    frames.append((None, frame.timestamp))
+                else:
+                    processed = sampler.process(frame.data)
+                    frames.append((processed, frame.timestamp))
 
                 # Emit substep progress
                 if video.duration > 0:
@@ -496,20 +565,37 @@ class ProcessingPipeline:
 
     def _encode_frames(
         self,
-        frames: list[tuple[np.ndarray, float]],
+        frames: list[tuple[np.ndarray | None, float]],
     ) -> tuple[list[np.ndarray], list[float]]:
-        """Encode frames with visual encoder."""
+        """Encode frames with visual encoder.
+
+        A None frame (unchanged since the last kept frame) inherits the
+        previous embedding and keeps its own timestamp, so event detection
+        and the index still see one embedding per sampled second.
+        """
+        self._encode_time_saved = 0.0
         if not frames or not self._visual_encoder:
             return [], []
 
         embeddings: list[np.ndarray] = []
         timestamps: list[float] = []
+        encoded = 0
+        encode_seconds = 0.0
 
         for i, (frame, timestamp) in enumerate(frames):
-            # Convert to batch format (1, 3, 224, 224)
-            frame_batch = frame.transpose(2, 0, 1)[np.newaxis, ...]
-
-            embedding = self._visual_encoder.encode(frame_batch)[0]
+            if frame is not None:
+                # Convert to batch format (1, 3, 224, 224)
+                frame_batch = frame.transpose(2, 0, 1)[np.newaxis, ...]
+
+                start = time.perf_counter()
+                embedding = self._visual_encoder.encode(frame_batch)[0]
+                encode_seconds += time.perf_counter() - start
+                encoded += 1
+            elif embeddings:
+                # Unchanged frame: inherit the previous embedding
+                embedding = embeddings[-1]
+            else:
+                continue
             embeddings.append(embedding)
             timestamps.append(timestamp)
 
@@ -521,28 +607,49 @@ class ProcessingPipeline:
                 message=f"Encoding frame {i + 1}/{len(frames)}...",
             )
 
+        skipped = len(embeddings) - encoded
+        if skipped and encoded:
+            self._encode_time_saved = skipped * encode_seconds / encoded
+            logger.info(
+                "Skipped %d/%d unchanged frames (%.0f%%), ~%.1fs saved",
+                skipped,
+                len(frames),
+                100 * skipped / len(frames),
+                self._encode_time_saved,
+            )
+
+        cache = getattr(self._visual_encoder, "cache", None)
+        if cache is not None:
+            stats = cache.stats
+            logger.info(
+                "Frame cache: %.0f%% of frames reused, ~%.1fs saved",
+                100 * stats.hit_rate,
+                stats.saved_seconds,
+            )
+
         return embeddings, timestamps
 
     def _encode_transcript(
         self,
         chunks: list[TranscriptChunkResult],
     ) -> list[np.ndarray]:
-        """Encode transcript chunks with text encoder."""
+        """Encode transcript chunks with text encoder, a batch at a time."""
         if not chunks or not self._text_encoder:
             return []
 
         embeddings: list[np.ndarray] = []
+        texts = [chunk.text for chunk in chunks]
 
-        for i, chunk in enumerate(chunks):
-            embedding = self._text_encoder.encode(chunk.text)
-            embeddings.append(embedding)
+        for start in range(0, len(texts), TEXT_ENCODE_BATCH):
+            batch = texts[start : start + TEXT_ENCODE_BATCH]
+            embeddings.extend(self._text_encoder.encode_batch(batch))
 
             # Emit substep progress
-            substep = (i + 1) / len(chunks)
+            done = start + len(batch)
             self._emit_progress(
                 ProcessingStage.TEXT_ENCODING,
-                substep=substep,
-                message=f"Encoding transcript {i + 1}/{len(chunks)}...",
+                substep=done / len(texts),
+                message=f"Encoding transcript {done}/{len(texts)}...",
             )
 
         return embeddings
@@ -588,26 +695,24 @@ class ProcessingPipeline:
 
             index = MultimodalIndex(dimension=768)
 
-            # Add visual embeddings
-            for i, (embedding, timestamp) in enumerate(
-                zip(visual_embeddings, timestamps, strict=False)
-            ):
-                index.add_visual(
-                    embedding=embedding,
-                    timestamp=timestamp,
-                    frame_index=i,
+            # Add visual embeddings (one index add for all frames)
+            num_frames = min(len(visual_embeddings), len(timestamps))
+            if num_frames:
+                index.add_visual_batch(
+                    np.vstack(visual_embeddings[:num_frames]),
+                    timestamps=timestamps[:num_frames],
+                    frame_indices=np.arange(num_frames),
                 )
 
             # Add transcript embeddings
-            for i, (embedding, chunk) in enumerate(
-                zip(text_embeddings, transcript_chunks, strict=False)
-            ):
-                index.add_transcript(
-                    embedding=embedding,
-                    start_time=chunk.start,
-                    end_time=chunk.end,
-                    text=chunk.text,
-                    segment_id=i,
+            chunks = transcript_chunks[: len(text_embeddings)]
+            if chunks:
+                index.add_transcript_batch(
+                    np.vstack(text_embeddings[: len(chunks)]),
+                    start_times=[chunk.start for chunk in chunks],
+                    end_times=[chunk.end for chunk in chunks],
+                    texts=[chunk.text for chunk in chunks],
+                    segment_ids=list(range(len(chunks))),
                 )
 
             return index
@@ -9,7 +9,8 @@ import numpy as np
 import pytest
 
 from tests.conftest import HAS_FAISS
-from vl_jepa.index import EmbeddingIndex
+from vl_jepa.index import BackendPolicy, EmbeddingIndex
+from vl_jepa.metadata_store import MetadataStore
 
 
 @pytest.fixture
@@ -106,3 +107,251 @@ class TestEmbeddingIndexBenchmarks:
 
         # Assert
         assert benchmark.stats["mean"] < 0.100  # 100ms
+
+    @pytest.mark.parametrize("num_queries", [1, 16, 64, 256])
+    def test_search_batch_throughput(
+        self,
+        benchmark,
+        index_10k: EmbeddingIndex,
+        num_queries: int,
+    ) -> None:
+        """
+        SPEC: S007
+        TEST_ID: T007.12
+        BUDGET: <10ms per query on 10k vectors, falling as Q grows
+        Given: An index with 10,000 vectors
+        When: search_batch(Q queries, k=10) is called
+        Then: One call answers all queries; per-query time is reported
+        """
+        # Arrange
+        queries = np.random.randn(num_queries, 768).astype(np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        # Act
+        result = benchmark(index_10k.search_batch, queries, k=10)
+
+        # Assert
+        per_query = benchmark.stats["mean"] / num_queries
+        benchmark.extra_info["num_queries"] = num_queries
+        benchmark.extra_info["per_query_ms"] = per_query * 1000
+        assert result.ids.shape == (num_queries, 10)
+        assert per_query < 0.010  # 10ms
+
+    def test_reconstruct_all_10k(
+        self,
+        benchmark,
+        index_10k: EmbeddingIndex,
+    ) -> None:
+        """
+        SPEC: S007
+        TEST_ID: T007.13
+        BUDGET: <100ms for 10k vectors
+        Given: An IVF index with 10,000 vectors
+        When: reconstruct_all() is called
+        Then: The full (N, D) matrix is returned in one vectorized call
+        """
+        # Act
+        result = benchmark(index_10k.reconstruct_all)
+
+        # Assert
+        assert result.shape == (10000, 768)
+        assert benchmark.stats["mean"] < 0.100  # 100ms
+
+    @pytest.mark.slow
+    def test_reconstruct_all_100k(
+        self,
+        benchmark,
+        index_100k: EmbeddingIndex,
+    ) -> None:
+        """
+        SPEC: S007
+        TEST_ID: T007.14
+        BUDGET: <1s for 100k vectors
+        Given: An IVF index with 100,000 vectors
+        When: reconstruct_all() is called
+        Then: The full (N, D) matrix is returned in one vectorized call
+        """
+        # Act
+        result = benchmark(index_100k.reconstruct_all)
+
+        # Assert
+        assert result.shape == (100000, 768)
+        assert benchmark.stats["mean"] < 1.0  # 1s
+
+
+@pytest.fixture(scope="module")
+def codec_corpus() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """10k clustered embeddings, 100 held-out queries and exact top-10 ids."""
+    rng = np.random.default_rng(42)
+    centers = rng.standard_normal((100, 768)).astype(np.float32)
+    data = centers[rng.integers(0, 100, 10100)] + 0.7 * rng.standard_normal(
+        (10100, 768)
+    ).astype(np.float32)
+    data /= np.linalg.norm(data, axis=1, keepdims=True)
+    corpus, queries = data[:10000], data[10000:]
+    truth = np.argsort(-(queries @ corpus.T), axis=1)[:, :10]
+    return corpus, queries, truth
+
+
+@pytest.mark.benchmark
+class TestEmbeddingIndexCodecBenchmarks:
+    """Memory per vector against recall@10 for each storage codec."""
+
+    @pytest.mark.parametrize(
+        "codec,rerank_factor",
+        [
+            ("float32", 0),
+            ("float16", 0),
+            ("sq8", 0),
+            ("sq8", 4),
+            ("pq", 0),
+            ("pq", 4),
+        ],
+    )
+    def test_codec_memory_vs_recall(
+        self,
+        benchmark,
+        codec_corpus: tuple[np.ndarray, np.ndarray, np.ndarray],
+        codec: str,
+        rerank_factor: int,
+    ) -> None:
+        """
+        SPEC: S007
+        TEST_ID: T007.15
+        Given: A 10k-vector index built with a storage codec
+        When: 100 queries are searched with search_batch(k=10, nprobe=16)
+        Then: bytes/vector and recall@10 vs exact search are reported
+        """
+        # Arrange
+        corpus, queries, truth = codec_corpus
+        index = EmbeddingIndex(codec=codec, rerank_factor=rerank_factor)
+        index.add_batch(corpus, list(range(len(corpus))))
+
+        # Act
+        result = benchmark(index.search_batch, queries, k=10, nprobe=16)
+
+        # Assert
+        hits = sum(
+            len(np.intersect1d(found, exact))
+            for found, exact in zip(result.ids, truth, strict=False)
+        )
+        recall = hits / truth.size
+        benchmark.extra_info["bytes_per_vector"] = index.bytes_per_vector
+        benchmark.extra_info["recall_at_10"] = recall
+
+        assert index.bytes_per_vector <= 4 * 768 * (2 if rerank_factor else 1)
+        assert recall > 0.3
+
+
+@pytest.mark.skipif(not HAS_FAISS, reason="Requires FAISS")
+@pytest.mark.benchmark
+class TestEmbeddingIndexBackendBenchmarks:
+    """Flat vs IVF vs HNSW search latency and recall@10."""
+
+    @pytest.mark.parametrize("backend", ["flat", "ivf", "hnsw"])
+    def test_backend_latency_vs_recall(
+        self,
+        benchmark,
+        codec_corpus: tuple[np.ndarray, np.ndarray, np.ndarray],
+        backend: str,
+    ) -> None:
+        """
+        SPEC: S007
+        TEST_ID: T007.16
+        BUDGET: <10ms per query on 10k vectors
+        Given: A 10k-vector index built with each backend policy
+        When: search(k=10) is called
+        Then: Latency and recall@10 vs exact search are reported
+        """
+        # Arrange
+        corpus, queries, truth = codec_corpus
+        index = EmbeddingIndex(policy=BackendPolicy(backend=backend))
+        index.add_batch(corpus, list(range(len(corpus))))
+        assert index.backend == backend
+
+        # Act
+        result = benchmark(index.search, queries[0], k=10)
+
+        # Assert
+        found = index.search_batch(queries, k=10)
+        hits = sum(
+            len(np.intersect1d(ids, exact))
+            for ids, exact in zip(found.ids, truth, strict=False)
+        )
+        benchmark.extra_info["recall_at_10"] = hits / truth.size
+        benchmark.extra_info["bytes_per_vector"] = index.bytes_per_vector
+        assert len(result) == 10
+        assert benchmark.stats["mean"] < 0.010  # 10ms
+
+
+@pytest.mark.benchmark
+class TestEmbeddingIndexLoadBenchmarks:
+    """Cold load to first query, read vs memory-mapped."""
+
+    @pytest.mark.parametrize("mmap", [False, True])
+    def test_load_to_first_query(
+        self,
+        benchmark,
+        codec_corpus: tuple[np.ndarray, np.ndarray, np.ndarray],
+        tmp_path,
+        mmap: bool,
+    ) -> None:
+        """
+        SPEC: S007
+        TEST_ID: T007.17
+        BUDGET: <100ms for 10k vectors
+        Given: A saved 10k-vector index
+        When: load(mmap=...) is followed by one search(k=10)
+        Then: Time to first query is reported; mmap skips reading vectors
+        """
+        # Arrange
+        corpus, queries, _ = codec_corpus
+        index = EmbeddingIndex(policy=BackendPolicy(backend="flat"))
+        index.add_batch(corpus, list(range(len(corpus))))
+        index.save(tmp_path / "index")
+
+        def load_and_query() -> list:
+            loaded = EmbeddingIndex.load(tmp_path / "index", mmap=mmap)
+            return loaded.search(queries[0], k=10)
+
+        # Act
+        result = benchmark(load_and_query)
+
+        # Assert
+        benchmark.extra_info["mmap"] = mmap
+        assert len(result) == 10
+        assert benchmark.stats["mean"] < 0.100  # 100ms
+
+    def test_metadata_load_100k(self, benchmark, tmp_path) -> None:
+        """
+        SPEC: S007
+        TEST_ID: T007.18
+        BUDGET: <100ms for 100k metadata rows
+        Given: A saved metadata sidecar with 100,000 transcript-style rows
+        When: MetadataStore.load() is followed by one lookup
+        Then: Only arrays are read; a single row is decoded
+        """
+        # Arrange
+        text = "lorem ipsum dolor sit amet " * 7
+        rows = {
+            i: {
+                "modality": "transcript",
+                "timestamp": i * 0.5,
+                "start_time": i * 0.5 - 0.25,
+                "end_time": i * 0.5 + 0.25,
+                "text": text[:180],
+            }
+            for i in range(100000)
+        }
+        MetadataStore(rows).save(tmp_path / "index.meta.npz")
+
+        def load_and_get() -> dict | None:
+            store = MetadataStore.load(tmp_path / "index.meta.npz")
+            return store.get(54321)
+
+        # Act
+        result = benchmark(load_and_get)
+
+        # Assert
+        assert result == rows[54321]
+        assert benchmark.stats["mean"] < 0.100  # 100ms
@@ -1,16 +1,26 @@
 """
 Performance Benchmarks for Query Pipeline
-TEST_IDs: T011.3
+TEST_IDs: T011.3-T011.21
 
 IMPLEMENTS: Week 4 Day 1 - Benchmark Implementation
 """
 
+from pathlib import Path
+
 import numpy as np
 import pytest
 
 from tests.conftest import HAS_FAISS
-from vl_jepa.index import EmbeddingIndex
-from vl_jepa.multimodal_index import MultimodalIndex, RankingConfig
+from vl_jepa.corpus import CorpusIndex
+from vl_jepa.diversity import mmr_select
+from vl_jepa.index import BackendPolicy, EmbeddingIndex
+from vl_jepa.lexical import BM25Index
+from vl_jepa.multimodal_index import (
+    DiversityConfig,
+    Modality,
+    MultimodalIndex,
+    RankingConfig,
+)
 
 
 @pytest.fixture
@@ -27,7 +37,8 @@ def populated_index() -> EmbeddingIndex:
 @pytest.fixture
 def populated_multimodal_index() -> MultimodalIndex:
     """Create a multimodal index with visual and transcript entries."""
-    index = MultimodalIndex(dimension=768)
+    # Query cache off: repeated benchmark queries must search every time
+    index = MultimodalIndex(dimension=768, cache_size=0)
 
     # Add 500 visual entries (simulating 500 frames)
     for i in range(500):
@@ -49,6 +60,95 @@ def populated_multimodal_index() -> MultimodalIndex:
     return index
 
 
+def _lecture_index(
+    num_frames: int, num_chunks: int, cache_size: int = 0
+) -> MultimodalIndex:
+    """A lecture at 2 FPS with transcript chunks spread over its length.
+
+    The query cache is off unless ``cache_size`` is given, so repeated
+    benchmark queries search every time.
+    """
+    index = MultimodalIndex(dimension=768, cache_size=cache_size)
+    rng = np.random.default_rng(0)
+
+    frames = rng.standard_normal((num_frames, 768)).astype(np.float32)
+    frames /= np.linalg.norm(frames, axis=1, keepdims=True)
+    for i, emb in enumerate(frames):
+        index.add_visual(emb, timestamp=i * 0.5, frame_index=i)
+
+    chunk_seconds = num_frames * 0.5 / num_chunks
+    chunks = rng.standard_normal((num_chunks, 768)).astype(np.float32)
+    chunks /= np.linalg.norm(chunks, axis=1, keepdims=True)
+    for i, emb in enumerate(chunks):
+        start = i * chunk_seconds
+        index.add_transcript(
+            emb, start_time=start, end_time=start + chunk_seconds - 0.5, text=f"{i}"
+        )
+
+    return index
+
+
+@pytest.fixture(scope="module")
+def ingest_10k() -> tuple[np.ndarray, np.ndarray]:
+    """10,000 normalized embeddings: 9,600 frames and 400 transcript chunks."""
+    emb = np.random.default_rng(1).standard_normal((10000, 768)).astype(np.float32)
+    emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+    return emb[:9600], emb[9600:]
+
+
+def _flat_multimodal_index() -> MultimodalIndex:
+    """Empty index on the flat backend, so ingest excludes one-off IVF training."""
+    index = MultimodalIndex(dimension=768)
+    index._index = EmbeddingIndex(policy=BackendPolicy(backend="flat"))
+    return index
+
+
+@pytest.fixture(scope="module")
+def saved_100k(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A saved 100,000-entry index: 98,000 frames and 2,000 transcript chunks."""
+    emb = np.random.default_rng(2).standard_normal((100000, 768)).astype(np.float32)
+    emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+    starts = np.arange(2000) * 24.5
+    index = _flat_multimodal_index()
+    index.add_visual_batch(emb[:98000], np.arange(98000) * 0.5, np.arange(98000))
+    index.add_transcript_batch(
+        emb[98000:], starts, starts + 24.0, [f"Chunk {i}" for i in range(2000)]
+    )
+    path = tmp_path_factory.mktemp("index_100k") / "lecture"
+    index.save(path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def lecture_multimodal_index() -> MultimodalIndex:
+    """A 1-hour lecture at 2 FPS: 7,200 visual frames, 150 transcript chunks."""
+    return _lecture_index(7200, 150)
+
+
+@pytest.fixture(scope="module")
+def lecture_corpus() -> CorpusIndex:
+    """Eight 1-hour lectures from two courses, each 7,200 frames + 150 chunks."""
+    corpus = CorpusIndex()
+    rng = np.random.default_rng(4)
+    for i in range(8):
+        emb = rng.standard_normal((7350, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        starts = np.arange(150) * 24.0
+        index = MultimodalIndex(dimension=768, cache_size=0)
+        index.add_visual_batch(emb[:7200], np.arange(7200) * 0.5, np.arange(7200))
+        index.add_transcript_batch(
+            emb[7200:], starts, starts + 23.5, [f"{i}.{j}" for j in range(150)]
+        )
+        corpus.add_lecture(f"lecture-{i}", index, {"course": f"C{i % 2}"})
+    return corpus
+
+
+@pytest.fixture(scope="module")
+def long_lecture_index() -> MultimodalIndex:
+    """A 3-hour lecture at 2 FPS: 21,600 visual frames, 450 transcript chunks."""
+    return _lecture_index(21600, 450)
+
+
 @pytest.mark.skipif(not HAS_FAISS, reason="Requires FAISS")
 @pytest.mark.benchmark
 class TestQueryPipelineBenchmarks:
@@ -145,3 +245,406 @@ class TestQueryPipelineBenchmarks:
         # Assert
         assert isinstance(result, list)
         assert benchmark.stats["mean"] < 0.050  # 50ms
+
+    def test_filtered_search_minority_modality(
+        self,
+        benchmark,
+        lecture_multimodal_index: MultimodalIndex,
+        sample_embedding: np.ndarray,
+    ) -> None:
+        """
+        TEST_ID: T011.7
+        BUDGET: <5ms per transcript-only query
+        Given: A lecture index with 7,200 visual and 150 transcript entries
+        When: search_transcript(k=10) is called
+        Then: Exactly 10 transcript results, at the cost of scoring 150 rows
+        """
+        # Act
+        result = benchmark(
+            lecture_multimodal_index.search_transcript, sample_embedding, k=10
+        )
+
+        # Assert
+        assert len(result) == 10
+        assert all(r.modality == Modality.TRANSCRIPT for r in result)
+        assert benchmark.stats["mean"] < 0.005  # 5ms
+
+    def test_aligned_context_long_lecture(
+        self,
+        benchmark,
+        long_lecture_index: MultimodalIndex,
+    ) -> None:
+        """
+        TEST_ID: T011.8
+        BUDGET: <1ms per timeline click
+        Given: A 3-hour lecture at 2 FPS (21,600 frames, 450 transcript chunks)
+        When: get_aligned_context is called for one timestamp
+        Then: The ±1s frames and overlapping chunks return in <1ms
+        """
+        long_lecture_index.get_aligned_context(0.0)  # build timeline indexes
+
+        # Act
+        result = benchmark(long_lecture_index.get_aligned_context, 5400.0)
+
+        # Assert
+        assert len(result["visual"]) == 5  # frames at 5399.0 ... 5401.0
+        assert len(result["transcript"]) >= 1
+        assert benchmark.stats["mean"] < 0.001  # 1ms
+
+    def test_aligned_context_batch_long_lecture(
+        self,
+        benchmark,
+        long_lecture_index: MultimodalIndex,
+    ) -> None:
+        """
+        TEST_ID: T011.9
+        BUDGET: <50ms for 100 timestamps
+        Given: A 3-hour lecture at 2 FPS (21,600 frames, 450 transcript chunks)
+        When: get_aligned_context_batch aligns 100 search-result timestamps
+        Then: All contexts return in <50ms
+        """
+        times = np.linspace(0.0, 10800.0, 100)
+        long_lecture_index.get_aligned_context(0.0)  # build timeline indexes
+
+        # Act
+        result = benchmark(long_lecture_index.get_aligned_context_batch, times)
+
+        # Assert
+        assert len(result) == 100
+        assert all(context["transcript"] for context in result)
+        assert benchmark.stats["mean"] < 0.050  # 50ms
+
+    @pytest.mark.benchmark(group="ingest-10k")
+    def test_ingest_10k_single_adds(
+        self,
+        benchmark,
+        ingest_10k: tuple[np.ndarray, np.ndarray],
+    ) -> None:
+        """
+        TEST_ID: T011.10
+        BUDGET: baseline for T011.11 (no budget)
+        Given: 9,600 frame and 400 transcript embeddings
+        When: They are added one add_visual/add_transcript call at a time
+        Then: The per-entry ingest cost is recorded
+        """
+        frames, chunks = ingest_10k
+
+        def ingest(index: MultimodalIndex) -> MultimodalIndex:
+            for i, emb in enumerate(frames):
+                index.add_visual(emb, timestamp=i * 0.5, frame_index=i)
+            for i, emb in enumerate(chunks):
+                index.add_transcript(emb, i * 12.0, i * 12.0 + 11.5, f"Chunk {i}")
+            return index
+
+        # Act
+        result = benchmark.pedantic(
+            ingest, setup=lambda: ((_flat_multimodal_index(),), {}), rounds=3
+        )
+
+        # Assert
+        assert result.size == 10000
+
+    @pytest.mark.benchmark(group="ingest-10k")
+    def test_ingest_10k_batch(
+        self,
+        benchmark,
+        ingest_10k: tuple[np.ndarray, np.ndarray],
+    ) -> None:
+        """
+        TEST_ID: T011.11
+        BUDGET: <250ms for 10,000 entries
+        Given: 9,600 frame and 400 transcript embeddings
+        When: They are added with add_visual_batch + add_transcript_batch
+        Then: Ingest finishes in <250ms, one index add per modality
+        """
+        frames, chunks = ingest_10k
+        starts = np.arange(len(chunks)) * 12.0
+        texts = [f"Chunk {i}" for i in range(len(chunks))]
+
+        def ingest(index: MultimodalIndex) -> MultimodalIndex:
+            index.add_visual_batch(
+                frames, np.arange(len(frames)) * 0.5, np.arange(len(frames))
+            )
+            index.add_transcript_batch(chunks, starts, starts + 11.5, texts)
+            return index
+
+        # Act
+        result = benchmark.pedantic(
+            ingest, setup=lambda: ((_flat_multimodal_index(),), {}), rounds=5
+        )
+
+        # Assert
+        assert result.size == 10000
+        assert benchmark.stats["mean"] < 0.250  # 250ms
+
+    @pytest.mark.benchmark(group="fusion")
+    def test_fused_ranking_weighted_lecture(
+        self,
+        benchmark,
+        lecture_multimodal_index: MultimodalIndex,
+        sample_embedding: np.ndarray,
+    ) -> None:
+        """
+        TEST_ID: T011.12
+        BUDGET: <5ms per weighted fusion query
+        Given: A lecture index with 7,200 visual and 150 transcript entries
+        When: search_multimodal(k=10) fuses weighted scores with time decay
+        Then: 10 results sorted by fused score in <5ms
+        """
+        config = RankingConfig(time_decay=0.001, time_reference=1800.0)
+
+        # Act
+        result = benchmark(
+            lecture_multimodal_index.search_multimodal,
+            sample_embedding,
+            k=10,
+            config=config,
+        )
+
+        # Assert
+        assert len(result) == 10
+        scores = [r.score for r in result]
+        assert scores == sorted(scores, reverse=True)
+        assert benchmark.stats["mean"] < 0.005  # 5ms
+
+    @pytest.mark.benchmark(group="fusion")
+    def test_fused_ranking_rrf_lecture(
+        self,
+        benchmark,
+        lecture_multimodal_index: MultimodalIndex,
+        sample_embedding: np.ndarray,
+    ) -> None:
+        """
+        TEST_ID: T011.13
+        BUDGET: <5ms per reciprocal rank fusion query
+        Given: A lecture index with 7,200 visual and 150 transcript entries
+        When: search_multimodal(k=10) fuses with reciprocal rank fusion
+        Then: 10 results, ranked by weight / (rrf_k + rank), in <5ms
+        """
+        config = RankingConfig(fusion="rrf")
+
+        # Act
+        result = benchmark(
+            lecture_multimodal_index.search_multimodal,
+            sample_embedding,
+            k=10,
+            config=config,
+        )
+
+        # Assert
+        assert len(result) == 10
+        assert result[0].score == pytest.approx(
+            config.transcript_weight / (config.rrf_k + 1)
+        )
+        assert benchmark.stats["mean"] < 0.005  # 5ms
+
+    @pytest.mark.benchmark(group="persistence-100k")
+    def test_save_100k(
+        self,
+        benchmark,
+        saved_100k: Path,
+        tmp_path: Path,
+    ) -> None:
+        """
+        TEST_ID: T011.14
+        BUDGET: <5s to save 100,000 entries
+        Given: A loaded 100,000-entry multimodal index
+        When: save() writes the FAISS index and the binary container
+        Then: The save finishes in <5s
+        """
+        index = MultimodalIndex.load(saved_100k)
+
+        # Act
+        benchmark.pedantic(index.save, args=(tmp_path / "copy",), rounds=3)
+
+        # Assert
+        assert (tmp_path / "copy.multimodal.bin").exists()
+        assert benchmark.stats["mean"] < 5.0  # 5s
+
+    @pytest.mark.benchmark(group="persistence-100k")
+    def test_load_100k(
+        self,
+        benchmark,
+        saved_100k: Path,
+    ) -> None:
+        """
+        TEST_ID: T011.15
+        BUDGET: <2s to load 100,000 entries
+        Given: A saved 100,000-entry multimodal index
+        When: load() reads it back with checksums verified
+        Then: All entries load in <2s with their exact embeddings
+        """
+        # Act
+        result = benchmark.pedantic(MultimodalIndex.load, args=(saved_100k,), rounds=3)
+
+        # Assert
+        assert (result.visual_count, result.transcript_count) == (98000, 2000)
+        expected = np.random.default_rng(2).standard_normal((1, 768))
+        entry = result.get_entry(0)
+        assert entry is not None
+        np.testing.assert_allclose(
+            entry.embedding, expected[0] / np.linalg.norm(expected), atol=1e-6
+        )
+        assert benchmark.stats["mean"] < 2.0  # 2s
+
+    def test_lexical_exact_term_20k_chunks(self, benchmark) -> None:
+        """
+        TEST_ID: T011.16
+        BUDGET: <1ms per keyword query
+        Given: A BM25 index over 20,000 transcript chunks of 40 words
+        When: A query with one rare term (an acronym in 20 chunks) is run
+        Then: Only that term's postings are scored, in <1ms
+        """
+        rng = np.random.default_rng(3)
+        words = rng.zipf(1.3, size=(20000, 40)) % 5000
+        texts = [" ".join(f"w{w}" for w in row) for row in words]
+        for i in range(0, 20000, 1000):
+            texts[i] += " RLHF"
+        lexical = BM25Index()
+        lexical.add(np.arange(20000), texts)
+
+        # Act
+        ids, _ = benchmark(lexical.search, "what is rlhf", k=10)
+
+        # Assert
+        assert ids.tolist() == list(range(0, 10000, 1000))
+        assert benchmark.stats["mean"] < 0.001  # 1ms
+
+    def test_hybrid_search_lecture(
+        self,
+        benchmark,
+        lecture_multimodal_index: MultimodalIndex,
+        sample_embedding: np.ndarray,
+    ) -> None:
+        """
+        TEST_ID: T011.17
+        BUDGET: <5ms per hybrid query
+        Given: A lecture index with 7,200 visual and 150 transcript entries
+        When: search_hybrid fuses the dense and BM25 transcript rankings
+        Then: 10 transcript results, the exact-term chunk among them, in <5ms
+        """
+        # Act
+        result = benchmark(
+            lecture_multimodal_index.search_hybrid,
+            sample_embedding,
+            "chunk 42",
+            k=10,
+        )
+
+        # Assert
+        assert len(result) == 10
+        assert "42" in [r.text for r in result]
+        assert benchmark.stats["mean"] < 0.005  # 5ms
+
+    def test_corpus_search_8_lectures(
+        self,
+        benchmark,
+        lecture_corpus: CorpusIndex,
+        sample_embedding: np.ndarray,
+    ) -> None:
+        """
+        TEST_ID: T011.18
+        BUDGET: <20ms per corpus query
+        Given: A corpus of 8 lecture shards (58,800 entries)
+        When: search_multimodal fans out to every shard and merges the top k
+        Then: 10 results from across the corpus, sorted by score, in <20ms
+        """
+        # Act
+        result = benchmark(lecture_corpus.search_multimodal, sample_embedding, k=10)
+
+        # Assert
+        assert len(result) == 10
+        scores = [r.score for r in result]
+        assert scores == sorted(scores, reverse=True)
+        assert set(lecture_corpus.lecture_ids) >= {r.lecture_id for r in result}
+        assert benchmark.stats["mean"] < 0.020  # 20ms
+
+    def test_repeated_queries_cached(self, benchmark) -> None:
+        """
+        TEST_ID: T011.19
+        BUDGET: <0.25ms per repeated query
+        Given: A lecture index with the query cache on, and 20 suggested
+               queries that were each searched once
+        When: The 20 queries are searched again with search_multimodal
+        Then: Every repeat is a cache hit, at <0.25ms per query
+        """
+        index = _lecture_index(7200, 150, cache_size=64)
+        queries = np.random.default_rng(5).standard_normal((20, 768))
+        queries = (queries / np.linalg.norm(queries, axis=1, keepdims=True)).astype(
+            np.float32
+        )
+        expected = [index.search_multimodal(q, k=10) for q in queries]
+
+        def repeat() -> list:
+            return [index.search_multimodal(q, k=10) for q in queries]
+
+        # Act
+        result = benchmark(repeat)
+
+        # Assert
+        assert result == expected
+        stats = index.cache_stats
+        assert (stats.misses, stats.size) == (20, 20)
+        assert stats.hit_rate > 0.9
+        assert benchmark.stats["mean"] < 20 * 0.00025  # 0.25ms per query
+
+    def test_mmr_select_200_candidates(self, benchmark) -> None:
+        """
+        TEST_ID: T011.20
+        BUDGET: <2ms to diversify 200 candidates
+        Given: 200 candidates (768-dim) from two modalities over one hour
+        When: mmr_select picks k=10 with a 5-second separation
+        Then: 10 distinct candidates are picked in <2ms
+        """
+        rng = np.random.default_rng(6)
+        embeddings = rng.standard_normal((200, 768)).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        relevance = np.sort(rng.random(200))[::-1]
+        timestamps = rng.random(200) * 3600
+        groups = rng.integers(0, 2, 200)
+
+        # Act
+        picked = benchmark(
+            mmr_select,
+            embeddings,
+            relevance,
+            10,
+            mmr_lambda=0.7,
+            timestamps=timestamps,
+            min_separation=5.0,
+            groups=groups,
+        )
+
+        # Assert
+        assert len(set(picked.tolist())) == 10
+        assert benchmark.stats["mean"] < 0.002  # 2ms
+
+    def test_diversified_search_lecture(
+        self,
+        benchmark,
+        lecture_multimodal_index: MultimodalIndex,
+        sample_embedding: np.ndarray,
+    ) -> None:
+        """
+        TEST_ID: T011.21
+        BUDGET: <5ms per diversified query
+        Given: A lecture index with 7,200 visual and 150 transcript entries
+        When: search_multimodal diversifies the top 200 fused candidates
+              (MMR, frames at least 5s apart)
+        Then: 10 results with no two frames within 5s, in <5ms
+        """
+        diversity = DiversityConfig(mmr_lambda=0.7, min_separation=5.0)
+
+        # Act
+        result = benchmark(
+            lecture_multimodal_index.search_multimodal,
+            sample_embedding,
+            k=10,
+            diversity=diversity,
+        )
+
+        # Assert
+        assert len(result) == 10
+        frames = sorted(r.timestamp for r in result if r.modality == Modality.VISUAL)
+        assert len(frames) < 2 or np.diff(frames).min() >= 5.0
+        assert benchmark.stats["mean"] < 0.005  # 5ms
@@ -1,6 +1,6 @@
 """
 Performance Benchmarks for Visual Encoder
-TEST_IDs: T004.9, T004.10
+TEST_IDs: T004.8-T004.13
 
 IMPLEMENTS: Week 4 Day 1 - Benchmark Implementation
 
@@ -19,6 +19,12 @@ import numpy as np
 import pytest
 
 from vl_jepa.encoders.placeholder import PlaceholderVisualEncoder
+from vl_jepa.frame_cache import CachedVisualEncoder, FrameEmbeddingCache
+from vl_jepa.model_registry import (
+    PLACEHOLDER_VISUAL_ENCODER,
+    ModelRegistry,
+    register_default_models,
+)
 
 # Performance target constants (from CLAUDE.md)
 GPU_TARGET_MS = 50  # <50ms per frame on GPU
@@ -153,3 +159,69 @@ class TestVisualEncoderBenchmarks:
         assert result.shape == (768,)
         # CI placeholder threshold (GPU_TARGET_MS for single frame)
         assert benchmark.stats["mean"] < GPU_TARGET_MS / 1000
+
+    @pytest.mark.parametrize("cached", [False, True], ids=["plain", "cached"])
+    def test_static_lecture_encode(
+        self,
+        benchmark,
+        placeholder_encoder: PlaceholderVisualEncoder,
+        cached: bool,
+    ) -> None:
+        """
+        TEST_ID: T004.12
+        BUDGET: <100ms per frame (placeholder, relaxed for CI)
+        Given: 60 frames at 1 FPS showing 6 slides, 10 frames each
+        When: They are encoded one at a time, through a fresh frame cache
+              or directly
+        Then: The cache encodes 6 frames and reuses the rest
+        """
+        rng = np.random.default_rng(0)
+        slides = rng.uniform(-1.0, 1.0, (6, 3, 224, 224)).astype(np.float32)
+        frames = slides.repeat(10, axis=0)
+
+        def encode_lecture() -> np.ndarray:
+            encoder = placeholder_encoder
+            if cached:
+                encoder = CachedVisualEncoder(encoder, FrameEmbeddingCache())
+            return np.stack([encoder.encode_single(frame) for frame in frames])
+
+        # Act
+        result = benchmark.pedantic(encode_lecture, rounds=5)
+
+        # Assert
+        assert result.shape == (60, 768)
+        # CI placeholder threshold, per frame
+        assert benchmark.stats["mean"] < 60 * CI_PLACEHOLDER_THRESHOLD_MS / 1000
+
+    @pytest.mark.parametrize("shared", [False, True], ids=["per-job", "registry"])
+    def test_short_job_encoder_setup(self, benchmark, shared: bool) -> None:
+        """
+        TEST_ID: T004.13
+        BUDGET: <100ms per frame with the registry (relaxed for CI)
+        Given: Short jobs of 5 frames each
+        When: Each job builds its own encoder, or acquires the shared one
+              from a model registry
+        Then: The registry builds the 460 MB projection once, so a job
+              costs its encodes only; per-job setup is the baseline
+        """
+        frames = np.random.default_rng(0).uniform(-1.0, 1.0, (5, 3, 224, 224))
+        frames = frames.astype(np.float32)
+        models = ModelRegistry()
+        register_default_models(models)
+
+        def run_job() -> np.ndarray:
+            if shared:
+                with models.acquire(PLACEHOLDER_VISUAL_ENCODER) as encoder:
+                    return encoder.encode(frames)
+            return PlaceholderVisualEncoder(seed=42).encode(frames)
+
+        # Act
+        result = benchmark.pedantic(run_job, rounds=5, warmup_rounds=1)
+
+        # Assert
+        assert result.shape == (5, 768)
+        assert models.stats.loads == (1 if shared else 0)
+        if shared:
+            # CI placeholder threshold, per frame
+            assert benchmark.stats["mean"] < 5 * CI_PLACEHOLDER_THRESHOLD_MS / 1000
+        models.close()
@@ -434,6 +434,32 @@ class TestAppCreation:
         assert app.redoc_url == "/api/redoc"
 
 
+class TestTextEncoderSelection:
+    """Tests for the choice of text encoder used by processing jobs."""
+
+    def test_failed_text_encoder_load_is_not_retried(self) -> None:
+        """A text encoder that fails to load is tried once per process."""
+        from vl_jepa.api import main
+        from vl_jepa.model_registry import (
+            PLACEHOLDER_TEXT_ENCODER,
+            TEXT_ENCODER,
+            ModelRegistry,
+        )
+
+        factory = MagicMock(side_effect=ImportError("no sentence-transformers"))
+        models = ModelRegistry()
+        models.register(TEXT_ENCODER, factory)
+
+        with (
+            patch.object(main, "get_models", return_value=models),
+            patch.object(main, "_text_encoder_failed", False),
+        ):
+            names = [main.get_text_encoder_name() for _ in range(3)]
+
+        assert names == [PLACEHOLDER_TEXT_ENCODER] * 3
+        assert factory.call_count == 1
+
+
 class TestModelsValidation:
     """Tests for Pydantic models."""
 
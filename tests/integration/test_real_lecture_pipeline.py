@@ -267,6 +267,59 @@ class TestRealVideoDINOv2Encoding:
         assert sim_adjacent >= 0.0  # At minimum, not anti-correlated
         assert sim_distant >= 0.0
 
+    def test_static_slide_skipping_on_real_frames(
+        self, lecture_video_path: Path, dinov2_encoder
+    ) -> None:
+        """
+        SPEC: S003, S004
+        TEST_ID: T_PIPELINE_REAL_2c
+
+        Given: Two minutes of a real lecture sampled at 1 FPS
+        When: Frames pass through FrameChangeGate before DINOv2
+        Then: Skipped frames are close to the embedding they inherit, and
+              the skip ratio and encoding time saved are reported
+        """
+        from vl_jepa.frame import FrameChangeGate, FrameSampler
+        from vl_jepa.video import VideoInput
+
+        sampler = FrameSampler(mode="center_crop")
+        gate = FrameChangeGate()
+
+        with VideoInput.open(lecture_video_path) as video:
+            frames = list(video.sample_frames(target_fps=1.0, max_frames=120))
+
+        # Encode every frame to compare inherited and true embeddings
+        kept, true_embeddings, encode_times = [], [], []
+        for frame in frames:
+            kept.append(gate.changed(frame.data))
+            processed = sampler.process(frame.data)
+            batch = np.transpose(processed, (2, 0, 1))[np.newaxis, ...]
+            start = time.time()
+            true_embeddings.append(dinov2_encoder.encode(batch)[0])
+            encode_times.append(time.time() - start)
+
+        similarities = []
+        inherited = true_embeddings[0]
+        for is_kept, embedding in zip(kept, true_embeddings, strict=True):
+            if is_kept:
+                inherited = embedding
+            else:
+                similarities.append(float(np.dot(inherited, embedding)))
+
+        logger.info(
+            "Static-slide gate: skipped %d/%d frames (%.0f%%), "
+            "~%.1fs of %.1fs encoding saved, min similarity %.3f",
+            gate.skipped,
+            gate.frames,
+            100 * gate.skip_ratio,
+            gate.skipped * np.mean(encode_times),
+            np.sum(encode_times),
+            min(similarities, default=1.0),
+        )
+
+        assert kept[0]
+        assert all(s > 0.9 for s in similarities)
+
 
 @pytest.mark.integration
 @pytest.mark.slow
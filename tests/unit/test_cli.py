@@ -210,3 +210,33 @@ class TestCLI:
 
         args = parse_args(["process", "video.mp4", "--threshold", "0.5"])
         assert args.threshold == 0.5
+
+    @pytest.mark.unit
+    def test_parse_process_frame_cache(self):
+        """Parse process with a frame embedding cache."""
+        from vl_jepa.cli import parse_args
+
+        args = parse_args(["process", "video.mp4"])
+        assert args.frame_cache is None and args.frame_cache_distance is None
+
+        args = parse_args(
+            [
+                "process",
+                "video.mp4",
+                "--frame-cache",
+                "frames.db",
+                "--frame-cache-distance",
+                "4",
+            ]
+        )
+        assert args.frame_cache == "frames.db"
+        assert args.frame_cache_distance == 4
+
+    @pytest.mark.unit
+    def test_parse_process_keep_static_frames(self):
+        """Parse process with static-frame skipping disabled."""
+        from vl_jepa.cli import parse_args
+
+        assert not parse_args(["process", "video.mp4"]).keep_static_frames
+        args = parse_args(["process", "video.mp4", "--keep-static-frames"])
+        assert args.keep_static_frames
@@ -0,0 +1,126 @@
+"""
+SPEC: Multimodal Index (binary container)
+TEST_IDs: T011.C1-T011.C4
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vl_jepa.container import Container, ContainerWriter
+
+
+@pytest.fixture
+def arrays() -> dict[str, np.ndarray]:
+    """Sections covering 1-D, 2-D, empty and big-endian arrays."""
+    rng = np.random.default_rng(0)
+    return {
+        "ids": np.arange(5, dtype=np.int64),
+        "flags": np.array([True, False, True]),
+        "matrix": rng.standard_normal((7, 3)).astype(np.float32),
+        "empty": np.empty((0, 3), dtype=np.float32),
+        "big_endian": np.arange(4, dtype=">f8"),
+    }
+
+
+def _write(path: Path, arrays: dict[str, np.ndarray]) -> None:
+    writer = ContainerWriter(path)
+    for name, array in arrays.items():
+        writer.add(name, array)
+    writer.close({"dimension": 3, "label": "énergie"})
+
+
+class TestContainer:
+    """Tests for the binary container used by MultimodalIndex.save."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("mmap", [False, True])
+    def test_roundtrip(self, arrays, tmp_path: Path, mmap: bool):
+        """
+        TEST_ID: T011.C1
+        Given: Arrays of several dtypes and shapes
+        When: Written to a container and read back
+        Then: Every section and the info dict are returned unchanged
+        """
+        _write(tmp_path / "c.bin", arrays)
+        container = Container(tmp_path / "c.bin", mmap=mmap)
+
+        assert container.info == {"dimension": 3, "label": "énergie"}
+        assert container.names == list(arrays)
+        for name, array in arrays.items():
+            loaded = container.read(name)
+            assert loaded.shape == array.shape
+            np.testing.assert_array_equal(loaded, array)
+        assert isinstance(container.read("matrix"), np.memmap) == mmap
+        assert "missing" not in container
+        with pytest.raises(KeyError):
+            container.read("missing")
+
+    @pytest.mark.unit
+    def test_rows_streamed_in_chunks(self, tmp_path: Path):
+        """
+        TEST_ID: T011.C2
+        Given: A section written as several row chunks
+        When: Read back
+        Then: It equals the concatenated chunks; bad row shapes raise
+        """
+        chunks = [np.full((n, 2), n, dtype=np.float32) for n in (3, 0, 5)]
+        writer = ContainerWriter(tmp_path / "c.bin")
+        writer.add_rows("rows", iter(chunks), np.float32, (2,))
+        with pytest.raises(ValueError, match="duplicate"):
+            writer.add_rows("rows", [], np.float32, (2,))
+        with pytest.raises(ValueError, match="chunk rows"):
+            writer.add_rows("bad", [np.zeros((1, 3))], np.float32, (2,))
+        writer.close()
+
+        loaded = Container(tmp_path / "c.bin").read("rows")
+        np.testing.assert_array_equal(loaded, np.concatenate(chunks))
+
+    @pytest.mark.unit
+    def test_corruption_detected(self, arrays, tmp_path: Path):
+        """
+        TEST_ID: T011.C3
+        Given: A container with one flipped byte in a section
+        When: That section is read
+        Then: ValueError is raised, unless verification is off
+        """
+        path = tmp_path / "c.bin"
+        _write(path, arrays)
+        data = bytearray(path.read_bytes())
+        data[data.index(arrays["matrix"].tobytes()) + 5] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        container = Container(path)
+        np.testing.assert_array_equal(container.read("ids"), arrays["ids"])
+        with pytest.raises(ValueError, match="checksum"):
+            container.read("matrix")
+        assert Container(path, verify=False).read("matrix").shape == (7, 3)
+
+    @pytest.mark.unit
+    def test_invalid_files_raise(self, arrays, tmp_path: Path):
+        """
+        TEST_ID: T011.C4
+        Given: Non-container, newer-version, truncated and aborted files
+        When: Opened
+        Then: ValueError is raised; an aborted write leaves no file behind
+        """
+        path = tmp_path / "c.bin"
+        path.write_bytes(b'{"entries": {}}')
+        with pytest.raises(ValueError, match="not a multimodal container"):
+            Container(path)
+
+        _write(path, arrays)
+        data = bytearray(path.read_bytes())
+        with pytest.raises(ValueError, match="truncated"):
+            path.write_bytes(bytes(data[:-4]))
+            Container(path)
+        data[8] = 99  # format version
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="version 99"):
+            Container(path)
+
+        writer = ContainerWriter(tmp_path / "aborted.bin")
+        writer.add("ids", arrays["ids"])
+        writer.abort()
+        assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,217 @@
+"""
+SPEC: Corpus Index (cross-lecture search)
+TEST_IDs: T011.CO1-T011.CO6
+"""
+
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vl_jepa.corpus import MANIFEST_NAME, CorpusIndex
+from vl_jepa.multimodal_index import Modality, MultimodalIndex
+
+LECTURES = {
+    "cs229-01": {"course": "CS229", "date": "2026-01-05"},
+    "cs229-02": {"course": "CS229", "date": "2026-01-12"},
+    "cs231-01": {"course": "CS231", "date": "2026-01-07"},
+}
+
+
+def _lecture(seed: int, n: int = 12) -> MultimodalIndex:
+    """Lecture index with n frames and n transcript chunks."""
+    rng = np.random.default_rng(seed)
+    emb = rng.standard_normal((2 * n, 768)).astype(np.float32)
+    emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+    times = np.arange(n, dtype=np.float64) * 10.0
+    index = MultimodalIndex()
+    index.add_visual_batch(emb[:n], times, np.arange(n))
+    index.add_transcript_batch(
+        emb[n:], times, times + 9.0, [f"chunk {i} of lecture {seed}" for i in range(n)]
+    )
+    return index
+
+
+@pytest.fixture
+def corpus() -> Iterator[CorpusIndex]:
+    """In-memory corpus of three lectures from two courses."""
+    corpus = CorpusIndex(max_workers=4)
+    for seed, (lecture_id, metadata) in enumerate(LECTURES.items()):
+        corpus.add_lecture(lecture_id, _lecture(seed), metadata)
+    yield corpus
+    corpus.close()
+
+
+def _query() -> np.ndarray:
+    query = np.random.default_rng(99).standard_normal(768).astype(np.float32)
+    return query / np.linalg.norm(query)
+
+
+class TestCorpusIndex:
+    """Tests for cross-lecture search over lecture shards."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("modality", [None, Modality.TRANSCRIPT])
+    def test_search_merges_shards(self, corpus: CorpusIndex, modality):
+        """
+        TEST_ID: T011.CO1
+        Given: Three lecture shards
+        When: The corpus is searched
+        Then: Results equal the best k over every lecture's own results
+        """
+        query = _query()
+
+        results = corpus.search(query, k=8, modality=modality)
+
+        expected = sorted(
+            (
+                (r.score, lecture_id, r.id)
+                for lecture_id in corpus.lecture_ids
+                for r in corpus.lecture(lecture_id).search(
+                    query, k=8, modality=modality
+                )
+            ),
+            key=lambda t: -t[0],
+        )[:8]
+        assert [(r.lecture_id, r.result.id) for r in results] == [
+            (lecture_id, entry_id) for _, lecture_id, entry_id in expected
+        ]
+        np.testing.assert_allclose([r.score for r in results], [t[0] for t in expected])
+
+    @pytest.mark.unit
+    def test_parallel_matches_sequential(self, corpus: CorpusIndex):
+        """
+        TEST_ID: T011.CO2
+        Given: The same lectures in a 1-thread and a 4-thread corpus
+        When: Searched with every search method
+        Then: Both return identical results
+        """
+        sequential = CorpusIndex(max_workers=1)
+        for lecture_id in corpus.lecture_ids:
+            sequential.add_lecture(
+                lecture_id, corpus.lecture(lecture_id), corpus.metadata(lecture_id)
+            )
+        query = _query()
+
+        for method, args in (
+            ("search", (query,)),
+            ("search_multimodal", (query,)),
+            ("search_hybrid", (query, "chunk 3 lecture")),
+        ):
+            parallel = getattr(corpus, method)(*args, k=10)
+            expected = getattr(sequential, method)(*args, k=10)
+            assert [(r.lecture_id, r.result.id, r.score) for r in parallel] == [
+                (r.lecture_id, r.result.id, r.score) for r in expected
+            ]
+            assert len(parallel) == 10
+        sequential.close()
+
+    @pytest.mark.unit
+    def test_metadata_filters(self, corpus: CorpusIndex):
+        """
+        TEST_ID: T011.CO3
+        Given: Lectures with course and date metadata
+        When: Filtered by value, by list, by predicate or by a missing key
+        Then: Only matching lectures are selected and searched
+        """
+        assert corpus.select() == list(LECTURES)
+        assert corpus.select({"course": "CS229"}) == ["cs229-01", "cs229-02"]
+        assert corpus.select({"course": ["CS231", "CS224"]}) == ["cs231-01"]
+        assert corpus.select(
+            {"course": "CS229", "date": lambda d: d >= "2026-01-10"}
+        ) == ["cs229-02"]
+        assert corpus.select({"instructor": "Ng"}) == []
+
+        results = corpus.search(_query(), k=50, filters={"course": "CS229"})
+        assert {r.lecture_id for r in results} == {"cs229-01", "cs229-02"}
+        assert corpus.search(_query(), k=5, filters={"course": "EE364"}) == []
+        assert corpus.search(_query(), k=0) == []
+
+    @pytest.mark.unit
+    def test_saved_corpus_loads_lazily(self, corpus: CorpusIndex, tmp_path: Path):
+        """
+        TEST_ID: T011.CO4
+        Given: A saved corpus
+        When: It is opened and queried with a filter, from several threads
+        Then: Nothing loads until queried, only matching lectures load,
+              and results equal the in-memory corpus
+        """
+        query = _query()
+        expected = corpus.search_multimodal(query, k=10)
+        corpus.save(tmp_path / "corpus")
+
+        loaded = CorpusIndex.load(tmp_path / "corpus", max_workers=4)
+        assert loaded.lecture_ids == list(LECTURES)
+        assert loaded.metadata("cs231-01") == LECTURES["cs231-01"]
+        assert loaded.loaded_count == 0
+
+        threads = [
+            threading.Thread(
+                target=loaded.search,
+                args=(query,),
+                kwargs={"filters": {"course": "CS229"}},
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert loaded.loaded_count == 2
+
+        results = loaded.search_multimodal(query, k=10)
+        assert loaded.loaded_count == 3
+        assert [(r.lecture_id, r.result.id) for r in results] == [
+            (r.lecture_id, r.result.id) for r in expected
+        ]
+        np.testing.assert_allclose(
+            [r.score for r in results], [r.score for r in expected], rtol=1e-6
+        )
+        loaded.close()
+
+    @pytest.mark.unit
+    def test_registered_lectures_not_rewritten(self, tmp_path: Path):
+        """
+        TEST_ID: T011.CO5
+        Given: A lecture registered from a path outside the corpus directory
+        When: The corpus is saved and reopened
+        Then: The manifest points at the original files
+        """
+        (tmp_path / "lectures").mkdir()
+        _lecture(0).save(tmp_path / "lectures" / "a")
+        corpus = CorpusIndex()
+        corpus.register_lecture("a", tmp_path / "lectures" / "a", {"course": "X"})
+        corpus.add_lecture("b", _lecture(1))
+        corpus.save(tmp_path / "corpus")
+
+        manifest = json.loads((tmp_path / "corpus" / MANIFEST_NAME).read_text())
+        paths = {entry["lecture_id"]: entry["path"] for entry in manifest["lectures"]}
+        assert paths["b"] == "b"
+        assert Path(paths["a"]) == (tmp_path / "lectures" / "a").resolve()
+        assert corpus.loaded_count == 1
+
+        reopened = CorpusIndex.load(tmp_path / "corpus")
+        assert reopened.lecture("a").size == 24
+        assert len(reopened.search(_query(), k=100)) == 48
+
+    @pytest.mark.unit
+    def test_invalid_operations_raise(self, corpus: CorpusIndex, tmp_path: Path):
+        """
+        TEST_ID: T011.CO6
+        Given: A corpus
+        When: Ids are duplicated or missing, or the manifest version is unknown
+        Then: ValueError or KeyError is raised
+        """
+        with pytest.raises(ValueError, match="already in corpus"):
+            corpus.add_lecture("cs229-01", _lecture(5))
+        with pytest.raises(KeyError):
+            corpus.lecture("missing")
+        corpus.remove_lecture("cs231-01")
+        assert "cs231-01" not in corpus and len(corpus) == 2
+
+        (tmp_path / MANIFEST_NAME).write_text('{"version": 99, "lectures": []}')
+        with pytest.raises(ValueError, match="version 99"):
+            CorpusIndex.load(tmp_path)
@@ -0,0 +1,101 @@
+"""
+SPEC: Multimodal Index (result diversification)
+TEST_IDs: T011.D1-T011.D3
+"""
+
+import numpy as np
+import pytest
+
+from vl_jepa.diversity import mmr_select
+
+
+def _candidates(n: int = 50, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    embeddings = rng.standard_normal((n, 16)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    relevance = np.sort(rng.random(n))[::-1]
+    return embeddings, relevance
+
+
+def _reference_mmr(embeddings, relevance, k, mmr_lambda) -> list[int]:
+    """Textbook greedy MMR, one candidate at a time."""
+    rel = (relevance - relevance.min()) / (relevance.max() - relevance.min())
+    picked: list[int] = []
+    while len(picked) < k:
+        best, best_gain = -1, -np.inf
+        for i in range(len(rel)):
+            if i in picked:
+                continue
+            redundancy = max(
+                (float(embeddings[i] @ embeddings[j]) for j in picked), default=0.0
+            )
+            gain = mmr_lambda * rel[i] - (1 - mmr_lambda) * redundancy
+            if gain > best_gain:
+                best, best_gain = i, gain
+        picked.append(best)
+    return picked
+
+
+class TestMMRSelect:
+    """Tests for maximal marginal relevance selection."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("mmr_lambda", [0.0, 0.3, 0.7])
+    def test_matches_reference(self, mmr_lambda: float):
+        """
+        TEST_ID: T011.D1
+        Given: 50 random candidates
+        When: 10 are picked by MMR
+        Then: The picks equal a brute-force greedy MMR
+        """
+        embeddings, relevance = _candidates()
+
+        picked = mmr_select(embeddings, relevance, 10, mmr_lambda=mmr_lambda)
+
+        expected = _reference_mmr(embeddings, relevance, 10, mmr_lambda)
+        assert picked.tolist() == expected
+
+    @pytest.mark.unit
+    def test_relevance_only_keeps_ranking(self):
+        """
+        TEST_ID: T011.D2
+        Given: Candidates sorted by relevance, with a tie
+        When: Picked with mmr_lambda=1 and no separation
+        Then: The plain top k comes back, ties in candidate order
+        """
+        embeddings, relevance = _candidates()
+        relevance[3] = relevance[2]
+
+        picked = mmr_select(embeddings, relevance, 10, mmr_lambda=1.0)
+
+        assert picked.tolist() == list(range(10))
+        assert mmr_select(embeddings, relevance, 0).size == 0
+        assert len(mmr_select(embeddings[:4], relevance[:4], 10)) == 4
+
+    @pytest.mark.unit
+    def test_min_separation_per_group(self):
+        """
+        TEST_ID: T011.D3
+        Given: Candidates one second apart in two groups
+        When: Picked with a 5-second minimum separation
+        Then: Picks of one group are >= 5s apart, groups do not block each
+              other, and the pool running out returns fewer than k
+        """
+        embeddings, relevance = _candidates(n=20)
+        timestamps = np.arange(20) % 10 * 1.0
+        groups = np.arange(20) // 10
+
+        picked = mmr_select(
+            embeddings,
+            relevance,
+            10,
+            mmr_lambda=1.0,
+            timestamps=timestamps,
+            min_separation=5.0,
+            groups=groups,
+        )
+
+        assert len(picked) == 4  # two per group fit in 10 seconds
+        for group in (0, 1):
+            times = np.sort(timestamps[picked[groups[picked] == group]])
+            assert len(times) == 2 and np.diff(times).min() >= 5.0
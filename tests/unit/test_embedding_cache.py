@@ -0,0 +1,144 @@
+"""
+SPEC: S006 - Text Encoding with Projection (embedding cache)
+TEST_IDs: T006.C1-T006.C4
+"""
+
+import zlib
+
+import numpy as np
+import pytest
+
+from vl_jepa.embedding_cache import EmbeddingCache
+from vl_jepa.encoders.placeholder import PlaceholderTextEncoder
+from vl_jepa.text import TextEncoder
+
+
+class _CountingModel:
+    """Deterministic stand-in for a SentenceTransformer: counts texts."""
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode(self, texts, batch_size=None, convert_to_numpy=True):
+        self.encoded.extend(texts)
+        rows = [
+            np.random.default_rng(zlib.crc32(t.encode())).standard_normal(384)
+            for t in texts
+        ]
+        return np.array(rows, dtype=np.float32)
+
+
+class TestEmbeddingCache:
+    """Tests for the content-addressed text embedding cache."""
+
+    @pytest.mark.unit
+    def test_encoder_reads_through_cache(self):
+        """
+        TEST_ID: T006.C1
+        Given: A TextEncoder with an in-memory cache
+        When: The same texts are encoded again, re-spaced or repeated
+        Then: Only new texts reach the model, results equal the uncached
+              encoder, and hits, misses and saved time are counted
+        """
+        model = _CountingModel()
+        cache = EmbeddingCache()
+        encoder = TextEncoder(model, cache=cache)
+        texts = ["gradient descent", "backpropagation", "gradient descent"]
+
+        first = encoder.encode_batch(texts)
+        second = encoder.encode_batch(["  gradient\tdescent ", "learning rate"])
+
+        assert model.encoded == ["gradient descent", "backpropagation", "learning rate"]
+        expected = TextEncoder(_CountingModel()).encode_batch(texts)
+        np.testing.assert_array_equal(first, expected)
+        np.testing.assert_array_equal(second[0], first[0])
+        assert encoder.cache is cache
+
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.encoded) == (1, 4, 3)
+        assert stats.disk_hits == 0 and stats.size == 3
+        assert stats.hit_rate == pytest.approx(0.2)
+        assert stats.saved_seconds == pytest.approx(stats.encode_seconds / 3)
+
+    @pytest.mark.unit
+    def test_persists_across_instances(self, tmp_path):
+        """
+        TEST_ID: T006.C2
+        Given: Embeddings cached in a SQLite file by one encoder
+        When: A new cache on the same file serves a new encoder
+        Then: The texts are read from disk without running the model; a
+              different projection or model name does not reuse them
+        """
+        path = tmp_path / "cache" / "text.db"
+        texts = [f"chunk {i}" for i in range(700)]
+        expected = TextEncoder(_CountingModel(), cache=EmbeddingCache(path))
+        expected = expected.encode_batch(texts)
+
+        model = _CountingModel()
+        cache = EmbeddingCache(path, capacity=10)
+        result = TextEncoder(model, cache=cache).encode_batch(texts)
+
+        assert model.encoded == []
+        np.testing.assert_array_equal(result, expected)
+        assert cache.stats.disk_hits == 700 and len(cache) == 10
+
+        projection = np.random.default_rng(0).standard_normal((384, 768))
+        other = TextEncoder(
+            model, projection=projection.astype(np.float32), cache=cache
+        )
+        other.encode("chunk 0")
+        TextEncoder(model, cache=cache, model_name="other-model").encode("chunk 0")
+        assert model.encoded == ["chunk 0", "chunk 0"]
+
+        cache.clear()
+        cache.close()
+        TextEncoder(model, cache=EmbeddingCache(path)).encode("chunk 1")
+        assert len(cache) == 0 and model.encoded[-1] == "chunk 1"
+
+    @pytest.mark.unit
+    def test_memory_lru_and_capacity(self):
+        """
+        TEST_ID: T006.C3
+        Given: A memory-only cache of capacity 2, and one of capacity 0
+        When: Three texts are encoded, then the first again
+        Then: The least recently used text was evicted and is encoded
+              again; capacity 0 keeps nothing; negative raises ValueError
+        """
+        calls: list[list[str]] = []
+
+        def encode(texts):
+            calls.append(texts)
+            return np.ones((len(texts), 4), dtype=np.float32)
+
+        cache = EmbeddingCache(capacity=2)
+        for text in ["a", "b", "c", "a"]:
+            cache.encode("ns", [text], encode)
+        assert calls == [["a"], ["b"], ["c"], ["a"]]
+        assert len(cache) == 2
+
+        empty = EmbeddingCache(capacity=0)
+        empty.encode("ns", ["a"], encode)
+        empty.encode("ns", ["a"], encode)
+        assert len(empty) == 0 and empty.stats.hits == 0
+        with pytest.raises(ValueError, match="capacity"):
+            EmbeddingCache(capacity=-1)
+
+    @pytest.mark.unit
+    def test_placeholder_encoder_uses_cache(self):
+        """
+        TEST_ID: T006.C4
+        Given: A PlaceholderTextEncoder with and without a cache
+        When: The same texts are encoded twice
+        Then: Results are equal and the second pass is all hits
+        """
+        texts = ["what is a tensor", "define entropy"]
+        cached = PlaceholderTextEncoder(cache=EmbeddingCache())
+
+        first = cached.encode_batch(texts)
+        second = cached.encode_batch(texts)
+
+        np.testing.assert_array_equal(
+            first, PlaceholderTextEncoder().encode_batch(texts)
+        )
+        np.testing.assert_array_equal(second, first)
+        assert cached.cache is not None and cached.cache.stats.hits == 2
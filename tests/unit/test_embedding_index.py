@@ -477,3 +477,791 @@ class TestEmbeddingIndexIVFTransition:
         results = loaded.search(embeddings[0], k=5)
         assert len(results) == 5
         assert results[0].score > 0.99
+
+
+class TestEmbeddingIndexBatchSearch:
+    """Tests for multi-query search_batch()."""
+
+    @pytest.mark.unit
+    def test_search_batch_shapes(self, sample_embedding_batch: np.ndarray):
+        """search_batch returns (Q, min(k, size)) id and score matrices."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex()
+        index.add_batch(sample_embedding_batch, ids=list(range(100, 110)))
+
+        batch = index.search_batch(sample_embedding_batch[:4], k=3)
+        assert len(batch) == 4
+        assert batch.ids.shape == (4, 3)
+        assert batch.scores.shape == (4, 3)
+
+        # k > size is clamped (INV012)
+        batch = index.search_batch(sample_embedding_batch[:2], k=50)
+        assert batch.ids.shape == (2, 10)
+
+    @pytest.mark.unit
+    def test_search_batch_matches_single_search(
+        self, sample_embedding_batch: np.ndarray
+    ):
+        """Each row of search_batch matches the equivalent search() call."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex()
+        ids = list(range(100, 110))
+        metadata = {i: {"timestamp": float(i)} for i in ids}
+        index.add_batch(sample_embedding_batch, ids=ids, metadata=metadata)
+
+        queries = sample_embedding_batch[:5]
+        batch = index.search_batch(queries, k=4)
+
+        for q, query in enumerate(queries):
+            single = index.search(query, k=4)
+            lazy = batch[q]
+            assert [r.id for r in lazy] == [r.id for r in single]
+            assert [r.score for r in lazy] == pytest.approx(
+                [r.score for r in single], abs=1e-5
+            )
+            assert lazy[0].id == ids[q]
+            assert lazy[0].metadata == {"timestamp": float(ids[q])}
+
+        assert len(batch.to_results()) == 5
+
+    @pytest.mark.unit
+    def test_search_batch_empty_index(self, sample_embedding_batch: np.ndarray):
+        """search_batch on an empty index returns empty rows."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex()
+        batch = index.search_batch(sample_embedding_batch[:3], k=5)
+        assert batch.ids.shape == (3, 0)
+        assert batch.to_results() == [[], [], []]
+
+
+class TestEmbeddingIndexNumpyFallback:
+    """Tests for the preallocated numpy fallback matrix."""
+
+    @pytest.mark.unit
+    def test_fallback_matrix_grows_without_losing_rows(self):
+        """Appending past capacity doubles storage and keeps existing rows."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import EmbeddingIndex
+
+        if HAS_FAISS:
+            pytest.skip("Test only relevant when FAISS unavailable")
+
+        index = EmbeddingIndex(dimension=768)
+        initial_capacity = len(index._vectors)
+
+        embeddings = np.random.randn(initial_capacity * 3, 768).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        for start in range(0, len(embeddings), 50):
+            chunk = embeddings[start : start + 50]
+            index.add_batch(chunk, ids=list(range(start, start + len(chunk))))
+
+        assert index.size == len(embeddings)
+        assert len(index._vectors) >= len(embeddings)
+        assert len(index._vectors) % initial_capacity == 0
+        np.testing.assert_array_equal(index._fallback_matrix(), embeddings)
+
+    @pytest.mark.unit
+    def test_fallback_search_returns_exact_top_k(self):
+        """Fallback top-k matches a full argsort over all scores."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import EmbeddingIndex
+
+        if HAS_FAISS:
+            pytest.skip("Test only relevant when FAISS unavailable")
+
+        index = EmbeddingIndex(dimension=768)
+        embeddings = np.random.randn(200, 768).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        index.add_batch(embeddings, ids=list(range(200)))
+
+        query = embeddings[7]
+        expected = np.argsort(embeddings @ query)[::-1][:10]
+
+        results = index.search(query, k=10)
+        assert [r.id for r in results] == expected.tolist()
+
+
+class TestEmbeddingIndexBackgroundRebuild:
+    """Tests for non-blocking background IVF rebuild."""
+
+    @pytest.mark.unit
+    def test_background_rebuild_swaps_to_ivf(self):
+        """Crossing the threshold trains IVF in the background and swaps."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import EmbeddingIndex
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+
+        index = EmbeddingIndex(dimension=768, background_rebuild=True)
+        assert index.rebuild_metrics["status"] == "idle"
+
+        embeddings = np.random.randn(1500, 768).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        index.add_batch(embeddings, list(range(1500)))
+
+        assert index.wait_for_rebuild(timeout=60)
+        metrics = index.rebuild_metrics
+        assert metrics["status"] == "completed"
+        assert metrics["duration_seconds"] > 0
+        assert metrics["use_ivf"] is True
+        assert index._use_ivf is True
+        assert index._index.ntotal == 1500
+
+    @pytest.mark.unit
+    def test_inserts_during_rebuild_are_served_and_replayed(self, monkeypatch):
+        """Flat index keeps serving while training; buffered rows survive swap."""
+        import threading
+
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import EmbeddingIndex
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+
+        index = EmbeddingIndex(dimension=768, background_rebuild=True)
+        release = threading.Event()
+        original_build = index._build_ivf_index
+
+        def slow_build(embeddings: np.ndarray):
+            release.wait(timeout=30)
+            return original_build(embeddings)
+
+        monkeypatch.setattr(index, "_build_ivf_index", slow_build)
+
+        embeddings = np.random.randn(1200, 768).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        index.add_batch(embeddings[:1000], list(range(1000)))
+        assert index.rebuild_metrics["status"] == "running"
+
+        # Insert while training: flat index answers immediately
+        index.add_batch(embeddings[1000:], list(range(1000, 1200)))
+        assert index._use_ivf is False
+        assert index.search(embeddings[1100], k=1)[0].id == 1100
+        assert index.rebuild_metrics["buffered_batches"] == 1
+
+        release.set()
+        assert index.wait_for_rebuild(timeout=60)
+
+        assert index._use_ivf is True
+        assert index._index.ntotal == 1200
+        assert index.rebuild_metrics["buffered_batches"] == 0
+
+        # Exhaustive probe: buffered rows map to the right ids after the swap
+        index._index.nprobe = index._index.nlist
+        assert index.search(embeddings[1100], k=1)[0].id == 1100
+        assert index.search(embeddings[10], k=1)[0].id == 10
+
+
+class TestEmbeddingIndexNprobe:
+    """Tests for search-time nprobe and recall calibration."""
+
+    @pytest.fixture
+    def ivf_index(self):
+        """IVF index over 2000 clustered embeddings, plus held-out queries."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import EmbeddingIndex
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+
+        rng = np.random.default_rng(0)
+        centers = rng.standard_normal((20, 768)).astype(np.float32)
+        embeddings = centers[rng.integers(0, 20, 2100)] + 0.5 * rng.standard_normal(
+            (2100, 768)
+        ).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+        index = EmbeddingIndex(dimension=768)
+        index.add_batch(embeddings[:2000], list(range(2000)))
+        assert index._use_ivf is True
+        return index, embeddings[:2000], embeddings[2000:]
+
+    @pytest.mark.unit
+    def test_search_nprobe_exhaustive_equals_exact(self, ivf_index):
+        """Probing every list returns the exact flat-search neighbours."""
+        index, embeddings, queries = ivf_index
+        nlist = index._index.nlist
+        exact = np.argsort(embeddings @ queries[0])[::-1][:10]
+
+        results = index.search(queries[0], k=10, nprobe=nlist)
+        assert [r.id for r in results] == exact.tolist()
+
+    @pytest.mark.unit
+    def test_invalid_nprobe_raises(self, ivf_index):
+        """nprobe below 1 is rejected."""
+        index, _, queries = ivf_index
+        with pytest.raises(ValueError, match="nprobe"):
+            index.search(queries[0], k=5, nprobe=0)
+        with pytest.raises(ValueError, match="nprobe"):
+            index.nprobe = 0
+
+    @pytest.mark.unit
+    def test_calibrate_nprobe_meets_target_and_persists(self, ivf_index, tmp_path):
+        """Calibration picks a nprobe reaching target recall; save/load keep it."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index, _, queries = ivf_index
+        chosen = index.calibrate_nprobe(queries, k=10, target_recall=0.9)
+
+        assert chosen is not None
+        assert 1 <= chosen <= index._index.nlist
+        assert index.nprobe == chosen
+        assert index._index.nprobe == chosen
+
+        save_path = tmp_path / "ivf_index"
+        index.save(save_path)
+        loaded = EmbeddingIndex.load(save_path)
+        assert loaded.nprobe == chosen
+        assert loaded._use_ivf is True
+
+    @pytest.mark.unit
+    def test_calibrate_nprobe_flat_index_returns_none(self, sample_embedding_batch):
+        """Exact backends need no calibration."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex()
+        index.add_batch(sample_embedding_batch, list(range(10)))
+        assert index.calibrate_nprobe(sample_embedding_batch[:3]) is None
+        with pytest.raises(ValueError, match="target_recall"):
+            index.calibrate_nprobe(sample_embedding_batch[:3], target_recall=1.5)
+
+
+class TestEmbeddingIndexReconstruct:
+    """Tests for bulk reconstruction of all stored embeddings."""
+
+    @pytest.mark.unit
+    def test_reconstruct_all_flat_and_fallback(self, sample_embedding_batch):
+        """Flat/numpy backends return stored rows in insertion order."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex()
+        index.add_batch(sample_embedding_batch, list(range(10)))
+
+        matrix = index.reconstruct_all()
+        np.testing.assert_allclose(matrix, sample_embedding_batch, atol=1e-6)
+
+        # Owned copy: later inserts do not alter it
+        index.add(sample_embedding_batch[0], id=10)
+        assert matrix.shape == (10, 768)
+
+    @pytest.mark.unit
+    def test_reconstruct_all_ivf(self):
+        """IVF indexes reconstruct every vector, including post-transition adds."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import EmbeddingIndex
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+
+        embeddings = np.random.randn(1300, 768).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+        index = EmbeddingIndex()
+        index.add_batch(embeddings[:1200], list(range(1200)))
+        index.add_batch(embeddings[1200:], list(range(1200, 1300)))
+        assert index._use_ivf is True
+
+        matrix = index.reconstruct_all()
+        assert matrix.shape == (1300, 768)
+        np.testing.assert_allclose(matrix, embeddings, atol=1e-6)
+
+    @pytest.mark.unit
+    def test_reconstruct_all_after_load(self, tmp_path: Path):
+        """A loaded IVF index can still be reconstructed in one call."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import EmbeddingIndex
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+
+        embeddings = np.random.randn(1100, 768).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        index = EmbeddingIndex()
+        index.add_batch(embeddings, list(range(1100)))
+        index.save(tmp_path / "idx")
+
+        loaded = EmbeddingIndex.load(tmp_path / "idx")
+        np.testing.assert_allclose(loaded.reconstruct_all(), embeddings, atol=1e-6)
+
+
+class TestEmbeddingIndexCodecs:
+    """Tests for compressed storage codecs on EmbeddingIndex."""
+
+    @pytest.fixture
+    def clustered(self) -> np.ndarray:
+        """1300 clustered, L2-normalized embeddings."""
+        rng = np.random.default_rng(1)
+        centers = rng.standard_normal((30, 768)).astype(np.float32)
+        emb = centers[rng.integers(0, 30, 1300)] + 0.6 * rng.standard_normal(
+            (1300, 768)
+        ).astype(np.float32)
+        return emb / np.linalg.norm(emb, axis=1, keepdims=True)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("codec", ["float16", "sq8", "pq"])
+    def test_codec_search_and_memory(self, clustered, codec):
+        """Compressed indexes still find near neighbours with less memory."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex(codec=codec)
+        assert index.codec == codec
+        index.add_batch(clustered[:1200], list(range(1200)))
+
+        assert index.bytes_per_vector < 4 * 768
+        results = index.search(clustered[5], k=10, nprobe=64)
+        assert len(results) == 10
+        if codec != "pq":
+            assert results[0].id == 5
+
+    @pytest.mark.unit
+    def test_rerank_restores_exact_scores(self, clustered):
+        """Re-ranking returns exact float32 inner products for the top hits."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex(codec="pq", rerank_factor=8)
+        index.add_batch(clustered[:1200], list(range(1200)))
+        assert index.bytes_per_vector == 96 + 4 * 768
+
+        results = index.search(clustered[7], k=5, nprobe=64)
+        assert results[0].id == 7
+        assert results[0].score == pytest.approx(1.0, abs=1e-5)
+        for r in results:
+            exact = float(clustered[r.id] @ clustered[7])
+            assert r.score == pytest.approx(exact, abs=1e-5)
+
+    @pytest.mark.unit
+    def test_codec_save_load_roundtrip(self, clustered, tmp_path: Path):
+        """Codec, re-rank store and codes survive save/load."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex(codec="sq8", rerank_factor=4)
+        index.add_batch(clustered[:1200], list(range(1200)))
+        index.save(tmp_path / "sq8")
+
+        loaded = EmbeddingIndex.load(tmp_path / "sq8")
+        assert loaded.codec == "sq8"
+        assert loaded.bytes_per_vector == index.bytes_per_vector
+        before = [r.id for r in index.search(clustered[3], k=5, nprobe=64)]
+        after = [r.id for r in loaded.search(clustered[3], k=5, nprobe=64)]
+        assert before == after
+
+    @pytest.mark.unit
+    def test_invalid_codec_raises(self):
+        """Unknown codec or negative rerank_factor is rejected."""
+        from vl_jepa.index import EmbeddingIndex
+
+        with pytest.raises(ValueError, match="Unknown codec"):
+            EmbeddingIndex(codec="int4")
+        with pytest.raises(ValueError, match="rerank_factor"):
+            EmbeddingIndex(codec="sq8", rerank_factor=-1)
+
+    @pytest.mark.unit
+    def test_fallback_codec_trains_at_policy_threshold(self, clustered, monkeypatch):
+        """The numpy fallback trains its codec at the policy's threshold."""
+        import sys
+
+        from vl_jepa.index import BackendPolicy, EmbeddingIndex
+
+        monkeypatch.setitem(sys.modules, "faiss", None)  # force the fallback
+        policy = BackendPolicy(backend="ivf", transition_threshold=200)
+        index = EmbeddingIndex(codec="sq8", policy=policy)
+        assert index._index is None
+
+        index.add_batch(clustered[:199], list(range(199)))
+        assert not index._codec.is_trained
+        index.add_batch(clustered[199:201], [199, 200])
+        assert index._codec.is_trained
+        assert index._vectors.dtype == np.uint8
+        assert index.search(clustered[5], k=1)[0].id == 5
+
+
+class TestEmbeddingIndexBackendPolicy:
+    """Tests for BackendPolicy and the HNSW backend."""
+
+    @pytest.mark.unit
+    def test_policy_validation(self):
+        """Invalid policies are rejected."""
+        from vl_jepa.index import BackendPolicy, EmbeddingIndex
+
+        with pytest.raises(ValueError, match="backend"):
+            BackendPolicy(backend="lsh")
+        with pytest.raises(ValueError, match="training"):
+            BackendPolicy(backend="ivf", transition_threshold=0)
+        with pytest.raises(ValueError, match="HNSW"):
+            BackendPolicy(backend="hnsw", hnsw_m=0)
+        with pytest.raises(ValueError, match="hnsw"):
+            EmbeddingIndex(codec="pq", policy=BackendPolicy(backend="hnsw"))
+
+    @pytest.mark.unit
+    def test_hnsw_from_first_insert(self, sample_embedding_batch: np.ndarray):
+        """HNSW with threshold 0 serves inserts without any training step."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import BackendPolicy, EmbeddingIndex
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+
+        policy = BackendPolicy(backend="hnsw", transition_threshold=0, hnsw_m=16)
+        index = EmbeddingIndex(policy=policy)
+        assert index.backend == "hnsw"
+
+        index.add_batch(sample_embedding_batch, list(range(10)))
+        results = index.search(sample_embedding_batch[4], k=3)
+        assert results[0].id == 4
+        assert index._index.hnsw.efSearch == policy.hnsw_ef_search
+
+    @pytest.mark.unit
+    def test_hnsw_transition_and_persistence(self, tmp_path: Path):
+        """Flat index moves to HNSW at the policy threshold; save/load keep it."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import BackendPolicy, EmbeddingIndex
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+
+        embeddings = np.random.randn(300, 768).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        policy = BackendPolicy(
+            backend="hnsw", transition_threshold=200, hnsw_ef_search=128
+        )
+
+        index = EmbeddingIndex(policy=policy)
+        index.add_batch(embeddings[:150], list(range(150)))
+        assert index.backend == "flat"
+        index.add_batch(embeddings[150:], list(range(150, 300)))
+        assert index.backend == "hnsw"
+        assert index._use_ivf is False
+        np.testing.assert_allclose(index.reconstruct_all(), embeddings, atol=1e-6)
+
+        index.save(tmp_path / "hnsw")
+        loaded = EmbeddingIndex.load(tmp_path / "hnsw")
+        assert loaded.backend == "hnsw"
+        assert loaded.policy == policy
+        assert loaded._index.hnsw.efSearch == 128
+        assert loaded.search(embeddings[250], k=1)[0].id == 250
+
+    @pytest.mark.unit
+    def test_flat_policy_never_transitions(self):
+        """backend='flat' keeps exact search past IVF_THRESHOLD."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import BackendPolicy, EmbeddingIndex
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+
+        embeddings = np.random.randn(1100, 768).astype(np.float32)
+        index = EmbeddingIndex(policy=BackendPolicy(backend="flat"))
+        index.add_batch(embeddings, list(range(1100)))
+        assert index.backend == "flat"
+
+
+class TestEmbeddingIndexRemoveUpsert:
+    """Tests for remove(), upsert() and compaction."""
+
+    POLICIES = {
+        "flat": {"backend": "flat"},
+        "ivf": {"backend": "ivf", "transition_threshold": 200},
+        "hnsw": {"backend": "hnsw", "transition_threshold": 0},
+    }
+
+    @pytest.fixture
+    def embeddings(self) -> np.ndarray:
+        """400 normalized embeddings."""
+        emb = np.random.default_rng(3).standard_normal((400, 768)).astype(np.float32)
+        return emb / np.linalg.norm(emb, axis=1, keepdims=True)
+
+    def _make_index(self, backend: str, **kwargs):
+        from vl_jepa.index import BackendPolicy, EmbeddingIndex
+
+        return EmbeddingIndex(policy=BackendPolicy(**self.POLICIES[backend]), **kwargs)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("backend", ["flat", "ivf", "hnsw"])
+    def test_removed_ids_never_returned(self, embeddings, backend):
+        """Tombstoned ids are excluded and k live results are still returned."""
+        index = self._make_index(backend)
+        index.add_batch(embeddings, list(range(400)))
+
+        removed = list(range(0, 80, 2))
+        assert index.remove(removed + [9999]) == len(removed)
+        assert index.size == 360
+        assert 0 not in index and 1 in index
+
+        batch = index.search_batch(embeddings[:80], k=10, nprobe=64)
+        assert batch.ids.shape == (80, 10)
+        assert not np.isin(batch.ids, removed).any()
+        assert index.search(embeddings[1], k=1)[0].id == 1
+
+    @pytest.mark.unit
+    def test_upsert_replaces_embedding_and_metadata(self, embeddings):
+        """Upserting an existing id replaces its row; the id stays unique."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex()
+        index.add_batch(embeddings[:20], list(range(20)), [{"v": 1} for _ in range(20)])
+        index.upsert(embeddings[300], id=3, metadata={"v": 2})
+
+        assert index.size == 20
+        top = index.search(embeddings[300], k=1)[0]
+        assert top.id == 3
+        assert top.metadata == {"v": 2}
+
+        ids = [r.id for r in index.search(embeddings[3], k=20)]
+        assert sorted(ids) == list(range(20))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("backend", ["flat", "ivf", "hnsw"])
+    def test_compaction_drops_deleted_rows(self, embeddings, backend):
+        """Passing COMPACTION_RATIO compacts storage and renumbers rows."""
+        index = self._make_index(backend)
+        index.add_batch(embeddings, list(range(400)))
+        backend_before = index.backend
+
+        index.remove(list(range(150)))
+
+        assert index.backend == backend_before
+        assert index.rebuild_metrics["deleted_rows"] == 0
+        assert len(index._id_map) == index.size == 250
+        assert index.ids == list(range(150, 400))
+        np.testing.assert_allclose(index.reconstruct_all(), embeddings[150:], atol=1e-6)
+        assert index.search(embeddings[200], k=1, nprobe=64)[0].id == 200
+
+        index.add(embeddings[0], id=0)
+        assert index.search(embeddings[0], k=1, nprobe=64)[0].id == 0
+
+    @pytest.mark.unit
+    def test_tombstones_survive_save_load(self, embeddings, tmp_path: Path):
+        """Removed ids stay removed after a save/load roundtrip."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = self._make_index("ivf")
+        index.add_batch(embeddings, list(range(400)))
+        index.remove([5, 6, 7])
+        index.save(tmp_path / "removed")
+
+        loaded = EmbeddingIndex.load(tmp_path / "removed")
+        assert loaded.size == 397
+        assert 5 not in loaded
+        batch = loaded.search_batch(embeddings[5:8], k=5, nprobe=64)
+        assert not np.isin(batch.ids, [5, 6, 7]).any()
+
+    @pytest.mark.unit
+    def test_background_compaction(self, embeddings):
+        """Background mode compacts off the calling thread and keeps serving."""
+        from tests.conftest import HAS_FAISS
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+
+        index = self._make_index("ivf", background_rebuild=True)
+        index.add_batch(embeddings, list(range(400)))
+        assert index.wait_for_rebuild(timeout=30)
+
+        index.remove(list(range(120)))
+        index.add(embeddings[0], id=0)
+        assert index.wait_for_rebuild(timeout=30)
+
+        assert index.backend == "ivf"
+        assert index.rebuild_metrics["deleted_rows"] == 0
+        assert index.size == 281
+        assert index.search(embeddings[0], k=1, nprobe=64)[0].id == 0
+        batch = index.search_batch(embeddings[1:120], k=5, nprobe=64)
+        assert not np.isin(batch.ids, np.arange(1, 120)).any()
+
+
+class TestEmbeddingIndexMmapLoad:
+    """Tests for load(mmap=True) and the binary id/metadata sidecars."""
+
+    @pytest.fixture
+    def embeddings(self) -> np.ndarray:
+        """300 normalized embeddings."""
+        emb = np.random.default_rng(4).standard_normal((300, 768)).astype(np.float32)
+        return emb / np.linalg.norm(emb, axis=1, keepdims=True)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("backend", ["flat", "ivf", "hnsw"])
+    def test_mmap_load_serves_and_copies_on_write(
+        self, embeddings, backend, tmp_path: Path
+    ):
+        """Mapped indexes answer like loaded ones and stay writable."""
+        from vl_jepa.index import BackendPolicy, EmbeddingIndex
+
+        policy = BackendPolicy(backend=backend, transition_threshold=200)
+        index = EmbeddingIndex(policy=policy)
+        index.add_batch(embeddings[:250], list(range(250)))
+        index.save(tmp_path / "mm")
+        assert (tmp_path / "mm.ids.npy").exists()
+
+        mapped = EmbeddingIndex.load(tmp_path / "mm", mmap=True)
+        assert mapped.backend == index.backend
+        assert mapped._id_map == index._id_map
+        before = index.search_batch(embeddings[:20], k=5, nprobe=64)
+        after = mapped.search_batch(embeddings[:20], k=5, nprobe=64)
+        np.testing.assert_array_equal(after.ids, before.ids)
+
+        mapped.add_batch(embeddings[250:], list(range(250, 300)))
+        mapped.remove([0])
+        assert mapped.size == 299
+        assert mapped.search(embeddings[280], k=1, nprobe=64)[0].id == 280
+        assert 0 not in mapped
+
+        # Files on disk are untouched by writes to the mapped index
+        assert EmbeddingIndex.load(tmp_path / "mm").size == 250
+
+    @pytest.mark.unit
+    def test_metadata_sidecar_decodes_hits_only(self, embeddings, tmp_path: Path):
+        """Metadata reloads from .meta.npz; search decodes returned rows only."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex()
+        metadata = [{"timestamp": float(i), "text": f"seg {i}"} for i in range(50)]
+        index.add_batch(embeddings[:50], list(range(50)), metadata)
+        index.save(tmp_path / "meta")
+        assert (tmp_path / "meta.meta.npz").exists()
+
+        loaded = EmbeddingIndex.load(tmp_path / "meta")
+        results = loaded.search(embeddings[12], k=3)
+        assert results[0].metadata == {"timestamp": 12.0, "text": "seg 12"}
+        assert set(loaded._metadata._decoded) == {r.id for r in results}
+        assert len(loaded._metadata) == 50
+
+    @pytest.mark.unit
+    def test_legacy_json_sidecar_loads(self, embeddings, tmp_path: Path):
+        """Sidecars with id map and metadata inline (no .npy/.npz) still load."""
+        import json
+
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex()
+        index.add_batch(
+            embeddings[:10], list(range(100, 110)), [{"t": i} for i in range(10)]
+        )
+        index.save(tmp_path / "legacy")
+
+        ids_path = tmp_path / "legacy.ids.npy"
+        json_path = tmp_path / "legacy.json"
+        mappings = json.loads(json_path.read_text())
+        mappings["id_map"] = np.load(ids_path).tolist()
+        mappings["metadata"] = {str(100 + i): {"t": i} for i in range(10)}
+        json_path.write_text(json.dumps(mappings))
+        ids_path.unlink()
+        (tmp_path / "legacy.meta.npz").unlink()
+
+        loaded = EmbeddingIndex.load(tmp_path / "legacy", mmap=True)
+        assert loaded._id_map == list(range(100, 110))
+        top = loaded.search(embeddings[3], k=1)[0]
+        assert top.id == 103
+        assert top.metadata == {"t": 3}
+
+
+class TestEmbeddingIndexFilteredSearch:
+    """Tests for id-restricted search (search(..., ids=...))."""
+
+    @pytest.fixture
+    def embeddings(self) -> np.ndarray:
+        """400 normalized embeddings."""
+        emb = np.random.default_rng(5).standard_normal((400, 768)).astype(np.float32)
+        return emb / np.linalg.norm(emb, axis=1, keepdims=True)
+
+    def _make_index(self, backend: str, **kwargs):
+        from vl_jepa.index import BackendPolicy, EmbeddingIndex
+
+        policy = TestEmbeddingIndexRemoveUpsert.POLICIES[backend]
+        return EmbeddingIndex(policy=BackendPolicy(**policy), **kwargs)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("exact_rows", [4096, 0])
+    @pytest.mark.parametrize("backend", ["flat", "ivf", "hnsw"])
+    def test_results_restricted_to_ids(self, embeddings, backend, exact_rows):
+        """Only live ids from the subset come back, min(k, matching) of them."""
+        index = self._make_index(backend)
+        index.EXACT_SUBSET_ROWS = exact_rows  # 0 forces the FAISS selector
+        index.add_batch(embeddings, list(range(400)))
+        index.remove([0, 7])
+
+        subset = list(range(0, 400, 7)) + [9999]  # 57 ids, one removed
+        batch = index.search_batch(embeddings[:20], k=10, nprobe=64, ids=subset)
+        assert batch.ids.shape == (20, 10)
+        assert np.isin(batch.ids, subset).all()
+        assert not np.isin(batch.ids, [0, 7]).any()
+        assert index.search(embeddings[14], k=1, ids=subset)[0].id == 14
+
+        few = index.search(embeddings[0], k=10, ids=[3, 7, 5, 3])
+        assert sorted(r.id for r in few) == [3, 5]
+        assert index.search(embeddings[0], k=10, ids=[]) == []
+
+    @pytest.mark.unit
+    def test_ivf_scores_match_unfiltered(self, tmp_path):
+        """Filtered and unfiltered IVF searches score an id the same way."""
+        from tests.conftest import HAS_FAISS
+        from vl_jepa.index import EmbeddingIndex
+
+        if not HAS_FAISS:
+            pytest.skip("Test requires FAISS")
+        import faiss
+
+        emb = np.random.default_rng(6).standard_normal((2000, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        index = EmbeddingIndex(dimension=768)
+        index.add_batch(emb, list(range(2000)))
+        assert index._use_ivf is True
+        nlist = index._index.nlist
+
+        unfiltered = index.search(emb[5], k=1, nprobe=nlist)[0]
+        exact = index.search(emb[5], k=1, ids=range(1, 2000, 2))[0]
+        index.EXACT_SUBSET_ROWS = 0  # FAISS selector path
+        selected = index.search(emb[5], k=1, nprobe=nlist, ids=range(1, 2000, 2))[0]
+
+        assert unfiltered.id == exact.id == selected.id == 5
+        assert unfiltered.score == pytest.approx(1.0, abs=1e-4)
+        assert exact.score == pytest.approx(unfiltered.score, abs=1e-4)
+        assert selected.score == pytest.approx(unfiltered.score, abs=1e-4)
+
+        # Indexes saved with the former L2 float32 IVF are retrained on load
+        quantizer = faiss.IndexFlatL2(768)
+        legacy = faiss.IndexIVFFlat(quantizer, 768, nlist)
+        legacy.train(emb)
+        legacy.add(emb)
+        index._index = legacy
+        index.save(tmp_path / "legacy.index")
+        loaded = EmbeddingIndex.load(tmp_path / "legacy.index")
+        assert loaded._index.metric_type == faiss.METRIC_INNER_PRODUCT
+        result = loaded.search(emb[5], k=1, nprobe=nlist)[0]
+        assert result.id == 5 and result.score == pytest.approx(1.0, abs=1e-4)
+
+    @pytest.mark.unit
+    def test_matches_exact_search_over_subset(self, embeddings):
+        """Filtered results equal a brute-force ranking of the subset."""
+        from vl_jepa.index import EmbeddingIndex
+
+        index = EmbeddingIndex(codec="sq8", rerank_factor=4)
+        index.add_batch(embeddings, list(range(400)))
+
+        subset = np.arange(1, 400, 3)
+        query = embeddings[100] + embeddings[200]
+        expected = subset[np.argsort(-(embeddings[subset] @ query))[:5]]
+
+        results = index.search(query, k=5, ids=subset)
+        assert [r.id for r in results] == expected.tolist()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("backend", ["flat", "ivf", "hnsw"])
+    def test_reconstruct_and_get_metadata(self, embeddings, backend):
+        """Stored vectors and metadata come back by id; unknown ids raise."""
+        index = self._make_index(backend)
+        index.add_batch(embeddings, list(range(400)), [{"n": i} for i in range(400)])
+        index.remove([7])
+
+        rows = index.reconstruct([12, 3, 399])
+        assert rows.shape == (3, 768) and rows.dtype == np.float32
+        np.testing.assert_allclose(rows, embeddings[[12, 3, 399]], atol=1e-5)
+        assert index.reconstruct([]).shape == (0, 768)
+        with pytest.raises(KeyError):
+            index.reconstruct([3, 7])
+
+        assert index.get_metadata(12) == {"n": 12}
+        assert index.get_metadata(9999) is None
@@ -85,6 +85,16 @@ class TestVisualEncoderProtocol:
 
         np.testing.assert_array_equal(emb1, emb2)
 
+    def test_cache_namespace_follows_projection(self) -> None:
+        """Frame cache namespace is shared by seed, distinct across seeds."""
+        enc1 = PlaceholderVisualEncoder(seed=42)
+        enc2 = PlaceholderVisualEncoder(seed=42)
+        enc3 = PlaceholderVisualEncoder(seed=7)
+
+        assert enc1.cache_namespace.startswith("placeholder-visual:")
+        assert enc1.cache_namespace == enc2.cache_namespace
+        assert enc1.cache_namespace != enc3.cache_namespace
+
 
 class TestTextEncoderProtocol:
     """Tests for TextEncoderProtocol compliance."""
@@ -115,6 +125,18 @@ class TestTextEncoderProtocol:
 
         assert embeddings.shape == (3, VISUAL_EMBEDDING_DIM)
 
+    def test_encode_batch_matches_encode(self) -> None:
+        """encode_batch() rows equal encode() of each text."""
+        encoder = PlaceholderTextEncoder()
+        texts = ["Hello", "World", "Test"]
+
+        embeddings = encoder.encode_batch(texts)
+
+        np.testing.assert_allclose(
+            embeddings, np.stack([encoder.encode(t) for t in texts]), rtol=1e-6
+        )
+        assert encoder.encode_batch([]).shape == (0, VISUAL_EMBEDDING_DIM)
+
     def test_embeddings_are_l2_normalized(self) -> None:
         """INV010: Embeddings are L2-normalized."""
         encoder = PlaceholderTextEncoder()
@@ -0,0 +1,130 @@
+"""
+SPEC: Multimodal Index (entry store)
+TEST_IDs: T011.ES1-T011.ES4
+"""
+
+import numpy as np
+import pytest
+
+from vl_jepa.entry_store import NONE_INT, EntryStore
+
+
+class TestEntryStore:
+    """Tests for the columnar MultimodalIndex entry store."""
+
+    @pytest.mark.unit
+    def test_columns_and_optional_values(self):
+        """
+        TEST_ID: T011.ES1
+        Given: Visual and transcript batches with missing optional fields
+        When: Appended to the store
+        Then: Columns, texts and None values read back per slot
+        """
+        store = EntryStore()
+        store.append([0, 1], modality=0, timestamps=[0.0, 0.5], frame_indices=[3, 4])
+        store.append(
+            [5, 9],
+            modality=1,
+            timestamps=[1.0, 3.0],
+            segment_ids=[None, 7],
+            starts=[0.5, 2.0],
+            ends=[1.5, 4.0],
+            texts=["énergie — 能量", None],
+        )
+
+        assert len(store) == 4
+        assert store.ids.tolist() == [0, 1, 5, 9]
+        assert store.column("modality").tolist() == [0, 0, 1, 1]
+        assert store.optional_int("frame_index", 1) == 4
+        assert store.optional_int("frame_index", 2) is None
+        assert store.optional_int("segment_id", 2) is None
+        assert store.optional_int("segment_id", 3) == 7
+        assert [store.text(slot) for slot in range(4)] == [
+            None,
+            None,
+            "énergie — 能量",
+            None,
+        ]
+        assert store.column("end")[3] == 4.0
+        assert np.isnan(store.column("start")[0])
+        assert store.column("segment_id")[0] == NONE_INT
+
+    @pytest.mark.unit
+    def test_slots_and_growth(self):
+        """
+        TEST_ID: T011.ES2
+        Given: A store grown well past its initial capacity
+        When: Ids are looked up
+        Then: Stored ids map to their slot, unknown ids to -1
+        """
+        store = EntryStore()
+        for start in range(0, 1000, 100):
+            ids = np.arange(start, start + 100) * 2
+            store.append(ids, modality=1, timestamps=ids * 0.5, texts=["t"] * 100)
+
+        assert len(store) == 1000
+        assert store.slots([0, 2, 1998, 3, -4, 5000]).tolist() == [
+            0,
+            1,
+            999,
+            -1,
+            -1,
+            -1,
+        ]
+        assert store.text(999) == "t"
+        assert store.nbytes < 1000 * 100
+
+    @pytest.mark.unit
+    def test_ids_must_ascend(self):
+        """
+        TEST_ID: T011.ES3
+        Given: A store holding ids up to 5
+        When: Ids that do not ascend past 5 are appended
+        Then: ValueError is raised and the store is unchanged
+        """
+        store = EntryStore()
+        store.append([4, 5], modality=0, timestamps=[0.0, 1.0])
+
+        with pytest.raises(ValueError, match="ascending"):
+            store.append([5, 6], modality=0, timestamps=[0.0, 1.0])
+        with pytest.raises(ValueError, match="ascending"):
+            store.append([8, 7], modality=0, timestamps=[0.0, 1.0])
+        assert store.ids.tolist() == [4, 5]
+
+    @pytest.mark.unit
+    def test_columns_roundtrip_and_take(self):
+        """
+        TEST_ID: T011.ES4
+        Given: A store with visual and transcript entries
+        When: Rebuilt from its columns, and a subset of slots is taken
+        Then: Both stores hold the same values as the source slots
+        """
+        store = EntryStore()
+        store.append([0, 1], modality=0, timestamps=[0.0, 0.5], frame_indices=[3, 4])
+        store.append(
+            [2, 3, 4],
+            modality=1,
+            timestamps=[1.0, 2.0, 3.0],
+            texts=["un", None, "trois — 3"],
+        )
+
+        copy = EntryStore.from_columns(store.columns(), store.text_bytes)
+        subset = store.take(np.array([1, 4]))
+
+        assert copy.ids.tolist() == [0, 1, 2, 3, 4]
+        assert [copy.text(slot) for slot in range(5)] == [
+            None,
+            None,
+            "un",
+            None,
+            "trois — 3",
+        ]
+        assert subset.ids.tolist() == [1, 4]
+        assert subset.optional_int("frame_index", 0) == 4
+        assert [subset.text(0), subset.text(1)] == [None, "trois — 3"]
+        subset.append([5], modality=1, timestamps=[4.0], texts=["cinq"])
+        assert subset.text(2) == "cinq"
+        with pytest.raises(ValueError, match="text_offsets"):
+            EntryStore.from_columns(
+                {**store.columns(), "text_offsets": np.zeros(2)}, b""
+            )
@@ -0,0 +1,154 @@
+"""
+SPEC: S004 - Visual Encoding (frame embedding cache)
+TEST_IDs: T004.F1-T004.F4
+"""
+
+import numpy as np
+import pytest
+
+from vl_jepa.frame_cache import (
+    CachedVisualEncoder,
+    FrameEmbeddingCache,
+    frame_fingerprints,
+    hamming_distances,
+)
+
+
+class _CountingEncoder:
+    """Deterministic stand-in for a visual encoder: counts frames."""
+
+    def __init__(self) -> None:
+        self.encoded = 0
+
+    def encode(self, frames: np.ndarray) -> np.ndarray:
+        self.encoded += len(frames)
+        if len(frames) == 0:
+            return np.empty((0, 768), dtype=np.float32)
+        flat = frames.reshape(len(frames), -1)
+        embeddings = np.stack([flat[:, i::768].mean(axis=1) for i in range(768)], 1)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return (embeddings / norms).astype(np.float32)
+
+
+def _slides(n: int, seed: int = 0) -> np.ndarray:
+    """n distinct slide-like frames (B, 3, 224, 224) of 32x32 blocks."""
+    rng = np.random.default_rng(seed)
+    blocks = rng.uniform(-1, 1, (n, 3, 7, 7)).astype(np.float32)
+    return blocks.repeat(32, axis=2).repeat(32, axis=3)
+
+
+class TestFrameEmbeddingCache:
+    """Tests for the content-fingerprinted frame embedding cache."""
+
+    @pytest.mark.unit
+    def test_exact_duplicates_reuse_embeddings(self):
+        """
+        TEST_ID: T004.F1
+        Given: A batch of three slides with repeats, then the batch again
+        When: It is encoded through the cache
+        Then: Each distinct frame is encoded once, results equal the plain
+              encoder, and hits and misses are counted
+        """
+        slides = _slides(3)
+        frames = slides[[0, 0, 1, 0, 2, 2]]
+        encoder = _CountingEncoder()
+        cache = FrameEmbeddingCache()
+
+        first = cache.encode(frames, encoder.encode)
+        second = cache.encode(frames, encoder.encode)
+
+        assert encoder.encoded == 3
+        np.testing.assert_array_equal(first, _CountingEncoder().encode(frames))
+        np.testing.assert_array_equal(second, first)
+        stats = cache.stats
+        assert (stats.hits, stats.near_hits, stats.misses) == (9, 0, 3)
+        assert stats.hit_rate == pytest.approx(0.75)
+        assert stats.saved_seconds == pytest.approx(3 * stats.encode_seconds)
+
+    @pytest.mark.unit
+    def test_near_duplicate_threshold(self):
+        """
+        TEST_ID: T004.F2
+        Given: A slide and a copy with slight pixel noise
+        When: Both are encoded with and without a near-duplicate threshold
+        Then: The noisy copy reuses the slide's embedding only with the
+              threshold, within a batch or across calls; another slide
+              never does
+        """
+        slide = _slides(1)
+        rng = np.random.default_rng(1)
+        noisy = slide + rng.normal(0, 0.01, slide.shape).astype(np.float32)
+        other = _slides(1, seed=2)
+        _, hashes = frame_fingerprints(np.concatenate([slide, noisy, other]))
+        assert hamming_distances(hashes[1:2], hashes[0])[0] <= 4
+        assert hamming_distances(hashes[2:3], hashes[0])[0] > 64
+
+        exact = FrameEmbeddingCache()
+        encoder = _CountingEncoder()
+        exact.encode(np.concatenate([slide, noisy]), encoder.encode)
+        assert encoder.encoded == 2
+
+        near = FrameEmbeddingCache(max_distance=8)
+        encoder = _CountingEncoder()
+        batch = near.encode(np.concatenate([slide, noisy]), encoder.encode)
+        later = near.encode(np.concatenate([noisy + 0.001, other]), encoder.encode)
+
+        assert encoder.encoded == 2  # the slide, then the other slide
+        np.testing.assert_array_equal(batch[1], batch[0])
+        np.testing.assert_array_equal(later[0], batch[0])
+        assert near.stats.near_hits == 2 and len(near) == 2
+        with pytest.raises(ValueError, match="max_distance"):
+            FrameEmbeddingCache(max_distance=-1)
+
+    @pytest.mark.unit
+    def test_persists_across_runs(self, tmp_path):
+        """
+        TEST_ID: T004.F3
+        Given: Frames cached in a SQLite file by one cache
+        When: A new cache opens the file, with the same or another namespace
+        Then: The same namespace serves exact and near duplicates without
+              encoding; another namespace encodes them; clear() empties it
+        """
+        path = tmp_path / "cache" / "frames.db"
+        slides = _slides(4)
+        FrameEmbeddingCache(path, namespace="enc").encode(
+            slides, _CountingEncoder().encode
+        )
+
+        encoder = _CountingEncoder()
+        cache = FrameEmbeddingCache(path, namespace="enc", max_distance=8, capacity=2)
+        cache.encode(slides, encoder.encode)
+        cache.encode(slides[:1] + 0.001, encoder.encode)
+        assert encoder.encoded == 0
+        assert cache.stats.disk_hits == 2 and cache.stats.near_hits == 1
+        assert len(cache) == 2
+
+        other = FrameEmbeddingCache(path, namespace="other")
+        other.encode(slides, encoder.encode)
+        assert encoder.encoded == 4
+
+        cache.clear()
+        cache.close()
+        FrameEmbeddingCache(path, namespace="enc").encode(slides, encoder.encode)
+        assert encoder.encoded == 8
+
+    @pytest.mark.unit
+    def test_cached_visual_encoder(self):
+        """
+        TEST_ID: T004.F4
+        Given: An encoder wrapped by CachedVisualEncoder with capacity 2
+        When: Frames are encoded one at a time
+        Then: encode_single matches the encoder, repeats are not
+              re-encoded, and the least recently used frame is evicted
+        """
+        slides = _slides(3)
+        inner = _CountingEncoder()
+        encoder = CachedVisualEncoder(inner, FrameEmbeddingCache(capacity=2))
+
+        embeddings = [encoder.encode_single(slides[i]) for i in [0, 1, 0, 2, 1, 0]]
+
+        expected = _CountingEncoder().encode(slides[:1])[0]
+        np.testing.assert_array_equal(embeddings[0], expected)
+        assert inner.encoded == 5  # 0, 1, 2; then 1 and 0 after eviction
+        assert encoder.encoder is inner and len(encoder.cache) == 2
+        assert encoder.encode(slides[:0]).shape == (0, 768)
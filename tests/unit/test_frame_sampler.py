@@ -1,12 +1,13 @@
 """
 SPEC: S003 - Frame Sampling and Normalization
-TEST_IDs: T003.1-T003.5
+TEST_IDs: T003.1-T003.5, T003.G1-T003.G2
 """
 
+import cv2
 import numpy as np
 import pytest
 
-from vl_jepa.frame import FrameSampler
+from vl_jepa.frame import FrameChangeGate, FrameSampler
 
 
 class TestFrameSampler:
@@ -116,3 +117,75 @@ class TestFrameSampler:
 
         # Assert
         assert output.shape == (224, 224, 3)
+
+
+def _slide(bullets: int, title: str = "Gradient descent") -> np.ndarray:
+    """A 720p slide: white background, a title and some bullet lines."""
+    slide = np.full((720, 1280, 3), 255, dtype=np.uint8)
+    cv2.putText(slide, title, (80, 120), cv2.FONT_HERSHEY_SIMPLEX, 2.0, (0, 0, 0), 4)
+    for i in range(bullets):
+        cv2.putText(
+            slide,
+            f"- step {i}: update the weights",
+            (100, 240 + 90 * i),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            1.4,
+            (0, 0, 0),
+            3,
+        )
+    return slide
+
+
+class TestFrameChangeGate:
+    """Tests for the static-slide change gate (S003)."""
+
+    @pytest.mark.unit
+    def test_skips_unchanged_slides(self) -> None:
+        """
+        SPEC: S003
+        TEST_ID: T003.G1
+        Given: A slide, noisy copies of it, a new bullet and a new slide
+        When: Each frame goes through the gate
+        Then: The first frame, the new bullet and the new slide pass;
+              noisy copies are skipped and counted
+        """
+        rng = np.random.default_rng(0)
+        slide = _slide(2)
+
+        def noisy(frame: np.ndarray) -> np.ndarray:
+            noise = rng.integers(-6, 7, frame.shape)
+            return np.clip(frame.astype(int) + noise, 0, 255).astype(np.uint8)
+
+        frames = [slide, noisy(slide), noisy(slide), _slide(3), noisy(_slide(3))]
+        frames.append(_slide(1, title="Momentum"))
+        gate = FrameChangeGate()
+
+        passed = [gate.changed(frame) for frame in frames]
+
+        assert passed == [True, False, False, True, False, True]
+        assert (gate.frames, gate.skipped) == (6, 3)
+        assert gate.skip_ratio == pytest.approx(0.5)
+
+    @pytest.mark.unit
+    def test_compares_against_last_kept_frame(self) -> None:
+        """
+        SPEC: S003
+        TEST_ID: T003.G2
+        Given: A frame that fades a little at every sample
+        When: Each step is below the threshold but the total is not
+        Then: The gate passes a frame once the drift since the last kept
+              frame is large enough; reset() forgets the reference
+        """
+        gate = FrameChangeGate(pixel_threshold=0.04)
+        levels = [100, 104, 108, 112, 116]
+        frames = [np.full((90, 160, 3), v, dtype=np.uint8) for v in levels]
+
+        passed = [gate.changed(frame) for frame in frames]
+
+        assert passed == [True, False, False, True, False]
+        gate.reset()
+        assert gate.frames == 0 and gate.changed(frames[-1])
+        with pytest.raises(ValueError, match="pixel_threshold"):
+            FrameChangeGate(pixel_threshold=1.5)
+        with pytest.raises(ValueError, match="min_changed"):
+            FrameChangeGate(min_changed=-0.1)
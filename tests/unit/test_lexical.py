@@ -0,0 +1,114 @@
+"""
+SPEC: Multimodal Index (lexical search)
+TEST_IDs: T011.L1-T011.L4
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from vl_jepa.lexical import BM25Index, tokenize
+
+TEXTS = [
+    "The Fourier transform of a Gaussian is a Gaussian",
+    "Gradient descent minimizes the loss",
+    "RLHF fine-tunes the policy; the reward model scores outputs",
+    "Stochastic gradient descent: gradient steps on mini-batches",
+]
+
+
+def _reference_bm25(texts: list[str], query: str, k1=1.5, b=0.75) -> np.ndarray:
+    """Textbook BM25 score of every document."""
+    docs = [tokenize(text) for text in texts]
+    mean_length = sum(len(doc) for doc in docs) / len(docs)
+    scores = np.zeros(len(docs))
+    for term in set(tokenize(query)):
+        df = sum(term in doc for doc in docs)
+        idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+        for i, doc in enumerate(docs):
+            tf = doc.count(term)
+            scores[i] += (
+                idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(doc) / mean_length))
+            )
+    return scores
+
+
+class TestBM25Index:
+    """Tests for the BM25 inverted index."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "query", ["gradient descent", "GAUSSIAN", "rlhf reward", "the loss"]
+    )
+    def test_scores_match_reference(self, query: str):
+        """
+        TEST_ID: T011.L1
+        Given: Four indexed documents
+        When: A query is searched
+        Then: Ids and scores equal a brute-force BM25 ranking
+        """
+        index = BM25Index()
+        index.add([10, 11, 12, 13], TEXTS)
+
+        ids, scores = index.search(query, k=10)
+
+        expected = _reference_bm25(TEXTS, query)
+        matching = np.flatnonzero(expected > 0)
+        order = matching[np.lexsort((matching, -expected[matching]))]
+        assert ids.tolist() == (order + 10).tolist()
+        np.testing.assert_allclose(scores, expected[order])
+
+    @pytest.mark.unit
+    def test_incremental_adds_equal_one_batch(self):
+        """
+        TEST_ID: T011.L2
+        Given: The same documents added in one batch or one at a time
+        When: Searched
+        Then: Both indexes return identical results
+        """
+        batch = BM25Index()
+        batch.add(range(100), TEXTS * 25)
+        incremental = BM25Index()
+        for i, text in enumerate(TEXTS * 25):
+            incremental.add([i], [text])
+
+        assert len(incremental) == 100
+        assert incremental.vocabulary_size == batch.vocabulary_size
+        for query in ("gradient", "fourier gaussian", "policy"):
+            expected_ids, expected_scores = batch.search(query, 7)
+            ids, scores = incremental.search(query, 7)
+            np.testing.assert_array_equal(ids, expected_ids)
+            np.testing.assert_array_equal(scores, expected_scores)
+
+    @pytest.mark.unit
+    def test_whole_words_only(self):
+        """
+        TEST_ID: T011.L3
+        Given: Indexed documents
+        When: Queries are substrings, unknown words, empty or k=0
+        Then: Nothing is returned; None texts are indexed as empty
+        """
+        index = BM25Index()
+        index.add([1, 2], [TEXTS[0], None])
+
+        for query, k in (("fourie", 5), ("laplace", 5), ("", 5), ("fourier", 0)):
+            ids, scores = index.search(query, k=k)
+            assert ids.size == 0 and scores.size == 0
+        assert index.search("fourier", k=5)[0].tolist() == [1]
+        assert BM25Index().search("fourier")[0].size == 0
+
+    @pytest.mark.unit
+    def test_invalid_arguments_raise(self):
+        """
+        TEST_ID: T011.L4
+        Given: Out-of-range parameters or mismatched inputs
+        When: The index is created or added to
+        Then: ValueError is raised
+        """
+        with pytest.raises(ValueError, match="k1"):
+            BM25Index(k1=-1.0)
+        with pytest.raises(ValueError, match="b must be"):
+            BM25Index(b=1.5)
+        with pytest.raises(ValueError, match="same length"):
+            BM25Index().add([1, 2], ["one"])
@@ -0,0 +1,141 @@
+"""
+SPEC: S007 - Embedding Index (metadata sidecar)
+TEST_IDs: T007.M1-T007.M5
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vl_jepa.metadata_store import MetadataStore
+
+
+@pytest.fixture
+def rows() -> dict[int, dict]:
+    """Metadata rows covering every column kind and missing keys."""
+    return {
+        7: {"modality": "visual", "timestamp": 1.5, "frame_index": 3},
+        2: {
+            "modality": "transcript",
+            "timestamp": 0.25,
+            "text": "énergie — 能量",
+            "start_time": 0.0,
+            "end_time": 0.5,
+        },
+        40: {"modality": "visual", "timestamp": 9.0, "frame_index": None},
+        11: {"flag": True, "tags": ["a", "b"], "nested": {"k": 1}, "big": 2**70},
+    }
+
+
+class TestMetadataStore:
+    """Tests for the columnar metadata store."""
+
+    @pytest.mark.unit
+    def test_roundtrip_preserves_values_and_types(self, rows, tmp_path: Path):
+        """
+        TEST_ID: T007.M1
+        Given: Rows with str, float, int, bool, None, nested and missing values
+        When: Saved and loaded
+        Then: Every row compares equal, with the same Python types
+        """
+        MetadataStore(rows).save(tmp_path / "m.meta.npz")
+        loaded = MetadataStore.load(tmp_path / "m.meta.npz")
+
+        assert len(loaded) == len(rows)
+        assert sorted(loaded) == sorted(rows)
+        for id_, row in rows.items():
+            assert loaded[id_] == row
+            for key, value in row.items():
+                assert type(loaded[id_][key]) is type(value)
+
+    @pytest.mark.unit
+    def test_rows_decoded_lazily(self, rows, tmp_path: Path):
+        """
+        TEST_ID: T007.M2
+        Given: A loaded store
+        When: One row is read
+        Then: Only that row is decoded; unknown ids are absent
+        """
+        MetadataStore(rows).save(tmp_path / "m.meta.npz")
+        loaded = MetadataStore.load(tmp_path / "m.meta.npz")
+        assert loaded._decoded == {}
+
+        assert loaded.get(40) == rows[40]
+        assert list(loaded._decoded) == [40]
+        assert loaded.get(3) is None
+        assert 3 not in loaded
+        assert np.int64(7) in loaded
+
+    @pytest.mark.unit
+    def test_mutations_after_load(self, rows, tmp_path: Path):
+        """
+        TEST_ID: T007.M3
+        Given: A loaded store
+        When: Rows are added, replaced and deleted, then saved again
+        Then: The mapping and the re-saved file reflect the changes
+        """
+        MetadataStore(rows).save(tmp_path / "m.meta.npz")
+        loaded = MetadataStore.load(tmp_path / "m.meta.npz")
+
+        loaded[99] = {"timestamp": 4.0}
+        loaded[7] = {"modality": "visual", "timestamp": 2.0}
+        del loaded[2]
+        loaded.pop(11)
+        with pytest.raises(KeyError):
+            del loaded[2]
+
+        expected = {99: {"timestamp": 4.0}, 7: loaded[7], 40: rows[40]}
+        assert dict(loaded.items()) == expected
+        assert len(loaded) == 3
+
+        loaded.save(tmp_path / "m2.meta.npz")
+        assert dict(MetadataStore.load(tmp_path / "m2.meta.npz").items()) == expected
+
+    @pytest.mark.unit
+    def test_unknown_version_raises(self, tmp_path: Path):
+        """
+        TEST_ID: T007.M4
+        Given: A metadata file with a newer format version
+        When: Loaded
+        Then: ValueError is raised
+        """
+        header = np.frombuffer(b'{"version": 99, "columns": []}', np.uint8)
+        path = tmp_path / "m.meta.npz"
+        with open(path, "wb") as f:
+            np.savez(f, ids=np.empty(0, np.int64), header=header)
+
+        with pytest.raises(ValueError, match="format"):
+            MetadataStore.load(path)
+
+    @pytest.mark.unit
+    def test_reads_do_not_rebuild_arrays(self, rows, tmp_path: Path, monkeypatch):
+        """
+        TEST_ID: T007.M5
+        Given: A loaded store whose rows have been read
+        When: It is saved, then saved again after editing a read row in place
+        Then: The first save writes the loaded arrays as-is; the second
+              re-encodes the columns and keeps the edit
+        """
+        from vl_jepa import metadata_store
+
+        MetadataStore(rows).save(tmp_path / "m.meta.npz")
+        loaded = MetadataStore.load(tmp_path / "m.meta.npz")
+        assert loaded[7] == rows[7] and loaded.get(2) == rows[2]
+
+        encode = metadata_store._encode_columns
+        calls: list[int] = []
+
+        def counting_encode(rows):
+            calls.append(len(rows))
+            return encode(rows)
+
+        monkeypatch.setattr(metadata_store, "_encode_columns", counting_encode)
+        loaded.save(tmp_path / "m2.meta.npz")
+        assert calls == []
+        assert dict(MetadataStore.load(tmp_path / "m2.meta.npz").items()) == rows
+
+        loaded[7]["timestamp"] = 3.0
+        loaded.save(tmp_path / "m3.meta.npz")
+        assert calls == [len(rows)]
+        assert MetadataStore.load(tmp_path / "m3.meta.npz")[7]["timestamp"] == 3.0
@@ -0,0 +1,200 @@
+"""
+SPEC: S014 - REST API Interface (shared model registry)
+TEST_IDs: T014.R1-T014.R5
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from vl_jepa.model_registry import (
+    PLACEHOLDER_TEXT_ENCODER,
+    ModelRegistry,
+    default_registry,
+    model_nbytes,
+)
+
+
+class _Clock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Factory:
+    """Model factory counting the instances it creates."""
+
+    def __init__(self, nbytes: int = 64, delay: float = 0.0) -> None:
+        self.created = 0
+        self._nbytes = nbytes
+        self._delay = delay
+
+    def __call__(self) -> object:
+        time.sleep(self._delay)
+        self.created += 1
+        model = type("Model", (), {})()
+        model.weights = np.zeros(self._nbytes, dtype=np.uint8)
+        return model
+
+
+class TestModelRegistry:
+    """Tests for the lazily loading, reference counting model registry."""
+
+    @pytest.mark.unit
+    def test_lazy_shared_singleton(self):
+        """
+        TEST_ID: T014.R1
+        Given: A registered model that is slow to load
+        When: Eight threads acquire it at once, then it is acquired again
+        Then: It is loaded once on first use and every caller shares it;
+              unknown or duplicate names raise ValueError
+        """
+        factory = _Factory(delay=0.05)
+        registry = ModelRegistry()
+        registry.register("encoder", factory)
+        assert "encoder" in registry and not registry.is_loaded("encoder")
+
+        models: list[object] = []
+
+        def use() -> None:
+            with registry.acquire("encoder") as model:
+                models.append(model)
+
+        threads = [threading.Thread(target=use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert factory.created == 1
+        assert all(model is models[0] for model in models)
+        assert registry.get("encoder") is models[0]
+        stats = registry.stats
+        assert (stats.loads, stats.hits, stats.resident) == (1, 8, 1)
+        assert stats.resident_bytes == 64 and stats.load_seconds >= 0.05
+
+        with pytest.raises(ValueError, match="unknown"):
+            registry.get("decoder")
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register("encoder", factory)
+
+    @pytest.mark.unit
+    def test_idle_timeout_respects_holders(self):
+        """
+        TEST_ID: T014.R2
+        Given: A registry with a 60 s idle timeout and a manual clock
+        When: Time passes while the model is held, then after release
+        Then: A held model is never unloaded, an idle one is unloaded after
+              the timeout and reloaded on the next use; a failing load
+              leaves nothing held
+        """
+        clock = _Clock()
+        factory = _Factory()
+        registry = ModelRegistry(idle_timeout=60, clock=clock)
+        registry.register("encoder", factory)
+
+        with registry.acquire("encoder"):
+            clock.now = 120.0
+            assert registry.evict_idle() == []
+            assert not registry.unload("encoder")
+        clock.now = 150.0
+        assert registry.evict_idle() == []
+        clock.now = 180.0
+        assert registry.evict_idle() == ["encoder"]
+        assert not registry.is_loaded("encoder")
+
+        registry.get("encoder")
+        assert factory.created == 2 and registry.stats.evictions == 1
+
+        def fail() -> object:
+            raise RuntimeError("no weights")
+
+        registry.register("broken", fail)
+        with pytest.raises(RuntimeError):
+            registry.get("broken")
+        clock.now = 1000.0
+        assert registry.evict_idle() == ["encoder"]
+        registry.close()
+        with pytest.raises(ValueError, match="idle_timeout"):
+            ModelRegistry(idle_timeout=0)
+
+    @pytest.mark.unit
+    def test_memory_budget_evicts_idle_lru(self):
+        """
+        TEST_ID: T014.R3
+        Given: A 100-byte budget and three 40-byte models
+        When: They are loaded in turn, one of them held
+        Then: The least recently used idle model is unloaded to make room;
+              a held model is kept even over budget
+        """
+        clock = _Clock()
+        registry = ModelRegistry(memory_budget=100, clock=clock)
+        factories = {name: _Factory(nbytes=40) for name in "abc"}
+        for name, factory in factories.items():
+            registry.register(name, factory)
+
+        registry.get("a")
+        clock.now = 1.0
+        registry.get("b")
+        clock.now = 2.0
+        registry.get("a")  # b is now the least recently used
+        clock.now = 3.0
+        registry.get("c")
+        assert [registry.is_loaded(name) for name in "abc"] == [True, False, True]
+        assert registry.stats.resident_bytes == 80
+
+        with registry.acquire("a"), registry.acquire("c"):
+            registry.configure(memory_budget=40)
+            assert registry.is_loaded("a") and registry.is_loaded("c")
+        registry.configure(memory_budget=40)
+        assert registry.stats.resident == 1
+        with pytest.raises(ValueError, match="memory_budget"):
+            registry.configure(memory_budget=-1)
+
+    @pytest.mark.unit
+    def test_model_nbytes_and_default_registry(self):
+        """
+        TEST_ID: T014.R4
+        Given: A model wrapping arrays, and the process-wide registry
+        When: Its size is measured, and a placeholder encoder is fetched twice
+        Then: Shared arrays count once; the default registry is a singleton
+              serving one encoder instance
+        """
+        shared = np.zeros((10, 10), dtype=np.float32)
+        model = type("Model", (), {})()
+        model.projection = shared
+        model.inner = type("Inner", (), {})()
+        model.inner.projection = shared
+        model.inner.bias = np.zeros(10, dtype=np.float64)
+        assert model_nbytes(model) == 400 + 80
+        assert model_nbytes(shared) == 400
+
+        registry = default_registry()
+        assert default_registry() is registry
+        encoder = registry.get(PLACEHOLDER_TEXT_ENCODER)
+        with registry.acquire(PLACEHOLDER_TEXT_ENCODER) as again:
+            assert again is encoder
+
+    @pytest.mark.unit
+    def test_reaper_unloads_idle_models(self):
+        """
+        TEST_ID: T014.R5
+        Given: A registry with a short idle timeout and its real clock
+        When: A model is used once and left idle
+        Then: The background sweep unloads it without further calls
+        """
+        registry = ModelRegistry(idle_timeout=0.01)
+        registry.register("encoder", _Factory())
+        registry.get("encoder")
+
+        deadline = time.monotonic() + 5.0
+        while registry.is_loaded("encoder") and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not registry.is_loaded("encoder")
+        registry.close()
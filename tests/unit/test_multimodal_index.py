@@ -4,6 +4,7 @@ Tests for MultimodalIndex.
 IMPLEMENTS: v0.2.0 Week 3 - Multimodal search tests
 """
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -11,7 +12,10 @@ import numpy as np
 import pytest
 
 from tests.conftest import HAS_FAISS
+from vl_jepa.index import EmbeddingIndex
 from vl_jepa.multimodal_index import (
+    DiversityConfig,
+    HybridConfig,
     Modality,
     MultimodalEntry,
     MultimodalIndex,
@@ -186,6 +190,90 @@ class TestMultimodalIndex:
         assert all(r.modality == Modality.TRANSCRIPT for r in results)
         assert len(results) <= populated_index.transcript_count
 
+    @pytest.mark.unit
+    def test_add_batches_match_single_adds(self, index: MultimodalIndex) -> None:
+        """Batch ingest stores the same entries and metadata as single adds."""
+        rng = np.random.default_rng(4)
+        emb = rng.standard_normal((5, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+
+        single = MultimodalIndex()
+        single.add_visual(emb[0], timestamp=0.5, frame_index=1, metadata={"s": 1})
+        single.add_visual(emb[1], timestamp=1.0, frame_index=2)
+        for i in (2, 3, 4):
+            single.add_transcript(emb[i], i * 2.0, i * 2.0 + 1.5, f"t{i}", segment_id=i)
+
+        assert index.add_visual_batch(
+            emb[:2], np.array([0.5, 1.0]), [1, 2], metadata=[{"s": 1}, None]
+        ) == [0, 1]
+        assert index.add_transcript_batch(
+            emb[2:],
+            start_times=[4.0, 6.0, 8.0],
+            end_times=[5.5, 7.5, 9.5],
+            texts=["t2", "t3", "t4"],
+            segment_ids=[2, 3, 4],
+        ) == [2, 3, 4]
+
+        assert (index.visual_count, index.transcript_count) == (2, 3)
+        for id_ in range(5):
+            got, want = index.get_entry(id_), single.get_entry(id_)
+            assert got is not None and want is not None
+            assert (got.modality, got.timestamp, got.frame_index, got.text) == (
+                want.modality,
+                want.timestamp,
+                want.frame_index,
+                want.text,
+            )
+            assert got.metadata == want.metadata
+            assert index._index._metadata[id_] == single._index._metadata[id_]
+        assert index.add_visual(emb[0], timestamp=9.0, frame_index=9) == 5
+        assert index.search(emb[3], k=1)[0].id == 3
+
+    @pytest.mark.unit
+    def test_add_batch_validates_lengths(self, index: MultimodalIndex) -> None:
+        """Mismatched batch inputs raise ValueError; empty batches are no-ops."""
+        emb = np.zeros((3, 768), dtype=np.float32)
+
+        with pytest.raises(ValueError):
+            index.add_visual_batch(emb, [0.0, 1.0], [0, 1, 2])
+        with pytest.raises(ValueError):
+            index.add_transcript_batch(emb, [0.0] * 3, [1.0] * 3, ["a", "b"])
+        with pytest.raises(ValueError):
+            index.add_visual_batch(emb[0], [0.0], [0])
+
+        assert index.add_visual_batch(emb[:0], [], []) == []
+        assert index.size == 0
+
+    @pytest.mark.unit
+    def test_filtered_search_with_dominant_modality(
+        self, index: MultimodalIndex
+    ) -> None:
+        """Filtered search returns min(k, matching) even when outnumbered."""
+        rng = np.random.default_rng(11)
+        query = rng.standard_normal(768).astype(np.float32)
+        query /= np.linalg.norm(query)
+
+        # Visual frames all sit closer to the query than any transcript
+        for i in range(200):
+            emb = query + 0.1 * rng.standard_normal(768).astype(np.float32)
+            index.add_visual(
+                emb / np.linalg.norm(emb), timestamp=float(i), frame_index=i
+            )
+        for i in range(8):
+            emb = rng.standard_normal(768).astype(np.float32)
+            index.add_transcript(
+                emb / np.linalg.norm(emb),
+                start_time=float(i),
+                end_time=i + 1.0,
+                text=f"chunk {i}",
+            )
+
+        transcripts = index.search_transcript(query, k=5)
+        assert len(transcripts) == 5
+        assert all(r.modality == Modality.TRANSCRIPT for r in transcripts)
+        assert len(index.search_transcript(query, k=20)) == 8
+        assert len(index.search_visual(query, k=20)) == 20
+
     @pytest.mark.unit
     def test_search_by_timestamp(self, populated_index: MultimodalIndex) -> None:
         """Can search by timestamp."""
@@ -224,6 +312,36 @@ class TestMultimodalIndex:
         assert isinstance(context["visual"], list)
         assert isinstance(context["transcript"], list)
 
+    @pytest.mark.unit
+    def test_get_aligned_context_batch(self, populated_index: MultimodalIndex) -> None:
+        """Batch alignment matches per-timestamp calls, in input order."""
+        times = [4.0, 0.0, 2.5, 100.0, 2.5]
+
+        batch = populated_index.get_aligned_context_batch(
+            times, visual_tolerance=1.0, transcript_tolerance=2.0
+        )
+
+        assert len(batch) == len(times)
+        for t, context in zip(times, batch, strict=True):
+            assert context == populated_index.get_aligned_context(t, 1.0, 2.0)
+        assert batch[3] == {"visual": [], "transcript": []}
+        assert [r.timestamp for r in batch[1]["visual"]][:2] == [0.0, 1.0]
+
+    @pytest.mark.unit
+    def test_timestamp_lookups_see_new_entries(self, index: MultimodalIndex) -> None:
+        """Entries added after a lookup are found by the next lookup."""
+        emb = np.zeros(768, dtype=np.float32)
+        emb[0] = 1.0
+        index.add_visual(emb, timestamp=5.0, frame_index=0)
+        assert len(index.search_by_timestamp(20.0, tolerance=1.0)) == 0
+
+        index.add_visual(emb, timestamp=20.5, frame_index=1)
+        index.add_transcript(emb, start_time=18.0, end_time=19.0, text="late")
+
+        assert [r.frame_index for r in index.search_by_timestamp(20.0, 1.0)] == [1]
+        context = index.get_aligned_context(20.0, transcript_tolerance=1.0)
+        assert [r.text for r in context["transcript"]] == ["late"]
+
     @pytest.mark.unit
     def test_save_and_load(self, populated_index: MultimodalIndex) -> None:
         """Can save and load index."""
@@ -239,7 +357,7 @@ class TestMultimodalIndex:
             else:
                 assert path.with_suffix(".npy").exists()
             assert path.with_suffix(".json").exists()
-            assert path.with_suffix(".multimodal.json").exists()
+            assert path.with_suffix(".multimodal.bin").exists()
 
             # Load
             loaded = MultimodalIndex.load(path)
@@ -248,6 +366,131 @@ class TestMultimodalIndex:
             assert loaded.visual_count == populated_index.visual_count
             assert loaded.transcript_count == populated_index.transcript_count
 
+    @pytest.mark.unit
+    def test_entries_served_from_index_after_load(self, tmp_path: Path) -> None:
+        """Loaded entries rebuild embeddings and fields without a second copy."""
+        index = MultimodalIndex()
+        emb = np.random.default_rng(3).standard_normal((6, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        index.add_visual_batch(emb[:4], [0.0, 1.0, 2.0, 3.0], [0, 1, 2, 3])
+        index.add_transcript(
+            emb[4], start_time=0.5, end_time=2.5, text="énergie", segment_id=9
+        )
+        index.add_transcript(emb[5], start_time=3.0, end_time=4.0, text="end")
+        index.save(tmp_path / "lecture")
+
+        loaded = MultimodalIndex.load(tmp_path / "lecture")
+        for id_ in range(6):
+            before, after = index.get_entry(id_), loaded.get_entry(id_)
+            assert after is not None and before is not None
+            np.testing.assert_array_equal(after.embedding, emb[id_])
+            assert (after.modality, after.timestamp) == (
+                before.modality,
+                before.timestamp,
+            )
+            assert (after.text, after.frame_index) == (before.text, before.frame_index)
+            assert after.metadata == before.metadata
+        assert loaded.get_entry(4).segment_id == 9
+        assert loaded.get_entry(99) is None
+        # Entry columns only: no per-entry embedding or dict is held
+        assert loaded._store.nbytes < 6 * 768
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("mmap", [False, True])
+    def test_load_one_modality(self, tmp_path: Path, mmap: bool) -> None:
+        """Loading one modality restores only its entries, exact and searchable."""
+        rng = np.random.default_rng(4)
+        emb = rng.standard_normal((8, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        index = MultimodalIndex()
+        index.add_visual_batch(emb[:5], np.arange(5.0), [0, 1, 2, 3, 4])
+        index.add_transcript_batch(
+            emb[5:],
+            [0.0, 2.0, 4.0],
+            [2.0, 4.0, 6.0],
+            ["a", "b", "c"],
+            metadata=[{"speaker": "x"}, None, None],
+        )
+        index.save(tmp_path / "lecture")
+
+        loaded = MultimodalIndex.load(
+            tmp_path / "lecture", mmap=mmap, modality=Modality.TRANSCRIPT
+        )
+        assert (loaded.visual_count, loaded.transcript_count, loaded.size) == (0, 3, 3)
+        assert loaded.get_entry(0) is None
+        entry = loaded.get_entry(5)
+        assert entry is not None
+        np.testing.assert_array_equal(entry.embedding, emb[5])
+        assert entry.text == "a"
+        assert entry.metadata == {"start_time": 0.0, "end_time": 2.0, "speaker": "x"}
+        assert [r.id for r in loaded.search(emb[6], k=1)] == [6]
+        assert [r.text for r in loaded.search_by_timestamp(3.0, 0.1)] == ["b"]
+        # New entries continue after the saved ids
+        assert loaded.add_visual(emb[0], timestamp=9.0, frame_index=9) == 8
+
+    @pytest.mark.unit
+    def test_load_one_modality_keeps_index_config(self, tmp_path: Path) -> None:
+        """A one-modality load rebuilds its index with the saved configuration."""
+        from vl_jepa.index import BackendPolicy
+
+        rng = np.random.default_rng(5)
+        emb = rng.standard_normal((6, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        index = MultimodalIndex()
+        index._index = EmbeddingIndex(
+            codec="sq8", policy=BackendPolicy(backend="ivf", transition_threshold=500)
+        )
+        index._index.nprobe = 8
+        index.add_visual_batch(emb[:3], np.arange(3.0), [0, 1, 2])
+        index.add_transcript_batch(
+            emb[3:], [0.0, 1.0, 2.0], [1.0, 2.0, 3.0], list("abc")
+        )
+        index.save(tmp_path / "lecture")
+
+        loaded = MultimodalIndex.load(tmp_path / "lecture", modality=Modality.VISUAL)
+
+        rebuilt = loaded._index
+        assert (rebuilt.codec, rebuilt.nprobe) == ("sq8", 8)
+        assert rebuilt._policy == BackendPolicy(backend="ivf", transition_threshold=500)
+        assert [r.id for r in loaded.search(emb[1], k=1)] == [1]
+
+    @pytest.mark.unit
+    def test_load_json_index(self, tmp_path: Path) -> None:
+        """Indexes saved as .multimodal.json still load, but only in full."""
+        emb = np.eye(768, dtype=np.float32)[:2]
+        embedding_index = EmbeddingIndex()
+        embedding_index.add_batch(
+            emb,
+            [0, 1],
+            [
+                {"modality": "visual", "timestamp": 1.0, "frame_index": 2},
+                {"modality": "transcript", "timestamp": 3.0, "text": "hi"},
+            ],
+        )
+        embedding_index.save(tmp_path / "old")
+        entries = {
+            "0": {"modality": "visual", "timestamp": 1.0, "frame_index": 2},
+            "1": {
+                "modality": "transcript",
+                "timestamp": 3.0,
+                "text": "hi",
+                "segment_id": 4,
+                "metadata": {"start_time": 2.0, "end_time": 4.0},
+            },
+        }
+        (tmp_path / "old.multimodal.json").write_text(
+            json.dumps({"next_id": 2, "entries": entries})
+        )
+
+        loaded = MultimodalIndex.load(tmp_path / "old")
+        assert (loaded.visual_count, loaded.transcript_count) == (1, 1)
+        transcript = loaded.get_entry(1)
+        assert transcript is not None
+        assert (transcript.text, transcript.segment_id) == ("hi", 4)
+        np.testing.assert_array_equal(transcript.embedding, emb[1])
+        with pytest.raises(ValueError, match="multimodal.bin"):
+            MultimodalIndex.load(tmp_path / "old", modality=Modality.VISUAL)
+
     @pytest.mark.unit
     def test_repr(self, populated_index: MultimodalIndex) -> None:
         """Index has readable repr."""
@@ -423,6 +666,16 @@ class TestRankingConfig:
         assert config.time_decay == 0.1
         assert config.time_reference == 30.0
 
+    @pytest.mark.unit
+    def test_invalid_fusion_raises(self) -> None:
+        """Unknown fusion modes and non-positive rrf_k raise ValueError."""
+        assert RankingConfig(fusion="rrf").rrf_k == 60
+
+        with pytest.raises(ValueError, match="fusion must be"):
+            RankingConfig(fusion="max")
+        with pytest.raises(ValueError, match="rrf_k must be positive"):
+            RankingConfig(fusion="rrf", rrf_k=0)
+
 
 class TestMultimodalSearch:
     """Tests for multimodal search with weighted fusion."""
@@ -574,3 +827,407 @@ class TestMultimodalSearch:
         results = index.search_multimodal(query, k=5)
 
         assert results == []
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("fusion", ["weighted", "rrf"])
+    def test_search_multimodal_matches_brute_force(self, fusion: str) -> None:
+        """Fused ranking equals scoring each modality's top list by hand."""
+        rng = np.random.default_rng(11)
+        emb = rng.standard_normal((303, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        index = MultimodalIndex()
+        index.add_visual_batch(emb[:300], np.arange(300) * 0.5, list(range(300)))
+        index.add_transcript_batch(
+            emb[300:], [0.0, 50.0, 100.0], [50.0, 100.0, 150.0], ["a", "b", "c"]
+        )
+        config = RankingConfig(
+            fusion=fusion, rrf_k=10, time_decay=0.01, time_reference=40.0
+        )
+        query = emb[7] + emb[301]
+        k = 6
+
+        scores = emb @ query
+        expected: dict[int, float] = {}
+        for ids, weight in (
+            (np.arange(300), config.visual_weight),
+            (np.arange(300, 303), config.transcript_weight),
+        ):
+            top = ids[np.argsort(-scores[ids])][: 2 * k]
+            for rank, id_ in enumerate(top.tolist(), start=1):
+                entry = index.get_entry(id_)
+                assert entry is not None
+                base = 1 / (config.rrf_k + rank) if fusion == "rrf" else scores[id_]
+                decay = np.exp(-0.01 * abs(entry.timestamp - 40.0))
+                expected[id_] = float(weight * base * decay)
+        best = sorted(expected, key=lambda i: -expected[i])[:k]
+
+        results = index.search_multimodal(query, k=k, config=config)
+        assert [r.id for r in results] == best
+        assert [r.score for r in results] == pytest.approx(
+            [expected[i] for i in best], rel=1e-5
+        )
+        # The minority modality is ranked even though visual hits dominate
+        assert {r.modality for r in results} == {Modality.VISUAL, Modality.TRANSCRIPT}
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not HAS_FAISS, reason="Test requires FAISS")
+    @pytest.mark.parametrize("fusion", ["weighted", "rrf"])
+    def test_search_multimodal_exact_match_on_ivf(self, fusion: str) -> None:
+        """Past the IVF threshold a stored frame still ranks itself first."""
+        rng = np.random.default_rng(12)
+        emb = rng.standard_normal((1520, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        index = MultimodalIndex()
+        index.add_visual_batch(emb[:1500], np.arange(1500) * 0.5, list(range(1500)))
+        starts = np.arange(20) * 40.0
+        index.add_transcript_batch(
+            emb[1500:], starts, starts + 30.0, [f"chunk {i}" for i in range(20)]
+        )
+        assert index._index._use_ivf is True
+        # Visual-heavy weights: under RRF the top hit of the heavier
+        # modality comes first whatever its similarity
+        config = RankingConfig(visual_weight=0.7, transcript_weight=0.3, fusion=fusion)
+
+        results = index.search_multimodal(emb[5], k=5, config=config)
+
+        assert results[0].id == 5
+        scores = [r.score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+
+class TestHybridSearch:
+    """Tests for BM25 keyword and hybrid transcript search."""
+
+    TEXTS = [
+        "today we derive the loss of a linear model",
+        "the KL divergence between two distributions",
+        "we minimize the loss with gradient descent",
+        "questions about the homework",
+    ]
+
+    @pytest.fixture
+    def index(self) -> MultimodalIndex:
+        """Frames plus four transcript chunks with distinct embeddings."""
+        emb = np.eye(768, dtype=np.float32)
+        index = MultimodalIndex()
+        index.add_visual_batch(emb[:2], [0.0, 1.0], [0, 1])
+        starts = np.arange(2) * 10.0
+        index.add_transcript_batch(emb[2:4], starts, starts + 9.0, self.TEXTS[:2])
+        return index
+
+    def _add_rest(self, index: MultimodalIndex) -> None:
+        emb = np.eye(768, dtype=np.float32)
+        for i in (2, 3):
+            index.add_transcript(
+                emb[2 + i], i * 10.0, i * 10.0 + 9.0, self.TEXTS[i], segment_id=i
+            )
+
+    @pytest.mark.unit
+    def test_hybrid_config_validation(self) -> None:
+        """Weights, fusion mode and rrf_k are validated."""
+        assert HybridConfig().fusion == "rrf"
+        with pytest.raises(ValueError, match="dense_weight must be in"):
+            HybridConfig(dense_weight=1.5)
+        with pytest.raises(ValueError, match="lexical_weight must be in"):
+            HybridConfig(lexical_weight=-0.5)
+        with pytest.raises(ValueError, match="fusion must be"):
+            HybridConfig(fusion="max")
+        with pytest.raises(ValueError, match="rrf_k must be positive"):
+            HybridConfig(rrf_k=0)
+
+    @pytest.mark.unit
+    def test_lexical_search_indexes_new_transcripts(
+        self, index: MultimodalIndex
+    ) -> None:
+        """Keyword search sees transcripts added one at a time and in batches."""
+        self._add_rest(index)
+
+        results = index.search_lexical("Loss", k=5)
+
+        # Both contain "loss"; the shorter chunk ranks first
+        assert [r.id for r in results] == [4, 2]
+        assert all(r.modality == Modality.TRANSCRIPT for r in results)
+        assert results[1].text == self.TEXTS[0]
+        assert [r.id for r in index.search_lexical("kl", k=5)] == [3]
+        assert index.search_lexical("homeworks", k=5) == []
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("fusion", ["rrf", "weighted"])
+    def test_hybrid_finds_exact_term(self, index: MultimodalIndex, fusion: str) -> None:
+        """An exact-term match outranks dense hits that share no words."""
+        self._add_rest(index)
+        # Closest embedding is the homework chunk (id 5); "KL" is in id 3
+        query = np.eye(768, dtype=np.float32)[5]
+
+        dense = index.search_transcript(query, k=1)
+        results = index.search_hybrid(
+            query,
+            "KL divergence",
+            k=3,
+            config=HybridConfig(dense_weight=0.4, lexical_weight=0.6, fusion=fusion),
+        )
+
+        assert dense[0].id == 5
+        assert results[0].id == 3
+        assert 5 in [r.id for r in results]
+        scores = [r.score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not HAS_FAISS, reason="Test requires FAISS")
+    @pytest.mark.parametrize("fusion", ["rrf", "weighted"])
+    def test_hybrid_dense_ranking_on_ivf(self, fusion: str) -> None:
+        """A transcript filter too large for exact scoring keeps dense order."""
+        rng = np.random.default_rng(13)
+        emb = rng.standard_normal((4210, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        index = MultimodalIndex()
+        index.add_visual_batch(emb[:10], np.arange(10.0), list(range(10)))
+        starts = np.arange(4200) * 10.0
+        texts = [f"chunk {i}" for i in range(4200)]
+        index.add_transcript_batch(emb[10:], starts, starts + 9.0, texts)
+        assert index._index._use_ivf is True
+        assert index.transcript_count > EmbeddingIndex.EXACT_SUBSET_ROWS
+
+        # No word in common with any chunk: only the dense ranking counts
+        results = index.search_hybrid(
+            emb[17], "unrelated words", k=5, config=HybridConfig(fusion=fusion)
+        )
+
+        assert results[0].id == 17
+        scores = [r.score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("modality", [None, Modality.TRANSCRIPT])
+    def test_lexical_index_rebuilt_on_load(
+        self, index: MultimodalIndex, tmp_path: Path, modality: Modality | None
+    ) -> None:
+        """Loaded indexes (full or transcript-only) answer keyword queries."""
+        self._add_rest(index)
+        index.save(tmp_path / "lecture")
+
+        loaded = MultimodalIndex.load(tmp_path / "lecture", modality=modality)
+
+        assert [r.id for r in loaded.search_lexical("gradient descent")] == [4]
+        assert [r.id for r in loaded.search_lexical("the loss")] == [
+            r.id for r in index.search_lexical("the loss")
+        ]
+
+
+class TestSearchCache:
+    """Tests for the query cache in front of the search methods."""
+
+    @pytest.fixture
+    def index(self) -> MultimodalIndex:
+        """Six frames and four transcript chunks with random embeddings."""
+        rng = np.random.default_rng(0)
+        emb = rng.standard_normal((10, 768)).astype(np.float32)
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        index = MultimodalIndex(cache_size=8)
+        index.add_visual_batch(emb[:6], np.arange(6.0), np.arange(6))
+        starts = np.arange(4) * 2.0
+        index.add_transcript_batch(
+            emb[6:], starts, starts + 1.5, ["a loss", "b loss", "c", "d"]
+        )
+        return index
+
+    @pytest.fixture
+    def query(self) -> np.ndarray:
+        """Query on a 1e-3 grid, so +1e-8 noise keeps its cache key."""
+        query = np.random.default_rng(1).standard_normal(768).astype(np.float32)
+        return np.round(query / np.linalg.norm(query), 3)
+
+    @pytest.mark.unit
+    def test_repeated_searches_hit(
+        self, index: MultimodalIndex, query: np.ndarray
+    ) -> None:
+        """Repeats of every search method are answered from the cache."""
+        searches = [
+            lambda q: index.search(q, k=5),
+            lambda q: index.search(q, k=5, modality=Modality.TRANSCRIPT),
+            lambda q: index.search_multimodal(q, k=5),
+            lambda q: index.search_hybrid(q, "loss", k=3),
+        ]
+        first = [search(query) for search in searches]
+        again = [search(query + 1e-8) for search in searches]
+
+        assert again == first
+        stats = index.cache_stats
+        assert (stats.hits, stats.misses, stats.size) == (4, 4, 4)
+        assert stats.hit_rate == 0.5
+
+    @pytest.mark.unit
+    def test_parameters_are_part_of_the_key(
+        self, index: MultimodalIndex, query: np.ndarray
+    ) -> None:
+        """k, modality, config and text each select their own results."""
+        index.search_multimodal(query, k=5)
+        index.search_multimodal(query, k=5, config=RankingConfig())  # same
+        weighted = index.search_multimodal(
+            query, k=5, config=RankingConfig(visual_weight=1.0)
+        )
+        index.search(query, k=5, modality=Modality.VISUAL)
+        index.search(query, k=4, modality=Modality.VISUAL)
+        index.search_hybrid(query, "loss", k=3)
+        index.search_hybrid(query, "a", k=3)
+
+        assert (index.cache_stats.hits, index.cache_stats.misses) == (1, 6)
+        assert weighted[0].modality == Modality.VISUAL
+
+    @pytest.mark.unit
+    def test_adds_invalidate_cached_results(
+        self, index: MultimodalIndex, query: np.ndarray
+    ) -> None:
+        """An added entry that matches the query appears in the next search."""
+        index.search(query, k=3)
+        version = index.version
+
+        new_id = index.add_visual(query, timestamp=9.0, frame_index=9)
+        results = index.search(query, k=3)
+
+        assert index.version > version
+        assert results[0].id == new_id
+        assert index.cache_stats.hits == 0
+        assert index.cache_stats.invalidations == 1
+
+    @pytest.mark.unit
+    def test_results_are_copies(
+        self, index: MultimodalIndex, query: np.ndarray
+    ) -> None:
+        """Changing a returned result does not change later cache hits."""
+        results = index.search(query, k=3)
+        score = results[0].score
+        results[0].score = -1.0
+        results.clear()
+
+        assert index.search(query, k=3)[0].score == score
+
+    @pytest.mark.unit
+    def test_cache_disabled(self, query: np.ndarray, tmp_path: Path) -> None:
+        """cache_size=0 searches every time; loaded indexes keep the setting."""
+        index = MultimodalIndex(cache_size=0)
+        index.add_visual(query, timestamp=0.0, frame_index=0)
+        index.search(query, k=1)
+        index.search(query, k=1)
+        assert index.cache_stats.lookups == 0
+
+        index.save(tmp_path / "lecture")
+        loaded = MultimodalIndex.load(tmp_path / "lecture", cache_size=0)
+        loaded.search(query, k=1)
+        assert loaded.cache_stats.capacity == 0
+        assert MultimodalIndex.load(tmp_path / "lecture").cache_stats.capacity > 0
+
+
+class TestDiversifiedSearch:
+    """Tests for MMR and temporal de-duplication of search results."""
+
+    @pytest.fixture
+    def index(self) -> MultimodalIndex:
+        """Five slides shown for 6s each (near-identical frames 1s apart),
+        plus one transcript chunk per slide."""
+        rng = np.random.default_rng(0)
+        slides = rng.standard_normal((5, 768))
+        frames = np.repeat(slides, 6, axis=0) + 0.05 * rng.standard_normal((30, 768))
+        frames = (frames / np.linalg.norm(frames, axis=1, keepdims=True)).astype(
+            np.float32
+        )
+        chunks = slides + 0.5 * rng.standard_normal((5, 768))
+        chunks = (chunks / np.linalg.norm(chunks, axis=1, keepdims=True)).astype(
+            np.float32
+        )
+        index = MultimodalIndex()
+        index.add_visual_batch(frames, np.arange(30.0), np.arange(30))
+        starts = np.arange(5) * 6.0
+        index.add_transcript_batch(
+            chunks, starts, starts + 5.5, [f"slide {i}" for i in range(5)]
+        )
+        return index
+
+    @pytest.fixture
+    def query(self) -> np.ndarray:
+        """Closest to slide 0, then slide 1."""
+        rng = np.random.default_rng(1)
+        slides = np.random.default_rng(0).standard_normal((5, 768))
+        query = slides[0] + 0.6 * slides[1] + 0.5 * rng.standard_normal(768)
+        return (query / np.linalg.norm(query)).astype(np.float32)
+
+    @pytest.mark.unit
+    def test_config_validation(self) -> None:
+        """Lambda, separation and pool size are validated."""
+        with pytest.raises(ValueError, match="mmr_lambda must be in"):
+            DiversityConfig(mmr_lambda=1.5)
+        with pytest.raises(ValueError, match="min_separation must be"):
+            DiversityConfig(min_separation=-1.0)
+        with pytest.raises(ValueError, match="pool_size must be positive"):
+            DiversityConfig(pool_size=0)
+
+    @pytest.mark.unit
+    def test_mmr_spreads_visual_results_over_slides(
+        self, index: MultimodalIndex, query: np.ndarray
+    ) -> None:
+        """Plain search returns one slide's frames; MMR covers several."""
+        plain = index.search(query, k=5, modality=Modality.VISUAL)
+        diverse = index.search(
+            query,
+            k=5,
+            modality=Modality.VISUAL,
+            diversity=DiversityConfig(mmr_lambda=0.5),
+        )
+
+        assert {r.frame_index // 6 for r in plain} == {0}
+        assert len({r.frame_index // 6 for r in diverse}) >= 3
+        assert diverse[0].id == plain[0].id
+        scores = [r.score for r in diverse]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.unit
+    def test_relevance_only_matches_plain_search(
+        self, index: MultimodalIndex, query: np.ndarray
+    ) -> None:
+        """mmr_lambda=1 without separation returns the plain ranking."""
+        config = DiversityConfig(mmr_lambda=1.0)
+
+        for search in (index.search, index.search_multimodal):
+            plain = search(query, k=8)
+            diverse = search(query, k=8, diversity=config)
+            assert [r.id for r in diverse] == [r.id for r in plain]
+            np.testing.assert_allclose(
+                [r.score for r in diverse], [r.score for r in plain], rtol=1e-6
+            )
+
+    @pytest.mark.unit
+    def test_min_separation_in_multimodal_search(
+        self, index: MultimodalIndex, query: np.ndarray
+    ) -> None:
+        """Frames are spaced by min_separation; transcripts are not
+        blocked by frames at the same time."""
+        config = RankingConfig(visual_weight=0.5, transcript_weight=0.5)
+        results = index.search_multimodal(
+            query,
+            k=6,
+            config=config,
+            diversity=DiversityConfig(mmr_lambda=1.0, min_separation=6.0),
+        )
+
+        frames = sorted(r.timestamp for r in results if r.modality == Modality.VISUAL)
+        assert len(frames) >= 3
+        assert np.diff(frames).min() >= 6.0
+        assert any(r.modality == Modality.TRANSCRIPT for r in results)
+        assert len(results) == 6
+
+    @pytest.mark.unit
+    def test_pool_bounds_candidates(
+        self, index: MultimodalIndex, query: np.ndarray
+    ) -> None:
+        """Only the top max(k, pool_size) candidates are considered."""
+        results = index.search(
+            query, k=2, diversity=DiversityConfig(mmr_lambda=0.0, pool_size=3)
+        )
+        top3 = index.search(query, k=3)
+
+        assert len(results) == 2
+        assert {r.id for r in results} <= {r.id for r in top3}
+        assert index.search(query, k=5, diversity=DiversityConfig()) != index.search(
+            query, k=5
+        )
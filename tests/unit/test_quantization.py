@@ -0,0 +1,112 @@
+"""
+SPEC: S007 - Embedding Index (compressed storage)
+TEST_IDs: T007.Q1-T007.Q5
+"""
+
+import numpy as np
+import pytest
+
+from vl_jepa.quantization import (
+    CODECS,
+    Float16Codec,
+    ProductQuantizer,
+    ScalarQuantizer8,
+    make_codec,
+)
+
+
+@pytest.fixture
+def embeddings() -> np.ndarray:
+    """Return 1200 L2-normalized embeddings (1200, 768)."""
+    rng = np.random.default_rng(0)
+    emb = rng.standard_normal((1200, 768)).astype(np.float32)
+    return emb / np.linalg.norm(emb, axis=1, keepdims=True)
+
+
+class TestCodecs:
+    """Tests for numpy embedding codecs."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "codec_cls,max_error",
+        [(Float16Codec, 1e-3), (ScalarQuantizer8, 5e-3)],
+    )
+    def test_scalar_codecs_roundtrip(self, embeddings, codec_cls, max_error):
+        """
+        TEST_ID: T007.Q1
+        Given: Normalized embeddings
+        When: Encoded and decoded by a scalar codec
+        Then: Reconstruction error stays within the quantization step
+        """
+        codec = codec_cls(768)
+        codec.train(embeddings)
+        codes = codec.encode(embeddings)
+
+        assert codes.dtype == codec.dtype
+        assert codes.shape == (1200, codec.code_width)
+        decoded = codec.decode(codes)
+        assert np.abs(decoded - embeddings).max() < max_error
+
+    @pytest.mark.unit
+    def test_product_quantizer_code_size(self, embeddings):
+        """
+        TEST_ID: T007.Q2
+        Given: A product quantizer with 96 sub-vectors
+        When: Trained and used to encode
+        Then: Each vector takes 96 bytes and decodes to (N, 768)
+        """
+        codec = ProductQuantizer(768, num_subvectors=96)
+        codec.train(embeddings)
+        codes = codec.encode(embeddings[:10])
+
+        assert codes.shape == (10, 96)
+        assert codec.bytes_per_vector == 96
+        assert codec.decode(codes).shape == (10, 768)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", ["float16", "sq8", "pq"])
+    def test_score_matches_decoded_inner_product(self, embeddings, name):
+        """
+        TEST_ID: T007.Q3
+        Given: Any trained codec
+        When: score() is called
+        Then: Scores equal inner products with the decoded vectors
+        """
+        codec = make_codec(name, 768)
+        codec.train(embeddings)
+        codes = codec.encode(embeddings)
+        queries = embeddings[:3]
+
+        expected = queries @ codec.decode(codes).T
+        np.testing.assert_allclose(codec.score(queries, codes), expected, atol=1e-4)
+
+    @pytest.mark.unit
+    def test_state_roundtrip(self, embeddings):
+        """
+        TEST_ID: T007.Q4
+        Given: A trained codec
+        When: Its state is restored into a fresh codec
+        Then: Both encode identically
+        """
+        for name in CODECS:
+            codec = make_codec(name, 768)
+            codec.train(embeddings)
+            restored = make_codec(name, 768)
+            restored.set_state(codec.get_state())
+
+            np.testing.assert_array_equal(
+                restored.encode(embeddings[:5]), codec.encode(embeddings[:5])
+            )
+
+    @pytest.mark.unit
+    def test_invalid_codec_arguments(self):
+        """
+        TEST_ID: T007.Q5
+        Given: Unknown codec name or bad sub-vector count
+        When: A codec is created
+        Then: Raises ValueError
+        """
+        with pytest.raises(ValueError, match="Unknown codec"):
+            make_codec("int4", 768)
+        with pytest.raises(ValueError, match="divide"):
+            ProductQuantizer(768, num_subvectors=100)
@@ -0,0 +1,76 @@
+"""
+SPEC: Multimodal Index (query cache)
+TEST_IDs: T011.Q1-T011.Q3
+"""
+
+import numpy as np
+import pytest
+
+from vl_jepa.query_cache import QueryCache, query_digest
+
+
+class TestQueryCache:
+    """Tests for the versioned LRU query cache."""
+
+    @pytest.mark.unit
+    def test_keys_round_query_embeddings(self):
+        """
+        TEST_ID: T011.Q1
+        Given: A query embedding
+        When: It is hashed after float noise, a real change or a reshape
+        Then: Noise and shape keep the key; a real change or params do not
+        """
+        # Components on a 1e-3 grid, far from the 1e-5 rounding boundaries
+        query = np.random.default_rng(0).standard_normal(768).astype(np.float32)
+        query = np.round(query / np.linalg.norm(query), 3)
+        cache = QueryCache()
+
+        assert query_digest(query) == query_digest(query + 1e-8)
+        assert query_digest(query) == query_digest(query.reshape(1, -1))
+        assert query_digest(query) != query_digest(query + np.float32(1e-3))
+        assert cache.key(query, "search", 10) == cache.key(query + 1e-8, "search", 10)
+        assert cache.key(query, "search", 10) != cache.key(query, "search", 5)
+
+    @pytest.mark.unit
+    def test_lru_eviction_and_versions(self):
+        """
+        TEST_ID: T011.Q2
+        Given: A cache of capacity 2
+        When: Three keys are stored, and one is read at another version
+        Then: The least recently used key is evicted, the stale entry is
+              dropped, and the counters and hit rate add up
+        """
+        cache = QueryCache(capacity=2)
+        cache.put("a", 0, [1])
+        cache.put("b", 0, [2])
+        assert cache.get("a", 0) == [1]  # "b" is now least recently used
+        cache.put("c", 0, [3])
+
+        assert cache.get("b", 0) is None
+        assert cache.get("c", 1) is None  # stale: index changed
+        assert cache.get("c", 0) is None  # and dropped
+        assert len(cache) == 1
+
+        stats = cache.stats
+        assert (stats.hits, stats.misses) == (1, 3)
+        assert (stats.evictions, stats.invalidations) == (1, 1)
+        assert (stats.size, stats.capacity) == (1, 2)
+        assert stats.hit_rate == pytest.approx(0.25)
+
+        cache.clear()
+        assert len(cache) == 0 and cache.stats.invalidations == 2
+
+    @pytest.mark.unit
+    def test_zero_capacity_disables(self):
+        """
+        TEST_ID: T011.Q3
+        Given: A cache of capacity 0, or a negative capacity
+        When: Values are stored, or the cache is created
+        Then: Nothing is kept; a negative capacity raises ValueError
+        """
+        cache = QueryCache(capacity=0)
+        cache.put("a", 0, [1])
+        assert cache.get("a", 0) is None
+        assert cache.stats.hit_rate == 0.0
+        with pytest.raises(ValueError, match="capacity"):
+            QueryCache(capacity=-1)
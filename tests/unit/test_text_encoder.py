@@ -1,12 +1,31 @@
 """
 SPEC: S006 - Text Encoding with Projection
-TEST_IDs: T006.1-T006.5
+TEST_IDs: T006.1-T006.5, T006.11-T006.13
 """
 
+import zlib
+
 import numpy as np
 import pytest
 
 
+class _HashModel:
+    """Deterministic stand-in for a SentenceTransformer: records calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], int | None]] = []
+
+    def encode(self, texts, batch_size=None, convert_to_numpy=True):
+        batch = [texts] if isinstance(texts, str) else list(texts)
+        self.calls.append((batch, batch_size))
+        rows = [
+            np.random.default_rng(zlib.crc32(t.encode())).standard_normal(384)
+            for t in batch
+        ]
+        out = np.array(rows, dtype=np.float32)
+        return out[0] if isinstance(texts, str) else out
+
+
 class TestTextEncoder:
     """Tests for MiniLM text encoder with projection (S006)."""
 
@@ -149,6 +168,73 @@ class TestTextEncoder:
 
         assert np.array_equal(encoder._projection, custom_proj)
 
+    @pytest.mark.unit
+    def test_batch_matches_single_encodes(self):
+        """
+        SPEC: S006
+        TEST_ID: T006.11
+        Given: A model and a custom projection
+        When: Texts are encoded in one batch and one at a time
+        Then: Rows are identical, and the batch makes one model call
+        """
+        from vl_jepa.text import TextEncoder
+
+        projection = np.random.default_rng(0).standard_normal((384, 768))
+        model = _HashModel()
+        encoder = TextEncoder(model, projection=projection.astype(np.float32))
+        texts = [f"chunk {i} about gradients" for i in range(10)]
+
+        batch = encoder.encode_batch(texts)
+        assert len(model.calls) == 1 and model.calls[0] == (texts, 32)
+        singles = np.stack([encoder.encode(t) for t in texts])
+
+        assert batch.shape == (10, 768) and batch.dtype == np.float32
+        np.testing.assert_allclose(batch, singles, rtol=1e-6, atol=1e-7)
+        np.testing.assert_allclose(np.linalg.norm(batch, axis=1), 1.0, rtol=1e-5)
+
+    @pytest.mark.unit
+    def test_batch_size_is_configurable(self):
+        """
+        SPEC: S006
+        TEST_ID: T006.12
+        Given: An encoder with batch_size=8
+        When: encode_batch is called with and without an override
+        Then: The model receives that batch size; non-positive sizes raise
+        """
+        from vl_jepa.text import TextEncoder
+
+        model = _HashModel()
+        encoder = TextEncoder(model, batch_size=8)
+
+        encoder.encode_batch(["a", "b"])
+        encoder.encode_batch(["a", "b"], batch_size=128)
+
+        assert [size for _, size in model.calls] == [8, 128]
+        with pytest.raises(ValueError, match="batch_size"):
+            TextEncoder(model, batch_size=0)
+
+    @pytest.mark.unit
+    def test_batch_validates_and_truncates(self):
+        """
+        SPEC: S006
+        TEST_ID: T006.13
+        Given: Batches with an empty text, a long text, or no texts
+        When: encode_batch is called
+        Then: Empty text raises, long text is truncated, no texts gives (0, 768)
+        """
+        from vl_jepa.text import TextEncoder
+
+        model = _HashModel()
+        encoder = TextEncoder(model)
+
+        with pytest.raises(ValueError, match="empty"):
+            encoder.encode_batch(["fine", "  "])
+        assert model.calls == []
+
+        encoder.encode_batch(["word " * 300])
+        assert len(model.calls[0][0][0].split()) == TextEncoder.MAX_TOKENS
+        assert encoder.encode_batch([]).shape == (0, 768)
+
 
 class TestTextEncoderRealModel:
     """Tests for TextEncoder with real sentence-transformers model."""
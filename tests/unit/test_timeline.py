@@ -0,0 +1,75 @@
+"""
+SPEC: Multimodal Index (timestamp lookups)
+TEST_IDs: T011.TL1-T011.TL3
+"""
+
+import numpy as np
+import pytest
+
+from vl_jepa.timeline import TimelineIndex
+
+
+def _brute_force(starts, ends, lo, hi) -> set[int]:
+    """Indices of intervals overlapping [lo, hi] by linear scan."""
+    return {i for i in range(len(starts)) if starts[i] <= hi and ends[i] >= lo}
+
+
+class TestTimelineIndex:
+    """Tests for the sorted timestamp / interval index."""
+
+    @pytest.mark.unit
+    def test_point_window_queries(self):
+        """
+        TEST_ID: T011.TL1
+        Given: Unsorted point timestamps with duplicates
+        When: Window queries are run, single and batched
+        Then: Exactly the points inside each closed window are returned
+        """
+        rng = np.random.default_rng(0)
+        times = np.round(rng.uniform(0, 50, 300), 1)
+        timeline = TimelineIndex(np.arange(300), times)
+
+        lo = rng.uniform(-5, 55, 100)
+        hi = lo + rng.uniform(0, 3, 100)
+        for rows, a, b in zip(timeline.query_batch(lo, hi), lo, hi, strict=True):
+            expected = _brute_force(times, times, a, b)
+            assert set(timeline.ids[rows].tolist()) == expected
+            assert np.all(np.diff(timeline.starts[rows]) >= 0)
+
+        assert set(timeline.ids[timeline.query(10.0, 10.0)]) == set(
+            np.flatnonzero(times == 10.0).tolist()
+        )
+
+    @pytest.mark.unit
+    def test_nested_interval_queries(self):
+        """
+        TEST_ID: T011.TL2
+        Given: Intervals of mixed lengths, some nested inside others
+        When: Window queries are run
+        Then: Every overlapping interval is returned, and nothing else
+        """
+        rng = np.random.default_rng(1)
+        starts = rng.uniform(0, 100, 200)
+        ends = starts + rng.choice([0.0, 0.5, 5.0, 60.0], 200)
+        timeline = TimelineIndex(np.arange(200) + 1000, starts, ends)
+
+        lo = rng.uniform(-10, 170, 200)
+        hi = lo + rng.uniform(0, 4, 200)
+        for rows, a, b in zip(timeline.query_batch(lo, hi), lo, hi, strict=True):
+            expected = {i + 1000 for i in _brute_force(starts, ends, a, b)}
+            assert set(timeline.ids[rows].tolist()) == expected
+
+    @pytest.mark.unit
+    def test_empty_timeline(self):
+        """
+        TEST_ID: T011.TL3
+        Given: A timeline without entries
+        When: Queried
+        Then: Empty row arrays are returned
+        """
+        timeline = TimelineIndex([], [], [])
+
+        assert len(timeline) == 0
+        assert len(timeline.query(0.0, 1.0)) == 0
+        rows = timeline.query_batch(np.zeros(3), np.ones(3))
+        assert [len(r) for r in rows] == [0, 0, 0]
@@ -2,7 +2,7 @@
 Unit tests for UI processing pipeline.
 
 SPEC: S013 - Gradio Web Interface
-TEST_IDs: T013.P1-T013.P12
+TEST_IDs: T013.P1-T013.P19
 
 Tests for ProcessingPipeline with progress callbacks.
 """
@@ -312,6 +312,165 @@ class TestProcessingPipeline:
         )
         assert progress > 0.9
 
+    @pytest.mark.unit
+    def test_build_index_adds_all_entries(self):
+        """
+        SPEC: S013
+        TEST_ID: T013.P19
+        Given: Frame and text embeddings with timestamps and chunks
+        When: _build_index() is called
+        Then: Every frame and chunk is indexed with its timing
+        """
+        import numpy as np
+
+        from vl_jepa.ui.processing import ProcessingPipeline, TranscriptChunkResult
+
+        pipeline = ProcessingPipeline(use_placeholders=True)
+        rng = np.random.default_rng(0)
+        frames = list(rng.standard_normal((6, 768)).astype(np.float32))
+        texts = list(rng.standard_normal((2, 768)).astype(np.float32))
+        chunks = [
+            TranscriptChunkResult(text="intro", start=0.0, end=2.0),
+            TranscriptChunkResult(text="body", start=2.0, end=4.0),
+        ]
+
+        index = pipeline._build_index(
+            frames, [0.5 * i for i in range(6)], texts, chunks
+        )
+
+        assert (index.visual_count, index.transcript_count) == (6, 2)
+        context = index.get_aligned_context(3.0, transcript_tolerance=0.5)
+        assert [r.frame_index for r in context["visual"]] == [5, 4]
+        assert [r.text for r in context["transcript"]] == ["body"]
+
+    @pytest.mark.unit
+    def test_encode_transcript_in_batches(self):
+        """
+        SPEC: S013
+        TEST_ID: T013.P15
+        Given: More transcript chunks than one encode batch
+        When: _encode_transcript() is called
+        Then: Chunks are encoded a batch at a time, rows match encode(),
+              and progress reaches 1.0
+        """
+        from vl_jepa.ui.processing import (
+            TEXT_ENCODE_BATCH,
+            ProcessingPipeline,
+            TranscriptChunkResult,
+        )
+
+        callback = MagicMock()
+        pipeline = ProcessingPipeline(use_placeholders=True, progress_callback=callback)
+        encoder = pipeline._text_encoder
+        chunks = [
+            TranscriptChunkResult(text=f"chunk {i}", start=i, end=i + 1.0)
+            for i in range(TEXT_ENCODE_BATCH + 5)
+        ]
+
+        with patch.object(
+            encoder, "encode_batch", wraps=encoder.encode_batch
+        ) as encode_batch:
+            embeddings = pipeline._encode_transcript(chunks)
+
+        assert encode_batch.call_count == 2
+        assert len(embeddings) == len(chunks)
+        np.testing.assert_allclose(
+            embeddings[-1], encoder.encode(chunks[-1].text), rtol=1e-6
+        )
+        assert callback.call_args.args[0].message.endswith(
+            f"{len(chunks)}/{len(chunks)}..."
+        )
+
+    @pytest.mark.unit
+    def test_encode_frames_with_frame_cache(self):
+        """
+        SPEC: S013
+        TEST_ID: T013.P16
+        Given: A pipeline with a frame cache and a run of identical frames
+        When: _encode_frames() is called
+        Then: Each distinct frame reaches the encoder once and every
+              frame keeps its own timestamp
+        """
+        from vl_jepa.frame_cache import FrameEmbeddingCache
+        from vl_jepa.ui.processing import ProcessingPipeline
+
+        encoder = MagicMock()
+        encoder.encode.side_effect = lambda batch: np.ones(
+            (len(batch), 768), dtype=np.float32
+        )
+        pipeline = ProcessingPipeline(
+            visual_encoder=encoder, frame_cache=FrameEmbeddingCache()
+        )
+        slide = np.zeros((224, 224, 3), dtype=np.float32)
+        frames = [(slide, 0.0), (slide, 1.0), (slide + 0.5, 2.0), (slide, 3.0)]
+
+        embeddings, timestamps = pipeline._encode_frames(frames)
+
+        assert encoder.encode.call_count == 2
+        assert len(embeddings) == 4 and timestamps == [0.0, 1.0, 2.0, 3.0]
+
+    @pytest.mark.unit
+    def test_encode_frames_inherits_skipped(self):
+        """
+        SPEC: S013
+        TEST_ID: T013.P17
+        Given: Sampled frames where unchanged slides are None
+        When: _encode_frames() is called
+        Then: Only kept frames are encoded, skipped frames inherit the
+              previous embedding and keep their own timestamp
+        """
+        from vl_jepa.ui.processing import ProcessingPipeline
+
+        encoder = MagicMock()
+        encoder.encode.side_effect = lambda batch: np.full(
+            (len(batch), 768), batch.mean(), dtype=np.float32
+        )
+        pipeline = ProcessingPipeline(visual_encoder=encoder)
+        slide = np.zeros((224, 224, 3), dtype=np.float32)
+        frames = [(slide, 0.0), (None, 1.0), (None, 2.0), (slide + 0.5, 3.0)]
+
+        embeddings, timestamps = pipeline._encode_frames(frames)
+
+        assert encoder.encode.call_count == 2
+        assert timestamps == [0.0, 1.0, 2.0, 3.0]
+        assert [float(e[0]) for e in embeddings] == [0.0, 0.0, 0.0, 0.5]
+        assert pipeline._encode_time_saved > 0
+
+    @pytest.mark.unit
+    def test_placeholder_pipelines_share_models(self):
+        """
+        SPEC: S013
+        TEST_ID: T013.P18
+        Given: A model registry with the default models registered
+        When: Two placeholder pipelines are created from it
+        Then: The encoders are loaded once and shared by both pipelines,
+              and stay loaded until both pipelines are closed
+        """
+        from vl_jepa.model_registry import (
+            PLACEHOLDER_VISUAL_ENCODER,
+            ModelRegistry,
+            register_default_models,
+        )
+        from vl_jepa.ui.processing import ProcessingPipeline
+
+        models = ModelRegistry()
+        register_default_models(models)
+
+        first = ProcessingPipeline(use_placeholders=True, models=models)
+        second = ProcessingPipeline(use_placeholders=True, models=models)
+
+        assert second._visual_encoder is first._visual_encoder
+        assert second._text_encoder is first._text_encoder
+        assert (models.stats.loads, models.stats.hits) == (2, 2)
+        assert models.stats.resident_bytes >= 150528 * 768 * 4
+
+        first.close()
+        assert not models.unload(PLACEHOLDER_VISUAL_ENCODER)
+        with second:
+            pass
+        assert models.unload(PLACEHOLDER_VISUAL_ENCODER)
+        models.close()
+
 
 class TestUIState:
     """Tests for UIState dataclass."""